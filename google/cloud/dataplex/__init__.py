@@ -13,75 +13,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from google.cloud.dataplex_v1 import _lazy
 
-from google.cloud.dataplex_v1.services.dataplex_service.client import (
-    DataplexServiceClient,
-)
-from google.cloud.dataplex_v1.services.dataplex_service.async_client import (
-    DataplexServiceAsyncClient,
-)
-from google.cloud.dataplex_v1.services.metadata_service.client import (
-    MetadataServiceClient,
-)
-from google.cloud.dataplex_v1.services.metadata_service.async_client import (
-    MetadataServiceAsyncClient,
-)
+# Each name is imported from its module on first access; see ``_lazy.attach``.
+_EXPORTS = {
+    "DataplexServiceClient": "google.cloud.dataplex_v1.services.dataplex_service.client",
+    "DataplexServiceAsyncClient": "google.cloud.dataplex_v1.services.dataplex_service.async_client",
+    "MetadataServiceClient": "google.cloud.dataplex_v1.services.metadata_service.client",
+    "MetadataServiceAsyncClient": "google.cloud.dataplex_v1.services.metadata_service.async_client",
+    "DiscoveryEvent": "google.cloud.dataplex_v1.types.logs",
+    "JobEvent": "google.cloud.dataplex_v1.types.logs",
+    "SessionEvent": "google.cloud.dataplex_v1.types.logs",
+    "Entity": "google.cloud.dataplex_v1.types.metadata_",
+    "GetEntityRequest": "google.cloud.dataplex_v1.types.metadata_",
+    "GetPartitionRequest": "google.cloud.dataplex_v1.types.metadata_",
+    "ListEntitiesRequest": "google.cloud.dataplex_v1.types.metadata_",
+    "ListEntitiesResponse": "google.cloud.dataplex_v1.types.metadata_",
+    "ListPartitionsRequest": "google.cloud.dataplex_v1.types.metadata_",
+    "ListPartitionsResponse": "google.cloud.dataplex_v1.types.metadata_",
+    "Partition": "google.cloud.dataplex_v1.types.metadata_",
+    "Schema": "google.cloud.dataplex_v1.types.metadata_",
+    "StorageFormat": "google.cloud.dataplex_v1.types.metadata_",
+    "StorageSystem": "google.cloud.dataplex_v1.types.metadata_",
+    "Action": "google.cloud.dataplex_v1.types.resources",
+    "Asset": "google.cloud.dataplex_v1.types.resources",
+    "AssetStatus": "google.cloud.dataplex_v1.types.resources",
+    "Lake": "google.cloud.dataplex_v1.types.resources",
+    "Zone": "google.cloud.dataplex_v1.types.resources",
+    "State": "google.cloud.dataplex_v1.types.resources",
+    "CancelJobRequest": "google.cloud.dataplex_v1.types.service",
+    "CreateAssetRequest": "google.cloud.dataplex_v1.types.service",
+    "CreateLakeRequest": "google.cloud.dataplex_v1.types.service",
+    "CreateTaskRequest": "google.cloud.dataplex_v1.types.service",
+    "CreateZoneRequest": "google.cloud.dataplex_v1.types.service",
+    "DeleteAssetRequest": "google.cloud.dataplex_v1.types.service",
+    "DeleteLakeRequest": "google.cloud.dataplex_v1.types.service",
+    "DeleteTaskRequest": "google.cloud.dataplex_v1.types.service",
+    "DeleteZoneRequest": "google.cloud.dataplex_v1.types.service",
+    "GetAssetRequest": "google.cloud.dataplex_v1.types.service",
+    "GetJobRequest": "google.cloud.dataplex_v1.types.service",
+    "GetLakeRequest": "google.cloud.dataplex_v1.types.service",
+    "GetTaskRequest": "google.cloud.dataplex_v1.types.service",
+    "GetZoneRequest": "google.cloud.dataplex_v1.types.service",
+    "ListActionsResponse": "google.cloud.dataplex_v1.types.service",
+    "ListAssetActionsRequest": "google.cloud.dataplex_v1.types.service",
+    "ListAssetsRequest": "google.cloud.dataplex_v1.types.service",
+    "ListAssetsResponse": "google.cloud.dataplex_v1.types.service",
+    "ListJobsRequest": "google.cloud.dataplex_v1.types.service",
+    "ListJobsResponse": "google.cloud.dataplex_v1.types.service",
+    "ListLakeActionsRequest": "google.cloud.dataplex_v1.types.service",
+    "ListLakesRequest": "google.cloud.dataplex_v1.types.service",
+    "ListLakesResponse": "google.cloud.dataplex_v1.types.service",
+    "ListTasksRequest": "google.cloud.dataplex_v1.types.service",
+    "ListTasksResponse": "google.cloud.dataplex_v1.types.service",
+    "ListZoneActionsRequest": "google.cloud.dataplex_v1.types.service",
+    "ListZonesRequest": "google.cloud.dataplex_v1.types.service",
+    "ListZonesResponse": "google.cloud.dataplex_v1.types.service",
+    "OperationMetadata": "google.cloud.dataplex_v1.types.service",
+    "UpdateAssetRequest": "google.cloud.dataplex_v1.types.service",
+    "UpdateLakeRequest": "google.cloud.dataplex_v1.types.service",
+    "UpdateTaskRequest": "google.cloud.dataplex_v1.types.service",
+    "UpdateZoneRequest": "google.cloud.dataplex_v1.types.service",
+    "Job": "google.cloud.dataplex_v1.types.tasks",
+    "Task": "google.cloud.dataplex_v1.types.tasks",
+}
 
-from google.cloud.dataplex_v1.types.logs import DiscoveryEvent
-from google.cloud.dataplex_v1.types.logs import JobEvent
-from google.cloud.dataplex_v1.types.logs import SessionEvent
-from google.cloud.dataplex_v1.types.metadata_ import Entity
-from google.cloud.dataplex_v1.types.metadata_ import GetEntityRequest
-from google.cloud.dataplex_v1.types.metadata_ import GetPartitionRequest
-from google.cloud.dataplex_v1.types.metadata_ import ListEntitiesRequest
-from google.cloud.dataplex_v1.types.metadata_ import ListEntitiesResponse
-from google.cloud.dataplex_v1.types.metadata_ import ListPartitionsRequest
-from google.cloud.dataplex_v1.types.metadata_ import ListPartitionsResponse
-from google.cloud.dataplex_v1.types.metadata_ import Partition
-from google.cloud.dataplex_v1.types.metadata_ import Schema
-from google.cloud.dataplex_v1.types.metadata_ import StorageFormat
-from google.cloud.dataplex_v1.types.metadata_ import StorageSystem
-from google.cloud.dataplex_v1.types.resources import Action
-from google.cloud.dataplex_v1.types.resources import Asset
-from google.cloud.dataplex_v1.types.resources import AssetStatus
-from google.cloud.dataplex_v1.types.resources import Lake
-from google.cloud.dataplex_v1.types.resources import Zone
-from google.cloud.dataplex_v1.types.resources import State
-from google.cloud.dataplex_v1.types.service import CancelJobRequest
-from google.cloud.dataplex_v1.types.service import CreateAssetRequest
-from google.cloud.dataplex_v1.types.service import CreateLakeRequest
-from google.cloud.dataplex_v1.types.service import CreateTaskRequest
-from google.cloud.dataplex_v1.types.service import CreateZoneRequest
-from google.cloud.dataplex_v1.types.service import DeleteAssetRequest
-from google.cloud.dataplex_v1.types.service import DeleteLakeRequest
-from google.cloud.dataplex_v1.types.service import DeleteTaskRequest
-from google.cloud.dataplex_v1.types.service import DeleteZoneRequest
-from google.cloud.dataplex_v1.types.service import GetAssetRequest
-from google.cloud.dataplex_v1.types.service import GetJobRequest
-from google.cloud.dataplex_v1.types.service import GetLakeRequest
-from google.cloud.dataplex_v1.types.service import GetTaskRequest
-from google.cloud.dataplex_v1.types.service import GetZoneRequest
-from google.cloud.dataplex_v1.types.service import ListActionsResponse
-from google.cloud.dataplex_v1.types.service import ListAssetActionsRequest
-from google.cloud.dataplex_v1.types.service import ListAssetsRequest
-from google.cloud.dataplex_v1.types.service import ListAssetsResponse
-from google.cloud.dataplex_v1.types.service import ListJobsRequest
-from google.cloud.dataplex_v1.types.service import ListJobsResponse
-from google.cloud.dataplex_v1.types.service import ListLakeActionsRequest
-from google.cloud.dataplex_v1.types.service import ListLakesRequest
-from google.cloud.dataplex_v1.types.service import ListLakesResponse
-from google.cloud.dataplex_v1.types.service import ListTasksRequest
-from google.cloud.dataplex_v1.types.service import ListTasksResponse
-from google.cloud.dataplex_v1.types.service import ListZoneActionsRequest
-from google.cloud.dataplex_v1.types.service import ListZonesRequest
-from google.cloud.dataplex_v1.types.service import ListZonesResponse
-from google.cloud.dataplex_v1.types.service import OperationMetadata
-from google.cloud.dataplex_v1.types.service import UpdateAssetRequest
-from google.cloud.dataplex_v1.types.service import UpdateLakeRequest
-from google.cloud.dataplex_v1.types.service import UpdateTaskRequest
-from google.cloud.dataplex_v1.types.service import UpdateZoneRequest
-from google.cloud.dataplex_v1.types.tasks import Job
-from google.cloud.dataplex_v1.types.tasks import Task
+__getattr__, __dir__ = _lazy.attach(__name__, _EXPORTS)
 
 __all__ = (
     "DataplexServiceClient",
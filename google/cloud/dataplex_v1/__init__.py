@@ -13,67 +13,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from . import _lazy
 
-from .services.dataplex_service import DataplexServiceClient
-from .services.dataplex_service import DataplexServiceAsyncClient
-from .services.metadata_service import MetadataServiceClient
-from .services.metadata_service import MetadataServiceAsyncClient
+# Each name is imported from its module on first access; see ``_lazy.attach``.
+_EXPORTS = {
+    "DataplexServiceClient": ".services.dataplex_service",
+    "DataplexServiceAsyncClient": ".services.dataplex_service",
+    "MetadataServiceClient": ".services.metadata_service",
+    "MetadataServiceAsyncClient": ".services.metadata_service",
+    "DiscoveryEvent": ".types.logs",
+    "JobEvent": ".types.logs",
+    "SessionEvent": ".types.logs",
+    "Entity": ".types.metadata_",
+    "GetEntityRequest": ".types.metadata_",
+    "GetPartitionRequest": ".types.metadata_",
+    "ListEntitiesRequest": ".types.metadata_",
+    "ListEntitiesResponse": ".types.metadata_",
+    "ListPartitionsRequest": ".types.metadata_",
+    "ListPartitionsResponse": ".types.metadata_",
+    "Partition": ".types.metadata_",
+    "Schema": ".types.metadata_",
+    "StorageFormat": ".types.metadata_",
+    "StorageSystem": ".types.metadata_",
+    "Action": ".types.resources",
+    "Asset": ".types.resources",
+    "AssetStatus": ".types.resources",
+    "Lake": ".types.resources",
+    "Zone": ".types.resources",
+    "State": ".types.resources",
+    "CancelJobRequest": ".types.service",
+    "CreateAssetRequest": ".types.service",
+    "CreateLakeRequest": ".types.service",
+    "CreateTaskRequest": ".types.service",
+    "CreateZoneRequest": ".types.service",
+    "DeleteAssetRequest": ".types.service",
+    "DeleteLakeRequest": ".types.service",
+    "DeleteTaskRequest": ".types.service",
+    "DeleteZoneRequest": ".types.service",
+    "GetAssetRequest": ".types.service",
+    "GetJobRequest": ".types.service",
+    "GetLakeRequest": ".types.service",
+    "GetTaskRequest": ".types.service",
+    "GetZoneRequest": ".types.service",
+    "ListActionsResponse": ".types.service",
+    "ListAssetActionsRequest": ".types.service",
+    "ListAssetsRequest": ".types.service",
+    "ListAssetsResponse": ".types.service",
+    "ListJobsRequest": ".types.service",
+    "ListJobsResponse": ".types.service",
+    "ListLakeActionsRequest": ".types.service",
+    "ListLakesRequest": ".types.service",
+    "ListLakesResponse": ".types.service",
+    "ListTasksRequest": ".types.service",
+    "ListTasksResponse": ".types.service",
+    "ListZoneActionsRequest": ".types.service",
+    "ListZonesRequest": ".types.service",
+    "ListZonesResponse": ".types.service",
+    "OperationMetadata": ".types.service",
+    "UpdateAssetRequest": ".types.service",
+    "UpdateLakeRequest": ".types.service",
+    "UpdateTaskRequest": ".types.service",
+    "UpdateZoneRequest": ".types.service",
+    "Job": ".types.tasks",
+    "Task": ".types.tasks",
+}
 
-from .types.logs import DiscoveryEvent
-from .types.logs import JobEvent
-from .types.logs import SessionEvent
-from .types.metadata_ import Entity
-from .types.metadata_ import GetEntityRequest
-from .types.metadata_ import GetPartitionRequest
-from .types.metadata_ import ListEntitiesRequest
-from .types.metadata_ import ListEntitiesResponse
-from .types.metadata_ import ListPartitionsRequest
-from .types.metadata_ import ListPartitionsResponse
-from .types.metadata_ import Partition
-from .types.metadata_ import Schema
-from .types.metadata_ import StorageFormat
-from .types.metadata_ import StorageSystem
-from .types.resources import Action
-from .types.resources import Asset
-from .types.resources import AssetStatus
-from .types.resources import Lake
-from .types.resources import Zone
-from .types.resources import State
-from .types.service import CancelJobRequest
-from .types.service import CreateAssetRequest
-from .types.service import CreateLakeRequest
-from .types.service import CreateTaskRequest
-from .types.service import CreateZoneRequest
-from .types.service import DeleteAssetRequest
-from .types.service import DeleteLakeRequest
-from .types.service import DeleteTaskRequest
-from .types.service import DeleteZoneRequest
-from .types.service import GetAssetRequest
-from .types.service import GetJobRequest
-from .types.service import GetLakeRequest
-from .types.service import GetTaskRequest
-from .types.service import GetZoneRequest
-from .types.service import ListActionsResponse
-from .types.service import ListAssetActionsRequest
-from .types.service import ListAssetsRequest
-from .types.service import ListAssetsResponse
-from .types.service import ListJobsRequest
-from .types.service import ListJobsResponse
-from .types.service import ListLakeActionsRequest
-from .types.service import ListLakesRequest
-from .types.service import ListLakesResponse
-from .types.service import ListTasksRequest
-from .types.service import ListTasksResponse
-from .types.service import ListZoneActionsRequest
-from .types.service import ListZonesRequest
-from .types.service import ListZonesResponse
-from .types.service import OperationMetadata
-from .types.service import UpdateAssetRequest
-from .types.service import UpdateLakeRequest
-from .types.service import UpdateTaskRequest
-from .types.service import UpdateZoneRequest
-from .types.tasks import Job
-from .types.tasks import Task
+__getattr__, __dir__ = _lazy.attach(__name__, _EXPORTS)
 
 __all__ = (
     "DataplexServiceAsyncClient",
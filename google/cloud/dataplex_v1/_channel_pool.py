@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pools of gRPC channels that spread calls over several connections."""
+
+import asyncio
+import itertools
+import threading
+from typing import Any, Callable, List, Optional, Sequence
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+#: Pick the channel with the fewest calls in flight.
+LEAST_OUTSTANDING = "least_outstanding"
+#: Pick channels in turn.
+ROUND_ROBIN = "round_robin"
+
+#: Channel options that keep every pooled channel on its own connection.
+#: Channels with identical arguments otherwise share subchannels, and so
+#: a single HTTP/2 connection.
+POOL_CHANNEL_OPTIONS = (("grpc.use_local_subchannel_pool", 1),)
+
+
+class _Balancer:
+    """Tracks the calls in flight on each channel of a pool."""
+
+    def __init__(self, channels: Sequence[Any], strategy: str):
+        if not channels:
+            raise ValueError("a channel pool needs at least one channel")
+        if strategy not in (LEAST_OUTSTANDING, ROUND_ROBIN):
+            raise ValueError("unknown channel pool strategy {!r}".format(strategy))
+        self._channels = list(channels)
+        self._strategy = strategy
+        self._outstanding = [0] * len(self._channels)
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def channels(self) -> List[Any]:
+        """List: The pooled channels."""
+        return list(self._channels)
+
+    @property
+    def outstanding(self) -> List[int]:
+        """List[int]: The number of calls in flight on each channel."""
+        with self._lock:
+            return list(self._outstanding)
+
+    def acquire(self) -> int:
+        """Pick a channel for a new call and count the call against it."""
+        size = len(self._channels)
+        with self._lock:
+            start = next(self._turn) % size
+            index = start
+            if self._strategy == LEAST_OUTSTANDING:
+                # Scan from a rotating start so ties are spread evenly.
+                for offset in range(1, size):
+                    candidate = (start + offset) % size
+                    if self._outstanding[candidate] < self._outstanding[index]:
+                        index = candidate
+            self._outstanding[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        """Record that a call on the channel at ``index`` has finished."""
+        with self._lock:
+            self._outstanding[index] -= 1
+
+
+class _PooledMultiCallable:
+    """Dispatches each invocation to the multi-callable of one pooled channel."""
+
+    def __init__(self, balancer: _Balancer, callables: Sequence[Callable]):
+        self._balancer = balancer
+        self._callables = callables
+
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index](*args, **kwargs)
+        finally:
+            self._balancer.release(index)
+
+    def with_call(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index].with_call(*args, **kwargs)
+        finally:
+            self._balancer.release(index)
+
+    def future(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            future = self._callables[index].future(*args, **kwargs)
+        except Exception:
+            self._balancer.release(index)
+            raise
+        future.add_done_callback(lambda _: self._balancer.release(index))
+        return future
+
+
+class _PooledUnaryStream(_PooledMultiCallable):
+    pass
+
+
+class _PooledStreamUnary(_PooledMultiCallable):
+    pass
+
+
+class _PooledStreamStream(_PooledMultiCallable):
+    pass
+
+
+# Register the pooled multi-callables with the gRPC interfaces they stand in
+# for, so that ``google.api_core`` wraps streaming methods as streams.
+grpc.UnaryUnaryMultiCallable.register(_PooledMultiCallable)
+grpc.UnaryStreamMultiCallable.register(_PooledUnaryStream)
+grpc.StreamUnaryMultiCallable.register(_PooledStreamUnary)
+grpc.StreamStreamMultiCallable.register(_PooledStreamStream)
+
+
+class ChannelPool(grpc.Channel):
+    """A ``grpc.Channel`` that spreads calls over several channels.
+
+    Each multi-callable created on the pool holds one multi-callable per
+    pooled channel, and picks one of them for every call. A blocking call
+    counts as in flight until it returns; a streaming call only while it
+    is being started.
+    """
+
+    def __init__(
+        self, channels: Sequence[grpc.Channel], strategy: str = LEAST_OUTSTANDING
+    ):
+        """Instantiate the pool.
+
+        Args:
+            channels (Sequence[grpc.Channel]): The channels to pool.
+            strategy (str): How a channel is picked for each call, either
+                :data:`LEAST_OUTSTANDING` or :data:`ROUND_ROBIN`.
+        """
+        self._balancer = _Balancer(channels, strategy)
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """List[grpc.Channel]: The pooled channels."""
+        return self._balancer.channels
+
+    @property
+    def outstanding(self) -> List[int]:
+        """List[int]: The number of calls in flight on each channel."""
+        return self._balancer.outstanding
+
+    def _pooled(self, cls, kind: str, method: str, *args, **kwargs):
+        return cls(
+            self._balancer,
+            [
+                getattr(channel, kind)(method, *args, **kwargs)
+                for channel in self._balancer.channels
+            ],
+        )
+
+    def unary_unary(self, method, *args, **kwargs):
+        return self._pooled(
+            _PooledMultiCallable, "unary_unary", method, *args, **kwargs
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._pooled(_PooledUnaryStream, "unary_stream", method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._pooled(_PooledStreamUnary, "stream_unary", method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._pooled(
+            _PooledStreamStream, "stream_stream", method, *args, **kwargs
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._balancer.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._balancer.channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self._balancer.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _AsyncPooledMultiCallable:
+    """Dispatches each invocation to the multi-callable of one pooled channel."""
+
+    def __init__(self, balancer: _Balancer, callables: Sequence[Callable]):
+        self._balancer = balancer
+        self._callables = callables
+
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            call = self._callables[index](*args, **kwargs)
+        except Exception:
+            self._balancer.release(index)
+            raise
+        add_done_callback = getattr(call, "add_done_callback", None)
+        if add_done_callback is None:
+            self._balancer.release(index)
+        else:
+            add_done_callback(lambda _: self._balancer.release(index))
+        return call
+
+
+class _AsyncPooledUnaryStream(_AsyncPooledMultiCallable):
+    pass
+
+
+class _AsyncPooledStreamUnary(_AsyncPooledMultiCallable):
+    pass
+
+
+class _AsyncPooledStreamStream(_AsyncPooledMultiCallable):
+    pass
+
+
+aio.UnaryUnaryMultiCallable.register(_AsyncPooledMultiCallable)
+aio.UnaryStreamMultiCallable.register(_AsyncPooledUnaryStream)
+aio.StreamUnaryMultiCallable.register(_AsyncPooledStreamUnary)
+aio.StreamStreamMultiCallable.register(_AsyncPooledStreamStream)
+
+
+class AsyncChannelPool(aio.Channel):
+    """An ``aio.Channel`` that spreads calls over several channels.
+
+    This is the ``asyncio`` counterpart of :class:`ChannelPool`. A call
+    counts as in flight until it is done, streaming calls included.
+    Connectivity is reported for the first channel.
+    """
+
+    def __init__(
+        self, channels: Sequence[aio.Channel], strategy: str = LEAST_OUTSTANDING
+    ):
+        """Instantiate the pool.
+
+        Args:
+            channels (Sequence[aio.Channel]): The channels to pool.
+            strategy (str): How a channel is picked for each call, either
+                :data:`LEAST_OUTSTANDING` or :data:`ROUND_ROBIN`.
+        """
+        self._balancer = _Balancer(channels, strategy)
+
+    @property
+    def channels(self) -> List[aio.Channel]:
+        """List[aio.Channel]: The pooled channels."""
+        return self._balancer.channels
+
+    @property
+    def outstanding(self) -> List[int]:
+        """List[int]: The number of calls in flight on each channel."""
+        return self._balancer.outstanding
+
+    def _pooled(self, cls, kind: str, method: str, *args, **kwargs):
+        return cls(
+            self._balancer,
+            [
+                getattr(channel, kind)(method, *args, **kwargs)
+                for channel in self._balancer.channels
+            ],
+        )
+
+    def unary_unary(self, method, *args, **kwargs):
+        return self._pooled(
+            _AsyncPooledMultiCallable, "unary_unary", method, *args, **kwargs
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._pooled(
+            _AsyncPooledUnaryStream, "unary_stream", method, *args, **kwargs
+        )
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._pooled(
+            _AsyncPooledStreamUnary, "stream_unary", method, *args, **kwargs
+        )
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._pooled(
+            _AsyncPooledStreamStream, "stream_stream", method, *args, **kwargs
+        )
+
+    def get_state(self, try_to_connect: bool = False):
+        return self._balancer.channels[0].get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        return await self._balancer.channels[0].wait_for_state_change(
+            last_observed_state
+        )
+
+    async def channel_ready(self):
+        await asyncio.gather(
+            *(channel.channel_ready() for channel in self._balancer.channels)
+        )
+
+    async def close(self, grace: Optional[float] = None):
+        await asyncio.gather(
+            *(channel.close(grace) for channel in self._balancer.channels)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Bounded concurrent expansion of parent resources into child listings."""
+
+import asyncio
+from concurrent import futures
+import itertools
+import queue
+import threading
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+ErrorCallback = Callable[[Any, Exception], None]
+
+_DONE = object()
+
+
+class _Failure:
+    """Carries an exception raised outside of a single item's expansion."""
+
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def fan_out(
+    items: Iterable[Any],
+    expand: Callable[[Any], Iterable[Any]],
+    *,
+    max_workers: int,
+    on_error: Optional[ErrorCallback] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """Expand many items concurrently on a thread pool.
+
+    ``items`` is consumed lazily on the calling thread, and each item is
+    handed to ``expand`` on a worker thread. Every chunk produced by
+    ``expand`` is yielded as an ``(item, chunk)`` pair in arrival order. At
+    most ``2 * max_workers`` chunks are buffered; workers wait for the
+    caller once the buffer is full.
+
+    A failure while expanding one item does not affect the others. It is
+    passed to ``on_error`` if given. Otherwise the first failure is raised
+    once every other item has been expanded. Errors raised by ``items``
+    itself propagate immediately.
+
+    Args:
+        items (Iterable[Any]): The items to expand.
+        expand (Callable[[Any], Iterable[Any]]): Returns the chunks for
+            one item, typically the pages of a ``List*`` call.
+        max_workers (int): The maximum number of items expanded at once.
+        on_error (Optional[Callable[[Any, Exception], None]]): Called with
+            the item and the exception when expanding an item fails.
+
+    Yields:
+        Tuple[Any, Any]: ``(item, chunk)`` pairs.
+
+    Raises:
+        ValueError: If ``max_workers`` is not positive.
+    """
+    if max_workers < 1:
+        raise ValueError(
+            "max_workers must be a positive integer, got {}".format(max_workers)
+        )
+
+    results: "queue.Queue[Any]" = queue.Queue()
+    budget = threading.Semaphore(2 * max_workers)
+    stopped = threading.Event()
+
+    def work(key, item):
+        try:
+            for chunk in expand(item):
+                budget.acquire()
+                if stopped.is_set():
+                    return
+                results.put((item, chunk, None))
+        except Exception as exc:
+            results.put((item, None, exc))
+        finally:
+            results.put((_DONE, key))
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="dataplex-fan-out"
+    )
+    # The futures of the items still being expanded, by key.
+    in_flight = {}
+    keys = itertools.count()
+    first_error = None
+    try:
+        items = iter(items)
+        exhausted = False
+        while True:
+            # Keep the pool saturated without draining ``items`` up front.
+            while not exhausted and len(in_flight) < 2 * max_workers:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    key = next(keys)
+                    in_flight[key] = executor.submit(work, key, item)
+            if not in_flight:
+                break
+
+            entry = results.get()
+            if entry[0] is _DONE:
+                del in_flight[entry[1]]
+                continue
+            item, chunk, exc = entry
+            if exc is not None:
+                if on_error is not None:
+                    on_error(item, exc)
+                elif first_error is None:
+                    first_error = exc
+                continue
+            budget.release()
+            yield item, chunk
+    finally:
+        stopped.set()
+        for future in in_flight.values():
+            future.cancel()
+        # Wake any worker waiting for buffer space so that it can exit.
+        for _ in range(max_workers):
+            budget.release()
+        executor.shutdown(wait=False)
+
+    if first_error is not None:
+        raise first_error
+
+
+async def async_fan_out(
+    items: AsyncIterable[Any],
+    expand: Callable[[Any], AsyncIterator[Any]],
+    *,
+    max_concurrency: int,
+    on_error: Optional[ErrorCallback] = None,
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """Expand many items concurrently on the running event loop.
+
+    This is the ``asyncio`` counterpart of :func:`fan_out`. A fixed set of
+    ``max_concurrency`` worker tasks pull items from ``items`` and iterate
+    ``expand(item)``; chunks are yielded as ``(item, chunk)`` pairs in
+    arrival order. All tasks are cancelled when iteration stops early.
+
+    Args:
+        items (AsyncIterable[Any]): The items to expand.
+        expand (Callable[[Any], AsyncIterator[Any]]): Returns the chunks
+            for one item, typically the pages of a ``List*`` call.
+        max_concurrency (int): The maximum number of items expanded at
+            once.
+        on_error (Optional[Callable[[Any, Exception], None]]): Called with
+            the item and the exception when expanding an item fails.
+
+    Yields:
+        Tuple[Any, Any]: ``(item, chunk)`` pairs.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is not positive.
+    """
+    if max_concurrency < 1:
+        raise ValueError(
+            "max_concurrency must be a positive integer, got {}".format(max_concurrency)
+        )
+
+    work: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max_concurrency)
+    results: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=2 * max_concurrency)
+
+    async def feed():
+        try:
+            async for item in items:
+                await work.put(item)
+        except asyncio.CancelledError:
+            # The workers are cancelled too; nobody would take the
+            # sentinels from the queue.
+            raise
+        except Exception as exc:
+            await results.put(_Failure(exc))
+        for _ in range(max_concurrency):
+            await work.put(_DONE)
+
+    async def worker():
+        while True:
+            item = await work.get()
+            if item is _DONE:
+                await results.put(_DONE)
+                return
+            try:
+                async for chunk in expand(item):
+                    await results.put((item, chunk, None))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await results.put((item, None, exc))
+
+    tasks = [asyncio.ensure_future(feed())]
+    tasks.extend(asyncio.ensure_future(worker()) for _ in range(max_concurrency))
+    first_error = None
+    try:
+        remaining = max_concurrency
+        while remaining:
+            entry = await results.get()
+            if entry is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(entry, _Failure):
+                raise entry.exception
+            item, chunk, exc = entry
+            if exc is not None:
+                if on_error is not None:
+                    on_error(item, exc)
+                elif first_error is None:
+                    first_error = exc
+                continue
+            yield item, chunk
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if first_error is not None:
+        raise first_error
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Installation of client interceptors on the channels of the transports."""
+
+import functools
+import re
+from typing import Any, Dict, Optional, Sequence, Union
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+_ASYNC_KINDS = (
+    aio.UnaryUnaryClientInterceptor,
+    aio.UnaryStreamClientInterceptor,
+    aio.StreamUnaryClientInterceptor,
+    aio.StreamStreamClientInterceptor,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def method_name(path: Union[str, bytes]) -> str:
+    """Return the transport method name of a gRPC method path.
+
+    ``"/google.cloud.dataplex.v1.MetadataService/GetEntity"`` becomes
+    ``"get_entity"``.
+    """
+    if isinstance(path, bytes):
+        path = path.decode()
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", path.rsplit("/", 1)[-1]).lower()
+
+
+def intercept_channel(channel: grpc.Channel, interceptors: Sequence) -> grpc.Channel:
+    """Return ``channel`` with ``interceptors`` applied, outermost first."""
+    if not interceptors:
+        return channel
+    return grpc.intercept_channel(channel, *interceptors)
+
+
+def async_channel_kwargs(
+    interceptors: Sequence, channel: Optional[aio.Channel] = None
+) -> Dict[str, Any]:
+    """Return the ``create_channel`` arguments installing ``interceptors``.
+
+    ``aio`` channels only accept interceptors when they are created, so a
+    transport can only install them on the channels it opens itself.
+
+    Args:
+        interceptors (Sequence): The asyncio client interceptors.
+        channel (Optional[aio.Channel]): The channel passed to the
+            transport, if any.
+
+    Raises:
+        ValueError: If interceptors are given along with ``channel``, or
+            one of them is not an asyncio client interceptor.
+    """
+    if not interceptors:
+        return {}
+    if channel is not None:
+        raise ValueError(
+            "interceptors cannot be installed on an existing channel; pass "
+            "them to the channel when creating it instead"
+        )
+    for interceptor in interceptors:
+        if not isinstance(interceptor, _ASYNC_KINDS):
+            raise ValueError(
+                "{!r} is not an asyncio client interceptor".format(interceptor)
+            )
+    return {"interceptors": list(interceptors)}
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Deferred imports for the names re-exported by package ``__init__`` modules."""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def attach(
+    package: str, exports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+    Each exported name is imported from its module on first access and
+    then stored on the package, so later lookups are plain attribute reads.
+    Python 3.6 has no module-level ``__getattr__`` (PEP 562), so there
+    every name is imported right away instead.
+
+    Args:
+        package (str): The ``__name__`` of the package.
+        exports (Mapping[str, str]): The module defining each exported
+            name, either absolute or relative to ``package``.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The
+        package's ``__getattr__`` and ``__dir__``.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(package, name)
+            ) from None
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    if sys.version_info < (3, 7):  # pragma: NO COVER
+        for name in exports:
+            __getattr__(name)
+
+    return __getattr__, __dir__
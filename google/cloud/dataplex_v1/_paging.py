@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shared helpers for the ``List*`` pagers of both services."""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, NamedTuple
+
+from google.api_core import exceptions as core_exceptions
+
+
+class _Failure:
+    """Carries an exception raised while fetching a page to the consumer."""
+
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+_DONE = object()
+
+
+def prefetch_pages(pager: Any, depth: int) -> Iterator[Any]:
+    """Iterate the pages of a synchronous pager, fetching ahead of the caller.
+
+    Page tokens chain, so at most one ``List*`` RPC is in flight at any
+    time. A background thread issues the next RPC as soon as the previous
+    response arrives, and stops once ``depth`` pages are waiting to be
+    consumed. The pager's most recent response is updated as each page is
+    handed to the caller, so attribute lookup on the pager behaves exactly
+    as it does without prefetching.
+
+    Args:
+        pager: A synchronous pager exposing ``_method``, ``_request``,
+            ``_response`` and ``_metadata``.
+        depth (int): The maximum number of pages fetched ahead of the
+            caller. Must be positive.
+
+    Yields:
+        The pager's responses, in order, starting with the initial one.
+
+    Raises:
+        ValueError: If ``depth`` is not positive.
+    """
+    if depth < 1:
+        raise ValueError("depth must be a positive integer, got {}".format(depth))
+
+    pages: "queue.Queue[Any]" = queue.Queue()
+    budget = threading.Semaphore(depth)
+    stopped = threading.Event()
+    method, request, metadata = pager._method, pager._request, pager._metadata
+
+    def produce(response):
+        try:
+            while response.next_page_token:
+                budget.acquire()
+                if stopped.is_set():
+                    return
+                request.page_token = response.next_page_token
+                response = method(request, metadata=metadata)
+                pages.put(response)
+        except Exception as exc:
+            pages.put(_Failure(exc))
+        else:
+            pages.put(_DONE)
+
+    producer = threading.Thread(
+        target=produce,
+        args=(pager._response,),
+        name="dataplex-page-prefetch",
+        daemon=True,
+    )
+    producer.start()
+    try:
+        yield pager._response
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            budget.release()
+            pager._response = item
+            yield item
+    finally:
+        # Wake the producer if it is waiting for budget so it can exit.
+        stopped.set()
+        budget.release()
+
+
+async def lookahead_pages(pager: Any, depth: int) -> AsyncIterator[Any]:
+    """Iterate the pages of an asynchronous pager, fetching ahead of the caller.
+
+    This is the ``asyncio`` counterpart of :func:`prefetch_pages`. The next
+    ``List*`` call is scheduled as a task as soon as the previous response
+    arrives, and the task waits once ``depth`` pages are waiting to be
+    consumed. The task is cancelled when iteration stops early.
+
+    Args:
+        pager: An asynchronous pager exposing ``_method``, ``_request``,
+            ``_response`` and ``_metadata``.
+        depth (int): The maximum number of pages fetched ahead of the
+            caller. Must be positive.
+
+    Yields:
+        The pager's responses, in order, starting with the initial one.
+
+    Raises:
+        ValueError: If ``depth`` is not positive.
+    """
+    if depth < 1:
+        raise ValueError("depth must be a positive integer, got {}".format(depth))
+
+    pages: "asyncio.Queue[Any]" = asyncio.Queue()
+    budget = asyncio.Semaphore(depth)
+    method, request, metadata = pager._method, pager._request, pager._metadata
+
+    async def produce(response):
+        try:
+            while response.next_page_token:
+                await budget.acquire()
+                request.page_token = response.next_page_token
+                response = await method(request, metadata=metadata)
+                pages.put_nowait(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            pages.put_nowait(_Failure(exc))
+        else:
+            pages.put_nowait(_DONE)
+
+    producer = asyncio.ensure_future(produce(pager._response))
+    try:
+        yield pager._response
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            budget.release()
+            pager._response = item
+            yield item
+    finally:
+        producer.cancel()
+
+
+def checkpoint_pages(pager: Any, pages: Iterator[Any]) -> Iterator[Any]:
+    """Iterate ``pages``, recording the pager's position as they are consumed.
+
+    The position after a page is saved to the pager's checkpoint file only
+    once the caller asks for the page after it, every ``every`` pages, so
+    that a page is never checkpointed before the caller is done with it.
+    The checkpoint is discarded when the listing completes.
+
+    Args:
+        pager: A synchronous pager exposing ``checkpoint`` and
+            ``_checkpoint_file``.
+        pages: The pager's pages.
+
+    Yields:
+        The pages, unchanged.
+    """
+    store = pager._checkpoint_file
+    for count, page in enumerate(pages, 1):
+        yield page
+        if count % store.every == 0:
+            store.save(pager.checkpoint)
+    store.discard(pager.checkpoint.fingerprint)
+
+
+async def checkpoint_pages_async(
+    pager: Any, pages: AsyncIterator[Any]
+) -> AsyncIterator[Any]:
+    """The ``asyncio`` counterpart of :func:`checkpoint_pages`."""
+    # The file is written and synced to disk outside of the event loop.
+    loop = asyncio.get_event_loop()
+    store = pager._checkpoint_file
+    count = 0
+    async for page in pages:
+        yield page
+        count += 1
+        if count % store.every == 0:
+            await loop.run_in_executor(None, store.save, pager.checkpoint)
+    await loop.run_in_executor(None, store.discard, pager.checkpoint.fingerprint)
+
+
+def completed_listing(response_type: Any) -> Callable[..., Any]:
+    """Return a stand-in for a ``List*`` RPC answering an empty last page.
+
+    It serves listings resumed from a complete checkpoint, so that they
+    list nothing instead of starting over.
+
+    Args:
+        response_type: The ``List*`` response message.
+    """
+
+    def method(request, **kwargs):
+        return response_type()
+
+    return method
+
+
+def completed_listing_async(response_type: Any) -> Callable[..., Awaitable[Any]]:
+    """The ``asyncio`` counterpart of :func:`completed_listing`."""
+
+    async def method(request, **kwargs):
+        return response_type()
+
+    return method
+
+
+class PageLimits(NamedTuple):
+    """The paging limits of a ``List*`` method.
+
+    Attributes:
+        items (str): The repeated response field holding the page's items.
+        maximum (int): The largest page size the service honours.
+    """
+
+    items: str
+    maximum: int
+
+
+PAGE_LIMITS = {
+    "list_lakes": PageLimits("lakes", 1000),
+    "list_lake_actions": PageLimits("actions", 1000),
+    "list_zones": PageLimits("zones", 1000),
+    "list_zone_actions": PageLimits("actions", 1000),
+    "list_assets": PageLimits("assets", 1000),
+    "list_asset_actions": PageLimits("actions", 1000),
+    "list_tasks": PageLimits("tasks", 1000),
+    "list_jobs": PageLimits("jobs", 1000),
+    "list_entities": PageLimits("entities", 1000),
+    "list_partitions": PageLimits("partitions", 1000),
+}
+
+
+class PageSizeTuner:
+    """Adapts the page size of a listing to how the service responds.
+
+    Every service in this package returns 10 items per page unless told
+    otherwise, so long listings spend most of their time on round trips.
+    The tuner starts larger, doubles the page size after each full page
+    that came back in less than half of ``target_latency``, and halves it
+    after a page slower than ``target_latency``. The size is also capped
+    so that a page is expected to stay below ``max_response_bytes``, well
+    within the default 4 MiB gRPC message limit. A page that exceeds its
+    deadline is requested again, with the same page token, at half the
+    size.
+
+    Only ``page_size`` changes between requests; the page token and every
+    other field are left untouched.
+
+    Args:
+        limits (PageLimits): The limits of the method being listed.
+        page_size (int): The size of the first page.
+        min_page_size (int): The page size never drops below this.
+        target_latency (float): The number of seconds a page should take.
+        max_response_bytes (int): The largest response to aim for.
+        clock (Callable[[], float]): The monotonic clock to use.
+    """
+
+    def __init__(
+        self,
+        limits: PageLimits,
+        *,
+        page_size: int = 100,
+        min_page_size: int = 10,
+        target_latency: float = 1.0,
+        max_response_bytes: int = 2 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limits = limits
+        self.min_page_size = min(min_page_size, limits.maximum)
+        self.page_size = self._clamp(page_size)
+        self.target_latency = target_latency
+        self.max_response_bytes = max_response_bytes
+        self._clock = clock
+
+    @classmethod
+    def for_method(cls, name: str, page_size: int = 0, **kwargs) -> "PageSizeTuner":
+        """Return a tuner for the ``List*`` transport method ``name``.
+
+        A ``page_size`` already set on the request is the starting point;
+        otherwise the tuner's own default is.
+        """
+        if page_size:
+            kwargs["page_size"] = page_size
+        return cls(PAGE_LIMITS[name], **kwargs)
+
+    def _clamp(self, page_size: int) -> int:
+        return max(self.min_page_size, min(self.limits.maximum, page_size))
+
+    def observe(self, latency: float, response_bytes: int, items: int) -> None:
+        """Pick the size of the next page from the outcome of the last one."""
+        page_size = self.page_size
+        if latency > self.target_latency:
+            page_size //= 2
+        elif latency < self.target_latency / 2 and items >= page_size:
+            page_size *= 2
+        if items and response_bytes:
+            page_size = min(
+                page_size, self.max_response_bytes * items // response_bytes
+            )
+        self.page_size = self._clamp(page_size)
+
+    def shrink(self) -> bool:
+        """Halve the page size after a deadline was exceeded.
+
+        Returns:
+            bool: ``False`` if the page size was already at its minimum.
+        """
+        page_size = self._clamp(self.page_size // 2)
+        if page_size == self.page_size:
+            return False
+        self.page_size = page_size
+        return True
+
+    def _observe_response(self, start: float, response: Any) -> None:
+        pb = type(response).pb(response)
+        self.observe(
+            self._clock() - start, pb.ByteSize(), len(getattr(pb, self.limits.items)),
+        )
+
+    def wrap(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``method`` setting and tuning the request's page size."""
+
+        def tuned(request, **kwargs):
+            while True:
+                request.page_size = self.page_size
+                start = self._clock()
+                try:
+                    response = method(request, **kwargs)
+                except core_exceptions.DeadlineExceeded:
+                    if not self.shrink():
+                        raise
+                    continue
+                self._observe_response(start, response)
+                return response
+
+        return tuned
+
+    def wrap_async(
+        self, method: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Return the ``asyncio`` counterpart of :meth:`wrap`."""
+
+        async def tuned(request, **kwargs):
+            while True:
+                request.page_size = self.page_size
+                start = self._clock()
+                try:
+                    response = await method(request, **kwargs)
+                except core_exceptions.DeadlineExceeded:
+                    if not self.shrink():
+                        raise
+                    continue
+                self._observe_response(start, response)
+                return response
+
+        return tuned
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Parsing of resource names against the templates of the ``*_path`` helpers."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class PathTemplate:
+    """A resource name template such as ``projects/{project}/locations/{location}``.
+
+    :meth:`parse` gives the same results as matching the name against the
+    template with one ``(?P<name>.+?)`` group per variable, as the
+    generated ``parse_*_path`` helpers do. Names are split on ``/`` rather
+    than matched, so the cost is linear in the length of the name; the
+    precompiled pattern is only consulted for names that do not split
+    cleanly, such as those with a ``/`` inside a variable other than the
+    last, or with a line break, which ``.`` does not match.
+    """
+
+    __slots__ = ("template", "names", "_literals", "_maxsplit", "_pattern")
+
+    def __init__(self, template: str):
+        """Instantiate the template.
+
+        Args:
+            template (str): Alternating literal segments and ``{variable}``
+                segments, starting with a literal.
+        """
+        segments = template.split("/")
+        self.template = template
+        self.names: Tuple[str, ...] = tuple(s[1:-1] for s in segments[1::2])
+        self._literals = segments[0::2]
+        self._maxsplit = len(segments) - 1
+        self._pattern = re.compile(
+            "^"
+            + "/".join(
+                "(?P<{}>.+?)".format(s[1:-1]) if i % 2 else re.escape(s)
+                for i, s in enumerate(segments)
+            )
+            + "$"
+        )
+
+    def parse(self, path: str) -> Dict[str, str]:
+        """Parse a resource name into its variables.
+
+        Args:
+            path (str): The resource name.
+
+        Returns:
+            Dict[str, str]: The value of each variable, or an empty dict if
+            the name does not match the template.
+        """
+        segments = path.split("/", self._maxsplit)
+        if (
+            segments[0::2] == self._literals
+            and len(segments) > self._maxsplit
+            and "" not in segments
+            and "\n" not in path
+        ):
+            # The last variable takes the rest of the name, as ``.+?$`` does.
+            return dict(zip(self.names, segments[1::2]))
+        m = self._pattern.match(path)
+        return m.groupdict() if m else {}
+
+    def parse_many(self, paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parse many resource names into columns.
+
+        Args:
+            paths (Iterable[str]): The resource names.
+
+        Returns:
+            Dict[str, List[Optional[str]]]: One list per variable, holding
+            the value for each name in order, or ``None`` where the name
+            does not match the template.
+        """
+        columns: Dict[str, List[Optional[str]]] = {name: [] for name in self.names}
+        appends = [columns[name].append for name in self.names]
+        literals = self._literals
+        maxsplit = self._maxsplit
+        for path in paths:
+            segments = path.split("/", maxsplit)
+            if (
+                segments[0::2] == literals
+                and len(segments) > maxsplit
+                and "" not in segments
+                and "\n" not in path
+            ):
+                values = segments[1::2]
+            else:
+                parsed = self.parse(path)
+                values = [parsed.get(name) for name in self.names]
+            for append, value in zip(appends, values):
+                append(value)
+        return columns
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.template)
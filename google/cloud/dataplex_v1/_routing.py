@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Routing headers of the clients' calls, memoized per resource name."""
+
+import functools
+from typing import Tuple
+
+from google.api_core import gapic_v1
+
+# The number of headers kept. api_core keeps only a few dozen encoded
+# parameters, fewer than the resources a busy client calls on.
+CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def header(field: str, value: str) -> Tuple[str, str]:
+    """Return the metadata routing a call by a single request field.
+
+    The same as ``gapic_v1.routing_header.to_grpc_metadata(((field, value),))``,
+    encoded once per field and value.
+
+    Args:
+        field (str): The path of the field in the request, such as
+            ``"name"`` or ``"lake.name"``.
+        value (str): The value of the field.
+
+    Returns:
+        Tuple[str, str]: The metadata key and value.
+    """
+    return gapic_v1.routing_header.to_grpc_metadata(((field, value),))
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Sharing of identical in-flight RPCs between coroutines."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Sequence, Tuple
+
+import proto  # type: ignore
+
+
+class SingleFlight:
+    """Lets concurrent identical calls share one RPC.
+
+    A call is identified by its request type, which is distinct for every
+    method, its serialized request and its metadata, which carries the
+    routing header. While a call is in flight, identical calls wait for its
+    response instead of sending their own. Each caller receives its own copy
+    of the response, and the retry and timeout of the first caller apply.
+
+    The shared RPC runs in its own task, so cancelling one waiting caller
+    does not cancel the RPC for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def call(
+        self,
+        rpc: Callable[..., Awaitable[proto.Message]],
+        request: proto.Message,
+        *,
+        metadata: Sequence[Tuple[str, str]],
+        **kwargs: Any,
+    ) -> proto.Message:
+        """Send ``request`` through ``rpc``, or join an identical call.
+
+        Args:
+            rpc (Callable[..., Awaitable[proto.Message]]): The wrapped RPC
+                method.
+            request (proto.Message): The request to send.
+            metadata (Sequence[Tuple[str, str]]): The request metadata,
+                including the routing header.
+            kwargs: Further arguments for ``rpc``, such as ``retry`` and
+                ``timeout``.
+
+        Returns:
+            proto.Message: A copy of the response.
+        """
+        key = (type(request), type(request).serialize(request), tuple(metadata))
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(rpc(request, metadata=metadata, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        response = await asyncio.shield(task)
+        return type(response)(response)
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Coalesced, concurrent ``GetEntity`` and ``GetPartition`` lookups."""
+
+from concurrent import futures
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+import proto  # type: ignore
+
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+
+EntityView = metadata_.GetEntityRequest.EntityView
+
+
+class MetadataBatcher:
+    """Front-end to a metadata client that collapses duplicate lookups.
+
+    Requests for the same resource that overlap in time share a single
+    RPC: the first caller issues it and every later caller waits for its
+    response. :meth:`get_entities` and :meth:`get_partitions` look up many
+    names at once, dispatching the distinct ones concurrently on a pool of
+    ``max_workers`` threads, and return the results in input order.
+
+    Nothing is kept once an RPC completes; combine with a
+    :class:`~google.cloud.dataplex_v1.caching.ResponseCache` on the client
+    to also serve repeated lookups.
+
+    .. code-block:: python
+
+        with MetadataBatcher(MetadataServiceClient()) as batcher:
+            entities = batcher.get_entities(names, view=EntityView.SCHEMA)
+
+    Attributes:
+        rpcs (int): The number of RPCs issued.
+        coalesced (int): The number of lookups served by an RPC that was
+            already in flight.
+    """
+
+    def __init__(
+        self,
+        client: MetadataServiceClient,
+        *,
+        max_workers: int = 8,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        """Instantiate the batcher.
+
+        Args:
+            client (google.cloud.dataplex_v1.services.metadata_service.MetadataServiceClient):
+                The client used to issue the RPCs.
+            max_workers (int): The maximum number of RPCs issued at the
+                same time by :meth:`get_entities` and
+                :meth:`get_partitions`.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+        """
+        if max_workers < 1:
+            raise ValueError(
+                "max_workers must be a positive integer, got {}".format(max_workers)
+            )
+        self._client = client
+        self._options = {"retry": retry, "timeout": timeout, "metadata": metadata}
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dataplex-batch"
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[str, bytes], futures.Future] = {}
+        self.rpcs = 0
+        self.coalesced = 0
+
+    def get_entity(self, name: str, *, view: EntityView = None) -> metadata_.Entity:
+        """Get a metadata entity, sharing any identical lookup in flight.
+
+        Args:
+            name (str): The resource name of the entity.
+            view (google.cloud.dataplex_v1.types.GetEntityRequest.EntityView):
+                The view of the entity to return.
+
+        Returns:
+            google.cloud.dataplex_v1.types.Entity: The entity.
+        """
+        request = metadata_.GetEntityRequest(name=name, view=view)
+        return self._result(self._submit("get_entity", request, inline=True))
+
+    def get_partition(self, name: str) -> metadata_.Partition:
+        """Get a metadata partition, sharing any identical lookup in flight.
+
+        Args:
+            name (str): The resource name of the partition.
+
+        Returns:
+            google.cloud.dataplex_v1.types.Partition: The partition.
+        """
+        request = metadata_.GetPartitionRequest(name=name)
+        return self._result(self._submit("get_partition", request, inline=True))
+
+    def get_entities(
+        self,
+        names: Iterable[str],
+        *,
+        view: EntityView = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[metadata_.Entity, Exception]]:
+        """Get many metadata entities concurrently.
+
+        Args:
+            names (Iterable[str]): The resource names of the entities.
+                Repeated names are looked up once.
+            view (google.cloud.dataplex_v1.types.GetEntityRequest.EntityView):
+                The view of the entities to return.
+            return_exceptions (bool): Whether failed lookups are returned
+                in place of their entity instead of raised.
+
+        Returns:
+            List[google.cloud.dataplex_v1.types.Entity]: The entities, in
+            the order of ``names``.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: The first failed
+                lookup in input order, once every lookup has completed,
+                unless ``return_exceptions`` is set.
+        """
+        requests = [metadata_.GetEntityRequest(name=name, view=view) for name in names]
+        return self._gather("get_entity", requests, return_exceptions)
+
+    def get_partitions(
+        self, names: Iterable[str], *, return_exceptions: bool = False,
+    ) -> List[Union[metadata_.Partition, Exception]]:
+        """Get many metadata partitions concurrently.
+
+        Args:
+            names (Iterable[str]): The resource names of the partitions.
+                Repeated names are looked up once.
+            return_exceptions (bool): Whether failed lookups are returned
+                in place of their partition instead of raised.
+
+        Returns:
+            List[google.cloud.dataplex_v1.types.Partition]: The
+            partitions, in the order of ``names``.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: The first failed
+                lookup in input order, once every lookup has completed,
+                unless ``return_exceptions`` is set.
+        """
+        requests = [metadata_.GetPartitionRequest(name=name) for name in names]
+        return self._gather("get_partition", requests, return_exceptions)
+
+    def _gather(
+        self, method: str, requests: List[proto.Message], return_exceptions: bool,
+    ) -> List[Union[proto.Message, Exception]]:
+        pending = [self._submit(method, request) for request in requests]
+        futures.wait(pending)
+        results: List[Union[proto.Message, Exception]] = []
+        for future in pending:
+            exc = future.exception()
+            if exc is None:
+                results.append(self._result(future))
+            elif return_exceptions:
+                results.append(exc)
+            else:
+                raise exc
+        return results
+
+    def _submit(
+        self, method: str, request: proto.Message, inline: bool = False
+    ) -> futures.Future:
+        key = (method, type(request).serialize(request))
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = self._in_flight[key] = futures.Future()
+            self.rpcs += 1
+
+        if inline:
+            self._run(key, future, method, request)
+        else:
+            try:
+                self._executor.submit(self._run, key, future, method, request)
+            except Exception as exc:
+                self._finish(key, future, exc=exc)
+        return future
+
+    def _run(
+        self,
+        key: Tuple[str, bytes],
+        future: futures.Future,
+        method: str,
+        request: proto.Message,
+    ) -> None:
+        try:
+            response = getattr(self._client, method)(request=request, **self._options)
+        except Exception as exc:
+            self._finish(key, future, exc=exc)
+        else:
+            self._finish(key, future, response=response)
+
+    def _finish(self, key, future, response=None, exc=None) -> None:
+        # Retire the key first so that later lookups issue a fresh RPC.
+        with self._lock:
+            del self._in_flight[key]
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(response)
+
+    @staticmethod
+    def _result(future: futures.Future) -> proto.Message:
+        # Every caller gets its own copy of the shared response.
+        response = future.result()
+        return type(response)(response)
+
+    def close(self) -> None:
+        """Wait for the lookups in flight and release the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+__all__ = (
+    "EntityView",
+    "MetadataBatcher",
+)
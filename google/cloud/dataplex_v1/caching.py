@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side caching of ``Get*`` responses."""
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+import proto  # type: ignore
+
+#: Seconds to keep the responses of each method, for the methods cached by default.
+DEFAULT_TTLS: Mapping[str, float] = {
+    "get_lake": 60.0,
+    "get_zone": 60.0,
+    "get_asset": 60.0,
+    "get_entity": 60.0,
+    "get_partition": 60.0,
+}
+
+
+class _Entry:
+    __slots__ = ("name", "response", "expires")
+
+    def __init__(self, name: str, response: proto.Message, expires: float):
+        self.name = name
+        self.response = response
+        self.expires = expires
+
+
+class ResponseCache:
+    """A thread-safe TTL and LRU bounded cache of ``Get*`` responses.
+
+    Pass an instance as the ``cache`` argument of
+    :class:`~google.cloud.dataplex_v1.services.dataplex_service.DataplexServiceClient`
+    or
+    :class:`~google.cloud.dataplex_v1.services.metadata_service.MetadataServiceClient`
+    to serve repeated lookups of the same resource without an RPC. A single
+    cache may be shared by several clients.
+
+    Entries are keyed by method and by the full request, so ``get_entity``
+    calls with different views are cached separately. Each entry expires
+    after the TTL of its method, and the least recently used entries are
+    dropped once ``max_size`` is reached. Clients evict a resource and
+    everything beneath it when they update or delete it; other writers are
+    only picked up once the entry expires.
+
+    Responses are copied on the way in and out, so callers may freely
+    modify what they get back.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1024,
+        ttls: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Instantiate the cache.
+
+        Args:
+            max_size (int): The maximum number of responses held.
+            ttls (Optional[Mapping[str, float]]): Seconds to keep the
+                responses of each method, keyed by client method name.
+                Methods missing from the mapping, or mapped to ``0``, are
+                not cached. Defaults to :data:`DEFAULT_TTLS`.
+            clock (Callable[[], float]): The monotonic clock used for
+                expiry.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+        self._max_size = max_size
+        self._ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, bytes], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def caches(self, method: str) -> bool:
+        """Return whether responses of ``method`` are cached."""
+        return self._ttls.get(method, 0) > 0
+
+    @staticmethod
+    def _key(method: str, request: proto.Message) -> Tuple[str, bytes]:
+        return method, type(request).serialize(request)
+
+    def get(self, method: str, request: proto.Message) -> Optional[proto.Message]:
+        """Look up the cached response to a request.
+
+        Args:
+            method (str): The client method name, e.g. ``"get_entity"``.
+            request (proto.Message): The request being sent.
+
+        Returns:
+            Optional[proto.Message]: A copy of the cached response, or
+            ``None`` if there is no live entry.
+        """
+        if not self.caches(method):
+            return None
+        key = self._key(method, request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            response = entry.response
+        return type(response)(response)
+
+    def put(self, method: str, request: proto.Message, response: proto.Message) -> None:
+        """Store the response to a request.
+
+        Args:
+            method (str): The client method name, e.g. ``"get_entity"``.
+            request (proto.Message): The request that was sent. Its
+                ``name`` field identifies the cached resource.
+            response (proto.Message): The response received.
+        """
+        if not self.caches(method):
+            return
+        key = self._key(method, request)
+        entry = _Entry(
+            request.name, type(response)(response), self._clock() + self._ttls[method],
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def revalidate(self, method: str, resource: proto.Message) -> int:
+        """Refresh or drop cached copies of a resource using its ``etag``.
+
+        Listing calls return the current ``etag`` of every entity and
+        partition. Passing such a listed resource here extends the life of
+        cached entries with the same ``etag`` and evicts those whose
+        ``etag`` differs, without fetching the resource again.
+
+        Args:
+            method (str): The client method whose entries to check, e.g.
+                ``"get_entity"``.
+            resource (proto.Message): A freshly listed resource with
+                ``name`` and ``etag`` fields.
+
+        Returns:
+            int: The number of entries refreshed.
+        """
+        return self.revalidate_many(method, (resource,))
+
+    def revalidate_many(self, method: str, resources: Iterable[proto.Message]) -> int:
+        """Like :meth:`revalidate`, for every resource of a listing at once.
+
+        Args:
+            method (str): The client method whose entries to check, e.g.
+                ``"get_entity"``.
+            resources (Iterable[proto.Message]): Freshly listed resources
+                with ``name`` and ``etag`` fields, such as a page.
+
+        Returns:
+            int: The number of entries refreshed.
+        """
+        if not self.caches(method):
+            return 0
+        etags = {resource.name: resource.etag for resource in resources}
+        refreshed = 0
+        expires = self._clock() + self._ttls[method]
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if key[0] != method or entry.name not in etags:
+                    continue
+                if entry.response.etag == etags[entry.name]:
+                    entry.expires = expires
+                    refreshed += 1
+                else:
+                    del self._entries[key]
+        return refreshed
+
+    def invalidate(self, name: str, *, children: bool = True) -> int:
+        """Evict every cached response for a resource.
+
+        Args:
+            name (str): The resource name to evict.
+            children (bool): Whether to also evict resources whose names
+                are nested under ``name``.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        prefix = name + "/"
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.name == name or (children and entry.name.startswith(prefix))
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Evict every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+
+def evict_on_completion(future, cache, name: str) -> None:
+    """Evict ``name`` from ``cache`` once an operation future completes.
+
+    ``add_done_callback`` would poll the operation on a thread of its own;
+    the resource is instead evicted when the caller's own ``done()`` or
+    ``result()`` first sees the operation complete.
+
+    Args:
+        future (google.api_core.operation.Operation): The operation
+            changing the resource.
+        cache (google.cloud.dataplex_v1.caching.ResponseCache): The cache
+            to evict from.
+        name (str): The resource name to evict, with everything beneath it.
+    """
+    refresh_and_update = future._refresh_and_update
+
+    def refresh_evicting(*args, **kwargs):
+        pending = not future.operation.done
+        refresh_and_update(*args, **kwargs)
+        if pending and future.operation.done:
+            cache.invalidate(name)
+
+    future._refresh_and_update = refresh_evicting
+
+
+__all__ = (
+    "DEFAULT_TTLS",
+    "ResponseCache",
+)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Checkpoints of ``List*`` iterations, to resume long listings."""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, NamedTuple, Optional
+
+import proto  # type: ignore
+
+
+class Checkpoint(NamedTuple):
+    """A position in a listing.
+
+    Attributes:
+        fingerprint (str): Identifies the listing: a digest of its request,
+            leaving out the page token and page size.
+        page_token (str): The token of the next page to read, ``""`` once
+            the listing is complete.
+    """
+
+    fingerprint: str
+    page_token: str
+
+    @property
+    def complete(self) -> bool:
+        """bool: Whether the listing had no page left to read. Resuming
+        from a complete checkpoint lists nothing, rather than starting
+        over."""
+        return not self.page_token
+
+
+def fingerprint(request: proto.Message) -> str:
+    """Return the fingerprint of the listing made by a ``List*`` request.
+
+    Requests that differ only in their page token or page size list the
+    same resources, and have the same fingerprint.
+
+    Args:
+        request (proto.Message): A ``List*`` request.
+
+    Returns:
+        str: A hexadecimal digest.
+    """
+    pb = type(request).pb(request)
+    listing = type(pb)()
+    listing.CopyFrom(pb)
+    listing.ClearField("page_token")
+    listing.ClearField("page_size")
+    digest = hashlib.sha256(pb.DESCRIPTOR.full_name.encode())
+    digest.update(b"\0")
+    digest.update(listing.SerializeToString(deterministic=True))
+    return digest.hexdigest()
+
+
+def resume_token(request: proto.Message, checkpoint: Checkpoint) -> str:
+    """Return the page token resuming ``request`` from ``checkpoint``.
+
+    Raises:
+        ValueError: If the checkpoint is of another listing.
+    """
+    if checkpoint.fingerprint != fingerprint(request):
+        raise ValueError("the checkpoint was taken from a different listing")
+    return checkpoint.page_token
+
+
+class CheckpointFile:
+    """Keeps the checkpoints of listings in a local file.
+
+    Pass it to a ``List*`` method as ``checkpoint_file``. The pager then
+    records its position every ``every`` pages, once the caller has moved
+    past them, and forgets it when the listing completes. Listing again
+    with the same request and file resumes from the recorded position, so
+    after a crash at most ``every`` pages are read twice.
+
+    .. code-block:: python
+
+        checkpoints = CheckpointFile("partitions.json", every=50)
+        for partition in client.list_partitions(
+            parent=entity, checkpoint_file=checkpoints
+        ):
+            ...
+
+    One file holds the checkpoints of any number of listings, and can be
+    shared by the pagers of one process. The file is replaced atomically
+    on every write.
+    """
+
+    def __init__(self, path: str, *, every: int = 100):
+        """Instantiate the checkpoint file.
+
+        Args:
+            path (str): The file to use. It is created on the first write.
+            every (int): The number of pages between two checkpoints.
+        """
+        if every < 1:
+            raise ValueError("every must be a positive integer, got {}".format(every))
+        self.path = path
+        self.every = every
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self._tokens = json.load(f)
+
+    def load(self, fingerprint: str) -> Optional[Checkpoint]:
+        """Return the checkpoint of a listing, or ``None``."""
+        with self._lock:
+            token = self._tokens.get(fingerprint)
+        return Checkpoint(fingerprint, token) if token is not None else None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Record the position of a listing, replacing any earlier one."""
+        with self._lock:
+            self._tokens[checkpoint.fingerprint] = checkpoint.page_token
+            self._write()
+
+    def discard(self, fingerprint: str) -> None:
+        """Forget the checkpoint of a listing."""
+        with self._lock:
+            if self._tokens.pop(fingerprint, None) is not None:
+                self._write()
+
+    def _write(self) -> None:
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._tokens, f, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+__all__ = (
+    "Checkpoint",
+    "CheckpointFile",
+    "fingerprint",
+    "resume_token",
+)
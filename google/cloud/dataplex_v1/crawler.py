@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Breadth-first traversal of the lakes, zones, assets and entities of a location."""
+
+import enum
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from google.cloud.dataplex_v1 import _fanout
+from google.cloud.dataplex_v1.services.dataplex_service import DataplexServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import resources
+
+
+class CrawlLevel(enum.Enum):
+    """The levels of the resource tree, in traversal order."""
+
+    LAKE = "lakes"
+    ZONE = "zones"
+    ASSET = "assets"
+    ENTITY = "entities"
+
+
+class CrawlRecord(NamedTuple):
+    """A resource found by the crawler.
+
+    Attributes:
+        level (CrawlLevel): The level the resource was found at.
+        parent (str): The resource name of the parent that was listed.
+        resource (Union[google.cloud.dataplex_v1.types.Lake, google.cloud.dataplex_v1.types.Zone, google.cloud.dataplex_v1.types.Asset, google.cloud.dataplex_v1.types.Entity]):
+            The resource itself.
+    """
+
+    level: CrawlLevel
+    parent: str
+    resource: Union[resources.Lake, resources.Zone, resources.Asset, metadata_.Entity]
+
+
+class LevelStats:
+    """Throughput of one level of a crawl.
+
+    Attributes:
+        level (CrawlLevel): The level these statistics describe.
+        parents (int): The number of parents listed.
+        pages (int): The number of response pages received.
+        resources (int): The number of resources found.
+        elapsed (float): Wall-clock seconds from the first request of the
+            level until its last resource was consumed.
+    """
+
+    __slots__ = ("level", "parents", "pages", "resources", "elapsed")
+
+    def __init__(self, level: CrawlLevel):
+        self.level = level
+        self.parents = 0
+        self.pages = 0
+        self.resources = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """float: Resources found per second."""
+        return self.resources / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return "{0}<{1}: {2} resources in {3} pages from {4} parents, {5:.1f}/s>".format(
+            self.__class__.__name__,
+            self.level.value,
+            self.resources,
+            self.pages,
+            self.parents,
+            self.throughput,
+        )
+
+
+class LakeCrawler:
+    """Walks the Dataplex resource tree of a location breadth-first.
+
+    Lakes are listed first, then the zones of every lake, then the assets
+    of every zone and finally, when a metadata client is given, the
+    entities of every zone. Within a level the parents are listed
+    concurrently on a pool of ``max_workers`` threads using the regular
+    ``List*`` pagers, and resources are yielded as soon as their page
+    arrives.
+
+    .. code-block:: python
+
+        crawler = LakeCrawler(DataplexServiceClient(), MetadataServiceClient())
+        for record in crawler.crawl(
+            DataplexServiceClient.common_location_path("my-project", "us-central1")
+        ):
+            print(record.level, record.resource.name)
+        print(crawler.stats)
+    """
+
+    def __init__(
+        self,
+        dataplex_client: DataplexServiceClient,
+        metadata_client: Optional[MetadataServiceClient] = None,
+        *,
+        max_workers: int = 8,
+        levels: Sequence[CrawlLevel] = tuple(CrawlLevel),
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ):
+        """Instantiate the crawler.
+
+        Args:
+            dataplex_client (google.cloud.dataplex_v1.services.dataplex_service.DataplexServiceClient):
+                The client used to list lakes, zones and assets.
+            metadata_client (Optional[google.cloud.dataplex_v1.services.metadata_service.MetadataServiceClient]):
+                The client used to list entities. Entities are skipped if
+                this is not set.
+            max_workers (int): The maximum number of parents listed at
+                the same time.
+            levels (Sequence[CrawlLevel]): The levels whose resources are
+                yielded. Levels that are needed to reach a requested level
+                are still listed, but their resources are not yielded.
+            on_error (Optional[Callable[[str, Exception], None]]): Called
+                with the parent's resource name when listing its children
+                fails. If not set, the level carries on and the first such
+                error is raised once it is done.
+        """
+        self._dataplex = dataplex_client
+        self._metadata = metadata_client
+        self._max_workers = max_workers
+        self._levels = frozenset(levels)
+        self._on_error = on_error
+        self._stats: Dict[CrawlLevel, LevelStats] = {}
+
+    @property
+    def stats(self) -> Dict[CrawlLevel, LevelStats]:
+        """Dict[CrawlLevel, LevelStats]: Throughput of each level crawled so far."""
+        return dict(self._stats)
+
+    def crawl(self, parent: str) -> Iterator[CrawlRecord]:
+        """Crawl every lake of a location.
+
+        Args:
+            parent (str): The location to crawl:
+                ``projects/{project_number}/locations/{location_id}``.
+
+        Yields:
+            CrawlRecord: The resources found, level by level.
+        """
+        self._stats = {}
+        wants_entities = (
+            self._metadata is not None and CrawlLevel.ENTITY in self._levels
+        )
+        wants_zones = wants_entities or bool(
+            self._levels & {CrawlLevel.ZONE, CrawlLevel.ASSET}
+        )
+
+        lakes = yield from self._level(CrawlLevel.LAKE, [parent], self._list_lakes)
+        if not wants_zones:
+            return
+        zones = yield from self._level(CrawlLevel.ZONE, lakes, self._list_zones)
+        if CrawlLevel.ASSET in self._levels:
+            yield from self._level(CrawlLevel.ASSET, zones, self._list_assets)
+        if wants_entities:
+            yield from self._level(CrawlLevel.ENTITY, zones, self._list_entities)
+
+    def _level(
+        self,
+        level: CrawlLevel,
+        parents: Iterable[str],
+        expand: Callable[[str], Iterable[Sequence]],
+    ):
+        stats = self._stats[level] = LevelStats(level)
+        emit = level in self._levels
+        names: List[str] = []
+        start = time.monotonic()
+        seen = set()
+        for parent, page in _fanout.fan_out(
+            parents, expand, max_workers=self._max_workers, on_error=self._on_error,
+        ):
+            if parent not in seen:
+                seen.add(parent)
+                stats.parents += 1
+            stats.pages += 1
+            for resource in page:
+                stats.resources += 1
+                names.append(resource.name)
+                if emit:
+                    yield CrawlRecord(level, parent, resource)
+            stats.elapsed = time.monotonic() - start
+        stats.elapsed = time.monotonic() - start
+        return names
+
+    def _list_lakes(self, parent: str) -> Iterator[Sequence[resources.Lake]]:
+        for page in self._dataplex.list_lakes(parent=parent).pages:
+            yield page.lakes
+
+    def _list_zones(self, lake: str) -> Iterator[Sequence[resources.Zone]]:
+        for page in self._dataplex.list_zones(parent=lake).pages:
+            yield page.zones
+
+    def _list_assets(self, zone: str) -> Iterator[Sequence[resources.Asset]]:
+        for page in self._dataplex.list_assets(parent=zone).pages:
+            yield page.assets
+
+    def _list_entities(self, zone: str) -> Iterator[Sequence[metadata_.Entity]]:
+        for view in (
+            metadata_.ListEntitiesRequest.EntityView.TABLES,
+            metadata_.ListEntitiesRequest.EntityView.FILESETS,
+        ):
+            pager = self._metadata.list_entities(
+                request=metadata_.ListEntitiesRequest(parent=zone, view=view)
+            )
+            for page in pager.pages:
+                yield page.entities
+
+
+__all__ = (
+    "CrawlLevel",
+    "CrawlRecord",
+    "LakeCrawler",
+    "LevelStats",
+)
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Incremental mirroring of the entities of Dataplex zones."""
+
+import enum
+import os
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+from google.cloud.dataplex_v1 import batching
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+
+_LIST_VIEWS = (
+    metadata_.ListEntitiesRequest.EntityView.TABLES,
+    metadata_.ListEntitiesRequest.EntityView.FILESETS,
+)
+
+# What identifies one revision of an entity: its etag and update time.
+_Version = Tuple[str, int, int]
+
+
+def _version(entity) -> _Version:
+    # Accepts both proto-plus and raw protobuf entities.
+    if isinstance(entity, metadata_.Entity):
+        entity = metadata_.Entity.pb(entity)
+    return (entity.etag, entity.update_time.seconds, entity.update_time.nanos)
+
+
+class DeltaKind(enum.Enum):
+    """How an entity changed between two synchronizations."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+
+class EntityDelta(NamedTuple):
+    """A change to one entity of the mirror.
+
+    Attributes:
+        kind (DeltaKind): How the entity changed.
+        name (str): The resource name of the entity.
+        entity (Optional[google.cloud.dataplex_v1.types.Entity]): The
+            entity as now fetched with its schema, or ``None`` if it was
+            deleted.
+        previous (Optional[google.cloud.dataplex_v1.types.Entity]): The
+            entity as held before, or ``None`` if it was added.
+    """
+
+    kind: DeltaKind
+    name: str
+    entity: Optional[metadata_.Entity]
+    previous: Optional[metadata_.Entity]
+
+
+class EntitySnapshot:
+    """The local copy of a set of entities, keyed by resource name.
+
+    Snapshots can be saved to a file and loaded back, so that a mirror
+    survives restarts and only fetches what changed in between.
+    """
+
+    def __init__(self, entities: Iterable[metadata_.Entity] = ()):
+        """Instantiate the snapshot.
+
+        Args:
+            entities (Iterable[google.cloud.dataplex_v1.types.Entity]): The
+                entities to start with.
+        """
+        self._entities: Dict[str, metadata_.Entity] = {e.name: e for e in entities}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entities
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entities)
+
+    def get(self, name: str) -> Optional[metadata_.Entity]:
+        """Return the entity with the given name, or ``None``."""
+        return self._entities.get(name)
+
+    def entities(self, parent: str = None) -> List[metadata_.Entity]:
+        """Return the entities held, optionally only those of one zone.
+
+        Args:
+            parent (Optional[str]): The resource name of a zone.
+        """
+        if parent is None:
+            return list(self._entities.values())
+        prefix = parent + "/entities/"
+        return [e for n, e in self._entities.items() if n.startswith(prefix)]
+
+    def apply(self, deltas: Iterable[EntityDelta]) -> None:
+        """Update the snapshot with the given changes."""
+        for delta in deltas:
+            if delta.kind is DeltaKind.DELETED:
+                self._entities.pop(delta.name, None)
+            else:
+                self._entities[delta.name] = delta.entity
+
+    def save(self, path: str) -> None:
+        """Write the snapshot to a file, replacing it atomically.
+
+        Args:
+            path (str): The file to write.
+        """
+        data = metadata_.ListEntitiesResponse.serialize(
+            metadata_.ListEntitiesResponse(entities=list(self._entities.values()))
+        )
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "EntitySnapshot":
+        """Read a snapshot written by :meth:`save`.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            EntitySnapshot: The snapshot.
+        """
+        with open(path, "rb") as f:
+            response = metadata_.ListEntitiesResponse.deserialize(f.read())
+        return cls(response.entities)
+
+
+class EntitySync:
+    """Keeps an :class:`EntitySnapshot` up to date with the service.
+
+    Each synchronization lists the tables and filesets of every zone in
+    the basic view, which carries no schema. Only the entities whose etag
+    or update time differs from the snapshot are then fetched with
+    ``GetEntity`` in the schema view, concurrently through a
+    :class:`~google.cloud.dataplex_v1.batching.MetadataBatcher`. Entities
+    of the zone that are no longer listed are deleted.
+
+    .. code-block:: python
+
+        mirror = EntitySync(MetadataServiceClient(), EntitySnapshot.load(path))
+        for delta in mirror.sync(zones):
+            print(delta.kind, delta.name)
+        mirror.snapshot.save(path)
+
+    Attributes:
+        listed (int): The number of entities listed so far.
+        fetched (int): The number of entities fetched so far.
+    """
+
+    def __init__(
+        self,
+        client: MetadataServiceClient,
+        snapshot: EntitySnapshot = None,
+        *,
+        max_workers: int = 8,
+        page_size: int = 0,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        """Instantiate the synchronizer.
+
+        Args:
+            client (google.cloud.dataplex_v1.services.metadata_service.MetadataServiceClient):
+                The client used to list and fetch entities.
+            snapshot (Optional[EntitySnapshot]): The snapshot to keep up to
+                date. A new, empty one is used if not set.
+            max_workers (int): The maximum number of entities fetched at
+                the same time.
+            page_size (int): The page size of the listings, or ``0`` for
+                the service default.
+            on_error (Optional[Callable[[str, Exception], None]]): Called
+                with the name of every entity that could not be fetched.
+                The entity is then left as it was, and fetched again on the
+                next synchronization. If not set, the first such error is
+                raised and the snapshot is left unchanged.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+        """
+        self.snapshot = snapshot if snapshot is not None else EntitySnapshot()
+        self._client = client
+        self._page_size = page_size
+        self._on_error = on_error
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+        self._batcher = batching.MetadataBatcher(
+            client,
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        self.listed = 0
+        self.fetched = 0
+
+    def _list_versions(self, parent: str) -> Dict[str, _Version]:
+        versions = {}
+        for view in _LIST_VIEWS:
+            pager = self._client.list_entities(
+                request=metadata_.ListEntitiesRequest(
+                    parent=parent, view=view, page_size=self._page_size
+                ),
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+                raw=True,
+            )
+            for entity in pager:
+                versions[entity.name] = _version(entity)
+        self.listed += len(versions)
+        return versions
+
+    def diff(self, parent: str) -> Tuple[List[str], List[str], List[str]]:
+        """Compare the snapshot of one zone with a fresh basic listing.
+
+        Args:
+            parent (str): The resource name of the zone.
+
+        Returns:
+            Tuple[List[str], List[str], List[str]]: The names of the added,
+            modified and deleted entities, each sorted.
+        """
+        versions = self._list_versions(parent)
+        held = {e.name: _version(e) for e in self.snapshot.entities(parent)}
+        added = sorted(n for n in versions if n not in held)
+        modified = sorted(n for n, v in versions.items() if n in held and held[n] != v)
+        deleted = sorted(n for n in held if n not in versions)
+        return added, modified, deleted
+
+    def sync(self, parents: Union[str, Iterable[str]]) -> List[EntityDelta]:
+        """Bring the snapshot up to date for one or more zones.
+
+        Args:
+            parents (Union[str, Iterable[str]]): The resource names of the
+                zones to synchronize. Entities of other zones are kept as
+                they are.
+
+        Returns:
+            List[EntityDelta]: The changes applied to the snapshot, zone
+            by zone: additions, then modifications, then deletions, each
+            sorted by name.
+        """
+        if isinstance(parents, str):
+            parents = [parents]
+        kinds: Dict[str, DeltaKind] = {}
+        for parent in parents:
+            added, modified, deleted = self.diff(parent)
+            kinds.update(dict.fromkeys(added, DeltaKind.ADDED))
+            kinds.update(dict.fromkeys(modified, DeltaKind.MODIFIED))
+            kinds.update(dict.fromkeys(deleted, DeltaKind.DELETED))
+
+        fetch = [n for n, kind in kinds.items() if kind is not DeltaKind.DELETED]
+        results = self._batcher.get_entities(
+            fetch, view=batching.EntityView.SCHEMA, return_exceptions=True
+        )
+        self.fetched += len(fetch)
+        fetched = dict(zip(fetch, results))
+
+        deltas = []
+        failed = []
+        for name, kind in kinds.items():
+            entity = fetched.get(name)
+            if isinstance(entity, core_exceptions.NotFound):
+                # Deleted between the listing and the lookup.
+                if name not in self.snapshot:
+                    continue
+                kind, entity = DeltaKind.DELETED, None
+            elif isinstance(entity, Exception):
+                failed.append((name, entity))
+                continue
+            deltas.append(EntityDelta(kind, name, entity, self.snapshot.get(name)))
+
+        if failed and self._on_error is None:
+            raise failed[0][1]
+        for name, exc in failed:
+            self._on_error(name, exc)
+        self.snapshot.apply(deltas)
+        return deltas
+
+    def close(self) -> None:
+        """Release the threads used to fetch entities."""
+        self._batcher.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+__all__ = (
+    "DeltaKind",
+    "EntityDelta",
+    "EntitySnapshot",
+    "EntitySync",
+)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Columnar export of ``list_partitions`` results.
+
+Every page is decoded straight from its protocol buffer into one batch of
+columns, without a :class:`~.types.Partition` wrapper per row, and only one
+page is held at a time:
+
+.. code-block:: python
+
+    pager = client.list_partitions(parent=entity_name)
+    with open("partitions.arrows", "wb") as sink:
+        write_partitions_arrow(pager, sink)
+
+The Arrow and NumPy helpers need the ``pyarrow`` and ``numpy`` packages,
+which are installed with the ``arrow`` and ``numpy`` extras.
+"""
+
+import importlib
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from google.cloud.dataplex_v1.services.metadata_service import pagers
+from google.cloud.dataplex_v1.types import metadata_
+
+#: The exported fields of :class:`~.types.Partition`, in column order.
+PARTITION_COLUMNS = ("name", "values", "location", "etag")
+
+_Pages = Union[pagers.ListPartitionsPager, Iterable[metadata_.ListPartitionsResponse]]
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            "{} is required for this export; install it with "
+            "`pip install google-cloud-dataplex[{}]`".format(module, extra)
+        ) from exc
+
+
+def partition_columns(pages: _Pages) -> Iterator[Dict[str, List[Any]]]:
+    """Decode each page of partitions into columns.
+
+    Args:
+        pages (Union[google.cloud.dataplex_v1.services.metadata_service.pagers.ListPartitionsPager, Iterable[google.cloud.dataplex_v1.types.ListPartitionsResponse]]):
+            The pager returned by ``list_partitions``, or its pages.
+
+    Yields:
+        Dict[str, List[Any]]: For every non-empty page, one list per name
+        in :data:`PARTITION_COLUMNS`. ``values`` holds a list of strings
+        per partition, the other columns a string.
+    """
+    if isinstance(pages, pagers.ListPartitionsPager):
+        pages = pages.pages
+    for page in pages:
+        partitions = metadata_.ListPartitionsResponse.pb(page).partitions
+        if not partitions:
+            continue
+        yield {
+            "name": [p.name for p in partitions],
+            "values": [list(p.values) for p in partitions],
+            "location": [p.location for p in partitions],
+            "etag": [p.etag for p in partitions],
+        }
+
+
+def partition_arrow_schema():
+    """Return the Arrow schema of the exported partitions.
+
+    Returns:
+        pyarrow.Schema: ``values`` is a list of strings, the other fields
+        are strings.
+    """
+    pa = _require("pyarrow", "arrow")
+    return pa.schema(
+        [
+            ("name", pa.string()),
+            ("values", pa.list_(pa.string())),
+            ("location", pa.string()),
+            ("etag", pa.string()),
+        ]
+    )
+
+
+def partition_record_batches(pages: _Pages) -> Iterator[Any]:
+    """Export partitions as one Arrow record batch per page.
+
+    Args:
+        pages (Union[google.cloud.dataplex_v1.services.metadata_service.pagers.ListPartitionsPager, Iterable[google.cloud.dataplex_v1.types.ListPartitionsResponse]]):
+            The pager returned by ``list_partitions``, or its pages.
+
+    Yields:
+        pyarrow.RecordBatch: The partitions of each non-empty page, with
+        the schema of :func:`partition_arrow_schema`.
+    """
+    pa = _require("pyarrow", "arrow")
+    schema = partition_arrow_schema()
+    for columns in partition_columns(pages):
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(columns[field.name], type=field.type) for field in schema],
+            schema=schema,
+        )
+
+
+def write_partitions_arrow(pages: _Pages, sink: Any) -> int:
+    """Write partitions to an Arrow IPC stream, one record batch per page.
+
+    Args:
+        pages (Union[google.cloud.dataplex_v1.services.metadata_service.pagers.ListPartitionsPager, Iterable[google.cloud.dataplex_v1.types.ListPartitionsResponse]]):
+            The pager returned by ``list_partitions``, or its pages.
+        sink (Union[str, pyarrow.NativeFile, IO[bytes]]): Where to write
+            the stream. It is not closed.
+
+    Returns:
+        int: The number of partitions written.
+    """
+    pa = _require("pyarrow", "arrow")
+    rows = 0
+    writer = pa.ipc.new_stream(sink, partition_arrow_schema())
+    try:
+        for batch in partition_record_batches(pages):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+
+def partition_arrays(pages: _Pages) -> Iterator[Any]:
+    """Export partitions as one NumPy structured array per page.
+
+    ``name``, ``location`` and ``etag`` are fixed-width unicode fields,
+    sized for the longest value of the page. ``values`` is an object
+    field holding a tuple of strings per partition.
+
+    Args:
+        pages (Union[google.cloud.dataplex_v1.services.metadata_service.pagers.ListPartitionsPager, Iterable[google.cloud.dataplex_v1.types.ListPartitionsResponse]]):
+            The pager returned by ``list_partitions``, or its pages.
+
+    Yields:
+        numpy.ndarray: The partitions of each non-empty page.
+    """
+    np = _require("numpy", "numpy")
+    for columns in partition_columns(pages):
+        dtype = [
+            (
+                column,
+                object
+                if column == "values"
+                else "U{}".format(max(1, max(map(len, columns[column])))),
+            )
+            for column in PARTITION_COLUMNS
+        ]
+        array = np.empty(len(columns["name"]), dtype=dtype)
+        for column in ("name", "location", "etag"):
+            array[column] = columns[column]
+        field = array["values"]
+        for index, values in enumerate(columns["values"]):
+            field[index] = tuple(values)
+        yield array
+
+
+__all__ = (
+    "PARTITION_COLUMNS",
+    "partition_arrays",
+    "partition_arrow_schema",
+    "partition_columns",
+    "partition_record_batches",
+    "write_partitions_arrow",
+)
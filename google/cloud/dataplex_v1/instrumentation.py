@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-method latency, size and paging metrics of the gRPC transports."""
+
+import abc
+import bisect
+import collections
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.dataplex_v1 import _interceptors
+
+_LOGGER = logging.getLogger(__name__)
+
+#: The upper bounds, in seconds, of the default latency histogram buckets.
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class CallRecord(NamedTuple):
+    """One attempt of a call, as seen by the instrumentation interceptors.
+
+    Attributes:
+        method (str): The transport method name, such as ``"get_entity"``.
+        code (grpc.StatusCode): The status the attempt ended with.
+        latency (float): How long the attempt took, in seconds.
+        request_bytes (int): The serialized size of the request.
+        response_bytes (int): The serialized size of the response, or
+            ``0`` if the attempt failed.
+        retry (bool): Whether the attempt re-sent the request of a failed
+            attempt.
+        page_items (Optional[int]): For ``List*`` methods, the number of
+            resources in the page received. ``None`` otherwise.
+    """
+
+    method: str
+    code: grpc.StatusCode
+    latency: float
+    request_bytes: int
+    response_bytes: int
+    retry: bool
+    page_items: Optional[int]
+
+
+class Sink(abc.ABC):
+    """Receives the :class:`CallRecord` of every attempt.
+
+    Sinks are called on the thread, or in the event loop, that made the
+    call, and should return quickly.
+    """
+
+    @abc.abstractmethod
+    def record(self, record: CallRecord) -> None:
+        """Receive a record."""
+        raise NotImplementedError()
+
+
+class MethodStats:
+    """The aggregated metrics of one method.
+
+    Attributes:
+        method (str): The transport method name.
+        calls (int): The number of attempts.
+        codes (Dict[grpc.StatusCode, int]): The number of attempts by
+            status.
+        retries (int): The number of attempts that were retries.
+        request_bytes (int): The total size of the requests sent.
+        response_bytes (int): The total size of the responses received.
+        pages (int): The number of pages received.
+        page_items (int): The number of resources in those pages.
+        buckets (Tuple[float, ...]): The upper bounds of the latency
+            histogram buckets.
+        bucket_counts (List[int]): The number of attempts per bucket, with
+            one more bucket for the attempts slower than the last bound.
+        latency_sum (float): The total latency of the attempts.
+    """
+
+    def __init__(self, method: str, buckets: Sequence[float]):
+        self.method = method
+        self.calls = 0
+        self.codes: Dict[grpc.StatusCode, int] = collections.Counter()
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.pages = 0
+        self.page_items = 0
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.latency_sum = 0.0
+
+    def _add(self, record: CallRecord) -> None:
+        self.calls += 1
+        self.codes[record.code] += 1
+        self.retries += record.retry
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        if record.page_items is not None:
+            self.pages += 1
+            self.page_items += record.page_items
+        self.bucket_counts[bisect.bisect_left(self.buckets, record.latency)] += 1
+        self.latency_sum += record.latency
+
+    def quantile(self, q: float) -> float:
+        """Estimate a latency quantile from the histogram.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The upper bound of the bucket the quantile falls in, or
+            ``inf`` if it falls beyond the last bound.
+        """
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.bucket_counts):
+            seen += count
+            if seen >= rank and seen:
+                return bound
+        return float("inf")
+
+    def __repr__(self) -> str:
+        return "MethodStats({}, calls={}, p50={}s, p99={}s)".format(
+            self.method, self.calls, self.quantile(0.5), self.quantile(0.99)
+        )
+
+
+class InMemorySink(Sink):
+    """Aggregates records per method in memory.
+
+    .. code-block:: python
+
+        sink = InMemorySink()
+        transport = MetadataServiceGrpcTransport(
+            interceptors=[InstrumentationInterceptor(sink)]
+        )
+        ...
+        for stats in sink.stats().values():
+            print(stats)
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Instantiate the sink.
+
+        Args:
+            buckets (Sequence[float]): The ascending upper bounds, in
+                seconds, of the latency histogram buckets.
+        """
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, MethodStats] = {}
+
+    def record(self, record: CallRecord) -> None:
+        with self._lock:
+            stats = self._stats.get(record.method)
+            if stats is None:
+                stats = self._stats[record.method] = MethodStats(
+                    record.method, self._buckets
+                )
+            stats._add(record)
+
+    def stats(self) -> Dict[str, MethodStats]:
+        """Return the metrics of every method called so far, by method name."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        """Forget every record."""
+        with self._lock:
+            self._stats = {}
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in labels.items()
+    )
+
+
+class PrometheusSink(InMemorySink):
+    """An :class:`InMemorySink` that renders the Prometheus text format.
+
+    Serve :meth:`render` from a metrics endpoint to have Prometheus
+    scrape the client metrics. Every metric is labelled with the
+    ``method``, and the call counts also with the ``code``.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        *,
+        prefix: str = "dataplex_client",
+    ):
+        """Instantiate the sink.
+
+        Args:
+            buckets (Sequence[float]): The ascending upper bounds, in
+                seconds, of the latency histogram buckets.
+            prefix (str): The prefix of the metric names.
+        """
+        super().__init__(buckets)
+        self._prefix = prefix
+
+    def render(self) -> str:
+        """Return the current metrics in the Prometheus text format."""
+        p = self._prefix
+        stats = sorted(self.stats().items())
+        lines: List[str] = []
+
+        def family(name, kind, help_text):
+            lines.append("# HELP {}_{} {}".format(p, name, help_text))
+            lines.append("# TYPE {}_{} {}".format(p, name, kind))
+
+        family("latency_seconds", "histogram", "Latency of each attempt.")
+        for method, s in stats:
+            with self._lock:
+                counts = list(s.bucket_counts)
+                total = s.latency_sum
+            cumulative = 0
+            for bound, count in zip(s.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    "{}_latency_seconds_bucket{{{}}} {}".format(
+                        p, _labels(method=method, le=le), cumulative
+                    )
+                )
+            lines.append(
+                "{}_latency_seconds_sum{{{}}} {!r}".format(
+                    p, _labels(method=method), total
+                )
+            )
+            lines.append(
+                "{}_latency_seconds_count{{{}}} {}".format(
+                    p, _labels(method=method), cumulative
+                )
+            )
+
+        family("calls_total", "counter", "Attempts by status code.")
+        for method, s in stats:
+            for code, count in sorted(s.codes.items(), key=lambda i: i[0].name):
+                lines.append(
+                    "{}_calls_total{{{}}} {}".format(
+                        p, _labels(method=method, code=code.name), count
+                    )
+                )
+        for name, attribute, help_text in (
+            ("retries_total", "retries", "Attempts that retried a failed one."),
+            ("request_bytes_total", "request_bytes", "Serialized request bytes."),
+            ("response_bytes_total", "response_bytes", "Serialized response bytes."),
+            ("pages_total", "pages", "Pages received by List methods."),
+            ("page_items_total", "page_items", "Resources in those pages."),
+        ):
+            family(name, "counter", help_text)
+            for method, s in stats:
+                lines.append(
+                    "{}_{}{{{}}} {}".format(
+                        p, name, _labels(method=method), getattr(s, attribute)
+                    )
+                )
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySink(Sink):
+    """Reports records through the OpenTelemetry metrics API.
+
+    Requires the ``opentelemetry-api`` package, installed with
+    ``pip install google-cloud-dataplex[opentelemetry]``. Every instrument
+    carries the ``rpc.method`` attribute, and the duration and call count
+    also ``rpc.grpc.status_code``.
+    """
+
+    def __init__(self, meter: Any = None, *, prefix: str = "dataplex.client"):
+        """Instantiate the sink.
+
+        Args:
+            meter (Optional[opentelemetry.metrics.Meter]): The meter to
+                create the instruments with. Defaults to the meter of this
+                module from the global meter provider.
+            prefix (str): The prefix of the instrument names.
+        """
+        try:
+            metrics = importlib.import_module("opentelemetry.metrics")
+        except ImportError as exc:
+            raise ImportError(
+                "opentelemetry-api is required for this sink; install it with "
+                "`pip install google-cloud-dataplex[opentelemetry]`"
+            ) from exc
+        if meter is None:
+            meter = metrics.get_meter(__name__)
+        self._duration = meter.create_histogram(
+            prefix + ".duration", unit="s", description="Latency of each attempt."
+        )
+        self._calls = meter.create_counter(
+            prefix + ".calls", description="Attempts by status code."
+        )
+        self._retries = meter.create_counter(
+            prefix + ".retries", description="Attempts that retried a failed one."
+        )
+        self._request_bytes = meter.create_counter(
+            prefix + ".request.size", unit="By", description="Request bytes."
+        )
+        self._response_bytes = meter.create_counter(
+            prefix + ".response.size", unit="By", description="Response bytes."
+        )
+        self._pages = meter.create_counter(
+            prefix + ".pages", description="Pages received by List methods."
+        )
+        self._page_items = meter.create_counter(
+            prefix + ".page_items", description="Resources in those pages."
+        )
+
+    def record(self, record: CallRecord) -> None:
+        attributes = {"rpc.method": record.method}
+        with_code = dict(attributes, **{"rpc.grpc.status_code": record.code.value[0]})
+        self._duration.record(record.latency, with_code)
+        self._calls.add(1, with_code)
+        if record.retry:
+            self._retries.add(1, attributes)
+        self._request_bytes.add(record.request_bytes, attributes)
+        self._response_bytes.add(record.response_bytes, attributes)
+        if record.page_items is not None:
+            self._pages.add(1, attributes)
+            self._page_items.add(record.page_items, attributes)
+
+
+def _byte_size(message) -> int:
+    pb = getattr(type(message), "pb", None)
+    if pb is not None:
+        message = pb(message)
+    return message.ByteSize()
+
+
+def _page_items(response) -> Optional[int]:
+    pb = getattr(type(response), "pb", None)
+    message = pb(response) if pb is not None else response
+    fields = message.DESCRIPTOR.fields_by_name
+    if "next_page_token" not in fields:
+        return None
+    for field in message.DESCRIPTOR.fields:
+        # The resources are the first repeated message field of the page.
+        if field.message_type is not None and _is_repeated(field):
+            return len(getattr(message, field.name))
+    return None
+
+
+def _is_repeated(field) -> bool:
+    try:
+        return field.is_repeated
+    except AttributeError:  # pragma: NO COVER
+        return field.label == field.LABEL_REPEATED
+
+
+class _Instrumentation:
+    # Failed attempts kept around to recognize their retries.
+    _MAX_FAILED = 1024
+
+    def __init__(self, sink: Sink):
+        self._sink = sink
+        self._lock = threading.Lock()
+        # id(request) -> (request, method). Holding the request keeps its id
+        # from being reused by another one while the entry exists.
+        self._failed: "collections.OrderedDict[int, Tuple[Any, str]]" = (
+            collections.OrderedDict()
+        )
+
+    def _started(self, request, method: str) -> bool:
+        with self._lock:
+            entry = self._failed.pop(id(request), None)
+        return entry is not None and entry[0] is request and entry[1] == method
+
+    def _finished(self, method, request, start, code, response, retry) -> None:
+        latency = time.perf_counter() - start
+        if code != grpc.StatusCode.OK:
+            with self._lock:
+                self._failed[id(request)] = (request, method)
+                while len(self._failed) > self._MAX_FAILED:
+                    self._failed.popitem(last=False)
+        try:
+            self._sink.record(
+                CallRecord(
+                    method=method,
+                    code=code,
+                    latency=latency,
+                    request_bytes=_byte_size(request),
+                    response_bytes=0 if response is None else _byte_size(response),
+                    retry=retry,
+                    page_items=None if response is None else _page_items(response),
+                )
+            )
+        except Exception:
+            _LOGGER.exception("instrumentation sink failed to record %s", method)
+
+
+class InstrumentationInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Records every call of a synchronous gRPC transport to a sink.
+
+    Instrumentation is off by default; pass the interceptor to the
+    transport to turn it on:
+
+    .. code-block:: python
+
+        sink = PrometheusSink()
+        transport = DataplexServiceGrpcTransport(
+            interceptors=[InstrumentationInterceptor(sink)]
+        )
+        client = DataplexServiceClient(transport=transport)
+
+    The interceptor sits below the retry logic of the client, so every
+    attempt is recorded on its own; an attempt that re-sends the request
+    of a failed attempt is flagged as a retry. Every call of a ``List*``
+    method fetches one page.
+    """
+
+    def __init__(self, sink: Sink):
+        """Instantiate the interceptor.
+
+        Args:
+            sink (Sink): Where the records go.
+        """
+        self._instrumentation = _Instrumentation(sink)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = _interceptors.method_name(client_call_details.method)
+        instrumentation = self._instrumentation
+        retry = instrumentation._started(request, method)
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+
+        def done(call):
+            code = call.code()
+            response = call.result() if code == grpc.StatusCode.OK else None
+            instrumentation._finished(method, request, start, code, response, retry)
+
+        outcome.add_done_callback(done)
+        return outcome
+
+
+class AsyncInstrumentationInterceptor(aio.UnaryUnaryClientInterceptor):
+    """Records every call of an ``asyncio`` gRPC transport to a sink.
+
+    This is the ``asyncio`` counterpart of
+    :class:`InstrumentationInterceptor`.
+    """
+
+    def __init__(self, sink: Sink):
+        """Instantiate the interceptor.
+
+        Args:
+            sink (Sink): Where the records go.
+        """
+        self._instrumentation = _Instrumentation(sink)
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = _interceptors.method_name(client_call_details.method)
+        instrumentation = self._instrumentation
+        retry = instrumentation._started(request, method)
+        start = time.perf_counter()
+        call = await continuation(client_call_details, request)
+        code = await call.code()
+        response = await call if code == grpc.StatusCode.OK else None
+        instrumentation._finished(method, request, start, code, response, retry)
+        return call
+
+
+__all__ = (
+    "AsyncInstrumentationInterceptor",
+    "CallRecord",
+    "DEFAULT_LATENCY_BUCKETS",
+    "InMemorySink",
+    "InstrumentationInterceptor",
+    "MethodStats",
+    "OpenTelemetrySink",
+    "PrometheusSink",
+    "Sink",
+)
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shared polling of many long-running operations of the async client."""
+
+import asyncio
+import collections
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import operation_async  # type: ignore
+
+# Poll errors worth retrying in a later round. Any other error fails the
+# operation, since polling it again would fail the same way.
+_RETRYABLE = (
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.TooManyRequests,
+)
+
+
+class OperationManager:
+    """Polls many :class:`~google.api_core.operation_async.AsyncOperation`
+    objects from a single loop.
+
+    Awaiting the result of an operation polls it on its own schedule, so
+    hundreds of pending operations mean hundreds of polling loops. The
+    manager instead polls the operations it tracks in rounds: every round
+    refreshes up to ``batch_size`` of them, least recently polled first,
+    and then waits. The wait is shared by all operations; it grows while
+    rounds complete nothing and shrinks again as operations finish, so
+    the rate of ``GetOperation`` calls stays bounded by ``batch_size``
+    over the current delay.
+
+    .. code-block:: python
+
+        async with OperationManager() as manager:
+            for asset in assets:
+                manager.add(await client.create_asset(parent=zone, asset=asset))
+            async for operation in manager.as_completed():
+                print(operation.operation.name, await operation.result())
+
+    Must be used from within a running event loop. Operations are no
+    longer tracked once :meth:`wait_all` or :meth:`as_completed` has
+    returned them complete.
+
+    Attributes:
+        polls (int): The number of ``GetOperation`` calls issued.
+        errors (int): The number of those calls that failed. Polls failing
+            with a transient error, such as ``UNAVAILABLE``, are retried in
+            a later round; any other error is raised when the operation is
+            waited for, and it is not polled again.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 50,
+        max_concurrency: int = 10,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 1.5,
+    ):
+        """Instantiate the manager.
+
+        Args:
+            batch_size (int): The maximum number of operations refreshed
+                per round.
+            max_concurrency (int): The maximum number of ``GetOperation``
+                calls in flight at once.
+            initial_delay (float): Seconds to wait before the first round,
+                and the shortest wait between rounds.
+            max_delay (float): The longest wait between rounds.
+            multiplier (float): The factor the wait grows by after a round
+                in which no operation completed. It shrinks by the same
+                factor after a round in which one did.
+        """
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be positive")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._multiplier = multiplier
+        self._delay = initial_delay
+        self._pending: Deque[operation_async.AsyncOperation] = collections.deque()
+        self._completions: Dict[int, asyncio.Future] = {}
+        self._tracked: Dict[int, operation_async.AsyncOperation] = {}
+        self._poller: Optional[asyncio.Future] = None
+        self._polling = 0
+        self.polls = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        """Return the number of tracked operations not yet complete."""
+        return len(self._pending) + self._polling
+
+    @property
+    def delay(self) -> float:
+        """float: The current wait between polling rounds."""
+        return self._delay
+
+    def add(
+        self, operation: operation_async.AsyncOperation
+    ) -> operation_async.AsyncOperation:
+        """Track an operation.
+
+        Args:
+            operation (google.api_core.operation_async.AsyncOperation): An
+                operation returned by the async client, such as by
+                ``create_asset``. Adding it again has no effect.
+
+        Returns:
+            google.api_core.operation_async.AsyncOperation: The operation.
+        """
+        if id(operation) in self._completions:
+            return operation
+        completion = asyncio.get_event_loop().create_future()
+        self._completions[id(operation)] = completion
+        self._tracked[id(operation)] = operation
+        if operation.operation.done:
+            completion.set_result(None)
+            return operation
+        self._pending.append(operation)
+        if self._poller is None or self._poller.done():
+            self._delay = self._initial_delay
+            self._poller = asyncio.ensure_future(self._poll_rounds())
+        return operation
+
+    def _release(self, operation: operation_async.AsyncOperation) -> None:
+        self._completions.pop(id(operation), None)
+        self._tracked.pop(id(operation), None)
+
+    async def _refresh(self, operation, semaphore) -> bool:
+        async with semaphore:
+            self.polls += 1
+            try:
+                # Polling is retried by the next round rather than inline.
+                return await operation.done(retry=None)
+            except asyncio.CancelledError:
+                raise
+            except _RETRYABLE:
+                self.errors += 1
+                return False
+            except Exception as exc:
+                self.errors += 1
+                completion = self._completions[id(operation)]
+                if not completion.done():
+                    completion.set_exception(exc)
+                return True
+
+    async def _poll_rounds(self) -> None:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        while self._pending:
+            await asyncio.sleep(self._delay)
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self._batch_size, len(self._pending)))
+            ]
+            self._polling = len(batch)
+            try:
+                done = await asyncio.gather(
+                    *(self._refresh(operation, semaphore) for operation in batch)
+                )
+            finally:
+                self._polling = 0
+            for operation, is_done in zip(batch, done):
+                if is_done:
+                    completion = self._completions[id(operation)]
+                    if not completion.done():
+                        completion.set_result(None)
+                else:
+                    # Polled operations go to the back of the queue.
+                    self._pending.append(operation)
+            if any(done):
+                self._delay = max(self._initial_delay, self._delay / self._multiplier)
+            else:
+                self._delay = min(self._max_delay, self._delay * self._multiplier)
+
+    def _select(self, operations) -> List[operation_async.AsyncOperation]:
+        if operations is None:
+            return list(self._tracked.values())
+        return [self.add(operation) for operation in operations]
+
+    async def as_completed(
+        self,
+        operations: Iterable[operation_async.AsyncOperation] = None,
+        *,
+        timeout: float = None,
+    ) -> AsyncIterator[operation_async.AsyncOperation]:
+        """Yield operations as they complete.
+
+        Args:
+            operations (Optional[Iterable[google.api_core.operation_async.AsyncOperation]]):
+                The operations to wait for, which are tracked if they are
+                not already. Defaults to every tracked operation.
+            timeout (Optional[float]): The maximum number of seconds to
+                wait in total.
+
+        Yields:
+            google.api_core.operation_async.AsyncOperation: Each operation
+            once it is complete. Its ``result()`` returns or raises at
+            once.
+
+        Raises:
+            asyncio.TimeoutError: If operations are still pending after
+                ``timeout``.
+            google.api_core.exceptions.GoogleAPICallError: If an operation
+                could not be polled.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        waiting = {
+            self._completions[id(operation)]: operation
+            for operation in self._select(operations)
+        }
+        while waiting:
+            remaining = None if deadline is None else max(0, deadline - loop.time())
+            done, _ = await asyncio.wait(
+                waiting, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                raise asyncio.TimeoutError(
+                    "{} operations still pending".format(len(waiting))
+                )
+            for completion in done:
+                operation = waiting.pop(completion)
+                self._release(operation)
+                # Raises the error of an operation that could not be polled.
+                completion.result()
+                yield operation
+
+    async def wait_all(
+        self,
+        operations: Iterable[operation_async.AsyncOperation] = None,
+        *,
+        timeout: float = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Wait for operations to complete and return their results.
+
+        Args:
+            operations (Optional[Iterable[google.api_core.operation_async.AsyncOperation]]):
+                The operations to wait for, which are tracked if they are
+                not already. Defaults to every tracked operation.
+            timeout (Optional[float]): The maximum number of seconds to
+                wait.
+            return_exceptions (bool): Whether failed operations are
+                returned as their exception instead of raising it.
+
+        Returns:
+            List[Any]: The result of every operation, in input order.
+
+        Raises:
+            asyncio.TimeoutError: If operations are still pending after
+                ``timeout``.
+            google.api_core.exceptions.GoogleAPICallError: The error of the
+                first failed operation, or of the first operation that could
+                not be polled, unless ``return_exceptions`` is set.
+        """
+        operations = self._select(operations)
+        completions = [self._completions[id(operation)] for operation in operations]
+        if completions:
+            _, pending = await asyncio.wait(completions, timeout=timeout)
+            if pending:
+                raise asyncio.TimeoutError(
+                    "{} operations still pending".format(len(pending))
+                )
+        results = []
+        for operation in operations:
+            self._release(operation)
+        for operation, completion in zip(operations, completions):
+            try:
+                completion.result()
+                results.append(await operation.result())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results.append(exc)
+        return results
+
+    async def close(self) -> None:
+        """Stop polling. Operations left pending are no longer refreshed."""
+        if self._poller is not None and not self._poller.done():
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+__all__ = ("OperationManager",)
@@ -0,0 +1,668 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A ``Get*`` response cache that persists across processes."""
+
+import bisect
+import errno
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: NO COVER
+    fcntl = None
+
+import proto  # type: ignore
+
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import resources
+from google.cloud.dataplex_v1.types import tasks
+
+#: Seconds to keep the responses of each method, for the methods cached by
+#: default. Entries outlive the process, so they are meant to be kept fresh
+#: with :meth:`PersistentCache.revalidate` rather than by a short TTL.
+DEFAULT_TTLS: Mapping[str, float] = {
+    "get_entity": 86400.0,
+    "get_partition": 86400.0,
+}
+
+_RESPONSE_TYPES: Mapping[str, type] = {
+    "get_asset": resources.Asset,
+    "get_entity": metadata_.Entity,
+    "get_job": tasks.Job,
+    "get_lake": resources.Lake,
+    "get_partition": metadata_.Partition,
+    "get_task": tasks.Task,
+    "get_zone": resources.Zone,
+}
+
+_LOG_MAGIC = b"DPXLOG1\n"
+_INDEX_MAGIC = b"DPXIDX1\n"
+
+# Log records: crc32 of the rest of the record, tombstone flag, then the
+# lengths of method, request, name, etag and response, and the write time.
+_RECORD = struct.Struct("<IBHIHHId")
+# Index header: magic, capacity, used slots, live entries and the indexed
+# length of the log.
+_HEADER = struct.Struct("<8sQQQQ")
+# Index slots: key hash, record offset and expiry time.
+_SLOT = struct.Struct("<QQd")
+
+_EMPTY = 0
+_DELETED = 2 ** 64 - 1
+_MIN_CAPACITY = 1024
+
+
+def _hash(method: str, key: bytes) -> int:
+    digest = hashlib.blake2b(method.encode() + b"\0" + key, digest_size=8).digest()
+    # Zero marks an empty slot.
+    return int.from_bytes(digest, "little") or 1
+
+
+class _Record:
+    __slots__ = ("tombstone", "method", "key", "name", "etag", "written", "value")
+
+    def __init__(self, tombstone, method, key, name, etag, written, value):
+        self.tombstone = tombstone
+        self.method = method
+        self.key = key
+        self.name = name
+        self.etag = etag
+        self.written = written
+        self.value = value
+
+    def encode(self) -> bytes:
+        method = self.method.encode()
+        name = self.name.encode()
+        etag = self.etag.encode()
+        body = _RECORD.pack(
+            0,
+            self.tombstone,
+            len(method),
+            len(self.key),
+            len(name),
+            len(etag),
+            len(self.value),
+            self.written,
+        )[4:] + b"".join((method, self.key, name, etag, self.value))
+        return struct.pack("<I", zlib.crc32(body)) + body
+
+
+class PersistentCache:
+    """A ``Get*`` response cache kept on disk.
+
+    Pass an instance as the ``cache`` argument of
+    :class:`~google.cloud.dataplex_v1.services.metadata_service.MetadataServiceClient`
+    or
+    :class:`~google.cloud.dataplex_v1.services.dataplex_service.DataplexServiceClient`,
+    like a :class:`~google.cloud.dataplex_v1.caching.ResponseCache`. A
+    process opening an existing cache serves lookups cached by earlier
+    processes without any RPC.
+
+    Responses are stored as serialized protocol buffers in an append-only
+    log. A hash index of the log, keyed by method and request, is memory
+    mapped, so a lookup reads a single record. Each record also holds the
+    resource name and ``etag`` of the response. Opening the cache reads
+    the live records once to index them by resource name, so that
+    :meth:`invalidate` and :meth:`revalidate` read only the records of
+    the resources they match. Superseded and invalidated records stay in
+    the log until :meth:`compact` is called.
+
+    A cache directory may be used by one process at a time; opening it
+    while another process has it open fails where ``fcntl`` locks are
+    available. Writes are flushed to the operating system but not synced;
+    a record torn by a crash is dropped when the cache is next opened.
+
+    .. code-block:: python
+
+        with PersistentCache("/var/cache/dataplex") as cache:
+            client = MetadataServiceClient(cache=cache)
+            entity = client.get_entity(name=name)
+            # Drop everything cached for one zone.
+            cache.invalidate(zone_name)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open the cache, creating it if needed.
+
+        Args:
+            path (str): The directory holding the cache files.
+            ttls (Optional[Mapping[str, float]]): Seconds to keep the
+                responses of each method, keyed by client method name.
+                Methods missing from the mapping, or mapped to ``0``, are
+                not cached. Defaults to :data:`DEFAULT_TTLS`.
+            clock (Callable[[], float]): The wall clock used for expiry.
+                Entries are shared between processes, so it must not be a
+                monotonic clock.
+
+        Raises:
+            ValueError: If ``ttls`` names a method that cannot be cached,
+                or the directory holds something other than a cache.
+            BlockingIOError: If another process has the cache open.
+        """
+        unknown = set(ttls or ()) - set(_RESPONSE_TYPES)
+        if unknown:
+            raise ValueError("cannot cache {}".format(", ".join(sorted(unknown))))
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._lock_file = self._lock_directory()
+        try:
+            self._log = self._open_log()
+        except ValueError:
+            self._lock_file.close()
+            raise
+        self._index_file = None
+        self._index: Optional[mmap.mmap] = None
+        self._capacity = 0
+        self._used = 0
+        self._live = 0
+        self._end = len(_LOG_MAGIC)
+        # The live slots of each resource name, and the names in order for
+        # finding the resources nested under a name.
+        self._names: Dict[str, Set[int]] = {}
+        self._slot_names: Dict[int, str] = {}
+        self._sorted_names: List[str] = []
+        self._load_index()
+        self.hits = 0
+        self.misses = 0
+
+    # Files.
+
+    def _lock_directory(self):
+        lock_file = open(os.path.join(self._path, "lock"), "a+b")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                raise BlockingIOError(
+                    errno.EAGAIN, "the cache is in use by another process", self._path,
+                )
+        return lock_file
+
+    def _open_log(self):
+        log_path = os.path.join(self._path, "log")
+        if not os.path.exists(log_path):
+            with open(log_path, "wb") as f:
+                f.write(_LOG_MAGIC)
+        log = open(log_path, "r+b")
+        if log.read(len(_LOG_MAGIC)) != _LOG_MAGIC:
+            log.close()
+            raise ValueError("{} is not a Dataplex cache log".format(log_path))
+        return log
+
+    def _index_path(self) -> str:
+        return os.path.join(self._path, "index")
+
+    def _map_index(self, capacity: int, *, reset: bool) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index_file.close()
+        size = _HEADER.size + capacity * _SLOT.size
+        if reset:
+            tmp = self._index_path() + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_INDEX_MAGIC, capacity, 0, 0, len(_LOG_MAGIC)))
+                f.truncate(size)
+            os.replace(tmp, self._index_path())
+        self._index_file = open(self._index_path(), "r+b")
+        self._index = mmap.mmap(self._index_file.fileno(), size)
+        self._capacity = capacity
+        _, _, self._used, self._live, _ = _HEADER.unpack_from(self._index, 0)
+        # Slot numbers of another mapping mean nothing in this one.
+        self._names = {}
+        self._slot_names = {}
+        self._sorted_names = []
+
+    def _load_index(self) -> None:
+        try:
+            with open(self._index_path(), "rb") as f:
+                magic, capacity, _, _, indexed = _HEADER.unpack(f.read(_HEADER.size))
+            valid = (
+                magic == _INDEX_MAGIC
+                and os.path.getsize(self._index_path())
+                == _HEADER.size + capacity * _SLOT.size
+                and indexed <= self._log.seek(0, os.SEEK_END)
+            )
+        except (OSError, struct.error):
+            valid = False
+        if valid:
+            self._map_index(capacity, reset=False)
+            self._load_names()
+        else:
+            self._map_index(_MIN_CAPACITY, reset=True)
+            indexed = len(_LOG_MAGIC)
+        # Index whatever was appended after the index was last written.
+        self._replay(indexed)
+
+    def _replay(self, offset: int) -> None:
+        end = self._log.seek(0, os.SEEK_END)
+        while offset < end:
+            record, size = self._read(offset)
+            if record is None:
+                # A torn write; drop it so that later appends are readable.
+                self._log.truncate(offset)
+                break
+            if record.tombstone:
+                self._unlink(record.method, record.key)
+            elif self.caches(record.method):
+                expires = record.written + self._ttls[record.method]
+                self._link(record.method, record.key, record.name, offset, expires)
+            offset += size
+        self._end = offset
+        self._set_indexed(offset)
+
+    def _set_indexed(self, offset: int) -> None:
+        _HEADER.pack_into(
+            self._index,
+            0,
+            _INDEX_MAGIC,
+            self._capacity,
+            self._used,
+            self._live,
+            offset,
+        )
+
+    def _read(self, offset: int) -> Tuple[Optional[_Record], int]:
+        self._log.seek(offset)
+        header = self._log.read(_RECORD.size)
+        if len(header) < _RECORD.size:
+            return None, 0
+        crc, tombstone, *lengths, written = _RECORD.unpack(header)
+        body = self._log.read(sum(lengths))
+        if len(body) < sum(lengths) or zlib.crc32(header[4:] + body) != crc:
+            return None, 0
+        fields = []
+        start = 0
+        for length in lengths:
+            fields.append(body[start : start + length])
+            start += length
+        method, key, name, etag, value = fields
+        record = _Record(
+            tombstone,
+            method.decode(),
+            key,
+            name.decode(),
+            etag.decode(),
+            written,
+            value,
+        )
+        return record, _RECORD.size + len(body)
+
+    def _append(self, record: _Record) -> int:
+        offset = self._log.seek(0, os.SEEK_END)
+        self._log.write(record.encode())
+        self._log.flush()
+        self._end = self._log.tell()
+        return offset
+
+    # Index.
+
+    def _slot(self, i: int) -> Tuple[int, int, float]:
+        return _SLOT.unpack_from(self._index, _HEADER.size + i * _SLOT.size)
+
+    def _set_slot(self, i: int, h: int, offset: int, expires: float) -> None:
+        _SLOT.pack_into(self._index, _HEADER.size + i * _SLOT.size, h, offset, expires)
+
+    def _slots(self) -> Iterator[Tuple[int, int, float]]:
+        for i in range(self._capacity):
+            h, offset, expires = self._slot(i)
+            if h != _EMPTY:
+                yield i, offset, expires
+
+    def _find(self, method: str, key: bytes) -> Tuple[int, Optional[int]]:
+        """Return the slot holding a key, or ``-1``, and the first free slot."""
+        h = _hash(method, key)
+        i = h % self._capacity
+        free = None
+        while True:
+            slot_hash, offset, _ = self._slot(i)
+            if slot_hash == _EMPTY:
+                return -1, i if free is None else free
+            if offset == _DELETED:
+                if free is None:
+                    free = i
+            elif slot_hash == h:
+                record, _ = self._read(offset)
+                if record is None:
+                    # The log was truncated or corrupted after the record
+                    # was indexed; it can't be served again.
+                    self._drop_slot(i)
+                    if free is None:
+                        free = i
+                elif record.method == method and record.key == key:
+                    return i, free
+            i = (i + 1) % self._capacity
+
+    def _drop_slot(self, i: int) -> None:
+        self._set_slot(i, self._slot(i)[0], _DELETED, 0.0)
+        self._live -= 1
+        self._unname_slot(i)
+
+    # Resource names.
+
+    def _load_names(self) -> None:
+        live = sorted(
+            ((offset, i) for i, offset, _ in self._slots() if offset != _DELETED)
+        )
+        for offset, i in live:
+            record, _ = self._read(offset)
+            if record is None:
+                self._drop_slot(i)
+            else:
+                self._name_slot(i, record.name)
+
+    def _name_slot(self, i: int, name: str) -> None:
+        slots = self._names.get(name)
+        if slots is None:
+            slots = self._names[name] = set()
+            bisect.insort(self._sorted_names, name)
+        slots.add(i)
+        self._slot_names[i] = name
+
+    def _unname_slot(self, i: int) -> None:
+        name = self._slot_names.pop(i, None)
+        if name is None:
+            return
+        slots = self._names[name]
+        slots.discard(i)
+        if not slots:
+            del self._names[name]
+            del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
+
+    def _named_slots(self, name: str, children: bool) -> List[int]:
+        slots = list(self._names.get(name, ()))
+        if children:
+            prefix = name + "/"
+            names = self._sorted_names
+            for k in range(bisect.bisect_left(names, prefix), len(names)):
+                if not names[k].startswith(prefix):
+                    break
+                slots.extend(self._names[names[k]])
+        return slots
+
+    def _link(
+        self, method: str, key: bytes, name: str, offset: int, expires: float
+    ) -> None:
+        found, free = self._find(method, key)
+        if found >= 0:
+            self._set_slot(found, _hash(method, key), offset, expires)
+            return
+        if self._slot(free)[0] == _EMPTY:
+            self._used += 1
+        self._live += 1
+        self._set_slot(free, _hash(method, key), offset, expires)
+        self._name_slot(free, name)
+        if self._used * 3 > self._capacity * 2:
+            self._grow()
+
+    def _unlink(self, method: str, key: bytes) -> bool:
+        found, _ = self._find(method, key)
+        if found < 0:
+            return False
+        self._drop_slot(found)
+        return True
+
+    def _grow(self) -> None:
+        live = [
+            (self._slot(i)[0], offset, expires, self._slot_names[i])
+            for i, offset, expires in self._slots()
+            if offset != _DELETED
+        ]
+        indexed = _HEADER.unpack_from(self._index, 0)[4]
+        capacity = max(_MIN_CAPACITY, self._capacity)
+        while len(live) * 2 > capacity:
+            capacity *= 2
+        self._map_index(capacity, reset=True)
+        for h, offset, expires, name in live:
+            i = h % capacity
+            while self._slot(i)[0] != _EMPTY:
+                i = (i + 1) % capacity
+            self._set_slot(i, h, offset, expires)
+            self._name_slot(i, name)
+        self._used = self._live = len(live)
+        self._set_indexed(indexed)
+
+    # Cache interface.
+
+    def __len__(self) -> int:
+        return self._live
+
+    def caches(self, method: str) -> bool:
+        """Return whether responses of ``method`` are cached."""
+        return self._ttls.get(method, 0) > 0
+
+    def get(self, method: str, request: proto.Message) -> Optional[proto.Message]:
+        """Look up the cached response to a request.
+
+        Args:
+            method (str): The client method name, e.g. ``"get_entity"``.
+            request (proto.Message): The request being sent.
+
+        Returns:
+            Optional[proto.Message]: The cached response, or ``None`` if
+            there is no live entry.
+        """
+        if not self.caches(method):
+            return None
+        key = type(request).serialize(request)
+        with self._lock:
+            found, _ = self._find(method, key)
+            if found >= 0:
+                _, offset, expires = self._slot(found)
+                if expires > self._clock():
+                    record, _ = self._read(offset)
+                    if record is not None:
+                        self.hits += 1
+                        return _RESPONSE_TYPES[method].deserialize(record.value)
+                    self._drop_slot(found)
+            self.misses += 1
+        return None
+
+    def put(self, method: str, request: proto.Message, response: proto.Message) -> None:
+        """Store the response to a request.
+
+        Args:
+            method (str): The client method name, e.g. ``"get_entity"``.
+            request (proto.Message): The request that was sent. Its
+                ``name`` field identifies the cached resource.
+            response (proto.Message): The response received.
+        """
+        if not self.caches(method):
+            return
+        now = self._clock()
+        record = _Record(
+            0,
+            method,
+            type(request).serialize(request),
+            request.name,
+            getattr(response, "etag", ""),
+            now,
+            type(response).serialize(response),
+        )
+        with self._lock:
+            offset = self._append(record)
+            self._link(
+                method, record.key, record.name, offset, now + self._ttls[method]
+            )
+            self._set_indexed(self._end)
+
+    def _tombstone(self, i: int, record: _Record) -> None:
+        self._append(_Record(1, record.method, record.key, record.name, "", 0.0, b""))
+        self._drop_slot(i)
+
+    def invalidate(self, name: str, *, children: bool = True) -> int:
+        """Evict every cached response for a resource.
+
+        Args:
+            name (str): The resource name to evict, such as a zone.
+            children (bool): Whether to also evict resources whose names
+                are nested under ``name``.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        dropped = 0
+        with self._lock:
+            for i in self._named_slots(name, children):
+                record, _ = self._read(self._slot(i)[1])
+                if record is None:
+                    self._drop_slot(i)
+                else:
+                    self._tombstone(i, record)
+                    dropped += 1
+            if dropped:
+                self._set_indexed(self._end)
+        return dropped
+
+    def revalidate(self, method: str, resource: proto.Message) -> int:
+        """Refresh or drop cached copies of a resource using its ``etag``.
+
+        Listing calls return the current ``etag`` of every entity and
+        partition. Passing such a listed resource here extends the life of
+        cached entries with the same ``etag`` and evicts those whose
+        ``etag`` differs, without fetching the resource again.
+
+        Args:
+            method (str): The client method whose entries to check, e.g.
+                ``"get_entity"``.
+            resource (proto.Message): A freshly listed resource with
+                ``name`` and ``etag`` fields.
+
+        Returns:
+            int: The number of entries refreshed.
+        """
+        return self.revalidate_many(method, (resource,))
+
+    def revalidate_many(self, method: str, resources: Iterable[proto.Message]) -> int:
+        """Like :meth:`revalidate`, for every resource of a listing at once.
+
+        Args:
+            method (str): The client method whose entries to check, e.g.
+                ``"get_entity"``.
+            resources (Iterable[proto.Message]): Freshly listed resources
+                with ``name`` and ``etag`` fields, such as a page.
+
+        Returns:
+            int: The number of entries refreshed.
+        """
+        if not self.caches(method):
+            return 0
+        expires = self._clock() + self._ttls[method]
+        refreshed = dropped = 0
+        with self._lock:
+            for resource in resources:
+                for i in list(self._names.get(resource.name, ())):
+                    h, offset, _ = self._slot(i)
+                    record, _ = self._read(offset)
+                    if record is None:
+                        self._drop_slot(i)
+                    elif record.method != method:
+                        continue
+                    elif record.etag == resource.etag:
+                        self._set_slot(i, h, offset, expires)
+                        refreshed += 1
+                    else:
+                        self._tombstone(i, record)
+                        dropped += 1
+            if dropped:
+                self._set_indexed(self._end)
+        return refreshed
+
+    def clear(self) -> None:
+        """Evict every cached response and empty the log."""
+        with self._lock:
+            self._log.truncate(len(_LOG_MAGIC))
+            self._log.flush()
+            self._map_index(_MIN_CAPACITY, reset=True)
+            self._live = 0
+            self._end = len(_LOG_MAGIC)
+
+    def compact(self) -> None:
+        """Rewrite the log with only the live entries."""
+        with self._lock:
+            now = self._clock()
+            records = []
+            for _, offset, expires in self._slots():
+                if offset != _DELETED and expires > now:
+                    record, _ = self._read(offset)
+                    if record is not None:
+                        records.append((record, expires))
+            log_path = os.path.join(self._path, "log")
+            with open(log_path + ".tmp", "wb") as f:
+                f.write(_LOG_MAGIC)
+                offsets = []
+                for record, _ in records:
+                    offsets.append(f.tell())
+                    f.write(record.encode())
+            self._log.close()
+            os.replace(log_path + ".tmp", log_path)
+            self._log = self._open_log()
+            self._map_index(_MIN_CAPACITY, reset=True)
+            self._live = 0
+            for (record, expires), offset in zip(records, offsets):
+                self._link(record.method, record.key, record.name, offset, expires)
+            self._end = self._log.seek(0, os.SEEK_END)
+            self._set_indexed(self._end)
+
+    def close(self) -> None:
+        """Flush the index and close the cache files."""
+        with self._lock:
+            if self._index is None:
+                return
+            self._index.flush()
+            self._index.close()
+            self._index_file.close()
+            self._log.close()
+            self._lock_file.close()
+            self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+__all__ = (
+    "DEFAULT_TTLS",
+    "PersistentCache",
+)
@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Declarative provisioning of the zones and assets of Dataplex lakes."""
+
+import asyncio
+import enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+from google.cloud.dataplex_v1.operation_manager import OperationManager
+from google.cloud.dataplex_v1.rate_limiting import AdaptiveRateLimiter
+from google.cloud.dataplex_v1.resource_names import AssetName
+from google.cloud.dataplex_v1.resource_names import ZoneName
+from google.cloud.dataplex_v1.services.dataplex_service import (
+    DataplexServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.types import resources
+from google.protobuf import field_mask_pb2  # type: ignore
+
+# The fields compared with the current state and sent in update masks.
+_MUTABLE_FIELDS = ("display_name", "labels", "description", "discovery_spec")
+# The fields that cannot change once the resource is created.
+_IMMUTABLE_FIELDS = {
+    resources.Zone: ("type_", "resource_spec"),
+    resources.Asset: ("resource_spec",),
+}
+
+_Resource = Union[resources.Zone, resources.Asset]
+
+
+class ActionKind(enum.Enum):
+    """What an action does to its resource."""
+
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class Action(NamedTuple):
+    """One change needed to reach the desired state.
+
+    Attributes:
+        kind (ActionKind): What the action does.
+        name (str): The resource name of the zone or asset.
+        resource (Union[google.cloud.dataplex_v1.types.Zone, google.cloud.dataplex_v1.types.Asset]):
+            The desired resource for creations and updates, and the
+            current one for deletions.
+        update_mask (Optional[google.protobuf.field_mask_pb2.FieldMask]):
+            The fields to update, for updates only.
+    """
+
+    kind: ActionKind
+    name: str
+    resource: _Resource
+    update_mask: Optional[field_mask_pb2.FieldMask] = None
+
+
+class ActionResult(NamedTuple):
+    """The outcome of an :class:`Action`.
+
+    Attributes:
+        action (Action): The action.
+        response (Any): The result of its long-running operation, or
+            ``None`` if it failed.
+        error (Optional[Exception]): Why it failed, or ``None``.
+    """
+
+    action: Action
+    response: Any
+    error: Optional[Exception]
+
+
+class DependencyError(Exception):
+    """An action was skipped because an action it depends on failed.
+
+    Attributes:
+        dependency (str): The resource name of the failed action.
+    """
+
+    def __init__(self, dependency: str):
+        super().__init__("{} could not be applied".format(dependency))
+        self.dependency = dependency
+
+
+def _is_set(message, field: str) -> bool:
+    try:
+        return message.HasField(field)
+    except ValueError:
+        # Scalar, repeated and map fields have no presence.
+        return bool(getattr(message, field))
+
+
+def _changed_fields(desired: _Resource, current: _Resource) -> List[str]:
+    # Only the fields set in the desired resource are managed.
+    want, have = type(desired).pb(desired), type(current).pb(current)
+    for field in _IMMUTABLE_FIELDS[type(desired)]:
+        if _is_set(want, field) and getattr(want, field) != getattr(have, field):
+            raise ValueError(
+                "{} cannot change once {} exists".format(field, desired.name)
+            )
+    return [
+        field
+        for field in _MUTABLE_FIELDS
+        if _is_set(want, field) and getattr(want, field) != getattr(have, field)
+    ]
+
+
+class Provisioner:
+    """Brings the zones and assets of lakes to a desired state.
+
+    The desired state is a set of :class:`~google.cloud.dataplex_v1.types.Zone`
+    and :class:`~google.cloud.dataplex_v1.types.Asset` specs, each named
+    with its full resource name. :meth:`plan` compares them with what
+    ``ListZones`` and ``ListAssets`` return and :meth:`execute` applies the
+    resulting actions concurrently: mutations are issued at most
+    ``max_qps`` per second, or at the pace of a shared
+    :class:`~google.cloud.dataplex_v1.rate_limiting.AdaptiveRateLimiter`,
+    and their long-running operations are awaited
+    together through an
+    :class:`~google.cloud.dataplex_v1.operation_manager.OperationManager`
+    instead of one after the other. An asset is only created once its
+    zone is, and a zone is only deleted once its assets are.
+
+    Only the fields set in a spec are managed: fields left empty are
+    neither compared nor updated.
+
+    .. code-block:: python
+
+        provisioner = Provisioner(DataplexServiceAsyncClient())
+        results = await provisioner.apply(
+            [
+                Zone(name=lake + "/zones/raw", type_=Zone.Type.RAW, ...),
+                Asset(name=lake + "/zones/raw/assets/events", ...),
+            ],
+            on_progress=lambda result, done, total: print(done, "/", total),
+        )
+    """
+
+    def __init__(
+        self,
+        client: DataplexServiceAsyncClient,
+        *,
+        max_qps: Optional[float] = 5.0,
+        rate_limiter: AdaptiveRateLimiter = None,
+        max_concurrency: int = 10,
+        operations: OperationManager = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        """Instantiate the provisioner.
+
+        Args:
+            client (google.cloud.dataplex_v1.services.dataplex_service.DataplexServiceAsyncClient):
+                The client used to list and change zones and assets.
+            max_qps (Optional[float]): The maximum number of mutations
+                issued per second, or ``None`` for no limit. Ignored if
+                ``rate_limiter`` is set.
+            rate_limiter (Optional[google.cloud.dataplex_v1.rate_limiting.AdaptiveRateLimiter]):
+                The limiter every mutation takes a token from. Share the
+                one of the client's rate limiting interceptor to keep the
+                mutations within the budget of all of its calls.
+            max_concurrency (int): The maximum number of mutation calls in
+                flight at once. Waiting for their operations does not count.
+            operations (Optional[google.cloud.dataplex_v1.operation_manager.OperationManager]):
+                The manager polling the operations. A new one is used if not
+                set.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        self._client = client
+        if rate_limiter is None and max_qps:
+            # Nothing reports back to this limiter, so its rate is fixed.
+            rate_limiter = AdaptiveRateLimiter(
+                max_qps, burst=1, min_rate=max_qps, max_rate=max_qps
+            )
+        self._rate_limiter = rate_limiter
+        self._max_concurrency = max_concurrency
+        self._operations = operations
+        self._call_options = dict(retry=retry, timeout=timeout, metadata=metadata)
+
+    async def _list(self, method, parents: Iterable[str]) -> Dict[str, _Resource]:
+        async def list_one(parent):
+            pager = await method(parent=parent, **self._call_options)
+            return [resource async for resource in pager]
+
+        pages = await asyncio.gather(*(list_one(parent) for parent in parents))
+        return {resource.name: resource for page in pages for resource in page}
+
+    async def plan(
+        self, specs: Iterable[_Resource], *, prune: bool = False
+    ) -> List[Action]:
+        """Compute the actions needed to reach the desired state.
+
+        Args:
+            specs (Iterable[Union[google.cloud.dataplex_v1.types.Zone, google.cloud.dataplex_v1.types.Asset]]):
+                The desired zones and assets. Zones that are only the
+                parent of an asset spec are kept as they are.
+            prune (bool): Whether the zones and assets of the lakes
+                covered by ``specs`` that are not in ``specs`` are deleted.
+
+        Returns:
+            List[Action]: The actions, in an order that respects their
+            dependencies: zone creations and updates, then asset creations
+            and updates, then asset deletions, then zone deletions.
+
+        Raises:
+            ValueError: If a spec is misnamed, changes an immutable field,
+                or belongs to a zone that neither exists nor is specified.
+        """
+        zones: Dict[str, resources.Zone] = {}
+        assets: Dict[str, resources.Asset] = {}
+        for spec in specs:
+            if isinstance(spec, resources.Zone):
+                zones[str(ZoneName.from_path(spec.name))] = spec
+            elif isinstance(spec, resources.Asset):
+                assets[str(AssetName.from_path(spec.name))] = spec
+            else:
+                raise TypeError("expected a Zone or an Asset, got {!r}".format(spec))
+        kept_zones = set(zones)
+        kept_zones.update(str(AssetName.from_path(name).parent) for name in assets)
+        lakes = sorted({str(ZoneName.from_path(name).parent) for name in kept_zones})
+
+        current_zones = await self._list(self._client.list_zones, lakes)
+        for name in kept_zones:
+            if name not in zones and name not in current_zones:
+                raise ValueError("zone {} does not exist".format(name))
+        listed = current_zones if prune else kept_zones
+        current_assets = await self._list(
+            self._client.list_assets, sorted(n for n in listed if n in current_zones)
+        )
+
+        def changes(desired, current):
+            actions = []
+            for name, resource in sorted(desired.items()):
+                if name not in current:
+                    actions.append(Action(ActionKind.CREATE, name, resource))
+                    continue
+                fields = _changed_fields(resource, current[name])
+                if fields:
+                    mask = field_mask_pb2.FieldMask(paths=fields)
+                    actions.append(Action(ActionKind.UPDATE, name, resource, mask))
+            return actions
+
+        actions = changes(zones, current_zones) + changes(assets, current_assets)
+        if prune:
+            actions.extend(
+                Action(ActionKind.DELETE, name, resource)
+                for name, resource in sorted(current_assets.items())
+                if name not in assets
+            )
+            actions.extend(
+                Action(ActionKind.DELETE, name, resource)
+                for name, resource in sorted(current_zones.items())
+                if name not in kept_zones
+            )
+        return actions
+
+    async def _perform(self, action: Action, semaphore, limiter, operations):
+        is_zone = isinstance(action.resource, resources.Zone)
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire_async()
+            if action.kind is ActionKind.DELETE:
+                method = (
+                    self._client.delete_zone if is_zone else self._client.delete_asset
+                )
+                operation = await method(name=action.name, **self._call_options)
+            elif action.kind is ActionKind.UPDATE:
+                key = "zone" if is_zone else "asset"
+                method = getattr(self._client, "update_" + key)
+                operation = await method(
+                    **{key: action.resource, "update_mask": action.update_mask},
+                    **self._call_options,
+                )
+            else:
+                key = "zone" if is_zone else "asset"
+                name = (
+                    ZoneName.from_path(action.name)
+                    if is_zone
+                    else AssetName.from_path(action.name)
+                )
+                method = getattr(self._client, "create_" + key)
+                operation = await method(
+                    parent=str(name.parent),
+                    **{key: action.resource, key + "_id": name.id},
+                    **self._call_options,
+                )
+        return (await operations.wait_all([operation]))[0]
+
+    async def execute(
+        self,
+        actions: Iterable[Action],
+        *,
+        on_progress: Optional[Callable[[ActionResult, int, int], None]] = None,
+        return_exceptions: bool = False,
+    ) -> List[ActionResult]:
+        """Apply actions concurrently, respecting their dependencies.
+
+        Args:
+            actions (Iterable[Action]): The actions, as returned by
+                :meth:`plan`.
+            on_progress (Optional[Callable[[ActionResult, int, int], None]]):
+                Called as each action completes or fails, with its result,
+                the number of actions settled so far and the total.
+            return_exceptions (bool): Whether to return failed actions in
+                the results instead of raising. Actions that depend on a
+                failed one fail with a :class:`DependencyError` either way.
+
+        Returns:
+            List[ActionResult]: The result of every action, in input order.
+
+        Raises:
+            Exception: The error of the first failed action, once every
+                action has settled, unless ``return_exceptions`` is set.
+        """
+        actions = list(actions)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        limiter = self._rate_limiter
+        operations = self._operations or OperationManager()
+        created_zones = {
+            a.name
+            for a in actions
+            if a.kind is ActionKind.CREATE and isinstance(a.resource, resources.Zone)
+        }
+        deleted_assets = [
+            a.name
+            for a in actions
+            if a.kind is ActionKind.DELETE and isinstance(a.resource, resources.Asset)
+        ]
+        tasks: Dict[str, asyncio.Future] = {}
+        settled = 0
+
+        def dependencies(action):
+            if isinstance(action.resource, resources.Asset):
+                zone = str(AssetName.from_path(action.name).parent)
+                if action.kind is not ActionKind.DELETE and zone in created_zones:
+                    return [zone]
+            elif action.kind is ActionKind.DELETE:
+                prefix = action.name + "/assets/"
+                return [n for n in deleted_assets if n.startswith(prefix)]
+            return []
+
+        async def run(action, waits_on):
+            nonlocal settled
+            response = error = None
+            for dependency in waits_on:
+                if (await tasks[dependency]).error is not None:
+                    error = DependencyError(dependency)
+                    break
+            if error is None:
+                try:
+                    response = await self._perform(
+                        action, semaphore, limiter, operations
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    error = exc
+            result = ActionResult(action, response, error)
+            settled += 1
+            if on_progress is not None:
+                on_progress(result, settled, len(actions))
+            return result
+
+        try:
+            for action in actions:
+                waits_on = [d for d in dependencies(action) if d in tasks]
+                tasks[action.name] = asyncio.ensure_future(run(action, waits_on))
+            results = await asyncio.gather(*(tasks[a.name] for a in actions))
+        finally:
+            if self._operations is None:
+                await operations.close()
+        if not return_exceptions:
+            for result in results:
+                if result.error is not None:
+                    raise result.error
+        return list(results)
+
+    async def apply(
+        self,
+        specs: Iterable[_Resource],
+        *,
+        prune: bool = False,
+        on_progress: Optional[Callable[[ActionResult, int, int], None]] = None,
+        return_exceptions: bool = False,
+    ) -> List[ActionResult]:
+        """Plan and execute the changes needed to reach the desired state.
+
+        See :meth:`plan` and :meth:`execute` for the arguments.
+
+        Returns:
+            List[ActionResult]: The result of every action taken.
+        """
+        actions = await self.plan(specs, prune=prune)
+        return await self.execute(
+            actions, on_progress=on_progress, return_exceptions=return_exceptions
+        )
+
+
+__all__ = (
+    "Action",
+    "ActionKind",
+    "ActionResult",
+    "DependencyError",
+    "Provisioner",
+)
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Adaptive client-side rate limiting of the calls made by a transport."""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.dataplex_v1 import _interceptors
+
+
+class AdaptiveRateLimiter:
+    """A token bucket whose rate adapts to the service's feedback.
+
+    Every call takes one token; tokens refill at :attr:`rate` per second,
+    up to ``burst``. Calls that find the bucket empty wait for their turn
+    in order of arrival. The rate follows an additive-increase,
+    multiplicative-decrease rule: each successful call raises it by
+    ``increase / rate``, about ``increase`` calls per second for every
+    second of sustained traffic, while a ``RESOURCE_EXHAUSTED`` response,
+    or a call slower than ``latency_target``, multiplies it by
+    ``decrease``. Decreases are at most once per ``cooldown`` seconds, so
+    that a burst of rejections of calls already in flight counts once.
+
+    A limiter is safe to share between threads and coroutines, and
+    between the synchronous and ``asyncio`` transports.
+
+    Attributes:
+        throttled (int): The number of ``RESOURCE_EXHAUSTED`` responses
+            seen.
+        waits (int): The number of calls that had to wait for a token.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        *,
+        burst: float = None,
+        min_rate: float = 1.0,
+        max_rate: float = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target: float = None,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Instantiate the limiter.
+
+        Args:
+            rate (float): The initial number of calls per second.
+            burst (Optional[float]): The most tokens the bucket holds.
+                Defaults to one second worth of ``rate``.
+            min_rate (float): The rate never drops below this.
+            max_rate (Optional[float]): The rate never grows above this.
+                Unbounded if not set.
+            increase (float): The additive increase, in calls per second
+                gained per second of successful calls.
+            decrease (float): The factor applied to the rate when the
+                service pushes back, between 0 and 1.
+            latency_target (Optional[float]): Calls slower than this many
+                seconds count as push-back. Latency is ignored if not set.
+            cooldown (float): The minimum number of seconds between two
+                decreases.
+            clock (Callable[[], float]): The monotonic clock to use.
+        """
+        if not 0 < min_rate <= rate:
+            raise ValueError("expected 0 < min_rate <= rate")
+        if max_rate is not None and max_rate < rate:
+            raise ValueError("max_rate must be at least rate")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self._rate = float(rate)
+        self._burst = float(burst) if burst is not None else max(1.0, self._rate)
+        self._min_rate = min_rate
+        self._max_rate = max_rate if max_rate is not None else float("inf")
+        self._increase = increase
+        self._decrease = decrease
+        self._latency_target = latency_target
+        self._cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self._burst
+        self._updated = clock()
+        self._last_decrease = float("-inf")
+        self.throttled = 0
+        self.waits = 0
+
+    @property
+    def rate(self) -> float:
+        """float: The current number of calls allowed per second."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, and return how many seconds to wait before using it."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            self.waits += 1
+            # A negative balance queues the caller behind earlier ones.
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a call may be made."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a call may be made."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _back_off(self, now: float) -> None:
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        self._refill(now)
+        self._rate = max(self._min_rate, self._rate * self._decrease)
+
+    def record(self, code: grpc.StatusCode, latency: float) -> None:
+        """Adapt the rate to the outcome of a call.
+
+        Args:
+            code (grpc.StatusCode): The status the call ended with. Only
+                ``OK`` and ``RESOURCE_EXHAUSTED`` are taken into account.
+            latency (float): How long the call took, in seconds.
+        """
+        with self._lock:
+            now = self._clock()
+            if code == grpc.StatusCode.RESOURCE_EXHAUSTED:
+                self.throttled += 1
+                self._back_off(now)
+            elif code == grpc.StatusCode.OK:
+                if self._latency_target is not None and latency > self._latency_target:
+                    self._back_off(now)
+                else:
+                    self._refill(now)
+                    self._rate = min(
+                        self._max_rate, self._rate + self._increase / self._rate
+                    )
+
+
+class _RateLimits:
+    def __init__(
+        self,
+        limiter: Optional[AdaptiveRateLimiter],
+        methods: Optional[Mapping[str, AdaptiveRateLimiter]],
+    ):
+        if limiter is None and not methods:
+            raise ValueError("expected a limiter, per-method limiters, or both")
+        self._default = limiter
+        self._methods = dict(methods or {})
+        self._resolved: Dict[str, Optional[AdaptiveRateLimiter]] = {}
+
+    def _limiter(self, path: str) -> Optional[AdaptiveRateLimiter]:
+        try:
+            return self._resolved[path]
+        except KeyError:
+            name = path.decode() if isinstance(path, bytes) else path
+            limiter = self._methods.get(name)
+            if limiter is None:
+                limiter = self._methods.get(
+                    _interceptors.method_name(name), self._default
+                )
+            return self._resolved.setdefault(path, limiter)
+
+
+class RateLimitInterceptor(_RateLimits, grpc.UnaryUnaryClientInterceptor):
+    """Rate limits the calls of a synchronous gRPC transport.
+
+    Pass it to the transport, and every call made through it, retries
+    included, first takes a token from the limiter of its method:
+
+    .. code-block:: python
+
+        limiter = AdaptiveRateLimiter(rate=50, max_rate=500)
+        transport = MetadataServiceGrpcTransport(
+            interceptors=[RateLimitInterceptor(limiter)]
+        )
+        client = MetadataServiceClient(transport=transport)
+
+    The default retry settings do not retry ``RESOURCE_EXHAUSTED``; with a
+    limiter in place the service's push-back slows every later call down
+    instead.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveRateLimiter = None,
+        *,
+        methods: Mapping[str, AdaptiveRateLimiter] = None,
+    ):
+        """Instantiate the interceptor.
+
+        Args:
+            limiter (Optional[AdaptiveRateLimiter]): The limiter of the
+                methods that have none of their own. Those methods are not
+                limited if not set.
+            methods (Optional[Mapping[str, AdaptiveRateLimiter]]): Limiters
+                of individual methods, keyed by the transport method name,
+                such as ``"get_entity"``, or the full gRPC method path.
+                Several methods can share one limiter.
+        """
+        super().__init__(limiter, methods)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        limiter = self._limiter(client_call_details.method)
+        if limiter is None:
+            return continuation(client_call_details, request)
+        limiter.acquire()
+        start = time.monotonic()
+        outcome = continuation(client_call_details, request)
+        outcome.add_done_callback(
+            lambda call: limiter.record(call.code(), time.monotonic() - start)
+        )
+        return outcome
+
+
+class AsyncRateLimitInterceptor(_RateLimits, aio.UnaryUnaryClientInterceptor):
+    """Rate limits the calls of an ``asyncio`` gRPC transport.
+
+    This is the ``asyncio`` counterpart of :class:`RateLimitInterceptor`,
+    and takes the same arguments. Callers wait for a token without
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveRateLimiter = None,
+        *,
+        methods: Mapping[str, AdaptiveRateLimiter] = None,
+    ):
+        """Instantiate the interceptor.
+
+        See :class:`RateLimitInterceptor` for the arguments.
+        """
+        super().__init__(limiter, methods)
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        limiter = self._limiter(client_call_details.method)
+        if limiter is None:
+            return await continuation(client_call_details, request)
+        await limiter.acquire_async()
+        start = time.monotonic()
+        call = await continuation(client_call_details, request)
+        limiter.record(await call.code(), time.monotonic() - start)
+        return call
+
+
+__all__ = (
+    "AdaptiveRateLimiter",
+    "AsyncRateLimitInterceptor",
+    "RateLimitInterceptor",
+)
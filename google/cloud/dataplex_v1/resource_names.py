@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compact, hashable values for the resource names of the Dataplex API.
+
+There is one type per ``*_path`` helper of the clients. A name holds its
+own identifier and a reference to its parent name, and parents are
+interned, so the project, location, lake and zone prefixes shared by many
+names are stored once:
+
+.. code-block:: python
+
+    name = PartitionName.from_path(partition.name)
+    name.entity                        # 'orders'
+    name.parent                        # EntityName('p', 'l', 'k', 'z', 'orders')
+    str(name) == partition.name        # True
+"""
+
+import threading
+from typing import Dict, Optional, Tuple, Type
+
+from google.cloud.dataplex_v1 import _path_template
+
+_interned: Dict[Tuple[type, Tuple[str, ...]], "ResourceName"] = {}
+_interned_lock = threading.Lock()
+
+
+class ResourceName:
+    """Base class of the resource name types.
+
+    Subclasses declare the collection and variable of their last segment,
+    and the type of their parent name. A name is built from the values of
+    every variable of its template, from the root down, and compares equal
+    to any other name of the same type with the same values.
+    """
+
+    __slots__ = ("_parent", "_id")
+
+    #: The literal segment before the identifier, such as ``"lakes"``.
+    collection: str = ""
+    #: The variable the identifier is bound to, such as ``"lake"``.
+    variable: str = ""
+    #: The type of the parent name, if any.
+    parent_type: Optional[Type["ResourceName"]] = None
+
+    #: The template of the name, as used by the clients' ``*_path`` helpers.
+    template: _path_template.PathTemplate
+    #: The variables of the template, from the root down.
+    variables: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        lineage = [cls]
+        while lineage[0].parent_type is not None:
+            lineage.insert(0, lineage[0].parent_type)
+        cls.variables = tuple(klass.variable for klass in lineage)
+        cls.template = _path_template.PathTemplate(
+            "/".join(
+                "{}/{{{}}}".format(klass.collection, klass.variable)
+                for klass in lineage
+            )
+        )
+        depth = len(lineage) - 1
+        for level, klass in enumerate(lineage):
+            setattr(cls, klass.variable, property(_ancestor_id(depth - level)))
+
+    def __init__(self, *values: str):
+        """Instantiate the name.
+
+        Args:
+            values (str): The value of each variable of the template, from
+                the root down, as passed to the matching ``*_path`` helper.
+        """
+        if len(values) != len(self.variables):
+            raise TypeError(
+                "{} takes {} values ({}), got {}".format(
+                    type(self).__name__,
+                    len(self.variables),
+                    ", ".join(self.variables),
+                    len(values),
+                )
+            )
+        parent_type = self.parent_type
+        self._parent = parent_type.intern(*values[:-1]) if parent_type else None
+        self._id = values[-1]
+
+    @classmethod
+    def intern(cls, *values: str) -> "ResourceName":
+        """Return the shared instance of the name with the given values.
+
+        Names created through :meth:`__init__` and :meth:`from_path` already
+        share their parents this way; intern a name to share it too.
+        """
+        key = (cls, values)
+        name = _interned.get(key)
+        if name is None:
+            name = cls(*values)
+            with _interned_lock:
+                name = _interned.setdefault(key, name)
+        return name
+
+    @classmethod
+    def from_path(cls, path: str) -> "ResourceName":
+        """Parse a resource name string.
+
+        Args:
+            path (str): The resource name, as returned by the matching
+                ``*_path`` helper.
+
+        Raises:
+            ValueError: If the name does not match the template.
+        """
+        values = cls.template.parse(path)
+        if not values:
+            raise ValueError(
+                "{!r} is not a resource name of the form {!r}".format(
+                    path, cls.template.template
+                )
+            )
+        return cls(*(values[variable] for variable in cls.variables))
+
+    @property
+    def parent(self) -> Optional["ResourceName"]:
+        """Optional[ResourceName]: The parent name, or ``None`` at the root."""
+        return self._parent
+
+    @property
+    def id(self) -> str:
+        """str: The value of the last variable of the name."""
+        return self._id
+
+    @property
+    def path(self) -> str:
+        """str: The resource name string."""
+        if self._parent is None:
+            return "{}/{}".format(self.collection, self._id)
+        return "{}/{}/{}".format(self._parent.path, self.collection, self._id)
+
+    def values(self) -> Tuple[str, ...]:
+        """Return the value of each variable of the template, from the root down."""
+        if self._parent is None:
+            return (self._id,)
+        return self._parent.values() + (self._id,)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the variables of the name, as the ``parse_*_path`` helpers do."""
+        return dict(zip(self.variables, self.values()))
+
+    def __str__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__, ", ".join(repr(v) for v in self.values())
+        )
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._id == other._id and (
+            self._parent is other._parent or self._parent == other._parent
+        )
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((type(self), self._parent, self._id))
+
+    def __reduce__(self):
+        # Unpickled names share their parents with the names already held.
+        return type(self), self.values()
+
+
+def _ancestor_id(levels: int):
+    def getter(self) -> str:
+        for _ in range(levels):
+            self = self._parent
+        return self._id
+
+    return getter
+
+
+def clear_interned() -> None:
+    """Forget the interned names.
+
+    Names already created keep their parents; only names created from now
+    on stop sharing them with the earlier ones.
+    """
+    with _interned_lock:
+        _interned.clear()
+
+
+def interned_count() -> int:
+    """Return the number of interned names."""
+    return len(_interned)
+
+
+class ProjectName(ResourceName):
+    """The name of a project, ``projects/{project}``."""
+
+    __slots__ = ()
+    collection = "projects"
+    variable = "project"
+
+
+class LocationName(ResourceName):
+    """The name of a location, ``projects/{project}/locations/{location}``."""
+
+    __slots__ = ()
+    collection = "locations"
+    variable = "location"
+    parent_type = ProjectName
+
+
+class LakeName(ResourceName):
+    """The name of a lake, ``.../locations/{location}/lakes/{lake}``."""
+
+    __slots__ = ()
+    collection = "lakes"
+    variable = "lake"
+    parent_type = LocationName
+
+
+class ActionName(ResourceName):
+    """The name of an action, ``.../lakes/{lake}/actions/{action}``."""
+
+    __slots__ = ()
+    collection = "actions"
+    variable = "action"
+    parent_type = LakeName
+
+
+class TaskName(ResourceName):
+    """The name of a task, ``.../lakes/{lake}/tasks/{task}``."""
+
+    __slots__ = ()
+    collection = "tasks"
+    variable = "task"
+    parent_type = LakeName
+
+
+class JobName(ResourceName):
+    """The name of a job, ``.../tasks/{task}/jobs/{job}``."""
+
+    __slots__ = ()
+    collection = "jobs"
+    variable = "job"
+    parent_type = TaskName
+
+
+class ZoneName(ResourceName):
+    """The name of a zone, ``.../lakes/{lake}/zones/{zone}``."""
+
+    __slots__ = ()
+    collection = "zones"
+    variable = "zone"
+    parent_type = LakeName
+
+
+class AssetName(ResourceName):
+    """The name of an asset, ``.../zones/{zone}/assets/{asset}``."""
+
+    __slots__ = ()
+    collection = "assets"
+    variable = "asset"
+    parent_type = ZoneName
+
+
+class EntityName(ResourceName):
+    """The name of an entity, ``.../zones/{zone}/entities/{entity}``."""
+
+    __slots__ = ()
+    collection = "entities"
+    variable = "entity"
+    parent_type = ZoneName
+
+
+class PartitionName(ResourceName):
+    """The name of a partition, ``.../entities/{entity}/partitions/{partition}``.
+
+    The partition identifier may itself contain ``/``.
+    """
+
+    __slots__ = ()
+    collection = "partitions"
+    variable = "partition"
+    parent_type = EntityName
+
+
+class FolderName(ResourceName):
+    """The name of a folder, ``folders/{folder}``."""
+
+    __slots__ = ()
+    collection = "folders"
+    variable = "folder"
+
+
+class OrganizationName(ResourceName):
+    """The name of an organization, ``organizations/{organization}``."""
+
+    __slots__ = ()
+    collection = "organizations"
+    variable = "organization"
+
+
+class BillingAccountName(ResourceName):
+    """The name of a billing account, ``billingAccounts/{billing_account}``."""
+
+    __slots__ = ()
+    collection = "billingAccounts"
+    variable = "billing_account"
+
+
+#: The name type for each key of the clients' ``*_path`` helpers, such as
+#: ``"zone"`` for ``zone_path`` or ``"common_project"`` for
+#: ``common_project_path``.
+RESOURCE_NAMES: Dict[str, Type[ResourceName]] = {
+    "action": ActionName,
+    "asset": AssetName,
+    "entity": EntityName,
+    "job": JobName,
+    "lake": LakeName,
+    "partition": PartitionName,
+    "task": TaskName,
+    "zone": ZoneName,
+    "common_billing_account": BillingAccountName,
+    "common_folder": FolderName,
+    "common_organization": OrganizationName,
+    "common_project": ProjectName,
+    "common_location": LocationName,
+}
+
+
+__all__ = (
+    "ActionName",
+    "AssetName",
+    "BillingAccountName",
+    "EntityName",
+    "FolderName",
+    "JobName",
+    "LakeName",
+    "LocationName",
+    "OrganizationName",
+    "PartitionName",
+    "ProjectName",
+    "RESOURCE_NAMES",
+    "ResourceName",
+    "TaskName",
+    "ZoneName",
+    "clear_interned",
+    "interned_count",
+)
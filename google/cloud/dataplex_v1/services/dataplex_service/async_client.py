@@ -33,6 +33,10 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import operation  # type: ignore
 from google.api_core import operation_async  # type: ignore
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1 import _routing
+from google.cloud.dataplex_v1 import _singleflight
+from google.cloud.dataplex_v1 import checkpoints
 from google.cloud.dataplex_v1.services.dataplex_service import pagers
 from google.cloud.dataplex_v1.types import resources
 from google.cloud.dataplex_v1.types import service
@@ -95,6 +99,7 @@ class DataplexServiceAsyncClient:
     parse_common_location_path = staticmethod(
         DataplexServiceClient.parse_common_location_path
     )
+    parse_many = staticmethod(DataplexServiceClient.parse_many)
 
     @classmethod
     def from_service_account_info(cls, info: dict, *args, **kwargs):
@@ -185,6 +190,7 @@ class DataplexServiceAsyncClient:
         transport: Union[str, DataplexServiceTransport] = "grpc_asyncio",
         client_options: ClientOptions = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        single_flight: bool = False,
     ) -> None:
         """Instantiates the dataplex service client.
 
@@ -213,6 +219,10 @@ class DataplexServiceAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            single_flight (bool): Whether concurrent identical ``Get*``
+                calls, and identical first-page ``List*`` calls, share a
+                single RPC. Each caller receives its own copy of the
+                response; the retry and timeout of the first caller apply.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -224,6 +234,7 @@ class DataplexServiceAsyncClient:
             client_options=client_options,
             client_info=client_info,
         )
+        self._single_flight = _singleflight.SingleFlight() if single_flight else None
 
     async def create_lake(
         self,
@@ -305,29 +316,35 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.CreateLakeRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
-        if lake is not None:
-            request.lake = lake
-        if lake_id is not None:
-            request.lake_id = lake_id
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.CreateLakeRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.CreateLakeRequest):
+            if isinstance(request, service.CreateLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateLakeRequest.wrap(request)
+            else:
+                request = service.CreateLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if lake is not None:
+                    request.lake = lake
+                if lake_id is not None:
+                    request.lake_id = lake_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_lake,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_lake
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateLakeRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -405,28 +422,34 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.UpdateLakeRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if lake is not None:
-            request.lake = lake
-        if update_mask is not None:
-            request.update_mask = update_mask
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.UpdateLakeRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.UpdateLakeRequest):
+            if isinstance(request, service.UpdateLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateLakeRequest.wrap(request)
+            else:
+                request = service.UpdateLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if lake is not None:
+                    request.lake = lake
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_lake,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_lake
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("lake.name", request.lake.name),)
+            _routing.header(
+                "lake.name", service.UpdateLakeRequest.pb(request).lake.name
             ),
         )
 
@@ -501,25 +524,31 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.DeleteLakeRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.DeleteLakeRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.DeleteLakeRequest):
+            if isinstance(request, service.DeleteLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteLakeRequest.wrap(request)
+            else:
+                request = service.DeleteLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_lake,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_lake
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteLakeRequest.pb(request).name),
         )
 
         # Send the request.
@@ -544,6 +573,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListLakesAsyncPager:
         r"""Lists lake resources in a project and location.
 
@@ -564,6 +599,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListLakesAsyncPager:
@@ -583,43 +640,74 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListLakesRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListLakesRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListLakesRequest):
+            if isinstance(request, service.ListLakesRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListLakesRequest.wrap(request)
+            else:
+                request = service.ListLakesRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_lakes,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_lakes
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListLakesRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListLakesResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_lakes", request.page_size)
+            request = service.ListLakesRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListLakesRequest.pb(request).parent),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListLakesAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -633,6 +721,7 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> resources.Lake:
         r"""Retrieves a lake resource.
 
@@ -651,6 +740,9 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Lake:
@@ -682,38 +774,43 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.GetLakeRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.GetLakeRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.GetLakeRequest):
+            if isinstance(request, service.GetLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetLakeRequest.wrap(request)
+            else:
+                request = service.GetLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_lake,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[self._client._transport.get_lake]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetLakeRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = resources.Lake.pb(response)
 
         # Done; return the response.
         return response
@@ -726,6 +823,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListLakeActionsAsyncPager:
         r"""Lists action resources in a lake.
 
@@ -744,6 +847,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListLakeActionsAsyncPager:
@@ -763,43 +888,78 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListLakeActionsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListLakeActionsRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListLakeActionsRequest):
+            if isinstance(request, service.ListLakeActionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListLakeActionsRequest.wrap(request)
+            else:
+                request = service.ListLakeActionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_lake_actions,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_lake_actions
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListLakeActionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListActionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_lake_actions", request.page_size
+            )
+            request = service.ListLakeActionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", service.ListLakeActionsRequest.pb(request).parent
+            ),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListLakeActionsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -878,29 +1038,35 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.CreateZoneRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
-        if zone is not None:
-            request.zone = zone
-        if zone_id is not None:
-            request.zone_id = zone_id
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.CreateZoneRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.CreateZoneRequest):
+            if isinstance(request, service.CreateZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateZoneRequest.wrap(request)
+            else:
+                request = service.CreateZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if zone is not None:
+                    request.zone = zone
+                if zone_id is not None:
+                    request.zone_id = zone_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_zone,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_zone
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateZoneRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -971,28 +1137,34 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.UpdateZoneRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if zone is not None:
-            request.zone = zone
-        if update_mask is not None:
-            request.update_mask = update_mask
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.UpdateZoneRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.UpdateZoneRequest):
+            if isinstance(request, service.UpdateZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateZoneRequest.wrap(request)
+            else:
+                request = service.UpdateZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if zone is not None:
+                    request.zone = zone
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_zone,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_zone
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("zone.name", request.zone.name),)
+            _routing.header(
+                "zone.name", service.UpdateZoneRequest.pb(request).zone.name
             ),
         )
 
@@ -1067,25 +1239,31 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.DeleteZoneRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.DeleteZoneRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.DeleteZoneRequest):
+            if isinstance(request, service.DeleteZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteZoneRequest.wrap(request)
+            else:
+                request = service.DeleteZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_zone,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_zone
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteZoneRequest.pb(request).name),
         )
 
         # Send the request.
@@ -1110,6 +1288,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListZonesAsyncPager:
         r"""Lists zone resources in a lake.
 
@@ -1128,6 +1312,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListZonesAsyncPager:
@@ -1147,43 +1353,74 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListZonesRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListZonesRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListZonesRequest):
+            if isinstance(request, service.ListZonesRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListZonesRequest.wrap(request)
+            else:
+                request = service.ListZonesRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_zones,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_zones
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListZonesRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListZonesResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_zones", request.page_size)
+            request = service.ListZonesRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListZonesRequest.pb(request).parent),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListZonesAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1197,6 +1434,7 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> resources.Zone:
         r"""Retrieves a zone resource.
 
@@ -1215,6 +1453,9 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Zone:
@@ -1238,38 +1479,43 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.GetZoneRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.GetZoneRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.GetZoneRequest):
+            if isinstance(request, service.GetZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetZoneRequest.wrap(request)
+            else:
+                request = service.GetZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_zone,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[self._client._transport.get_zone]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetZoneRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = resources.Zone.pb(response)
 
         # Done; return the response.
         return response
@@ -1282,6 +1528,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListZoneActionsAsyncPager:
         r"""Lists action resources in a zone.
 
@@ -1300,6 +1552,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListZoneActionsAsyncPager:
@@ -1319,43 +1593,78 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListZoneActionsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListZoneActionsRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListZoneActionsRequest):
+            if isinstance(request, service.ListZoneActionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListZoneActionsRequest.wrap(request)
+            else:
+                request = service.ListZoneActionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_zone_actions,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_zone_actions
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListZoneActionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListActionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_zone_actions", request.page_size
+            )
+            request = service.ListZoneActionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", service.ListZoneActionsRequest.pb(request).parent
+            ),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListZoneActionsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1428,29 +1737,35 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.CreateAssetRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
-        if asset is not None:
-            request.asset = asset
-        if asset_id is not None:
-            request.asset_id = asset_id
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.CreateAssetRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.CreateAssetRequest):
+            if isinstance(request, service.CreateAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateAssetRequest.wrap(request)
+            else:
+                request = service.CreateAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if asset is not None:
+                    request.asset = asset
+                if asset_id is not None:
+                    request.asset_id = asset_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_asset,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_asset
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateAssetRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -1518,28 +1833,34 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.UpdateAssetRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if asset is not None:
-            request.asset = asset
-        if update_mask is not None:
-            request.update_mask = update_mask
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.UpdateAssetRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.UpdateAssetRequest):
+            if isinstance(request, service.UpdateAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateAssetRequest.wrap(request)
+            else:
+                request = service.UpdateAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if asset is not None:
+                    request.asset = asset
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_asset,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_asset
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("asset.name", request.asset.name),)
+            _routing.header(
+                "asset.name", service.UpdateAssetRequest.pb(request).asset.name
             ),
         )
 
@@ -1615,25 +1936,31 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.DeleteAssetRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.DeleteAssetRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.DeleteAssetRequest):
+            if isinstance(request, service.DeleteAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteAssetRequest.wrap(request)
+            else:
+                request = service.DeleteAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_asset,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_asset
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteAssetRequest.pb(request).name),
         )
 
         # Send the request.
@@ -1658,6 +1985,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListAssetsAsyncPager:
         r"""Lists asset resources in a zone.
 
@@ -1676,6 +2009,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListAssetsAsyncPager:
@@ -1695,43 +2050,74 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListAssetsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListAssetsRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListAssetsRequest):
+            if isinstance(request, service.ListAssetsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListAssetsRequest.wrap(request)
+            else:
+                request = service.ListAssetsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_assets,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_assets
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListAssetsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListAssetsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_assets", request.page_size)
+            request = service.ListAssetsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListAssetsRequest.pb(request).parent),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListAssetsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1745,6 +2131,7 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> resources.Asset:
         r"""Retrieves an asset resource.
 
@@ -1763,6 +2150,9 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Asset:
@@ -1781,38 +2171,45 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.GetAssetRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.GetAssetRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.GetAssetRequest):
+            if isinstance(request, service.GetAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetAssetRequest.wrap(request)
+            else:
+                request = service.GetAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_asset,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.get_asset
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetAssetRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = resources.Asset.pb(response)
 
         # Done; return the response.
         return response
@@ -1825,6 +2222,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListAssetActionsAsyncPager:
         r"""Lists action resources in an asset.
 
@@ -1843,6 +2246,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListAssetActionsAsyncPager:
@@ -1862,43 +2287,78 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListAssetActionsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListAssetActionsRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListAssetActionsRequest):
+            if isinstance(request, service.ListAssetActionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListAssetActionsRequest.wrap(request)
+            else:
+                request = service.ListAssetActionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_asset_actions,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_asset_actions
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListAssetActionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListActionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_asset_actions", request.page_size
+            )
+            request = service.ListAssetActionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", service.ListAssetActionsRequest.pb(request).parent
+            ),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListAssetActionsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1962,29 +2422,35 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.CreateTaskRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
-        if task is not None:
-            request.task = task
-        if task_id is not None:
-            request.task_id = task_id
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.CreateTaskRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.CreateTaskRequest):
+            if isinstance(request, service.CreateTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateTaskRequest.wrap(request)
+            else:
+                request = service.CreateTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if task is not None:
+                    request.task = task
+                if task_id is not None:
+                    request.task_id = task_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_task,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_task
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateTaskRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -2053,28 +2519,34 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.UpdateTaskRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if task is not None:
-            request.task = task
-        if update_mask is not None:
-            request.update_mask = update_mask
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.UpdateTaskRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.UpdateTaskRequest):
+            if isinstance(request, service.UpdateTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateTaskRequest.wrap(request)
+            else:
+                request = service.UpdateTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if task is not None:
+                    request.task = task
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_task,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_task
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("task.name", request.task.name),)
+            _routing.header(
+                "task.name", service.UpdateTaskRequest.pb(request).task.name
             ),
         )
 
@@ -2148,25 +2620,31 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.DeleteTaskRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.DeleteTaskRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.DeleteTaskRequest):
+            if isinstance(request, service.DeleteTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteTaskRequest.wrap(request)
+            else:
+                request = service.DeleteTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_task,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_task
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteTaskRequest.pb(request).name),
         )
 
         # Send the request.
@@ -2191,6 +2669,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListTasksAsyncPager:
         r"""Lists tasks under the given lake.
 
@@ -2209,6 +2693,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListTasksAsyncPager:
@@ -2228,43 +2734,74 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListTasksRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListTasksRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListTasksRequest):
+            if isinstance(request, service.ListTasksRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListTasksRequest.wrap(request)
+            else:
+                request = service.ListTasksRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_tasks,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_tasks
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListTasksRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListTasksResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_tasks", request.page_size)
+            request = service.ListTasksRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListTasksRequest.pb(request).parent),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListTasksAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -2278,6 +2815,7 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> tasks.Task:
         r"""Get task resource.
 
@@ -2296,6 +2834,9 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Task:
@@ -2311,38 +2852,43 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.GetTaskRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.GetTaskRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.GetTaskRequest):
+            if isinstance(request, service.GetTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetTaskRequest.wrap(request)
+            else:
+                request = service.GetTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_task,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[self._client._transport.get_task]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetTaskRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = tasks.Task.pb(response)
 
         # Done; return the response.
         return response
@@ -2355,6 +2901,12 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListJobsAsyncPager:
         r"""Lists Jobs under the given task.
 
@@ -2373,6 +2925,28 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListJobsAsyncPager:
@@ -2392,43 +2966,74 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.ListJobsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.ListJobsRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.ListJobsRequest):
+            if isinstance(request, service.ListJobsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListJobsRequest.wrap(request)
+            else:
+                request = service.ListJobsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_jobs,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_jobs
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListJobsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(service.ListJobsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_jobs", request.page_size)
+            request = service.ListJobsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListJobsRequest.pb(request).parent),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListJobsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -2442,6 +3047,7 @@ class DataplexServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> tasks.Job:
         r"""Get job resource.
 
@@ -2460,6 +3066,9 @@ class DataplexServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Job:
@@ -2477,38 +3086,43 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.GetJobRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.GetJobRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.GetJobRequest):
+            if isinstance(request, service.GetJobRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetJobRequest.wrap(request)
+            else:
+                request = service.GetJobRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_job,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[self._client._transport.get_job]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetJobRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = tasks.Job.pb(response)
 
         # Done; return the response.
         return response
@@ -2550,25 +3164,31 @@ class DataplexServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = service.CancelJobRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a service.CancelJobRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, service.CancelJobRequest):
+            if isinstance(request, service.CancelJobRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CancelJobRequest.wrap(request)
+            else:
+                request = service.CancelJobRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.cancel_job,
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.cancel_job
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.CancelJobRequest.pb(request).name),
         )
 
         # Send the request.
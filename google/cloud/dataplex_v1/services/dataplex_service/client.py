@@ -14,9 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 import pkg_resources
 
 from google.api_core import client_options as client_options_lib
@@ -36,6 +37,11 @@ except AttributeError:  # pragma: NO COVER
 
 from google.api_core import operation  # type: ignore
 from google.api_core import operation_async  # type: ignore
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1 import _path_template
+from google.cloud.dataplex_v1 import _routing
+from google.cloud.dataplex_v1 import caching
+from google.cloud.dataplex_v1 import checkpoints
 from google.cloud.dataplex_v1.services.dataplex_service import pagers
 from google.cloud.dataplex_v1.types import resources
 from google.cloud.dataplex_v1.types import service
@@ -46,6 +52,8 @@ from google.protobuf import timestamp_pb2  # type: ignore
 from .transports.base import DataplexServiceTransport, DEFAULT_CLIENT_INFO
 from .transports.grpc import DataplexServiceGrpcTransport
 from .transports.grpc_asyncio import DataplexServiceGrpcAsyncIOTransport
+from .transports.grpc_pool import DataplexServiceGrpcPoolTransport
+from .transports.grpc_asyncio_pool import DataplexServiceGrpcAsyncIOPoolTransport
 
 
 class DataplexServiceClientMeta(type):
@@ -61,6 +69,8 @@ class DataplexServiceClientMeta(type):
     )  # type: Dict[str, Type[DataplexServiceTransport]]
     _transport_registry["grpc"] = DataplexServiceGrpcTransport
     _transport_registry["grpc_asyncio"] = DataplexServiceGrpcAsyncIOTransport
+    _transport_registry["grpc_pool"] = DataplexServiceGrpcPoolTransport
+    _transport_registry["grpc_asyncio_pool"] = DataplexServiceGrpcAsyncIOPoolTransport
 
     def get_transport_class(cls, label: str = None,) -> Type[DataplexServiceTransport]:
         """Returns an appropriate transport class.
@@ -172,6 +182,39 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         """
         return self._transport
 
+    # The template of each resource name, keyed as the ``*_path`` helpers.
+    _path_templates = {
+        "action": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/actions/{action}"
+        ),
+        "asset": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/zones/{zone}/assets/{asset}"
+        ),
+        "job": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/tasks/{task}/jobs/{job}"
+        ),
+        "lake": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}"
+        ),
+        "task": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/tasks/{task}"
+        ),
+        "zone": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/zones/{zone}"
+        ),
+        "common_billing_account": _path_template.PathTemplate(
+            "billingAccounts/{billing_account}"
+        ),
+        "common_folder": _path_template.PathTemplate("folders/{folder}"),
+        "common_organization": _path_template.PathTemplate(
+            "organizations/{organization}"
+        ),
+        "common_project": _path_template.PathTemplate("projects/{project}"),
+        "common_location": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}"
+        ),
+    }
+
     @staticmethod
     def action_path(project: str, location: str, lake: str, action: str,) -> str:
         """Returns a fully-qualified action string."""
@@ -182,11 +225,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_action_path(path: str) -> Dict[str, str]:
         """Parses a action path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/actions/(?P<action>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["action"].parse(path)
 
     @staticmethod
     def asset_path(
@@ -200,11 +239,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_asset_path(path: str) -> Dict[str, str]:
         """Parses a asset path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/zones/(?P<zone>.+?)/assets/(?P<asset>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["asset"].parse(path)
 
     @staticmethod
     def job_path(project: str, location: str, lake: str, task: str, job: str,) -> str:
@@ -216,11 +251,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_job_path(path: str) -> Dict[str, str]:
         """Parses a job path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/tasks/(?P<task>.+?)/jobs/(?P<job>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["job"].parse(path)
 
     @staticmethod
     def lake_path(project: str, location: str, lake: str,) -> str:
@@ -232,11 +263,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_lake_path(path: str) -> Dict[str, str]:
         """Parses a lake path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["lake"].parse(path)
 
     @staticmethod
     def task_path(project: str, location: str, lake: str, task: str,) -> str:
@@ -248,11 +275,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_task_path(path: str) -> Dict[str, str]:
         """Parses a task path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/tasks/(?P<task>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["task"].parse(path)
 
     @staticmethod
     def zone_path(project: str, location: str, lake: str, zone: str,) -> str:
@@ -264,11 +287,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_zone_path(path: str) -> Dict[str, str]:
         """Parses a zone path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/zones/(?P<zone>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["zone"].parse(path)
 
     @staticmethod
     def common_billing_account_path(billing_account: str,) -> str:
@@ -280,8 +299,9 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["common_billing_account"].parse(
+            path
+        )
 
     @staticmethod
     def common_folder_path(folder: str,) -> str:
@@ -291,8 +311,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["common_folder"].parse(path)
 
     @staticmethod
     def common_organization_path(organization: str,) -> str:
@@ -302,8 +321,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["common_organization"].parse(path)
 
     @staticmethod
     def common_project_path(project: str,) -> str:
@@ -313,8 +331,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["common_project"].parse(path)
 
     @staticmethod
     def common_location_path(project: str, location: str,) -> str:
@@ -326,8 +343,25 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return DataplexServiceClient._path_templates["common_location"].parse(path)
+
+    @staticmethod
+    def parse_many(
+        resource: str, paths: Iterable[str]
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses many resource names of one kind into columns.
+
+        Args:
+            resource (str): The kind of resource, named as in its
+                ``*_path`` helper, e.g. ``"action"`` or ``"common_location"``.
+            paths (Iterable[str]): The resource names.
+
+        Returns:
+            Dict[str, List[Optional[str]]]: One list per path segment, holding
+            the value for each name in order, or ``None`` where a name does
+            not match.
+        """
+        return DataplexServiceClient._path_templates[resource].parse_many(paths)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -403,6 +437,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         transport: Union[str, DataplexServiceTransport, None] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        cache: Optional[caching.ResponseCache] = None,
     ) -> None:
         """Instantiates the dataplex service client.
 
@@ -436,6 +471,13 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            cache (Optional[google.cloud.dataplex_v1.caching.ResponseCache]):
+                A cache for ``Get*`` responses. If set, repeated lookups
+                of a resource are served from it until they expire, and
+                updating or deleting a resource evicts it, both when the
+                operation starts and when its future is seen complete.
+                A :class:`~google.cloud.dataplex_v1.persistent_cache.PersistentCache`
+                also serves lookups cached by earlier processes.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -450,6 +492,8 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             client_options
         )
 
+        self._cache = cache
+
         api_key_value = getattr(client_options, "api_key", None)
         if api_key_value and credentials:
             raise ValueError(
@@ -579,15 +623,19 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.CreateLakeRequest):
-            request = service.CreateLakeRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
-            if lake is not None:
-                request.lake = lake
-            if lake_id is not None:
-                request.lake_id = lake_id
+            if isinstance(request, service.CreateLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateLakeRequest.wrap(request)
+            else:
+                request = service.CreateLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if lake is not None:
+                    request.lake = lake
+                if lake_id is not None:
+                    request.lake_id = lake_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -596,7 +644,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateLakeRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -679,13 +727,17 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.UpdateLakeRequest):
-            request = service.UpdateLakeRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if lake is not None:
-                request.lake = lake
-            if update_mask is not None:
-                request.update_mask = update_mask
+            if isinstance(request, service.UpdateLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateLakeRequest.wrap(request)
+            else:
+                request = service.UpdateLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if lake is not None:
+                    request.lake = lake
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -694,14 +746,18 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("lake.name", request.lake.name),)
+            _routing.header(
+                "lake.name", service.UpdateLakeRequest.pb(request).lake.name
             ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.lake.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -710,6 +766,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.lake.name)
+
         # Done; return the response.
         return response
 
@@ -775,11 +836,15 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.DeleteLakeRequest):
-            request = service.DeleteLakeRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.DeleteLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteLakeRequest.wrap(request)
+            else:
+                request = service.DeleteLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -788,12 +853,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteLakeRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -802,6 +871,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.name)
+
         # Done; return the response.
         return response
 
@@ -813,6 +887,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListLakesPager:
         r"""Lists lake resources in a project and location.
 
@@ -833,6 +913,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListLakesPager:
@@ -857,29 +959,60 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListLakesRequest):
-            request = service.ListLakesRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListLakesRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListLakesRequest.wrap(request)
+            else:
+                request = service.ListLakesRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_lakes]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListLakesRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListLakesResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_lakes", request.page_size)
+            request = service.ListLakesRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListLakesRequest.pb(request).parent),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListLakesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -893,6 +1026,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> resources.Lake:
         r"""Retrieves a lake resource.
 
@@ -911,6 +1045,9 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Lake:
@@ -947,11 +1084,21 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.GetLakeRequest):
-            request = service.GetLakeRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.GetLakeRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetLakeRequest.wrap(request)
+            else:
+                request = service.GetLakeRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_lake", request)
+            if cached is not None:
+                return resources.Lake.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -960,11 +1107,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetLakeRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_lake", request, response)
+
+        if raw:
+            response = resources.Lake.pb(response)
 
         # Done; return the response.
         return response
@@ -977,6 +1129,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListLakeActionsPager:
         r"""Lists action resources in a lake.
 
@@ -995,6 +1153,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListLakeActionsPager:
@@ -1019,29 +1199,64 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListLakeActionsRequest):
-            request = service.ListLakeActionsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListLakeActionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListLakeActionsRequest.wrap(request)
+            else:
+                request = service.ListLakeActionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_lake_actions]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListLakeActionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListActionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_lake_actions", request.page_size
+            )
+            request = service.ListLakeActionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", service.ListLakeActionsRequest.pb(request).parent
+            ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListLakeActionsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1125,15 +1340,19 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.CreateZoneRequest):
-            request = service.CreateZoneRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
-            if zone is not None:
-                request.zone = zone
-            if zone_id is not None:
-                request.zone_id = zone_id
+            if isinstance(request, service.CreateZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateZoneRequest.wrap(request)
+            else:
+                request = service.CreateZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if zone is not None:
+                    request.zone = zone
+                if zone_id is not None:
+                    request.zone_id = zone_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1142,7 +1361,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateZoneRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -1218,13 +1437,17 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.UpdateZoneRequest):
-            request = service.UpdateZoneRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if zone is not None:
-                request.zone = zone
-            if update_mask is not None:
-                request.update_mask = update_mask
+            if isinstance(request, service.UpdateZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateZoneRequest.wrap(request)
+            else:
+                request = service.UpdateZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if zone is not None:
+                    request.zone = zone
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1233,14 +1456,18 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("zone.name", request.zone.name),)
+            _routing.header(
+                "zone.name", service.UpdateZoneRequest.pb(request).zone.name
             ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.zone.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -1249,6 +1476,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.zone.name)
+
         # Done; return the response.
         return response
 
@@ -1314,11 +1546,15 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.DeleteZoneRequest):
-            request = service.DeleteZoneRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.DeleteZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteZoneRequest.wrap(request)
+            else:
+                request = service.DeleteZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1327,12 +1563,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteZoneRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -1341,6 +1581,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.name)
+
         # Done; return the response.
         return response
 
@@ -1352,6 +1597,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListZonesPager:
         r"""Lists zone resources in a lake.
 
@@ -1370,6 +1621,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListZonesPager:
@@ -1394,29 +1667,60 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListZonesRequest):
-            request = service.ListZonesRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListZonesRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListZonesRequest.wrap(request)
+            else:
+                request = service.ListZonesRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_zones]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListZonesRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListZonesResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_zones", request.page_size)
+            request = service.ListZonesRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListZonesRequest.pb(request).parent),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListZonesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1430,6 +1734,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> resources.Zone:
         r"""Retrieves a zone resource.
 
@@ -1448,6 +1753,9 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Zone:
@@ -1476,11 +1784,21 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.GetZoneRequest):
-            request = service.GetZoneRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.GetZoneRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetZoneRequest.wrap(request)
+            else:
+                request = service.GetZoneRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_zone", request)
+            if cached is not None:
+                return resources.Zone.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1489,11 +1807,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetZoneRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_zone", request, response)
+
+        if raw:
+            response = resources.Zone.pb(response)
 
         # Done; return the response.
         return response
@@ -1506,6 +1829,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListZoneActionsPager:
         r"""Lists action resources in a zone.
 
@@ -1524,6 +1853,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListZoneActionsPager:
@@ -1548,29 +1899,64 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListZoneActionsRequest):
-            request = service.ListZoneActionsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListZoneActionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListZoneActionsRequest.wrap(request)
+            else:
+                request = service.ListZoneActionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_zone_actions]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListZoneActionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListActionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_zone_actions", request.page_size
+            )
+            request = service.ListZoneActionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", service.ListZoneActionsRequest.pb(request).parent
+            ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListZoneActionsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1648,15 +2034,19 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.CreateAssetRequest):
-            request = service.CreateAssetRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
-            if asset is not None:
-                request.asset = asset
-            if asset_id is not None:
-                request.asset_id = asset_id
+            if isinstance(request, service.CreateAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateAssetRequest.wrap(request)
+            else:
+                request = service.CreateAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if asset is not None:
+                    request.asset = asset
+                if asset_id is not None:
+                    request.asset_id = asset_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1665,7 +2055,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateAssetRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -1738,13 +2128,17 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.UpdateAssetRequest):
-            request = service.UpdateAssetRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if asset is not None:
-                request.asset = asset
-            if update_mask is not None:
-                request.update_mask = update_mask
+            if isinstance(request, service.UpdateAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateAssetRequest.wrap(request)
+            else:
+                request = service.UpdateAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if asset is not None:
+                    request.asset = asset
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1753,14 +2147,18 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("asset.name", request.asset.name),)
+            _routing.header(
+                "asset.name", service.UpdateAssetRequest.pb(request).asset.name
             ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.asset.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -1769,6 +2167,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.asset.name)
+
         # Done; return the response.
         return response
 
@@ -1835,11 +2238,15 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.DeleteAssetRequest):
-            request = service.DeleteAssetRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.DeleteAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteAssetRequest.wrap(request)
+            else:
+                request = service.DeleteAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -1848,12 +2255,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteAssetRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -1862,6 +2273,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.name)
+
         # Done; return the response.
         return response
 
@@ -1873,6 +2289,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListAssetsPager:
         r"""Lists asset resources in a zone.
 
@@ -1891,6 +2313,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListAssetsPager:
@@ -1915,29 +2359,60 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListAssetsRequest):
-            request = service.ListAssetsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListAssetsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListAssetsRequest.wrap(request)
+            else:
+                request = service.ListAssetsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_assets]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListAssetsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListAssetsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_assets", request.page_size)
+            request = service.ListAssetsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListAssetsRequest.pb(request).parent),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListAssetsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -1951,6 +2426,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> resources.Asset:
         r"""Retrieves an asset resource.
 
@@ -1969,6 +2445,9 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Asset:
@@ -1992,11 +2471,21 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.GetAssetRequest):
-            request = service.GetAssetRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.GetAssetRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetAssetRequest.wrap(request)
+            else:
+                request = service.GetAssetRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_asset", request)
+            if cached is not None:
+                return resources.Asset.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2005,11 +2494,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetAssetRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_asset", request, response)
+
+        if raw:
+            response = resources.Asset.pb(response)
 
         # Done; return the response.
         return response
@@ -2022,6 +2516,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListAssetActionsPager:
         r"""Lists action resources in an asset.
 
@@ -2040,6 +2540,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListAssetActionsPager:
@@ -2064,29 +2586,64 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListAssetActionsRequest):
-            request = service.ListAssetActionsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListAssetActionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListAssetActionsRequest.wrap(request)
+            else:
+                request = service.ListAssetActionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_asset_actions]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListAssetActionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListActionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_asset_actions", request.page_size
+            )
+            request = service.ListAssetActionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", service.ListAssetActionsRequest.pb(request).parent
+            ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListAssetActionsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -2155,15 +2712,19 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.CreateTaskRequest):
-            request = service.CreateTaskRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
-            if task is not None:
-                request.task = task
-            if task_id is not None:
-                request.task_id = task_id
+            if isinstance(request, service.CreateTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CreateTaskRequest.wrap(request)
+            else:
+                request = service.CreateTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
+                if task is not None:
+                    request.task = task
+                if task_id is not None:
+                    request.task_id = task_id
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2172,7 +2733,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.CreateTaskRequest.pb(request).parent),
         )
 
         # Send the request.
@@ -2246,13 +2807,17 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.UpdateTaskRequest):
-            request = service.UpdateTaskRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if task is not None:
-                request.task = task
-            if update_mask is not None:
-                request.update_mask = update_mask
+            if isinstance(request, service.UpdateTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.UpdateTaskRequest.wrap(request)
+            else:
+                request = service.UpdateTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if task is not None:
+                    request.task = task
+                if update_mask is not None:
+                    request.update_mask = update_mask
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2261,14 +2826,18 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata(
-                (("task.name", request.task.name),)
+            _routing.header(
+                "task.name", service.UpdateTaskRequest.pb(request).task.name
             ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.task.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -2277,6 +2846,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.task.name)
+
         # Done; return the response.
         return response
 
@@ -2341,11 +2915,15 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.DeleteTaskRequest):
-            request = service.DeleteTaskRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.DeleteTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.DeleteTaskRequest.wrap(request)
+            else:
+                request = service.DeleteTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2354,12 +2932,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.DeleteTaskRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -2368,6 +2950,11 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             metadata_type=service.OperationMetadata,
         )
 
+        # Evict it again once it has changed: lookups made meanwhile cache
+        # the resource as it was.
+        if self._cache is not None:
+            caching.evict_on_completion(response, self._cache, request.name)
+
         # Done; return the response.
         return response
 
@@ -2379,6 +2966,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListTasksPager:
         r"""Lists tasks under the given lake.
 
@@ -2397,6 +2990,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListTasksPager:
@@ -2421,29 +3036,60 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListTasksRequest):
-            request = service.ListTasksRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListTasksRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListTasksRequest.wrap(request)
+            else:
+                request = service.ListTasksRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_tasks]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListTasksRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListTasksResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_tasks", request.page_size)
+            request = service.ListTasksRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListTasksRequest.pb(request).parent),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListTasksPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -2457,6 +3103,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> tasks.Task:
         r"""Get task resource.
 
@@ -2475,6 +3122,9 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Task:
@@ -2495,11 +3145,21 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.GetTaskRequest):
-            request = service.GetTaskRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.GetTaskRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetTaskRequest.wrap(request)
+            else:
+                request = service.GetTaskRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_task", request)
+            if cached is not None:
+                return tasks.Task.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2508,11 +3168,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetTaskRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_task", request, response)
+
+        if raw:
+            response = tasks.Task.pb(response)
 
         # Done; return the response.
         return response
@@ -2525,6 +3190,12 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListJobsPager:
         r"""Lists Jobs under the given task.
 
@@ -2543,6 +3214,28 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.dataplex_service.pagers.ListJobsPager:
@@ -2567,29 +3260,60 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.ListJobsRequest):
-            request = service.ListJobsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, service.ListJobsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.ListJobsRequest.wrap(request)
+            else:
+                request = service.ListJobsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_jobs]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = service.ListJobsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(service.ListJobsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_jobs", request.page_size)
+            request = service.ListJobsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", service.ListJobsRequest.pb(request).parent),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListJobsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -2603,6 +3327,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> tasks.Job:
         r"""Get job resource.
 
@@ -2621,6 +3346,9 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Job:
@@ -2643,11 +3371,21 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.GetJobRequest):
-            request = service.GetJobRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.GetJobRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.GetJobRequest.wrap(request)
+            else:
+                request = service.GetJobRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_job", request)
+            if cached is not None:
+                return tasks.Job.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2656,11 +3394,16 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.GetJobRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_job", request, response)
+
+        if raw:
+            response = tasks.Job.pb(response)
 
         # Done; return the response.
         return response
@@ -2707,11 +3450,15 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, service.CancelJobRequest):
-            request = service.CancelJobRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, service.CancelJobRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = service.CancelJobRequest.wrap(request)
+            else:
+                request = service.CancelJobRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -2720,7 +3467,7 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", service.CancelJobRequest.pb(request).name),
         )
 
         # Send the request.
@@ -2728,6 +3475,10 @@ class DataplexServiceClient(metaclass=DataplexServiceClientMeta):
             request, retry=retry, timeout=timeout, metadata=metadata,
         )
 
+        # The resource is changing; evict it and everything beneath it.
+        if self._cache is not None:
+            self._cache.invalidate(request.name)
+
     def __enter__(self):
         return self
 
@@ -24,6 +24,8 @@ from typing import (
     Iterator,
 )
 
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1 import checkpoints
 from google.cloud.dataplex_v1.types import resources
 from google.cloud.dataplex_v1.types import service
 from google.cloud.dataplex_v1.types import tasks
@@ -53,7 +55,10 @@ class ListLakesPager:
         request: service.ListLakesRequest,
         response: service.ListLakesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -66,17 +71,52 @@ class ListLakesPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListLakesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListLakesResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListLakesResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -85,7 +125,10 @@ class ListLakesPager:
 
     def __iter__(self) -> Iterator[resources.Lake]:
         for page in self.pages:
-            yield from page.lakes
+            if self._raw:
+                yield from service.ListLakesResponse.pb(page).lakes
+            else:
+                yield from page.lakes
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -115,7 +158,10 @@ class ListLakesAsyncPager:
         request: service.ListLakesRequest,
         response: service.ListLakesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -128,17 +174,53 @@ class ListLakesAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListLakesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListLakesResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListLakesResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListLakesResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -148,7 +230,12 @@ class ListLakesAsyncPager:
     def __aiter__(self) -> AsyncIterator[resources.Lake]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.lakes:
+                items = (
+                    service.ListLakesResponse.pb(page).lakes
+                    if self._raw
+                    else page.lakes
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -181,7 +268,10 @@ class ListLakeActionsPager:
         request: service.ListLakeActionsRequest,
         response: service.ListActionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -194,17 +284,52 @@ class ListLakeActionsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListLakeActionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListActionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListActionsResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -213,7 +338,10 @@ class ListLakeActionsPager:
 
     def __iter__(self) -> Iterator[resources.Action]:
         for page in self.pages:
-            yield from page.actions
+            if self._raw:
+                yield from service.ListActionsResponse.pb(page).actions
+            else:
+                yield from page.actions
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -243,7 +371,10 @@ class ListLakeActionsAsyncPager:
         request: service.ListLakeActionsRequest,
         response: service.ListActionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -256,17 +387,53 @@ class ListLakeActionsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListLakeActionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListActionsResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListActionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListActionsResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -276,7 +443,12 @@ class ListLakeActionsAsyncPager:
     def __aiter__(self) -> AsyncIterator[resources.Action]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.actions:
+                items = (
+                    service.ListActionsResponse.pb(page).actions
+                    if self._raw
+                    else page.actions
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -309,7 +481,10 @@ class ListZonesPager:
         request: service.ListZonesRequest,
         response: service.ListZonesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -322,17 +497,52 @@ class ListZonesPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListZonesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListZonesResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListZonesResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -341,7 +551,10 @@ class ListZonesPager:
 
     def __iter__(self) -> Iterator[resources.Zone]:
         for page in self.pages:
-            yield from page.zones
+            if self._raw:
+                yield from service.ListZonesResponse.pb(page).zones
+            else:
+                yield from page.zones
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -371,7 +584,10 @@ class ListZonesAsyncPager:
         request: service.ListZonesRequest,
         response: service.ListZonesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -384,17 +600,53 @@ class ListZonesAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListZonesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListZonesResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListZonesResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListZonesResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -404,7 +656,12 @@ class ListZonesAsyncPager:
     def __aiter__(self) -> AsyncIterator[resources.Zone]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.zones:
+                items = (
+                    service.ListZonesResponse.pb(page).zones
+                    if self._raw
+                    else page.zones
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -437,7 +694,10 @@ class ListZoneActionsPager:
         request: service.ListZoneActionsRequest,
         response: service.ListActionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -450,17 +710,52 @@ class ListZoneActionsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListZoneActionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListActionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListActionsResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -469,7 +764,10 @@ class ListZoneActionsPager:
 
     def __iter__(self) -> Iterator[resources.Action]:
         for page in self.pages:
-            yield from page.actions
+            if self._raw:
+                yield from service.ListActionsResponse.pb(page).actions
+            else:
+                yield from page.actions
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -499,7 +797,10 @@ class ListZoneActionsAsyncPager:
         request: service.ListZoneActionsRequest,
         response: service.ListActionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -512,17 +813,53 @@ class ListZoneActionsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListZoneActionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListActionsResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListActionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListActionsResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -532,7 +869,12 @@ class ListZoneActionsAsyncPager:
     def __aiter__(self) -> AsyncIterator[resources.Action]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.actions:
+                items = (
+                    service.ListActionsResponse.pb(page).actions
+                    if self._raw
+                    else page.actions
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -565,7 +907,10 @@ class ListAssetsPager:
         request: service.ListAssetsRequest,
         response: service.ListAssetsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -578,17 +923,52 @@ class ListAssetsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListAssetsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListAssetsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListAssetsResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -597,7 +977,10 @@ class ListAssetsPager:
 
     def __iter__(self) -> Iterator[resources.Asset]:
         for page in self.pages:
-            yield from page.assets
+            if self._raw:
+                yield from service.ListAssetsResponse.pb(page).assets
+            else:
+                yield from page.assets
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -627,7 +1010,10 @@ class ListAssetsAsyncPager:
         request: service.ListAssetsRequest,
         response: service.ListAssetsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -640,17 +1026,53 @@ class ListAssetsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListAssetsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListAssetsResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListAssetsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListAssetsResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -660,7 +1082,12 @@ class ListAssetsAsyncPager:
     def __aiter__(self) -> AsyncIterator[resources.Asset]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.assets:
+                items = (
+                    service.ListAssetsResponse.pb(page).assets
+                    if self._raw
+                    else page.assets
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -693,7 +1120,10 @@ class ListAssetActionsPager:
         request: service.ListAssetActionsRequest,
         response: service.ListActionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -706,17 +1136,52 @@ class ListAssetActionsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListAssetActionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListActionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListActionsResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -725,7 +1190,10 @@ class ListAssetActionsPager:
 
     def __iter__(self) -> Iterator[resources.Action]:
         for page in self.pages:
-            yield from page.actions
+            if self._raw:
+                yield from service.ListActionsResponse.pb(page).actions
+            else:
+                yield from page.actions
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -755,7 +1223,10 @@ class ListAssetActionsAsyncPager:
         request: service.ListAssetActionsRequest,
         response: service.ListActionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -768,17 +1239,53 @@ class ListAssetActionsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListAssetActionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListActionsResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListActionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListActionsResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -788,7 +1295,12 @@ class ListAssetActionsAsyncPager:
     def __aiter__(self) -> AsyncIterator[resources.Action]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.actions:
+                items = (
+                    service.ListActionsResponse.pb(page).actions
+                    if self._raw
+                    else page.actions
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -821,7 +1333,10 @@ class ListTasksPager:
         request: service.ListTasksRequest,
         response: service.ListTasksResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -834,17 +1349,52 @@ class ListTasksPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListTasksRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListTasksResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListTasksResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -853,7 +1403,10 @@ class ListTasksPager:
 
     def __iter__(self) -> Iterator[tasks.Task]:
         for page in self.pages:
-            yield from page.tasks
+            if self._raw:
+                yield from service.ListTasksResponse.pb(page).tasks
+            else:
+                yield from page.tasks
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -883,7 +1436,10 @@ class ListTasksAsyncPager:
         request: service.ListTasksRequest,
         response: service.ListTasksResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -896,17 +1452,53 @@ class ListTasksAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListTasksRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListTasksResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListTasksResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListTasksResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -916,7 +1508,12 @@ class ListTasksAsyncPager:
     def __aiter__(self) -> AsyncIterator[tasks.Task]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.tasks:
+                items = (
+                    service.ListTasksResponse.pb(page).tasks
+                    if self._raw
+                    else page.tasks
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -949,7 +1546,10 @@ class ListJobsPager:
         request: service.ListJobsRequest,
         response: service.ListJobsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -962,17 +1562,52 @@ class ListJobsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListJobsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[service.ListJobsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[service.ListJobsResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -981,7 +1616,10 @@ class ListJobsPager:
 
     def __iter__(self) -> Iterator[tasks.Job]:
         for page in self.pages:
-            yield from page.jobs
+            if self._raw:
+                yield from service.ListJobsResponse.pb(page).jobs
+            else:
+                yield from page.jobs
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -1011,7 +1649,10 @@ class ListJobsAsyncPager:
         request: service.ListJobsRequest,
         response: service.ListJobsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -1024,17 +1665,53 @@ class ListJobsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = service.ListJobsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[service.ListJobsResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[service.ListJobsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[service.ListJobsResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -1044,7 +1721,10 @@ class ListJobsAsyncPager:
     def __aiter__(self) -> AsyncIterator[tasks.Job]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.jobs:
+                items = (
+                    service.ListJobsResponse.pb(page).jobs if self._raw else page.jobs
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -19,15 +19,21 @@ from typing import Dict, Type
 from .base import DataplexServiceTransport
 from .grpc import DataplexServiceGrpcTransport
 from .grpc_asyncio import DataplexServiceGrpcAsyncIOTransport
+from .grpc_pool import DataplexServiceGrpcPoolTransport
+from .grpc_asyncio_pool import DataplexServiceGrpcAsyncIOPoolTransport
 
 
 # Compile a registry of transports.
 _transport_registry = OrderedDict()  # type: Dict[str, Type[DataplexServiceTransport]]
 _transport_registry["grpc"] = DataplexServiceGrpcTransport
 _transport_registry["grpc_asyncio"] = DataplexServiceGrpcAsyncIOTransport
+_transport_registry["grpc_pool"] = DataplexServiceGrpcPoolTransport
+_transport_registry["grpc_asyncio_pool"] = DataplexServiceGrpcAsyncIOPoolTransport
 
 __all__ = (
     "DataplexServiceTransport",
     "DataplexServiceGrpcTransport",
     "DataplexServiceGrpcAsyncIOTransport",
+    "DataplexServiceGrpcPoolTransport",
+    "DataplexServiceGrpcAsyncIOPoolTransport",
 )
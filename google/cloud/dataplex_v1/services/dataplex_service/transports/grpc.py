@@ -25,6 +25,7 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
 
+from google.cloud.dataplex_v1 import _interceptors
 from google.cloud.dataplex_v1.types import resources
 from google.cloud.dataplex_v1.types import service
 from google.cloud.dataplex_v1.types import tasks
@@ -68,6 +69,7 @@ class DataplexServiceGrpcTransport(DataplexServiceTransport):
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        interceptors: Sequence[grpc.UnaryUnaryClientInterceptor] = (),
     ) -> None:
         """Instantiate the transport.
 
@@ -110,6 +112,10 @@ class DataplexServiceGrpcTransport(DataplexServiceTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            interceptors (Sequence[grpc.UnaryUnaryClientInterceptor]):
+                Client interceptors every call goes through, outermost
+                first, such as a
+                :class:`~google.cloud.dataplex_v1.rate_limiting.RateLimitInterceptor`.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -183,6 +189,12 @@ class DataplexServiceGrpcTransport(DataplexServiceTransport):
                 ],
             )
 
+        # Install the interceptors before any stub is created.
+        self._interceptors = tuple(interceptors)
+        self._grpc_channel = _interceptors.intercept_channel(
+            self._grpc_channel, self._interceptors
+        )
+
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
 
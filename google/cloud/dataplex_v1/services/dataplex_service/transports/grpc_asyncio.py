@@ -16,7 +16,9 @@
 import warnings
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, Union
 
+from google.api_core import exceptions as core_exceptions
 from google.api_core import gapic_v1
+from google.api_core import retry as retries
 from google.api_core import grpc_helpers_async
 from google.api_core import operations_v1
 from google.auth import credentials as ga_credentials  # type: ignore
@@ -25,6 +27,7 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 import grpc  # type: ignore
 from grpc.experimental import aio  # type: ignore
 
+from google.cloud.dataplex_v1 import _interceptors
 from google.cloud.dataplex_v1.types import resources
 from google.cloud.dataplex_v1.types import service
 from google.cloud.dataplex_v1.types import tasks
@@ -113,6 +116,7 @@ class DataplexServiceGrpcAsyncIOTransport(DataplexServiceTransport):
         quota_project_id=None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        interceptors: Sequence[aio.UnaryUnaryClientInterceptor] = (),
     ) -> None:
         """Instantiate the transport.
 
@@ -156,6 +160,12 @@ class DataplexServiceGrpcAsyncIOTransport(DataplexServiceTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            interceptors (Sequence[aio.UnaryUnaryClientInterceptor]):
+                Client interceptors every call goes through, outermost
+                first, such as a
+                :class:`~google.cloud.dataplex_v1.rate_limiting.AsyncRateLimitInterceptor`.
+                They are installed on the channels the transport creates,
+                and cannot be combined with ``channel``.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -168,6 +178,12 @@ class DataplexServiceGrpcAsyncIOTransport(DataplexServiceTransport):
         self._stubs: Dict[str, Callable] = {}
         self._operations_client: Optional[operations_v1.OperationsAsyncClient] = None
 
+        # aio channels only take interceptors when they are created.
+        self._interceptors = tuple(interceptors)
+        self._channel_kwargs = _interceptors.async_channel_kwargs(
+            self._interceptors, channel
+        )
+
         if api_mtls_endpoint:
             warnings.warn("api_mtls_endpoint is deprecated", DeprecationWarning)
         if client_cert_source:
@@ -226,6 +242,7 @@ class DataplexServiceGrpcAsyncIOTransport(DataplexServiceTransport):
                     ("grpc.max_send_message_length", -1),
                     ("grpc.max_receive_message_length", -1),
                 ],
+                **self._channel_kwargs,
             )
 
         # Wrap messages. This must be done after self._grpc_channel exists
@@ -935,6 +952,232 @@ class DataplexServiceGrpcAsyncIOTransport(DataplexServiceTransport):
             )
         return self._stubs["cancel_job"]
 
+    def _prep_wrapped_messages(self, client_info):
+        # Precompute the wrapped methods.
+        self._wrapped_methods = {
+            self.create_lake: gapic_v1.method_async.wrap_method(
+                self.create_lake, default_timeout=60.0, client_info=client_info,
+            ),
+            self.update_lake: gapic_v1.method_async.wrap_method(
+                self.update_lake, default_timeout=60.0, client_info=client_info,
+            ),
+            self.delete_lake: gapic_v1.method_async.wrap_method(
+                self.delete_lake, default_timeout=60.0, client_info=client_info,
+            ),
+            self.list_lakes: gapic_v1.method_async.wrap_method(
+                self.list_lakes,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.get_lake: gapic_v1.method_async.wrap_method(
+                self.get_lake,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.list_lake_actions: gapic_v1.method_async.wrap_method(
+                self.list_lake_actions,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.create_zone: gapic_v1.method_async.wrap_method(
+                self.create_zone, default_timeout=60.0, client_info=client_info,
+            ),
+            self.update_zone: gapic_v1.method_async.wrap_method(
+                self.update_zone, default_timeout=60.0, client_info=client_info,
+            ),
+            self.delete_zone: gapic_v1.method_async.wrap_method(
+                self.delete_zone, default_timeout=60.0, client_info=client_info,
+            ),
+            self.list_zones: gapic_v1.method_async.wrap_method(
+                self.list_zones,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.get_zone: gapic_v1.method_async.wrap_method(
+                self.get_zone,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.list_zone_actions: gapic_v1.method_async.wrap_method(
+                self.list_zone_actions,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.create_asset: gapic_v1.method_async.wrap_method(
+                self.create_asset, default_timeout=60.0, client_info=client_info,
+            ),
+            self.update_asset: gapic_v1.method_async.wrap_method(
+                self.update_asset, default_timeout=60.0, client_info=client_info,
+            ),
+            self.delete_asset: gapic_v1.method_async.wrap_method(
+                self.delete_asset, default_timeout=60.0, client_info=client_info,
+            ),
+            self.list_assets: gapic_v1.method_async.wrap_method(
+                self.list_assets,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.get_asset: gapic_v1.method_async.wrap_method(
+                self.get_asset,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.list_asset_actions: gapic_v1.method_async.wrap_method(
+                self.list_asset_actions,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.create_task: gapic_v1.method_async.wrap_method(
+                self.create_task, default_timeout=60.0, client_info=client_info,
+            ),
+            self.update_task: gapic_v1.method_async.wrap_method(
+                self.update_task, default_timeout=60.0, client_info=client_info,
+            ),
+            self.delete_task: gapic_v1.method_async.wrap_method(
+                self.delete_task, default_timeout=60.0, client_info=client_info,
+            ),
+            self.list_tasks: gapic_v1.method_async.wrap_method(
+                self.list_tasks,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.get_task: gapic_v1.method_async.wrap_method(
+                self.get_task,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.list_jobs: gapic_v1.method_async.wrap_method(
+                self.list_jobs,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.get_job: gapic_v1.method_async.wrap_method(
+                self.get_job,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.cancel_job: gapic_v1.method_async.wrap_method(
+                self.cancel_job, default_timeout=60.0, client_info=client_info,
+            ),
+        }
+
     def close(self):
         return self.grpc_channel.close()
 
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Optional, Sequence
+
+from google.auth import credentials as ga_credentials  # type: ignore
+
+import grpc  # type: ignore
+
+from google.cloud.dataplex_v1 import _channel_pool
+from google.cloud.dataplex_v1 import _interceptors
+from .grpc import DataplexServiceGrpcTransport
+
+
+class DataplexServiceGrpcPoolTransport(DataplexServiceGrpcTransport):
+    """gRPC backend transport for DataplexService over a pool of channels.
+
+    A single channel multiplexes every call over one HTTP/2 connection,
+    which caps the number of concurrent calls at the server's stream
+    limit. This transport opens ``pool_size`` channels, each on its own
+    connection, and sends every call on one of them: by default the
+    channel with the fewest calls in flight.
+
+    It accepts the same arguments as
+    :class:`~.DataplexServiceGrpcTransport`, and is registered with the
+    clients as ``"grpc_pool"``.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 4,
+        strategy: str = _channel_pool.LEAST_OUTSTANDING,
+        channels: Sequence[grpc.Channel] = None,
+        **kwargs,
+    ) -> None:
+        """Instantiate the transport.
+
+        Args:
+            pool_size (int): The number of channels to open. Ignored if
+                ``channel`` or ``channels`` is provided.
+            strategy (str): How a channel is picked for each call, either
+                ``"least_outstanding"`` or ``"round_robin"``.
+            channels (Optional[Sequence[grpc.Channel]]): Existing channels
+                to pool instead of opening new ones.
+            kwargs: The arguments of
+                :class:`~.DataplexServiceGrpcTransport`.
+        """
+        if pool_size < 1:
+            raise ValueError(
+                "pool_size must be a positive integer, got {}".format(pool_size)
+            )
+        if channels:
+            kwargs["channel"] = channels[0]
+        self._pool_size = 1 if kwargs.get("channel") else pool_size
+        self._pool_channels = list(channels or ())
+        self._pool_strategy = strategy
+        self._quota_project_id = kwargs.get("quota_project_id")
+        self._pool: Optional[_channel_pool.ChannelPool] = None
+        super().__init__(**kwargs)
+
+    @classmethod
+    def create_channel(
+        cls,
+        host: str = "dataplex.googleapis.com",
+        credentials: ga_credentials.Credentials = None,
+        credentials_file: str = None,
+        scopes: Optional[Sequence[str]] = None,
+        quota_project_id: Optional[str] = None,
+        **kwargs,
+    ) -> grpc.Channel:
+        """Create and return a gRPC channel on its own connection.
+
+        See :meth:`~.DataplexServiceGrpcTransport.create_channel`.
+        """
+        kwargs["options"] = list(kwargs.get("options", ())) + list(
+            _channel_pool.POOL_CHANNEL_OPTIONS
+        )
+        return super().create_channel(
+            host,
+            credentials=credentials,
+            credentials_file=credentials_file,
+            scopes=scopes,
+            quota_project_id=quota_project_id,
+            **kwargs,
+        )
+
+    def _prep_wrapped_messages(self, client_info):
+        # The first channel exists by now, with the interceptors installed;
+        # open the rest of the pool before any stub is created.
+        channels = [self._grpc_channel] + [
+            _interceptors.intercept_channel(channel, self._interceptors)
+            for channel in self._pool_channels[1:]
+        ]
+        while len(channels) < self._pool_size:
+            channel = type(self).create_channel(
+                self._host,
+                credentials=self._credentials,
+                credentials_file=None,
+                scopes=self._scopes,
+                ssl_credentials=self._ssl_channel_credentials,
+                quota_project_id=self._quota_project_id,
+                options=[
+                    ("grpc.max_send_message_length", -1),
+                    ("grpc.max_receive_message_length", -1),
+                ],
+            )
+            channels.append(
+                _interceptors.intercept_channel(channel, self._interceptors)
+            )
+        self._pool = _channel_pool.ChannelPool(channels, self._pool_strategy)
+        super()._prep_wrapped_messages(client_info)
+
+    @property
+    def grpc_channel(self) -> grpc.Channel:
+        """Return the pool of channels designed to connect to this service.
+        """
+        return self._pool
+
+    @property
+    def channels(self) -> Sequence[grpc.Channel]:
+        """Return the pooled channels."""
+        return self._pool.channels
+
+
+__all__ = ("DataplexServiceGrpcPoolTransport",)
@@ -16,7 +16,16 @@
 from collections import OrderedDict
 import functools
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import pkg_resources
 
 from google.api_core.client_options import ClientOptions
@@ -31,6 +40,11 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.dataplex_v1 import _fanout
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1 import _routing
+from google.cloud.dataplex_v1 import _singleflight
+from google.cloud.dataplex_v1 import checkpoints
 from google.cloud.dataplex_v1.services.metadata_service import pagers
 from google.cloud.dataplex_v1.types import metadata_
 from google.protobuf import timestamp_pb2  # type: ignore
@@ -79,6 +93,7 @@ class MetadataServiceAsyncClient:
     parse_common_location_path = staticmethod(
         MetadataServiceClient.parse_common_location_path
     )
+    parse_many = staticmethod(MetadataServiceClient.parse_many)
 
     @classmethod
     def from_service_account_info(cls, info: dict, *args, **kwargs):
@@ -169,6 +184,7 @@ class MetadataServiceAsyncClient:
         transport: Union[str, MetadataServiceTransport] = "grpc_asyncio",
         client_options: ClientOptions = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        single_flight: bool = False,
     ) -> None:
         """Instantiates the metadata service client.
 
@@ -197,6 +213,10 @@ class MetadataServiceAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            single_flight (bool): Whether concurrent identical ``Get*``
+                calls, and identical first-page ``List*`` calls, share a
+                single RPC. Each caller receives its own copy of the
+                response; the retry and timeout of the first caller apply.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -208,6 +228,7 @@ class MetadataServiceAsyncClient:
             client_options=client_options,
             client_info=client_info,
         )
+        self._single_flight = _singleflight.SingleFlight() if single_flight else None
 
     async def get_entity(
         self,
@@ -217,6 +238,7 @@ class MetadataServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> metadata_.Entity:
         r"""Get a metadata entity.
 
@@ -235,6 +257,9 @@ class MetadataServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Entity:
@@ -252,38 +277,45 @@ class MetadataServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = metadata_.GetEntityRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a metadata_.GetEntityRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, metadata_.GetEntityRequest):
+            if isinstance(request, metadata_.GetEntityRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.GetEntityRequest.wrap(request)
+            else:
+                request = metadata_.GetEntityRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_entity,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.get_entity
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", metadata_.GetEntityRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = metadata_.Entity.pb(response)
 
         # Done; return the response.
         return response
@@ -296,6 +328,12 @@ class MetadataServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListEntitiesAsyncPager:
         r"""List metadata entities in a zone.
 
@@ -314,6 +352,28 @@ class MetadataServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.metadata_service.pagers.ListEntitiesAsyncPager:
@@ -333,43 +393,74 @@ class MetadataServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = metadata_.ListEntitiesRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a metadata_.ListEntitiesRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, metadata_.ListEntitiesRequest):
+            if isinstance(request, metadata_.ListEntitiesRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.ListEntitiesRequest.wrap(request)
+            else:
+                request = metadata_.ListEntitiesRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_entities,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_entities
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = metadata_.ListEntitiesRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(metadata_.ListEntitiesResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_entities", request.page_size)
+            request = metadata_.ListEntitiesRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", metadata_.ListEntitiesRequest.pb(request).parent),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListEntitiesAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -383,6 +474,7 @@ class MetadataServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> metadata_.Partition:
         r"""Get a metadata partition of an entity.
 
@@ -401,6 +493,9 @@ class MetadataServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Partition:
@@ -418,38 +513,45 @@ class MetadataServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = metadata_.GetPartitionRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if name is not None:
-            request.name = name
+        # Minor optimization to avoid making a copy if the user passes
+        # in a metadata_.GetPartitionRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, metadata_.GetPartitionRequest):
+            if isinstance(request, metadata_.GetPartitionRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.GetPartitionRequest.wrap(request)
+            else:
+                request = metadata_.GetPartitionRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_partition,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.get_partition
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", metadata_.GetPartitionRequest.pb(request).name),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        if raw:
+            response = metadata_.Partition.pb(response)
 
         # Done; return the response.
         return response
@@ -462,6 +564,12 @@ class MetadataServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListPartitionsAsyncPager:
         r"""List metadata partitions of an entity.
 
@@ -480,6 +588,28 @@ class MetadataServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.metadata_service.pagers.ListPartitionsAsyncPager:
@@ -499,48 +629,154 @@ class MetadataServiceAsyncClient:
                 "the individual field arguments should be set."
             )
 
-        request = metadata_.ListPartitionsRequest(request)
-
-        # If we have keyword arguments corresponding to fields on the
-        # request, apply these.
-        if parent is not None:
-            request.parent = parent
+        # Minor optimization to avoid making a copy if the user passes
+        # in a metadata_.ListPartitionsRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, metadata_.ListPartitionsRequest):
+            if isinstance(request, metadata_.ListPartitionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.ListPartitionsRequest.wrap(request)
+            else:
+                request = metadata_.ListPartitionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_partitions,
-            default_retry=retries.Retry(
-                initial=1.0,
-                maximum=10.0,
-                multiplier=1.3,
-                predicate=retries.if_exception_type(
-                    core_exceptions.ServiceUnavailable,
-                ),
-                deadline=60.0,
-            ),
-            default_timeout=60.0,
-            client_info=DEFAULT_CLIENT_INFO,
-        )
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_partitions
+        ]
+
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = metadata_.ListPartitionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing_async(metadata_.ListPartitionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_partitions", request.page_size
+            )
+            request = metadata_.ListPartitionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap_async(rpc)
 
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", metadata_.ListPartitionsRequest.pb(request).parent
+            ),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing any identical call already in flight.
+        if self._single_flight is not None:
+            response = await self._single_flight.call(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata,
+            )
+
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListPartitionsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            lookahead=lookahead,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
         return response
 
+    async def scan_partitions(
+        self,
+        parent: str,
+        *,
+        views: Sequence[metadata_.ListEntitiesRequest.EntityView] = (
+            metadata_.ListEntitiesRequest.EntityView.TABLES,
+            metadata_.ListEntitiesRequest.EntityView.FILESETS,
+        ),
+        max_concurrency: int = 8,
+        on_error: Callable[[metadata_.Entity, Exception], None] = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> AsyncIterator[Tuple[metadata_.Entity, metadata_.Partition]]:
+        r"""Scan the partitions of every entity in a zone concurrently.
+
+        Entities are listed with ``list_entities`` and the partitions of
+        up to ``max_concurrency`` entities are listed at the same time.
+        Results are streamed as they arrive, so partitions of different
+        entities may interleave.
+
+        Args:
+            parent (:class:`str`):
+                Required. The resource name of the parent zone:
+                ``projects/{project_number}/locations/{location_id}/lakes/{lake_id}/zones/{zone_id}``.
+            views (Sequence[google.cloud.dataplex_v1.types.ListEntitiesRequest.EntityView]):
+                The entity views to list. Defaults to both tables and
+                filesets.
+            max_concurrency (int): The maximum number of entities whose
+                partitions are listed at the same time.
+            on_error (Callable[[google.cloud.dataplex_v1.types.Entity, Exception], None]):
+                Called when listing the partitions of one entity fails.
+                If not set, the scan carries on with the other entities
+                and the first such error is raised once they are done.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            AsyncIterator[Tuple[google.cloud.dataplex_v1.types.Entity, google.cloud.dataplex_v1.types.Partition]]:
+                ``(entity, partition)`` pairs for every partition in the
+                zone.
+
+        """
+
+        async def entities():
+            for view in views:
+                pager = await self.list_entities(
+                    request=metadata_.ListEntitiesRequest(parent=parent, view=view),
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                )
+                async for entity in pager:
+                    yield entity
+
+        async def partitions(entity):
+            pager = await self.list_partitions(
+                parent=entity.name, retry=retry, timeout=timeout, metadata=metadata,
+            )
+            async for page in pager.pages:
+                yield page.partitions
+
+        async for entity, chunk in _fanout.async_fan_out(
+            entities(), partitions, max_concurrency=max_concurrency, on_error=on_error,
+        ):
+            for partition in chunk:
+                yield entity, partition
+
     async def __aenter__(self):
         return self
 
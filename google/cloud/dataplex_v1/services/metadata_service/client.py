@@ -14,9 +14,21 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import pkg_resources
 
 from google.api_core import client_options as client_options_lib
@@ -34,12 +46,20 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.dataplex_v1 import _fanout
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1 import _path_template
+from google.cloud.dataplex_v1 import _routing
+from google.cloud.dataplex_v1 import caching
+from google.cloud.dataplex_v1 import checkpoints
 from google.cloud.dataplex_v1.services.metadata_service import pagers
 from google.cloud.dataplex_v1.types import metadata_
 from google.protobuf import timestamp_pb2  # type: ignore
 from .transports.base import MetadataServiceTransport, DEFAULT_CLIENT_INFO
 from .transports.grpc import MetadataServiceGrpcTransport
 from .transports.grpc_asyncio import MetadataServiceGrpcAsyncIOTransport
+from .transports.grpc_pool import MetadataServiceGrpcPoolTransport
+from .transports.grpc_asyncio_pool import MetadataServiceGrpcAsyncIOPoolTransport
 
 
 class MetadataServiceClientMeta(type):
@@ -55,6 +75,8 @@ class MetadataServiceClientMeta(type):
     )  # type: Dict[str, Type[MetadataServiceTransport]]
     _transport_registry["grpc"] = MetadataServiceGrpcTransport
     _transport_registry["grpc_asyncio"] = MetadataServiceGrpcAsyncIOTransport
+    _transport_registry["grpc_pool"] = MetadataServiceGrpcPoolTransport
+    _transport_registry["grpc_asyncio_pool"] = MetadataServiceGrpcAsyncIOPoolTransport
 
     def get_transport_class(cls, label: str = None,) -> Type[MetadataServiceTransport]:
         """Returns an appropriate transport class.
@@ -162,6 +184,30 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         """
         return self._transport
 
+    # The template of each resource name, keyed as the ``*_path`` helpers.
+    _path_templates = {
+        "entity": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/zones/{zone}/entities/{entity}"
+        ),
+        "partition": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/zones/{zone}/entities/{entity}/partitions/{partition}"
+        ),
+        "zone": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}/lakes/{lake}/zones/{zone}"
+        ),
+        "common_billing_account": _path_template.PathTemplate(
+            "billingAccounts/{billing_account}"
+        ),
+        "common_folder": _path_template.PathTemplate("folders/{folder}"),
+        "common_organization": _path_template.PathTemplate(
+            "organizations/{organization}"
+        ),
+        "common_project": _path_template.PathTemplate("projects/{project}"),
+        "common_location": _path_template.PathTemplate(
+            "projects/{project}/locations/{location}"
+        ),
+    }
+
     @staticmethod
     def entity_path(
         project: str, location: str, lake: str, zone: str, entity: str,
@@ -174,11 +220,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_entity_path(path: str) -> Dict[str, str]:
         """Parses a entity path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/zones/(?P<zone>.+?)/entities/(?P<entity>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["entity"].parse(path)
 
     @staticmethod
     def partition_path(
@@ -197,11 +239,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_partition_path(path: str) -> Dict[str, str]:
         """Parses a partition path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/zones/(?P<zone>.+?)/entities/(?P<entity>.+?)/partitions/(?P<partition>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["partition"].parse(path)
 
     @staticmethod
     def zone_path(project: str, location: str, lake: str, zone: str,) -> str:
@@ -213,11 +251,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_zone_path(path: str) -> Dict[str, str]:
         """Parses a zone path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)/zones/(?P<zone>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["zone"].parse(path)
 
     @staticmethod
     def common_billing_account_path(billing_account: str,) -> str:
@@ -229,8 +263,9 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["common_billing_account"].parse(
+            path
+        )
 
     @staticmethod
     def common_folder_path(folder: str,) -> str:
@@ -240,8 +275,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["common_folder"].parse(path)
 
     @staticmethod
     def common_organization_path(organization: str,) -> str:
@@ -251,8 +285,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["common_organization"].parse(path)
 
     @staticmethod
     def common_project_path(project: str,) -> str:
@@ -262,8 +295,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["common_project"].parse(path)
 
     @staticmethod
     def common_location_path(project: str, location: str,) -> str:
@@ -275,8 +307,25 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return MetadataServiceClient._path_templates["common_location"].parse(path)
+
+    @staticmethod
+    def parse_many(
+        resource: str, paths: Iterable[str]
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses many resource names of one kind into columns.
+
+        Args:
+            resource (str): The kind of resource, named as in its
+                ``*_path`` helper, e.g. ``"entity"`` or ``"common_location"``.
+            paths (Iterable[str]): The resource names.
+
+        Returns:
+            Dict[str, List[Optional[str]]]: One list per path segment, holding
+            the value for each name in order, or ``None`` where a name does
+            not match.
+        """
+        return MetadataServiceClient._path_templates[resource].parse_many(paths)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -352,6 +401,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         transport: Union[str, MetadataServiceTransport, None] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        cache: Optional[caching.ResponseCache] = None,
     ) -> None:
         """Instantiates the metadata service client.
 
@@ -385,6 +435,11 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            cache (Optional[google.cloud.dataplex_v1.caching.ResponseCache]):
+                A cache for ``Get*`` responses. If set, repeated lookups
+                of a resource are served from it until they expire.
+                A :class:`~google.cloud.dataplex_v1.persistent_cache.PersistentCache`
+                also serves lookups cached by earlier processes.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -399,6 +454,8 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
             client_options
         )
 
+        self._cache = cache
+
         api_key_value = getattr(client_options, "api_key", None)
         if api_key_value and credentials:
             raise ValueError(
@@ -451,6 +508,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> metadata_.Entity:
         r"""Get a metadata entity.
 
@@ -469,6 +527,9 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Entity:
@@ -491,11 +552,21 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, metadata_.GetEntityRequest):
-            request = metadata_.GetEntityRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, metadata_.GetEntityRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.GetEntityRequest.wrap(request)
+            else:
+                request = metadata_.GetEntityRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_entity", request)
+            if cached is not None:
+                return metadata_.Entity.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -504,11 +575,16 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", metadata_.GetEntityRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_entity", request, response)
+
+        if raw:
+            response = metadata_.Entity.pb(response)
 
         # Done; return the response.
         return response
@@ -521,6 +597,12 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListEntitiesPager:
         r"""List metadata entities in a zone.
 
@@ -539,6 +621,28 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.metadata_service.pagers.ListEntitiesPager:
@@ -563,29 +667,60 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, metadata_.ListEntitiesRequest):
-            request = metadata_.ListEntitiesRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, metadata_.ListEntitiesRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.ListEntitiesRequest.wrap(request)
+            else:
+                request = metadata_.ListEntitiesRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_entities]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = metadata_.ListEntitiesRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(metadata_.ListEntitiesResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method("list_entities", request.page_size)
+            request = metadata_.ListEntitiesRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header("parent", metadata_.ListEntitiesRequest.pb(request).parent),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListEntitiesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
@@ -599,6 +734,7 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> metadata_.Partition:
         r"""Get a metadata partition of an entity.
 
@@ -617,6 +753,9 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If set, return the underlying protocol buffer
+                message instead of its proto-plus wrapper, which is
+                cheaper to read in bulk.
 
         Returns:
             google.cloud.dataplex_v1.types.Partition:
@@ -639,11 +778,21 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, metadata_.GetPartitionRequest):
-            request = metadata_.GetPartitionRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if name is not None:
-                request.name = name
+            if isinstance(request, metadata_.GetPartitionRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.GetPartitionRequest.wrap(request)
+            else:
+                request = metadata_.GetPartitionRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if name is not None:
+                    request.name = name
+
+        # Serve repeated lookups from the cache, if one is configured.
+        if self._cache is not None:
+            cached = self._cache.get("get_partition", request)
+            if cached is not None:
+                return metadata_.Partition.pb(cached) if raw else cached
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
@@ -652,11 +801,16 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+            _routing.header("name", metadata_.GetPartitionRequest.pb(request).name),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if self._cache is not None:
+            self._cache.put("get_partition", request, response)
+
+        if raw:
+            response = metadata_.Partition.pb(response)
 
         # Done; return the response.
         return response
@@ -669,6 +823,12 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        adaptive_page_size: bool = False,
+        page_retry: OptionalRetry = None,
+        resume_from: checkpoints.Checkpoint = None,
+        checkpoint_file: checkpoints.CheckpointFile = None,
     ) -> pagers.ListPartitionsPager:
         r"""List metadata partitions of an entity.
 
@@ -687,6 +847,28 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, iterating over the pager yields the
+                underlying protocol buffer messages instead of their
+                proto-plus wrappers, which are cheaper to read in bulk.
+            adaptive_page_size (bool): If set, the page size starts
+                above the service default, grows toward the service
+                maximum while pages come back fast, and shrinks when they
+                are slow, large, or exceed their deadline. The size in use
+                is available as the pager's ``page_size``.
+            page_retry (google.api_core.retry.Retry): If set, how to retry
+                the requests of later pages. A failed page is requested
+                again with the same page token, and iteration carries on.
+            resume_from (google.cloud.dataplex_v1.checkpoints.Checkpoint):
+                A checkpoint of this listing, taken from an earlier
+                pager's ``checkpoint``, to continue from. Resuming a
+                complete listing lists nothing.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the listing resumes from the checkpoint recorded
+                there, if any, and records its own as pages are consumed.
 
         Returns:
             google.cloud.dataplex_v1.services.metadata_service.pagers.ListPartitionsPager:
@@ -711,34 +893,138 @@ class MetadataServiceClient(metaclass=MetadataServiceClientMeta):
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
         if not isinstance(request, metadata_.ListPartitionsRequest):
-            request = metadata_.ListPartitionsRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if parent is not None:
-                request.parent = parent
+            if isinstance(request, metadata_.ListPartitionsRequest.pb()):
+                # Wrap a raw protobuf request rather than copying it.
+                request = metadata_.ListPartitionsRequest.wrap(request)
+            else:
+                request = metadata_.ListPartitionsRequest(request)
+                # If we have keyword arguments corresponding to fields on the
+                # request, apply these.
+                if parent is not None:
+                    request.parent = parent
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_partitions]
 
+        # Resume the listing where a checkpoint left it.
+        if resume_from is None and checkpoint_file is not None:
+            resume_from = checkpoint_file.load(checkpoints.fingerprint(request))
+        if resume_from is not None:
+            request = metadata_.ListPartitionsRequest(request)
+            request.page_token = checkpoints.resume_token(request, resume_from)
+            if resume_from.complete:
+                # Nothing is left to list; don't start over.
+                rpc = _paging.completed_listing(metadata_.ListPartitionsResponse)
+
+        # Let the page size follow how fast and large the pages are.
+        if adaptive_page_size:
+            tuner = _paging.PageSizeTuner.for_method(
+                "list_partitions", request.page_size
+            )
+            request = metadata_.ListPartitionsRequest(request)
+            request.page_size = tuner.page_size
+            rpc = tuner.wrap(rpc)
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
-            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+            _routing.header(
+                "parent", metadata_.ListPartitionsRequest.pb(request).parent
+            ),
         )
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Retry the later pages on their own, keeping the pages read.
+        if page_retry is not None:
+            rpc = functools.partial(rpc, retry=page_retry)
+
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPartitionsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            raw=raw,
+            checkpoint_file=checkpoint_file,
         )
 
         # Done; return the response.
         return response
 
+    def scan_partitions(
+        self,
+        parent: str,
+        *,
+        views: Sequence[metadata_.ListEntitiesRequest.EntityView] = (
+            metadata_.ListEntitiesRequest.EntityView.TABLES,
+            metadata_.ListEntitiesRequest.EntityView.FILESETS,
+        ),
+        max_workers: int = 8,
+        on_error: Callable[[metadata_.Entity, Exception], None] = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[Tuple[metadata_.Entity, metadata_.Partition]]:
+        r"""Scan the partitions of every entity in a zone concurrently.
+
+        Entities are listed with ``list_entities`` and the partitions of
+        up to ``max_workers`` entities are listed at the same time on a
+        thread pool. Results are streamed as they arrive, so partitions of
+        different entities may interleave.
+
+        Args:
+            parent (str):
+                Required. The resource name of the parent zone:
+                ``projects/{project_number}/locations/{location_id}/lakes/{lake_id}/zones/{zone_id}``.
+            views (Sequence[google.cloud.dataplex_v1.types.ListEntitiesRequest.EntityView]):
+                The entity views to list. Defaults to both tables and
+                filesets.
+            max_workers (int): The maximum number of entities whose
+                partitions are listed at the same time.
+            on_error (Callable[[google.cloud.dataplex_v1.types.Entity, Exception], None]):
+                Called when listing the partitions of one entity fails.
+                If not set, the scan carries on with the other entities
+                and the first such error is raised once they are done.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[Tuple[google.cloud.dataplex_v1.types.Entity, google.cloud.dataplex_v1.types.Partition]]:
+                ``(entity, partition)`` pairs for every partition in the
+                zone.
+
+        """
+
+        def entities():
+            for view in views:
+                yield from self.list_entities(
+                    request=metadata_.ListEntitiesRequest(parent=parent, view=view),
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                )
+
+        def partitions(entity):
+            pager = self.list_partitions(
+                parent=entity.name, retry=retry, timeout=timeout, metadata=metadata,
+            )
+            for page in pager.pages:
+                yield page.partitions
+
+        for entity, chunk in _fanout.fan_out(
+            entities(), partitions, max_workers=max_workers, on_error=on_error,
+        ):
+            for partition in chunk:
+                yield entity, partition
+
     def __enter__(self):
         return self
 
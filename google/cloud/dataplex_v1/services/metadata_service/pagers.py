@@ -24,6 +24,8 @@ from typing import (
     Iterator,
 )
 
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1 import checkpoints
 from google.cloud.dataplex_v1.types import metadata_
 
 
@@ -51,7 +53,10 @@ class ListEntitiesPager:
         request: metadata_.ListEntitiesRequest,
         response: metadata_.ListEntitiesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -64,17 +69,52 @@ class ListEntitiesPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = metadata_.ListEntitiesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[metadata_.ListEntitiesResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[metadata_.ListEntitiesResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -83,7 +123,10 @@ class ListEntitiesPager:
 
     def __iter__(self) -> Iterator[metadata_.Entity]:
         for page in self.pages:
-            yield from page.entities
+            if self._raw:
+                yield from metadata_.ListEntitiesResponse.pb(page).entities
+            else:
+                yield from page.entities
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -113,7 +156,10 @@ class ListEntitiesAsyncPager:
         request: metadata_.ListEntitiesRequest,
         response: metadata_.ListEntitiesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -126,17 +172,53 @@ class ListEntitiesAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = metadata_.ListEntitiesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[metadata_.ListEntitiesResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[metadata_.ListEntitiesResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[metadata_.ListEntitiesResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -146,7 +228,12 @@ class ListEntitiesAsyncPager:
     def __aiter__(self) -> AsyncIterator[metadata_.Entity]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.entities:
+                items = (
+                    metadata_.ListEntitiesResponse.pb(page).entities
+                    if self._raw
+                    else page.entities
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -179,7 +266,10 @@ class ListPartitionsPager:
         request: metadata_.ListPartitionsRequest,
         response: metadata_.ListPartitionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiate the pager.
 
@@ -192,17 +282,52 @@ class ListPartitionsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages to fetch ahead of
+                iteration on a background thread. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = metadata_.ListPartitionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
     @property
     def pages(self) -> Iterator[metadata_.ListPartitionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages(self, self._fetch_pages())
+
+    def _fetch_pages(self) -> Iterator[metadata_.ListPartitionsResponse]:
+        if self._prefetch:
+            yield from _paging.prefetch_pages(self, self._prefetch)
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -211,7 +336,10 @@ class ListPartitionsPager:
 
     def __iter__(self) -> Iterator[metadata_.Partition]:
         for page in self.pages:
-            yield from page.partitions
+            if self._raw:
+                yield from metadata_.ListPartitionsResponse.pb(page).partitions
+            else:
+                yield from page.partitions
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -241,7 +369,10 @@ class ListPartitionsAsyncPager:
         request: metadata_.ListPartitionsRequest,
         response: metadata_.ListPartitionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        lookahead: int = 0,
+        raw: bool = False,
+        checkpoint_file: checkpoints.CheckpointFile = None
     ):
         """Instantiates the pager.
 
@@ -254,17 +385,53 @@ class ListPartitionsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            lookahead (int): The number of pages to fetch ahead of
+                iteration in a background task. If ``0``, each
+                page is fetched only once the previous one has been
+                consumed.
+            raw (bool): If set, yield the underlying protocol buffer
+                messages instead of their proto-plus wrappers.
+            checkpoint_file (google.cloud.dataplex_v1.checkpoints.CheckpointFile):
+                If set, the position of the pager is saved to it as
+                pages are consumed.
         """
         self._method = method
         self._request = metadata_.ListPartitionsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._lookahead = lookahead
+        self._raw = raw
+        self._checkpoint_file = checkpoint_file
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterator[metadata_.ListPartitionsResponse]:
+    def page_size(self) -> int:
+        """int: The page size of the most recent request, ``0`` meaning
+        the service default."""
+        return self._request.page_size
+
+    @property
+    def checkpoint(self) -> checkpoints.Checkpoint:
+        """google.cloud.dataplex_v1.checkpoints.Checkpoint: The position
+        after the most recent page. Resuming from it continues with the
+        page that follows."""
+        return checkpoints.Checkpoint(
+            checkpoints.fingerprint(self._request), self._response.next_page_token
+        )
+
+    @property
+    def pages(self) -> AsyncIterator[metadata_.ListPartitionsResponse]:
+        if self._checkpoint_file is None:
+            return self._fetch_pages()
+        return _paging.checkpoint_pages_async(self, self._fetch_pages())
+
+    async def _fetch_pages(self) -> AsyncIterator[metadata_.ListPartitionsResponse]:
+        if self._lookahead:
+            async for page in _paging.lookahead_pages(self, self._lookahead):
+                yield page
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -274,7 +441,12 @@ class ListPartitionsAsyncPager:
     def __aiter__(self) -> AsyncIterator[metadata_.Partition]:
         async def async_generator():
             async for page in self.pages:
-                for response in page.partitions:
+                items = (
+                    metadata_.ListPartitionsResponse.pb(page).partitions
+                    if self._raw
+                    else page.partitions
+                )
+                for response in items:
                     yield response
 
         return async_generator()
@@ -19,15 +19,21 @@ from typing import Dict, Type
 from .base import MetadataServiceTransport
 from .grpc import MetadataServiceGrpcTransport
 from .grpc_asyncio import MetadataServiceGrpcAsyncIOTransport
+from .grpc_pool import MetadataServiceGrpcPoolTransport
+from .grpc_asyncio_pool import MetadataServiceGrpcAsyncIOPoolTransport
 
 
 # Compile a registry of transports.
 _transport_registry = OrderedDict()  # type: Dict[str, Type[MetadataServiceTransport]]
 _transport_registry["grpc"] = MetadataServiceGrpcTransport
 _transport_registry["grpc_asyncio"] = MetadataServiceGrpcAsyncIOTransport
+_transport_registry["grpc_pool"] = MetadataServiceGrpcPoolTransport
+_transport_registry["grpc_asyncio_pool"] = MetadataServiceGrpcAsyncIOPoolTransport
 
 __all__ = (
     "MetadataServiceTransport",
     "MetadataServiceGrpcTransport",
     "MetadataServiceGrpcAsyncIOTransport",
+    "MetadataServiceGrpcPoolTransport",
+    "MetadataServiceGrpcAsyncIOPoolTransport",
 )
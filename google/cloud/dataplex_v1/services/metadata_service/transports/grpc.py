@@ -24,6 +24,7 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
 
+from google.cloud.dataplex_v1 import _interceptors
 from google.cloud.dataplex_v1.types import metadata_
 from .base import MetadataServiceTransport, DEFAULT_CLIENT_INFO
 
@@ -59,6 +60,7 @@ class MetadataServiceGrpcTransport(MetadataServiceTransport):
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        interceptors: Sequence[grpc.UnaryUnaryClientInterceptor] = (),
     ) -> None:
         """Instantiate the transport.
 
@@ -101,6 +103,10 @@ class MetadataServiceGrpcTransport(MetadataServiceTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            interceptors (Sequence[grpc.UnaryUnaryClientInterceptor]):
+                Client interceptors every call goes through, outermost
+                first, such as a
+                :class:`~google.cloud.dataplex_v1.rate_limiting.RateLimitInterceptor`.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -173,6 +179,12 @@ class MetadataServiceGrpcTransport(MetadataServiceTransport):
                 ],
             )
 
+        # Install the interceptors before any stub is created.
+        self._interceptors = tuple(interceptors)
+        self._grpc_channel = _interceptors.intercept_channel(
+            self._grpc_channel, self._interceptors
+        )
+
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
 
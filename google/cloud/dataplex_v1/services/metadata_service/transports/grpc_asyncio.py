@@ -16,7 +16,9 @@
 import warnings
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, Union
 
+from google.api_core import exceptions as core_exceptions
 from google.api_core import gapic_v1
+from google.api_core import retry as retries
 from google.api_core import grpc_helpers_async
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
@@ -24,6 +26,7 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 import grpc  # type: ignore
 from grpc.experimental import aio  # type: ignore
 
+from google.cloud.dataplex_v1 import _interceptors
 from google.cloud.dataplex_v1.types import metadata_
 from .base import MetadataServiceTransport, DEFAULT_CLIENT_INFO
 from .grpc import MetadataServiceGrpcTransport
@@ -104,6 +107,7 @@ class MetadataServiceGrpcAsyncIOTransport(MetadataServiceTransport):
         quota_project_id=None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        interceptors: Sequence[aio.UnaryUnaryClientInterceptor] = (),
     ) -> None:
         """Instantiate the transport.
 
@@ -147,6 +151,12 @@ class MetadataServiceGrpcAsyncIOTransport(MetadataServiceTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            interceptors (Sequence[aio.UnaryUnaryClientInterceptor]):
+                Client interceptors every call goes through, outermost
+                first, such as a
+                :class:`~google.cloud.dataplex_v1.rate_limiting.AsyncRateLimitInterceptor`.
+                They are installed on the channels the transport creates,
+                and cannot be combined with ``channel``.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -158,6 +168,12 @@ class MetadataServiceGrpcAsyncIOTransport(MetadataServiceTransport):
         self._ssl_channel_credentials = ssl_channel_credentials
         self._stubs: Dict[str, Callable] = {}
 
+        # aio channels only take interceptors when they are created.
+        self._interceptors = tuple(interceptors)
+        self._channel_kwargs = _interceptors.async_channel_kwargs(
+            self._interceptors, channel
+        )
+
         if api_mtls_endpoint:
             warnings.warn("api_mtls_endpoint is deprecated", DeprecationWarning)
         if client_cert_source:
@@ -216,6 +232,7 @@ class MetadataServiceGrpcAsyncIOTransport(MetadataServiceTransport):
                     ("grpc.max_send_message_length", -1),
                     ("grpc.max_receive_message_length", -1),
                 ],
+                **self._channel_kwargs,
             )
 
         # Wrap messages. This must be done after self._grpc_channel exists
@@ -339,6 +356,67 @@ class MetadataServiceGrpcAsyncIOTransport(MetadataServiceTransport):
             )
         return self._stubs["list_partitions"]
 
+    def _prep_wrapped_messages(self, client_info):
+        # Precompute the wrapped methods.
+        self._wrapped_methods = {
+            self.get_entity: gapic_v1.method_async.wrap_method(
+                self.get_entity,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.list_entities: gapic_v1.method_async.wrap_method(
+                self.list_entities,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.get_partition: gapic_v1.method_async.wrap_method(
+                self.get_partition,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+            self.list_partitions: gapic_v1.method_async.wrap_method(
+                self.list_partitions,
+                default_retry=retries.Retry(
+                    initial=1.0,
+                    maximum=10.0,
+                    multiplier=1.3,
+                    predicate=retries.if_exception_type(
+                        core_exceptions.ServiceUnavailable,
+                    ),
+                    deadline=60.0,
+                ),
+                default_timeout=60.0,
+                client_info=client_info,
+            ),
+        }
+
     def close(self):
         return self.grpc_channel.close()
 
@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""One channel and one set of credentials shared by both Dataplex clients."""
+
+import threading
+from typing import Optional, Sequence, Tuple
+
+from google.api_core import gapic_v1
+import google.auth  # type: ignore
+from google.auth import credentials as ga_credentials  # type: ignore
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.dataplex_v1 import _channel_pool
+from google.cloud.dataplex_v1.services.dataplex_service import (
+    DataplexServiceAsyncClient,
+    DataplexServiceClient,
+)
+from google.cloud.dataplex_v1.services.dataplex_service import transports as dataplex
+from google.cloud.dataplex_v1.services.dataplex_service.transports.base import (
+    DEFAULT_CLIENT_INFO,
+)
+from google.cloud.dataplex_v1.services.metadata_service import (
+    MetadataServiceAsyncClient,
+    MetadataServiceClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import transports as metadata
+
+DEFAULT_HOST = dataplex.DataplexServiceTransport.DEFAULT_HOST
+AUTH_SCOPES = dataplex.DataplexServiceTransport.AUTH_SCOPES
+
+
+class _RefCount:
+    """Closes a channel once its last lease is released."""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.leases = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self.closed:
+                raise ValueError("the shared channel has already been closed")
+            self.leases += 1
+
+    def release(self) -> bool:
+        """Drop one lease, and return whether the channel should now close."""
+        with self._lock:
+            self.leases -= 1
+            if self.leases or self.closed:
+                return False
+            self.closed = True
+            return True
+
+
+class _Lease(grpc.Channel):
+    """One holder's handle on a :class:`SharedChannel`."""
+
+    def __init__(self, refs: _RefCount):
+        refs.acquire()
+        self._refs = refs
+        self._released = False
+
+    def unary_unary(self, *args, **kwargs):
+        return self._refs.channel.unary_unary(*args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self._refs.channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self._refs.channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self._refs.channel.stream_stream(*args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._refs.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._refs.channel.unsubscribe(callback)
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        if self._refs.release():
+            self._refs.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class SharedChannel:
+    """A ``grpc.Channel`` shared by several transports.
+
+    Every transport gets its own lease from :meth:`lease`. Closing a lease,
+    as closing a client does, only releases that holder's reference; the
+    channel itself is closed with its last lease.
+    """
+
+    def __init__(self, channel: grpc.Channel):
+        """Instantiate the shared channel.
+
+        Args:
+            channel (grpc.Channel): The channel to share. It is owned by
+                the shared channel from now on.
+        """
+        self._refs = _RefCount(channel)
+
+    @property
+    def channel(self) -> grpc.Channel:
+        """grpc.Channel: The underlying channel."""
+        return self._refs.channel
+
+    @property
+    def leases(self) -> int:
+        """int: The number of leases not yet closed."""
+        return self._refs.leases
+
+    @property
+    def closed(self) -> bool:
+        """bool: Whether the underlying channel has been closed."""
+        return self._refs.closed
+
+    def lease(self) -> grpc.Channel:
+        """Return a new handle on the channel for one more holder.
+
+        Raises:
+            ValueError: If the channel has already been closed.
+        """
+        return _Lease(self._refs)
+
+
+class _AsyncLease(aio.Channel):
+    """One holder's handle on an :class:`AsyncSharedChannel`."""
+
+    def __init__(self, refs: _RefCount):
+        refs.acquire()
+        self._refs = refs
+        self._released = False
+
+    def unary_unary(self, *args, **kwargs):
+        return self._refs.channel.unary_unary(*args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self._refs.channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self._refs.channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self._refs.channel.stream_stream(*args, **kwargs)
+
+    def get_state(self, try_to_connect: bool = False):
+        return self._refs.channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        return await self._refs.channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await self._refs.channel.channel_ready()
+
+    async def close(self, grace: Optional[float] = None):
+        if self._released:
+            return
+        self._released = True
+        if self._refs.release():
+            await self._refs.channel.close(grace)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncSharedChannel(SharedChannel):
+    """An ``aio.Channel`` shared by several transports.
+
+    This is the ``asyncio`` counterpart of :class:`SharedChannel`.
+    """
+
+    def lease(self) -> aio.Channel:
+        """Return a new handle on the channel for one more holder.
+
+        Raises:
+            ValueError: If the channel has already been closed.
+        """
+        return _AsyncLease(self._refs)
+
+
+def _open_channel(
+    transport_class,
+    host: str,
+    credentials: Optional[ga_credentials.Credentials],
+    scopes: Optional[Sequence[str]],
+    quota_project_id: Optional[str],
+    pool_size: int,
+):
+    if credentials is None:
+        credentials, _ = google.auth.default(
+            scopes=scopes, default_scopes=AUTH_SCOPES, quota_project_id=quota_project_id
+        )
+    if ":" not in host:
+        host += ":443"
+    options = [
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+    ]
+    if pool_size > 1:
+        options.extend(_channel_pool.POOL_CHANNEL_OPTIONS)
+    channels = [
+        transport_class.create_channel(
+            host,
+            credentials=credentials,
+            scopes=scopes,
+            quota_project_id=quota_project_id,
+            options=options,
+        )
+        for _ in range(pool_size)
+    ]
+    return host, channels
+
+
+def create_clients(
+    *,
+    host: str = DEFAULT_HOST,
+    credentials: ga_credentials.Credentials = None,
+    scopes: Sequence[str] = None,
+    quota_project_id: Optional[str] = None,
+    client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+    pool_size: int = 1,
+) -> Tuple[DataplexServiceClient, MetadataServiceClient]:
+    """Create both clients over one channel and one set of credentials.
+
+    The clients can be closed independently; the channel is closed along
+    with the second one.
+
+    .. code-block:: python
+
+        dataplex_client, metadata_client = create_clients()
+        with metadata_client:
+            ...
+
+    Args:
+        host (str): The hostname to connect to.
+        credentials (Optional[google.auth.credentials.Credentials]): The
+            authorization credentials to attach to requests. If not set,
+            the default credentials are looked up once for both clients.
+        scopes (Optional[Sequence[str]]): A list of scopes.
+        quota_project_id (Optional[str]): An optional project to use for
+            billing and quota.
+        client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+            The client info used to send a user-agent string along with
+            API requests.
+        pool_size (int): The number of connections shared by the clients.
+            See :class:`~.DataplexServiceGrpcPoolTransport`.
+
+    Returns:
+        Tuple[google.cloud.dataplex_v1.services.dataplex_service.DataplexServiceClient, google.cloud.dataplex_v1.services.metadata_service.MetadataServiceClient]:
+            The two clients.
+    """
+    if pool_size < 1:
+        raise ValueError(
+            "pool_size must be a positive integer, got {}".format(pool_size)
+        )
+    host, channels = _open_channel(
+        dataplex.DataplexServiceGrpcTransport,
+        host,
+        credentials,
+        scopes,
+        quota_project_id,
+        pool_size,
+    )
+    channel = channels[0] if pool_size == 1 else _channel_pool.ChannelPool(channels)
+    shared = SharedChannel(channel)
+    return (
+        DataplexServiceClient(
+            transport=dataplex.DataplexServiceGrpcTransport(
+                host=host, channel=shared.lease(), client_info=client_info
+            )
+        ),
+        MetadataServiceClient(
+            transport=metadata.MetadataServiceGrpcTransport(
+                host=host, channel=shared.lease(), client_info=client_info
+            )
+        ),
+    )
+
+
+def create_async_clients(
+    *,
+    host: str = DEFAULT_HOST,
+    credentials: ga_credentials.Credentials = None,
+    scopes: Sequence[str] = None,
+    quota_project_id: Optional[str] = None,
+    client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+    pool_size: int = 1,
+) -> Tuple[DataplexServiceAsyncClient, MetadataServiceAsyncClient]:
+    """Create both async clients over one channel and one set of credentials.
+
+    This is the ``asyncio`` counterpart of :func:`create_clients`, and
+    takes the same arguments.
+
+    Returns:
+        Tuple[google.cloud.dataplex_v1.services.dataplex_service.DataplexServiceAsyncClient, google.cloud.dataplex_v1.services.metadata_service.MetadataServiceAsyncClient]:
+            The two clients.
+    """
+    if pool_size < 1:
+        raise ValueError(
+            "pool_size must be a positive integer, got {}".format(pool_size)
+        )
+    host, channels = _open_channel(
+        dataplex.DataplexServiceGrpcAsyncIOTransport,
+        host,
+        credentials,
+        scopes,
+        quota_project_id,
+        pool_size,
+    )
+    channel = (
+        channels[0] if pool_size == 1 else _channel_pool.AsyncChannelPool(channels)
+    )
+    shared = AsyncSharedChannel(channel)
+    return (
+        DataplexServiceAsyncClient(
+            transport=dataplex.DataplexServiceGrpcAsyncIOTransport(
+                host=host, channel=shared.lease(), client_info=client_info
+            )
+        ),
+        MetadataServiceAsyncClient(
+            transport=metadata.MetadataServiceGrpcAsyncIOTransport(
+                host=host, channel=shared.lease(), client_info=client_info
+            )
+        ),
+    )
+
+
+__all__ = (
+    "AsyncSharedChannel",
+    "SharedChannel",
+    "create_async_clients",
+    "create_clients",
+)
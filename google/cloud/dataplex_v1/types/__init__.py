@@ -13,71 +13,68 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from .logs import (
-    DiscoveryEvent,
-    JobEvent,
-    SessionEvent,
-)
-from .metadata_ import (
-    Entity,
-    GetEntityRequest,
-    GetPartitionRequest,
-    ListEntitiesRequest,
-    ListEntitiesResponse,
-    ListPartitionsRequest,
-    ListPartitionsResponse,
-    Partition,
-    Schema,
-    StorageFormat,
-    StorageSystem,
-)
-from .resources import (
-    Action,
-    Asset,
-    AssetStatus,
-    Lake,
-    Zone,
-    State,
-)
-from .service import (
-    CancelJobRequest,
-    CreateAssetRequest,
-    CreateLakeRequest,
-    CreateTaskRequest,
-    CreateZoneRequest,
-    DeleteAssetRequest,
-    DeleteLakeRequest,
-    DeleteTaskRequest,
-    DeleteZoneRequest,
-    GetAssetRequest,
-    GetJobRequest,
-    GetLakeRequest,
-    GetTaskRequest,
-    GetZoneRequest,
-    ListActionsResponse,
-    ListAssetActionsRequest,
-    ListAssetsRequest,
-    ListAssetsResponse,
-    ListJobsRequest,
-    ListJobsResponse,
-    ListLakeActionsRequest,
-    ListLakesRequest,
-    ListLakesResponse,
-    ListTasksRequest,
-    ListTasksResponse,
-    ListZoneActionsRequest,
-    ListZonesRequest,
-    ListZonesResponse,
-    OperationMetadata,
-    UpdateAssetRequest,
-    UpdateLakeRequest,
-    UpdateTaskRequest,
-    UpdateZoneRequest,
-)
-from .tasks import (
-    Job,
-    Task,
-)
+from google.cloud.dataplex_v1 import _lazy
+
+# Each name is imported from its module on first access; see ``_lazy.attach``.
+_EXPORTS = {
+    "DiscoveryEvent": ".logs",
+    "JobEvent": ".logs",
+    "SessionEvent": ".logs",
+    "Entity": ".metadata_",
+    "GetEntityRequest": ".metadata_",
+    "GetPartitionRequest": ".metadata_",
+    "ListEntitiesRequest": ".metadata_",
+    "ListEntitiesResponse": ".metadata_",
+    "ListPartitionsRequest": ".metadata_",
+    "ListPartitionsResponse": ".metadata_",
+    "Partition": ".metadata_",
+    "Schema": ".metadata_",
+    "StorageFormat": ".metadata_",
+    "StorageSystem": ".metadata_",
+    "Action": ".resources",
+    "Asset": ".resources",
+    "AssetStatus": ".resources",
+    "Lake": ".resources",
+    "Zone": ".resources",
+    "State": ".resources",
+    "CancelJobRequest": ".service",
+    "CreateAssetRequest": ".service",
+    "CreateLakeRequest": ".service",
+    "CreateTaskRequest": ".service",
+    "CreateZoneRequest": ".service",
+    "DeleteAssetRequest": ".service",
+    "DeleteLakeRequest": ".service",
+    "DeleteTaskRequest": ".service",
+    "DeleteZoneRequest": ".service",
+    "GetAssetRequest": ".service",
+    "GetJobRequest": ".service",
+    "GetLakeRequest": ".service",
+    "GetTaskRequest": ".service",
+    "GetZoneRequest": ".service",
+    "ListActionsResponse": ".service",
+    "ListAssetActionsRequest": ".service",
+    "ListAssetsRequest": ".service",
+    "ListAssetsResponse": ".service",
+    "ListJobsRequest": ".service",
+    "ListJobsResponse": ".service",
+    "ListLakeActionsRequest": ".service",
+    "ListLakesRequest": ".service",
+    "ListLakesResponse": ".service",
+    "ListTasksRequest": ".service",
+    "ListTasksResponse": ".service",
+    "ListZoneActionsRequest": ".service",
+    "ListZonesRequest": ".service",
+    "ListZonesResponse": ".service",
+    "OperationMetadata": ".service",
+    "UpdateAssetRequest": ".service",
+    "UpdateLakeRequest": ".service",
+    "UpdateTaskRequest": ".service",
+    "UpdateZoneRequest": ".service",
+    "Job": ".tasks",
+    "Task": ".tasks",
+}
+
+__getattr__, __dir__ = _lazy.attach(__name__, _EXPORTS)
 
 __all__ = (
     "DiscoveryEvent",
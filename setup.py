@@ -32,6 +32,11 @@ dependencies = [
     "google-api-core[grpc] >= 1.28.0, <3.0.0dev",
     "proto-plus >= 1.15.0",
 ]
+extras = {
+    "arrow": ["pyarrow >= 3.0.0"],
+    "numpy": ["numpy >= 1.16.0"],
+    "opentelemetry": ["opentelemetry-api >= 1.0.0"],
+}
 
 package_root = os.path.abspath(os.path.dirname(__file__))
 
@@ -78,6 +83,7 @@ setuptools.setup(
     python_requires=">=3.6",
     namespace_packages=namespaces,
     install_requires=dependencies,
+    extras_require=extras,
     include_package_data=True,
     zip_safe=False,
 )
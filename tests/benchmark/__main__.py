@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Run the benchmarks, and compare them with an earlier run.
+
+From the repository root::
+
+    python -m tests.benchmark --output main.json
+    python -m tests.benchmark --output branch.json --compare main.json
+
+Results are written as JSON. With ``--compare``, the exit status is ``1``
+if a benchmark got slower than ``--threshold`` allows.
+"""
+
+import argparse
+import sys
+
+from tests.benchmark import benchmarks  # noqa: F401 registers the benchmarks
+from tests.benchmark import harness
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "names", nargs="*", help="benchmarks or groups to run; all if omitted"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="a JSON file of results to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the tolerated slowdown when comparing, 0.1 for 10%%",
+    )
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in harness.REGISTRY.values():
+            print("{:<16} {}".format(bench.group, bench.name))
+        return 0
+
+    results = harness.run(
+        args.names, min_time=args.min_time, rounds=args.rounds, log=print
+    )
+    if args.output:
+        harness.save(results, args.output)
+    if not args.compare:
+        return 0
+
+    changes = harness.compare(harness.load(args.compare), results)
+    print()
+    for change in changes:
+        print("{:<40} {:>+8.1%}".format(change.name, change.ratio - 1))
+    slower = harness.regressions(changes, args.threshold)
+    for change in slower:
+        print("regression: {} is {:.1%} slower".format(change.name, change.ratio - 1))
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Benchmarks of the client's hot paths."""
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+
+from google.cloud.dataplex_v1.services.dataplex_service import DataplexServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import (
+    MetadataServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import pagers
+from google.cloud.dataplex_v1.services.metadata_service import transports
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import service
+
+from tests import fake_server
+from tests.benchmark.harness import benchmark
+
+ENTITY = "projects/p/locations/us-central1/lakes/lake/zones/zone/entities/entity"
+PAGES = 10
+PAGE_SIZE = 1000
+LIST_PARTITIONS = 10000
+# More distinct names than api_core keeps routing headers for.
+CALL_NAMES = 1000
+
+
+def _full_entity() -> metadata_.Entity:
+    with fake_server.FakeDataplexServer(fake_server.Scale(schema_fields=100)) as server:
+        return server.metadata_client().get_entity(
+            request={
+                "name": server.entity_name(),
+                "view": metadata_.GetEntityRequest.EntityView.FULL,
+            }
+        )
+
+
+def _partition_pages():
+    return [
+        metadata_.ListPartitionsResponse(
+            partitions=[
+                metadata_.Partition(
+                    name="{}/partitions/{}".format(ENTITY, page * PAGE_SIZE + i),
+                    values=[str(page), str(i)],
+                    location="gs://bucket/entity/page={}/i={}".format(page, i),
+                    etag="etag",
+                )
+                for i in range(PAGE_SIZE)
+            ],
+            next_page_token=str(page + 1) if page + 1 < PAGES else "",
+        )
+        for page in range(PAGES)
+    ]
+
+
+# Request construction.
+
+
+@benchmark("requests")
+def request_from_dict():
+    def construct():
+        metadata_.ListPartitionsRequest(
+            {"parent": ENTITY, "page_size": 100, "filter": "part > 10"}
+        )
+
+    return construct
+
+
+@benchmark("requests")
+def nested_request_from_dict():
+    def construct():
+        service.CreateZoneRequest(
+            {
+                "parent": "projects/p/locations/l/lakes/lake",
+                "zone_id": "zone",
+                "zone": {
+                    "type_": "RAW",
+                    "labels": {"team": "data", "env": "prod"},
+                    "resource_spec": {"location_type": "SINGLE_REGION"},
+                    "discovery_spec": {"enabled": True, "include_patterns": ["*"]},
+                },
+            }
+        )
+
+    return construct
+
+
+# Resource name parsing.
+
+
+@benchmark("paths")
+def parse_partition_path():
+    name = ENTITY + "/partitions/2022-01-01"
+
+    def parse():
+        MetadataServiceClient.parse_partition_path(name)
+
+    return parse
+
+
+@benchmark("paths")
+def parse_asset_path():
+    name = "projects/p/locations/l/lakes/lake/zones/zone/assets/asset"
+
+    def parse():
+        DataplexServiceClient.parse_asset_path(name)
+
+    return parse
+
+
+@benchmark("paths")
+def parse_unmatched_path():
+    def parse():
+        MetadataServiceClient.parse_partition_path("not/a/partition")
+
+    return parse
+
+
+# Pager iteration over pre-built pages, without a server.
+
+
+def _pager_iteration(raw: bool):
+    pages = _partition_pages()
+
+    def method(request, metadata):
+        return pages[int(request.page_token)]
+
+    def iterate():
+        pager = pagers.ListPartitionsPager(
+            method=method,
+            request=metadata_.ListPartitionsRequest(parent=ENTITY),
+            response=pages[0],
+            raw=raw,
+        )
+        count = 0
+        for partition in pager:
+            partition.location
+            count += 1
+        return count
+
+    return iterate
+
+
+@benchmark("pagers")
+def pager_iteration():
+    return _pager_iteration(raw=False)
+
+
+@benchmark("pagers")
+def pager_iteration_raw():
+    return _pager_iteration(raw=True)
+
+
+# Attribute access through proto-plus wrappers and raw messages.
+
+
+@benchmark("access")
+def proto_plus_access():
+    entity = _full_entity()
+
+    def read():
+        for field in entity.schema.fields:
+            field.name, field.type_, field.mode
+        return len(entity.schema.fields)
+
+    return read
+
+
+@benchmark("access")
+def raw_pb_access():
+    entity = metadata_.Entity.pb(_full_entity())
+
+    def read():
+        for field in entity.schema.fields:
+            field.name, field.type_, field.mode
+        return len(entity.schema.fields)
+
+    return read
+
+
+# Serialization of FULL-view entities.
+
+
+@benchmark("serialization")
+def entity_full_serialize():
+    entity = _full_entity()
+
+    def serialize():
+        metadata_.Entity.serialize(entity)
+
+    return serialize
+
+
+@benchmark("serialization")
+def entity_full_deserialize():
+    data = metadata_.Entity.serialize(_full_entity())
+
+    def deserialize():
+        metadata_.Entity.deserialize(data)
+
+    return deserialize
+
+
+# End-to-end listing against the local fake server.
+
+
+def _list_server():
+    return fake_server.FakeDataplexServer(
+        fake_server.Scale(lakes=1, zones=1, entities=1, partitions=LIST_PARTITIONS)
+    )
+
+
+@benchmark("list")
+def sync_list_partitions():
+    server = _list_server()
+    client = server.metadata_client()
+    request = {"parent": server.entity_name(), "page_size": PAGE_SIZE}
+
+    def list_partitions():
+        return sum(1 for _ in client.list_partitions(request=request))
+
+    yield list_partitions
+    server.stop()
+
+
+@benchmark("list")
+def async_list_partitions():
+    server = _list_server()
+    clients = []
+    request = {"parent": server.entity_name(), "page_size": PAGE_SIZE}
+
+    async def list_partitions():
+        # The client must be created with the timing loop running.
+        if not clients:
+            clients.append(server.metadata_async_client())
+        pager = await clients[0].list_partitions(request=request)
+        count = 0
+        async for _ in pager:
+            count += 1
+        return count
+
+    yield list_partitions
+    server.stop()
+
+
+# Client overhead per call, over channels answering without any I/O.
+
+
+class _InstantChannel:
+    """A channel whose stubs return a canned response at once."""
+
+    def __init__(self, response, asynchronous=False):
+        self._response = response
+        self._asynchronous = asynchronous
+
+    def unary_unary(self, method, request_serializer, response_deserializer):
+        response = self._response
+
+        if self._asynchronous:
+
+            def stub(request, timeout=None, metadata=None, **kwargs):
+                return grpc_helpers_async.FakeUnaryUnaryCall(response)
+
+        else:
+
+            def stub(request, timeout=None, metadata=None, **kwargs):
+                return response
+
+        return stub
+
+
+def _instant_client(asynchronous=False):
+    response = metadata_.Entity(name=ENTITY)
+    channel = _InstantChannel(response, asynchronous)
+    credentials = ga_credentials.AnonymousCredentials()
+    if asynchronous:
+        return MetadataServiceAsyncClient(
+            transport=transports.MetadataServiceGrpcAsyncIOTransport(
+                channel=channel, credentials=credentials
+            )
+        )
+    return MetadataServiceClient(
+        transport=transports.MetadataServiceGrpcTransport(
+            channel=channel, credentials=credentials
+        )
+    )
+
+
+def _call_names():
+    return ["{}-{}".format(ENTITY, i) for i in range(CALL_NAMES)]
+
+
+@benchmark("calls")
+def sync_get_entity():
+    client = _instant_client()
+    requests = [metadata_.GetEntityRequest(name=name) for name in _call_names()]
+
+    def call():
+        for request in requests:
+            client.get_entity(request=request)
+        return len(requests)
+
+    return call
+
+
+@benchmark("calls")
+def sync_get_entity_flattened():
+    client = _instant_client()
+    names = _call_names()
+
+    def call():
+        for name in names:
+            client.get_entity(name=name)
+        return len(names)
+
+    return call
+
+
+@benchmark("calls")
+def sync_get_entity_raw_request():
+    client = _instant_client()
+    requests = [
+        metadata_.GetEntityRequest.pb(metadata_.GetEntityRequest(name=name))
+        for name in _call_names()
+    ]
+
+    def call():
+        for request in requests:
+            client.get_entity(request=request)
+        return len(requests)
+
+    return call
+
+
+@benchmark("calls")
+def async_get_entity():
+    clients = []
+    requests = [metadata_.GetEntityRequest(name=name) for name in _call_names()]
+
+    async def call():
+        # The client must be created with the timing loop running.
+        if not clients:
+            clients.append(_instant_client(asynchronous=True))
+        for request in requests:
+            await clients[0].get_entity(request=request)
+        return len(requests)
+
+    return call
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A small harness timing benchmarks and comparing runs stored as JSON."""
+
+import asyncio
+import datetime
+import gc
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Benchmarks are registered here, in definition order, by ``benchmark``.
+REGISTRY: "Dict[str, Benchmark]" = {}
+
+
+class Benchmark(NamedTuple):
+    """A registered benchmark.
+
+    Attributes:
+        name (str): The unique name of the benchmark.
+        group (str): Benchmarks of a group are reported together.
+        setup (Callable): Called once, it returns the operation to time:
+            a function or coroutine function taking no arguments. The
+            operation may return the number of items it processed, to
+            report a throughput in items per second. If ``setup`` is a
+            generator, it yields the operation instead, and resumes once
+            the operation has been timed, to clean up.
+    """
+
+    name: str
+    group: str
+    setup: Callable
+
+
+def benchmark(group: str, name: str = None) -> Callable:
+    """Register the decorated setup function as a benchmark."""
+
+    def register(setup: Callable) -> Callable:
+        key = name or setup.__name__
+        if key in REGISTRY:
+            raise ValueError("duplicate benchmark {!r}".format(key))
+        REGISTRY[key] = Benchmark(key, group, setup)
+        return setup
+
+    return register
+
+
+def _time_sync(operation: Callable, number: int):
+    items = 0
+    start = time.perf_counter()
+    for _ in range(number):
+        items += operation() or 0
+    return time.perf_counter() - start, items
+
+
+async def _time_async(operation: Callable, number: int):
+    items = 0
+    start = time.perf_counter()
+    for _ in range(number):
+        items += await operation() or 0
+    return time.perf_counter() - start, items
+
+
+def measure(operation: Callable, *, min_time: float = 0.2, rounds: int = 5) -> dict:
+    """Time ``operation`` and return its statistics.
+
+    The number of calls per round grows until a round takes ``min_time``
+    seconds, then ``rounds`` rounds are timed with the garbage collector
+    disabled.
+
+    Args:
+        operation (Callable): A function or coroutine function taking no
+            arguments.
+        min_time (float): The minimum duration of a round, in seconds.
+        rounds (int): The number of timed rounds.
+
+    Returns:
+        dict: ``mean``, ``stdev``, ``min`` and ``max`` seconds per call,
+        ``ops_per_sec``, and ``items_per_sec`` if the operation returns
+        item counts, with the ``rounds`` and ``number`` of calls per round.
+    """
+    if inspect.iscoroutinefunction(operation):
+        loop = asyncio.new_event_loop()
+
+        def timer(number):
+            return loop.run_until_complete(_time_async(operation, number))
+
+    else:
+        loop = None
+
+        def timer(number):
+            return _time_sync(operation, number)
+
+    try:
+        number = 1
+        while True:
+            elapsed, _ = timer(number)
+            if elapsed >= min_time:
+                break
+            number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+        samples, items = [], 0
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                elapsed, round_items = timer(number)
+                samples.append(elapsed / number)
+                items += round_items
+        finally:
+            if enabled:
+                gc.enable()
+    finally:
+        if loop is not None:
+            loop.close()
+
+    mean = statistics.mean(samples)
+    result = {
+        "mean": mean,
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "max": max(samples),
+        "ops_per_sec": 1 / mean,
+        "rounds": rounds,
+        "number": number,
+    }
+    if items:
+        result["items_per_sec"] = items / (sum(samples) * number)
+    return result
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            universal_newlines=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    names: List[str] = None,
+    *,
+    min_time: float = 0.2,
+    rounds: int = 5,
+    log: Callable[[str], None] = None,
+) -> dict:
+    """Run registered benchmarks.
+
+    Args:
+        names (Optional[List[str]]): Run only the benchmarks whose name or
+            group is listed. All of them if not set.
+        min_time (float): See :func:`measure`.
+        rounds (int): See :func:`measure`.
+        log (Optional[Callable[[str], None]]): Called with a line per
+            finished benchmark.
+
+    Returns:
+        dict: The results, as written to JSON: ``meta`` describes the run,
+        and ``results`` maps benchmark names to their statistics.
+    """
+    results = {}
+    for bench in REGISTRY.values():
+        if names and bench.name not in names and bench.group not in names:
+            continue
+        setup = bench.setup()
+        if inspect.isgenerator(setup):
+            operation = next(setup)
+        else:
+            operation, setup = setup, iter(())
+        try:
+            stats = measure(operation, min_time=min_time, rounds=rounds)
+        finally:
+            next(setup, None)
+        stats["group"] = bench.group
+        results[bench.name] = stats
+        if log is not None:
+            log(format_result(bench.name, stats))
+    return {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "min_time": min_time,
+            "rounds": rounds,
+        },
+        "results": results,
+    }
+
+
+def format_result(name: str, stats: dict) -> str:
+    """Return a one-line summary of a benchmark's statistics."""
+    line = "{:<40} {:>12.3f} us/op  +-{:>5.1f}%  {:>12,.0f} op/s".format(
+        name,
+        stats["mean"] * 1e6,
+        100 * stats["stdev"] / stats["mean"],
+        stats["ops_per_sec"],
+    )
+    if "items_per_sec" in stats:
+        line += "  {:>12,.0f} items/s".format(stats["items_per_sec"])
+    return line
+
+
+class Change(NamedTuple):
+    """The change of one benchmark between two runs.
+
+    Attributes:
+        name (str): The benchmark.
+        baseline (float): The mean seconds per call of the baseline run.
+        current (float): The mean seconds per call of the current run.
+    """
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """float: How many times slower the current run is."""
+        return self.current / self.baseline
+
+
+def compare(baseline: dict, current: dict) -> List[Change]:
+    """Return the changes of the benchmarks present in both runs."""
+    changes = []
+    for name, stats in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is not None:
+            changes.append(Change(name, before["mean"], stats["mean"]))
+    return changes
+
+
+def regressions(changes: List[Change], threshold: float) -> List[Change]:
+    """Return the changes slower than the baseline by more than ``threshold``.
+
+    Args:
+        changes (List[Change]): Changes returned by :func:`compare`.
+        threshold (float): The tolerated slowdown, ``0.1`` for 10%.
+    """
+    return [change for change in changes if change.ratio > 1 + threshold]
+
+
+def load(path: str) -> dict:
+    """Read results written by :func:`save`."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results: dict, path: str) -> None:
+    """Write results as JSON."""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,928 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""An in-process fake of the Dataplex services, served over local gRPC.
+
+The fake serves synthetic lakes, zones, assets, entities and partitions
+through real gRPC, so that the clients' serialization, channels and paging
+can be measured end to end without a network:
+
+.. code-block:: python
+
+    with FakeDataplexServer(Scale(entities=100, partitions=10000)) as server:
+        client = server.metadata_client()
+        for partition in client.list_partitions(parent=server.entity_name()):
+            ...
+
+It can also be run on its own, for load tests from other processes::
+
+    python -m tests.fake_server --port 50051
+
+Filters and orderings of ``List*`` requests are ignored, and tasks and jobs
+are not served.
+"""
+
+import argparse
+import hashlib
+import itertools
+import random
+import threading
+import time
+from concurrent import futures
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Union
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.longrunning import operations_pb2  # type: ignore
+from google.protobuf import empty_pb2  # type: ignore
+from google.protobuf import timestamp_pb2  # type: ignore
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import resources
+from google.cloud.dataplex_v1.types import service
+
+_DATAPLEX = "google.cloud.dataplex.v1.DataplexService"
+_METADATA = "google.cloud.dataplex.v1.MetadataService"
+_OPERATIONS = "google.longrunning.Operations"
+
+_DEFAULT_PAGE_SIZE = 10
+_MAX_PAGE_SIZE = 1000
+
+
+class Scale(NamedTuple):
+    """The size of the synthetic data served by :class:`FakeDataplexServer`.
+
+    Attributes:
+        lakes (int): The number of lakes.
+        zones (int): The number of zones of each lake.
+        assets (int): The number of assets of each zone.
+        entities (int): The number of entities of each zone.
+        partitions (int): The number of partitions of each entity.
+        schema_fields (int): The number of schema fields of each entity.
+    """
+
+    lakes: int = 2
+    zones: int = 2
+    assets: int = 2
+    entities: int = 10
+    partitions: int = 100
+    schema_fields: int = 20
+
+
+class _Abort(Exception):
+    def __init__(self, code: grpc.StatusCode, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _now() -> timestamp_pb2.Timestamp:
+    timestamp = timestamp_pb2.Timestamp()
+    timestamp.GetCurrentTime()
+    return timestamp
+
+
+def _etag(*parts: str) -> str:
+    return hashlib.sha1("/".join(parts).encode()).hexdigest()[:16]
+
+
+class _Children:
+    """The resources of one parent, in creation order."""
+
+    def __init__(self):
+        self.items: Dict[str, object] = {}
+        self._values: Optional[List[object]] = None
+
+    def values(self) -> List[object]:
+        if self._values is None:
+            self._values = list(self.items.values())
+        return self._values
+
+    def put(self, name: str, resource: object) -> None:
+        self.items[name] = resource
+        self._values = None
+
+    def pop(self, name: str) -> None:
+        del self.items[name]
+        self._values = None
+
+
+class FakeDataplexServer:
+    """Serves ``DataplexService``, ``MetadataService`` and long-running
+    operations on a local port.
+
+    Lakes, zones and assets can be created, updated and deleted; those
+    calls return operations that complete ``operation_delay`` seconds
+    later. Entities and partitions are read-only, and are generated on
+    first access.
+
+    Every call first waits ``latency`` seconds, plus ``item_latency`` per
+    resource returned by ``List*`` methods, and then fails with
+    ``error_code`` with probability ``error_rate``. Failures of specific
+    calls can be queued with :meth:`fail_next`. The number of calls of
+    each method is counted in :attr:`calls`.
+    """
+
+    def __init__(
+        self,
+        scale: Scale = Scale(),
+        *,
+        project: str = "fake-project",
+        location: str = "us-central1",
+        latency: Union[float, Mapping[str, float]] = 0.0,
+        item_latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        operation_delay: float = 0.0,
+        port: int = 0,
+        max_workers: int = 10,
+        seed: int = None,
+    ):
+        """Instantiate and start the server.
+
+        Args:
+            scale (Scale): The size of the synthetic data.
+            project (str): The project of every resource.
+            location (str): The location of every resource.
+            latency (Union[float, Mapping[str, float]]): Seconds added to
+                every call, or to the calls of each method, keyed by
+                transport method name such as ``"list_partitions"``.
+            item_latency (float): Seconds added per resource returned by
+                ``List*`` methods.
+            error_rate (float): The probability of a call failing.
+            error_code (grpc.StatusCode): The status of random failures.
+            operation_delay (float): Seconds before operations complete.
+            port (int): The port to listen on. A free port is picked if
+                ``0``.
+            max_workers (int): The number of calls served concurrently.
+            seed (Optional[int]): Seeds the random failures.
+        """
+        self.scale = scale
+        self.project = project
+        self.location = location
+        self.latency = latency
+        self.item_latency = item_latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.operation_delay = operation_delay
+        self.calls: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls_lock = threading.Lock()
+        self._failures: Dict[str, List[grpc.StatusCode]] = {}
+        self._children: Dict[str, _Children] = {}
+        self._resources: Dict[str, object] = {}
+        self._operations: Dict[str, _Operation] = {}
+        self._operation_ids = itertools.count(1)
+        self._uids = itertools.count(1)
+        self._populate()
+
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+        self._server.add_generic_rpc_handlers(self._handlers())
+        self.port = self._server.add_insecure_port("localhost:{}".format(port))
+        self._server.start()
+
+    @property
+    def address(self) -> str:
+        """str: The ``host:port`` the server listens on."""
+        return "localhost:{}".format(self.port)
+
+    def stop(self, grace: float = None) -> None:
+        """Stop serving, waiting up to ``grace`` seconds for calls in flight."""
+        self._server.stop(grace).wait()
+
+    def __enter__(self) -> "FakeDataplexServer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def fail_next(self, method: str, code: grpc.StatusCode, count: int = 1) -> None:
+        """Make the next ``count`` calls of ``method`` fail with ``code``.
+
+        Args:
+            method (str): A transport method name, such as ``"get_entity"``.
+            code (grpc.StatusCode): The status to fail with.
+            count (int): The number of calls to fail.
+        """
+        with self._calls_lock:
+            self._failures.setdefault(method, []).extend([code] * count)
+
+    # Resource names of the synthetic data.
+
+    def location_name(self) -> str:
+        """Return the name of the location of every lake."""
+        return "projects/{}/locations/{}".format(self.project, self.location)
+
+    def lake_name(self, lake: int = 0) -> str:
+        """Return the name of a synthetic lake, by index."""
+        return "{}/lakes/lake-{}".format(self.location_name(), lake)
+
+    def zone_name(self, lake: int = 0, zone: int = 0) -> str:
+        """Return the name of a synthetic zone, by index."""
+        return "{}/zones/zone-{}".format(self.lake_name(lake), zone)
+
+    def asset_name(self, lake: int = 0, zone: int = 0, asset: int = 0) -> str:
+        """Return the name of a synthetic asset, by index."""
+        return "{}/assets/asset-{}".format(self.zone_name(lake, zone), asset)
+
+    def entity_name(self, lake: int = 0, zone: int = 0, entity: int = 0) -> str:
+        """Return the name of a synthetic entity, by index."""
+        return "{}/entities/entity-{}".format(self.zone_name(lake, zone), entity)
+
+    def partition_name(
+        self, lake: int = 0, zone: int = 0, entity: int = 0, partition: int = 0
+    ) -> str:
+        """Return the name of a synthetic partition, by index."""
+        return "{}/partitions/{}".format(
+            self.entity_name(lake, zone, entity), partition
+        )
+
+    # Clients of the server.
+
+    def channel(self) -> grpc.Channel:
+        """Return a new channel to the server."""
+        return grpc.insecure_channel(self.address)
+
+    def async_channel(self) -> aio.Channel:
+        """Return a new ``asyncio`` channel to the server.
+
+        This must be called with an event loop running.
+        """
+        return aio.insecure_channel(self.address)
+
+    def dataplex_client(self, **kwargs):
+        """Return a ``DataplexServiceClient`` of the server.
+
+        Keyword arguments are passed to the transport.
+        """
+        from google.cloud.dataplex_v1.services import dataplex_service
+
+        return dataplex_service.DataplexServiceClient(
+            transport=dataplex_service.transports.DataplexServiceGrpcTransport(
+                channel=self.channel(), **kwargs
+            )
+        )
+
+    def metadata_client(self, **kwargs):
+        """Return a ``MetadataServiceClient`` of the server.
+
+        Keyword arguments are passed to the transport.
+        """
+        from google.cloud.dataplex_v1.services import metadata_service
+
+        return metadata_service.MetadataServiceClient(
+            transport=metadata_service.transports.MetadataServiceGrpcTransport(
+                channel=self.channel(), **kwargs
+            )
+        )
+
+    def dataplex_async_client(self, **kwargs):
+        """Return a ``DataplexServiceAsyncClient`` of the server.
+
+        This must be called with an event loop running. Keyword arguments
+        are passed to the transport.
+        """
+        from google.cloud.dataplex_v1.services import dataplex_service
+
+        return dataplex_service.DataplexServiceAsyncClient(
+            transport=dataplex_service.transports.DataplexServiceGrpcAsyncIOTransport(
+                channel=self.async_channel(),
+                credentials=ga_credentials.AnonymousCredentials(),
+                **kwargs,
+            )
+        )
+
+    def metadata_async_client(self, **kwargs):
+        """Return a ``MetadataServiceAsyncClient`` of the server.
+
+        This must be called with an event loop running. Keyword arguments
+        are passed to the transport.
+        """
+        from google.cloud.dataplex_v1.services import metadata_service
+
+        return metadata_service.MetadataServiceAsyncClient(
+            transport=metadata_service.transports.MetadataServiceGrpcAsyncIOTransport(
+                channel=self.async_channel(),
+                credentials=ga_credentials.AnonymousCredentials(),
+                **kwargs,
+            )
+        )
+
+    # Synthetic data.
+
+    def _populate(self) -> None:
+        scale = self.scale
+        for lake in range(scale.lakes):
+            self._put(
+                self.location_name(),
+                resources.Lake.pb(
+                    resources.Lake(
+                        name=self.lake_name(lake),
+                        display_name="Lake {}".format(lake),
+                        state=resources.State.ACTIVE,
+                    )
+                ),
+            )
+            for zone in range(scale.zones):
+                self._put(
+                    self.lake_name(lake),
+                    resources.Zone.pb(
+                        resources.Zone(
+                            name=self.zone_name(lake, zone),
+                            state=resources.State.ACTIVE,
+                            type_=(
+                                resources.Zone.Type.RAW
+                                if zone % 2 == 0
+                                else resources.Zone.Type.CURATED
+                            ),
+                            resource_spec={
+                                "location_type": resources.Zone.ResourceSpec.LocationType.SINGLE_REGION
+                            },
+                        )
+                    ),
+                )
+                for asset in range(scale.assets):
+                    self._put(
+                        self.zone_name(lake, zone),
+                        resources.Asset.pb(
+                            resources.Asset(
+                                name=self.asset_name(lake, zone, asset),
+                                state=resources.State.ACTIVE,
+                                resource_spec={
+                                    "name": "projects/{}/buckets/bucket-{}-{}-{}".format(
+                                        self.project, lake, zone, asset
+                                    ),
+                                    "type_": resources.Asset.ResourceSpec.Type.STORAGE_BUCKET,
+                                },
+                            )
+                        ),
+                    )
+
+    def _put(self, parent: str, resource) -> None:
+        if not resource.uid:
+            resource.uid = "uid-{}".format(next(self._uids))
+        if not resource.HasField("create_time"):
+            resource.create_time.CopyFrom(_now())
+        self._children.setdefault(parent, _Children()).put(resource.name, resource)
+        self._resources[resource.name] = resource
+
+    def _entities(self, zone: str) -> _Children:
+        children = self._children.get(zone + "/entities")
+        if children is None:
+            if zone not in self._resources:
+                raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(zone))
+            children = _Children()
+            assets = self._children.get(zone, _Children()).values()
+            for index in range(self.scale.entities):
+                entity = self._entity(zone, index, assets)
+                children.put(entity.name, entity)
+            self._children[zone + "/entities"] = children
+        return children
+
+    def _entity(self, zone: str, index: int, assets: List):
+        entity_id = "entity-{}".format(index)
+        table = index % 2 == 0
+        data_path = "gs://{}/{}".format(zone.rsplit("/", 1)[-1], entity_id)
+        entity = metadata_.Entity.pb(
+            metadata_.Entity(
+                name="{}/entities/{}".format(zone, entity_id),
+                id=entity_id,
+                display_name="Entity {}".format(index),
+                etag=_etag(zone, entity_id),
+                type_=(
+                    metadata_.Entity.Type.TABLE
+                    if table
+                    else metadata_.Entity.Type.FILESET
+                ),
+                asset=assets[index % len(assets)].name.rsplit("/", 1)[-1]
+                if assets
+                else "",
+                data_path=data_path,
+                data_path_pattern=data_path + "/**",
+                system=metadata_.StorageSystem.CLOUD_STORAGE,
+                format_={"format_": metadata_.StorageFormat.Format.PARQUET},
+                schema={
+                    "user_managed": False,
+                    "fields": [
+                        {
+                            "name": "column_{}".format(field),
+                            "type_": metadata_.Schema.Type.STRING,
+                            "mode": metadata_.Schema.Mode.NULLABLE,
+                            "description": "Synthetic column {}".format(field),
+                        }
+                        for field in range(self.scale.schema_fields)
+                    ],
+                    "partition_fields": [
+                        {"name": "part", "type_": metadata_.Schema.Type.INT64}
+                    ],
+                    "partition_style": metadata_.Schema.PartitionStyle.HIVE_COMPATIBLE,
+                },
+            )
+        )
+        entity.create_time.CopyFrom(_now())
+        entity.update_time.CopyFrom(entity.create_time)
+        return entity
+
+    def _partitions(self, entity_name: str) -> _Children:
+        children = self._children.get(entity_name)
+        if children is None:
+            entity = self._entities(entity_name.rsplit("/entities/", 1)[0]).items.get(
+                entity_name
+            )
+            if entity is None:
+                raise _Abort(
+                    grpc.StatusCode.NOT_FOUND, "{} not found".format(entity_name)
+                )
+            children = _Children()
+            for index in range(self.scale.partitions):
+                partition = metadata_.Partition.pb(metadata_.Partition())
+                partition.name = "{}/partitions/{}".format(entity_name, index)
+                partition.values.append(str(index))
+                partition.location = "{}/part={}".format(entity.data_path, index)
+                partition.etag = _etag(entity_name, str(index))
+                children.put(partition.name, partition)
+            self._children[entity_name] = children
+        return children
+
+    # Serving.
+
+    def _handlers(self):
+        def handler(
+            method, request_type, response_type, fn, items=None, mutating=False
+        ):
+            return grpc.unary_unary_rpc_method_handler(
+                self._serve(method, fn, items, mutating),
+                request_deserializer=request_type.FromString,
+                response_serializer=response_type.SerializeToString,
+            )
+
+        operation = operations_pb2.Operation
+        dataplex = {
+            "ListLakes": handler(
+                "list_lakes",
+                service.ListLakesRequest.pb(),
+                service.ListLakesResponse.pb(),
+                self._lister(service.ListLakesResponse, "lakes"),
+                items="lakes",
+            ),
+            "GetLake": handler(
+                "get_lake", service.GetLakeRequest.pb(), resources.Lake.pb(), self._get,
+            ),
+            "CreateLake": handler(
+                "create_lake",
+                service.CreateLakeRequest.pb(),
+                operation,
+                self._creator("lake", "lake_id", resources.Lake),
+                mutating=True,
+            ),
+            "UpdateLake": handler(
+                "update_lake",
+                service.UpdateLakeRequest.pb(),
+                operation,
+                self._updater("lake"),
+                mutating=True,
+            ),
+            "DeleteLake": handler(
+                "delete_lake",
+                service.DeleteLakeRequest.pb(),
+                operation,
+                self._delete,
+                mutating=True,
+            ),
+            "ListZones": handler(
+                "list_zones",
+                service.ListZonesRequest.pb(),
+                service.ListZonesResponse.pb(),
+                self._lister(service.ListZonesResponse, "zones"),
+                items="zones",
+            ),
+            "GetZone": handler(
+                "get_zone", service.GetZoneRequest.pb(), resources.Zone.pb(), self._get,
+            ),
+            "CreateZone": handler(
+                "create_zone",
+                service.CreateZoneRequest.pb(),
+                operation,
+                self._creator("zone", "zone_id", resources.Zone),
+                mutating=True,
+            ),
+            "UpdateZone": handler(
+                "update_zone",
+                service.UpdateZoneRequest.pb(),
+                operation,
+                self._updater("zone"),
+                mutating=True,
+            ),
+            "DeleteZone": handler(
+                "delete_zone",
+                service.DeleteZoneRequest.pb(),
+                operation,
+                self._delete,
+                mutating=True,
+            ),
+            "ListAssets": handler(
+                "list_assets",
+                service.ListAssetsRequest.pb(),
+                service.ListAssetsResponse.pb(),
+                self._lister(service.ListAssetsResponse, "assets"),
+                items="assets",
+            ),
+            "GetAsset": handler(
+                "get_asset",
+                service.GetAssetRequest.pb(),
+                resources.Asset.pb(),
+                self._get,
+            ),
+            "CreateAsset": handler(
+                "create_asset",
+                service.CreateAssetRequest.pb(),
+                operation,
+                self._creator("asset", "asset_id", resources.Asset),
+                mutating=True,
+            ),
+            "UpdateAsset": handler(
+                "update_asset",
+                service.UpdateAssetRequest.pb(),
+                operation,
+                self._updater("asset"),
+                mutating=True,
+            ),
+            "DeleteAsset": handler(
+                "delete_asset",
+                service.DeleteAssetRequest.pb(),
+                operation,
+                self._delete,
+                mutating=True,
+            ),
+        }
+        for rpc, method, request_type in (
+            ("ListLakeActions", "list_lake_actions", service.ListLakeActionsRequest),
+            ("ListZoneActions", "list_zone_actions", service.ListZoneActionsRequest),
+            ("ListAssetActions", "list_asset_actions", service.ListAssetActionsRequest),
+        ):
+            dataplex[rpc] = handler(
+                method,
+                request_type.pb(),
+                service.ListActionsResponse.pb(),
+                self._list_actions,
+                items="actions",
+            )
+        metadata = {
+            "ListEntities": handler(
+                "list_entities",
+                metadata_.ListEntitiesRequest.pb(),
+                metadata_.ListEntitiesResponse.pb(),
+                self._list_entities,
+                items="entities",
+            ),
+            "GetEntity": handler(
+                "get_entity",
+                metadata_.GetEntityRequest.pb(),
+                metadata_.Entity.pb(),
+                self._get_entity,
+            ),
+            "ListPartitions": handler(
+                "list_partitions",
+                metadata_.ListPartitionsRequest.pb(),
+                metadata_.ListPartitionsResponse.pb(),
+                self._list_partitions,
+                items="partitions",
+            ),
+            "GetPartition": handler(
+                "get_partition",
+                metadata_.GetPartitionRequest.pb(),
+                metadata_.Partition.pb(),
+                self._get_partition,
+            ),
+        }
+        operations = {
+            "GetOperation": handler(
+                "get_operation",
+                operations_pb2.GetOperationRequest,
+                operation,
+                self._get_operation,
+            ),
+            "ListOperations": handler(
+                "list_operations",
+                operations_pb2.ListOperationsRequest,
+                operations_pb2.ListOperationsResponse,
+                self._list_operations,
+                items="operations",
+            ),
+            "DeleteOperation": handler(
+                "delete_operation",
+                operations_pb2.DeleteOperationRequest,
+                empty_pb2.Empty,
+                self._delete_operation,
+                mutating=True,
+            ),
+            "CancelOperation": handler(
+                "cancel_operation",
+                operations_pb2.CancelOperationRequest,
+                empty_pb2.Empty,
+                self._cancel_operation,
+                mutating=True,
+            ),
+        }
+        return (
+            grpc.method_handlers_generic_handler(_DATAPLEX, dataplex),
+            grpc.method_handlers_generic_handler(_METADATA, metadata),
+            grpc.method_handlers_generic_handler(_OPERATIONS, operations),
+        )
+
+    def _serve(self, method: str, fn: Callable, items: Optional[str], mutating: bool):
+        # Calls are counted under a lock of their own. Only the calls that
+        # change resources or operations hold the data lock while they run;
+        # the others take it just to read what they serve, so that concurrent
+        # reads, and their latency, overlap.
+        def serve(request, context):
+            with self._calls_lock:
+                self.calls[method] = self.calls.get(method, 0) + 1
+                queued = self._failures.get(method)
+                code = queued.pop(0) if queued else None
+                if code is None and self._random.random() < self.error_rate:
+                    code = self.error_code
+            latency = self.latency
+            if not isinstance(latency, (int, float)):
+                latency = latency.get(method, 0.0)
+            response, message = None, "injected failure"
+            try:
+                if code is None and mutating:
+                    with self._lock:
+                        response = fn(request)
+                elif code is None:
+                    response = fn(request)
+            except _Abort as exc:
+                code, message = exc.code, str(exc)
+            delay = latency
+            if items is not None and response is not None:
+                delay += self.item_latency * len(getattr(response, items))
+            if delay:
+                time.sleep(delay)
+            if code is not None:
+                context.abort(code, message)
+            return response
+
+        return serve
+
+    def _page(self, request, response_type, field: str, items: List):
+        page_size = request.page_size or _DEFAULT_PAGE_SIZE
+        if page_size < 0:
+            raise _Abort(grpc.StatusCode.INVALID_ARGUMENT, "negative page_size")
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+        try:
+            offset = int(request.page_token or 0)
+        except ValueError:
+            raise _Abort(grpc.StatusCode.INVALID_ARGUMENT, "invalid page_token")
+        end = offset + page_size
+        response = response_type.pb()()
+        getattr(response, field).extend(items[offset:end])
+        if end < len(items):
+            response.next_page_token = str(end)
+        return response
+
+    def _lister(self, response_type, field: str):
+        def list_children(request):
+            if request.parent not in self._resources and request.parent != (
+                self.location_name()
+            ):
+                raise _Abort(
+                    grpc.StatusCode.NOT_FOUND, "{} not found".format(request.parent)
+                )
+            with self._lock:
+                children = self._children.get(request.parent, _Children()).values()
+            return self._page(request, response_type, field, children)
+
+        return list_children
+
+    def _list_actions(self, request):
+        return self._page(request, service.ListActionsResponse, "actions", [])
+
+    def _get(self, request):
+        resource = self._resources.get(request.name)
+        if resource is None:
+            raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+        return resource
+
+    def _list_entities(self, request):
+        with self._lock:
+            entities = self._entities(request.parent).values()
+        view = metadata_.ListEntitiesRequest.EntityView
+        if request.view == view.TABLES:
+            kind = metadata_.Entity.Type.TABLE
+        elif request.view == view.FILESETS:
+            kind = metadata_.Entity.Type.FILESET
+        else:
+            raise _Abort(grpc.StatusCode.INVALID_ARGUMENT, "view is required")
+        basic = []
+        for entity in entities:
+            if entity.type_ == kind:
+                entity = type(entity).FromString(entity.SerializeToString())
+                entity.ClearField("schema")
+                basic.append(entity)
+        return self._page(request, metadata_.ListEntitiesResponse, "entities", basic)
+
+    def _get_entity(self, request):
+        zone = request.name.rsplit("/entities/", 1)[0]
+        with self._lock:
+            entity = self._entities(zone).items.get(request.name)
+        if entity is None:
+            raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+        view = metadata_.GetEntityRequest.EntityView
+        if request.view in (view.SCHEMA, view.FULL):
+            return entity
+        entity = type(entity).FromString(entity.SerializeToString())
+        entity.ClearField("schema")
+        return entity
+
+    def _list_partitions(self, request):
+        with self._lock:
+            partitions = self._partitions(request.parent).values()
+        return self._page(
+            request, metadata_.ListPartitionsResponse, "partitions", partitions
+        )
+
+    def _get_partition(self, request):
+        entity = request.name.rsplit("/partitions/", 1)[0]
+        with self._lock:
+            partition = self._partitions(entity).items.get(request.name)
+        if partition is None:
+            raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+        return partition
+
+    # Long-running operations.
+
+    def _operation(self, target: str, verb: str, response=None):
+        name = "{}/operations/operation-{}".format(
+            self.location_name(), next(self._operation_ids)
+        )
+        metadata = service.OperationMetadata.pb(
+            service.OperationMetadata(target=target, verb=verb, api_version="v1")
+        )
+        metadata.create_time.CopyFrom(_now())
+        operation = _Operation(
+            name,
+            metadata,
+            response if response is not None else empty_pb2.Empty(),
+            time.monotonic() + self.operation_delay,
+        )
+        self._operations[name] = operation
+        return operation.poll()
+
+    def _creator(self, kind: str, id_field: str, resource_type):
+        def create(request):
+            parent = request.parent
+            if parent not in self._resources and parent != self.location_name():
+                raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(parent))
+            name = "{}/{}s/{}".format(parent, kind, getattr(request, id_field))
+            if name in self._resources:
+                raise _Abort(
+                    grpc.StatusCode.ALREADY_EXISTS, "{} already exists".format(name)
+                )
+            resource = resource_type.pb()()
+            resource.CopyFrom(getattr(request, kind))
+            resource.name = name
+            resource.state = resources.State.ACTIVE
+            if not request.validate_only:
+                resource.update_time.CopyFrom(_now())
+                self._put(parent, resource)
+            return self._operation(name, "create", resource)
+
+        return create
+
+    def _updater(self, kind: str):
+        def update(request):
+            changes = getattr(request, kind)
+            resource = self._resources.get(changes.name)
+            if resource is None:
+                raise _Abort(
+                    grpc.StatusCode.NOT_FOUND, "{} not found".format(changes.name)
+                )
+            if not request.update_mask.paths:
+                raise _Abort(
+                    grpc.StatusCode.INVALID_ARGUMENT, "update_mask is required"
+                )
+            updated = type(resource)()
+            updated.CopyFrom(resource)
+            try:
+                request.update_mask.MergeMessage(changes, updated, True, True)
+            except ValueError as exc:
+                raise _Abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+            if not request.validate_only:
+                updated.update_time.CopyFrom(_now())
+                self._put(updated.name.rsplit("/", 2)[0], updated)
+            return self._operation(updated.name, "update", updated)
+
+        return update
+
+    def _delete(self, request):
+        resource = self._resources.get(request.name)
+        if resource is None:
+            raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+        if self._children.get(request.name, _Children()).items:
+            raise _Abort(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "{} still has children".format(request.name),
+            )
+        parent = request.name.rsplit("/", 2)[0]
+        self._children[parent].pop(request.name)
+        del self._resources[request.name]
+        self._children.pop(request.name + "/entities", None)
+        return self._operation(request.name, "delete")
+
+    def _get_operation(self, request):
+        with self._lock:
+            return self._find_operation(request.name).poll()
+
+    def _list_operations(self, request):
+        with self._lock:
+            operations = [operation.poll() for operation in self._operations.values()]
+        return self._page(
+            request, operations_pb2.ListOperationsResponse, "operations", operations
+        )
+
+    def _delete_operation(self, request):
+        if self._operations.pop(request.name, None) is None:
+            raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(request.name))
+        return empty_pb2.Empty()
+
+    def _cancel_operation(self, request):
+        operation = self._find_operation(request.name)
+        if not operation.poll().done:
+            operation.operation.done = True
+            operation.operation.error.code = grpc.StatusCode.CANCELLED.value[0]
+            operation.operation.error.message = "cancelled"
+        return empty_pb2.Empty()
+
+    def _find_operation(self, name: str) -> "_Operation":
+        operation = self._operations.get(name)
+        if operation is None:
+            raise _Abort(grpc.StatusCode.NOT_FOUND, "{} not found".format(name))
+        return operation
+
+
+class _Operation:
+    """A simulated long-running operation, done once its time has come."""
+
+    def __init__(self, name: str, metadata, result, done_at: float):
+        self.operation = operations_pb2.Operation(name=name)
+        self.operation.metadata.Pack(metadata)
+        self.result = result
+        self.done_at = done_at
+
+    def poll(self) -> operations_pb2.Operation:
+        if not self.operation.done and time.monotonic() >= self.done_at:
+            self.operation.done = True
+            self.operation.response.Pack(self.result)
+        operation = operations_pb2.Operation()
+        operation.CopyFrom(self.operation)
+        return operation
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=50051)
+    for field, default in Scale._field_defaults.items():
+        parser.add_argument("--" + field.replace("_", "-"), type=int, default=default)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--item-latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--operation-delay", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    server = FakeDataplexServer(
+        Scale(**{field: getattr(args, field) for field in Scale._fields}),
+        port=args.port,
+        latency=args.latency,
+        item_latency=args.item_latency,
+        error_rate=args.error_rate,
+        operation_delay=args.operation_delay,
+    )
+    print("Serving on {}".format(server.address), flush=True)
+    try:
+        server._server.wait_for_termination()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+__all__ = (
+    "FakeDataplexServer",
+    "Scale",
+)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import os
+import time
 import mock
 
 import grpc
@@ -38,6 +40,7 @@ from google.auth.exceptions import MutualTLSChannelError
 from google.cloud.dataplex_v1.services.dataplex_service import (
     DataplexServiceAsyncClient,
 )
+from google.cloud.dataplex_v1 import caching
 from google.cloud.dataplex_v1.services.dataplex_service import DataplexServiceClient
 from google.cloud.dataplex_v1.services.dataplex_service import pagers
 from google.cloud.dataplex_v1.services.dataplex_service import transports
@@ -1523,6 +1526,31 @@ def test_list_lakes_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_lakes_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_lakes), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListLakesResponse(
+                lakes=[resources.Lake(), resources.Lake(), resources.Lake(),],
+                next_page_token="abc",
+            ),
+            service.ListLakesResponse(lakes=[], next_page_token="def",),
+            service.ListLakesResponse(
+                lakes=[resources.Lake(),], next_page_token="ghi",
+            ),
+            service.ListLakesResponse(lakes=[resources.Lake(), resources.Lake(),],),
+            RuntimeError,
+        )
+        pages = list(client.list_lakes(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_lakes_async_pager():
     client = DataplexServiceAsyncClient(
@@ -1586,6 +1614,36 @@ async def test_list_lakes_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_lakes_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_lakes), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListLakesResponse(
+                lakes=[resources.Lake(), resources.Lake(), resources.Lake(),],
+                next_page_token="abc",
+            ),
+            service.ListLakesResponse(lakes=[], next_page_token="def",),
+            service.ListLakesResponse(
+                lakes=[resources.Lake(),], next_page_token="ghi",
+            ),
+            service.ListLakesResponse(lakes=[resources.Lake(), resources.Lake(),],),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (await client.list_lakes(request={}, lookahead=2)).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.GetLakeRequest, dict,])
 def test_get_lake(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -2091,6 +2149,35 @@ def test_list_lake_actions_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_lake_actions_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_lake_actions), "__call__"
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(), resources.Action(),],
+                next_page_token="abc",
+            ),
+            service.ListActionsResponse(actions=[], next_page_token="def",),
+            service.ListActionsResponse(
+                actions=[resources.Action(),], next_page_token="ghi",
+            ),
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(),],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_lake_actions(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_lake_actions_async_pager():
     client = DataplexServiceAsyncClient(
@@ -2162,6 +2249,42 @@ async def test_list_lake_actions_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_lake_actions_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_lake_actions),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(), resources.Action(),],
+                next_page_token="abc",
+            ),
+            service.ListActionsResponse(actions=[], next_page_token="def",),
+            service.ListActionsResponse(
+                actions=[resources.Action(),], next_page_token="ghi",
+            ),
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(),],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (
+            await client.list_lake_actions(request={}, lookahead=2)
+        ).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.CreateZoneRequest, dict,])
 def test_create_zone(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -3063,6 +3186,31 @@ def test_list_zones_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_zones_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_zones), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListZonesResponse(
+                zones=[resources.Zone(), resources.Zone(), resources.Zone(),],
+                next_page_token="abc",
+            ),
+            service.ListZonesResponse(zones=[], next_page_token="def",),
+            service.ListZonesResponse(
+                zones=[resources.Zone(),], next_page_token="ghi",
+            ),
+            service.ListZonesResponse(zones=[resources.Zone(), resources.Zone(),],),
+            RuntimeError,
+        )
+        pages = list(client.list_zones(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_zones_async_pager():
     client = DataplexServiceAsyncClient(
@@ -3126,6 +3274,36 @@ async def test_list_zones_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_zones_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_zones), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListZonesResponse(
+                zones=[resources.Zone(), resources.Zone(), resources.Zone(),],
+                next_page_token="abc",
+            ),
+            service.ListZonesResponse(zones=[], next_page_token="def",),
+            service.ListZonesResponse(
+                zones=[resources.Zone(),], next_page_token="ghi",
+            ),
+            service.ListZonesResponse(zones=[resources.Zone(), resources.Zone(),],),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (await client.list_zones(request={}, lookahead=2)).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.GetZoneRequest, dict,])
 def test_get_zone(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -3631,6 +3809,35 @@ def test_list_zone_actions_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_zone_actions_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_zone_actions), "__call__"
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(), resources.Action(),],
+                next_page_token="abc",
+            ),
+            service.ListActionsResponse(actions=[], next_page_token="def",),
+            service.ListActionsResponse(
+                actions=[resources.Action(),], next_page_token="ghi",
+            ),
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(),],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_zone_actions(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_zone_actions_async_pager():
     client = DataplexServiceAsyncClient(
@@ -3702,6 +3909,42 @@ async def test_list_zone_actions_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_zone_actions_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_zone_actions),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(), resources.Action(),],
+                next_page_token="abc",
+            ),
+            service.ListActionsResponse(actions=[], next_page_token="def",),
+            service.ListActionsResponse(
+                actions=[resources.Action(),], next_page_token="ghi",
+            ),
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(),],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (
+            await client.list_zone_actions(request={}, lookahead=2)
+        ).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.CreateAssetRequest, dict,])
 def test_create_asset(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -4603,6 +4846,31 @@ def test_list_assets_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_assets_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_assets), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListAssetsResponse(
+                assets=[resources.Asset(), resources.Asset(), resources.Asset(),],
+                next_page_token="abc",
+            ),
+            service.ListAssetsResponse(assets=[], next_page_token="def",),
+            service.ListAssetsResponse(
+                assets=[resources.Asset(),], next_page_token="ghi",
+            ),
+            service.ListAssetsResponse(assets=[resources.Asset(), resources.Asset(),],),
+            RuntimeError,
+        )
+        pages = list(client.list_assets(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_assets_async_pager():
     client = DataplexServiceAsyncClient(
@@ -4666,19 +4934,49 @@ async def test_list_assets_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
-@pytest.mark.parametrize("request_type", [service.GetAssetRequest, dict,])
-def test_get_asset(request_type, transport: str = "grpc"):
-    client = DataplexServiceClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+@pytest.mark.asyncio
+async def test_list_assets_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
     )
 
-    # Everything is optional in proto3 as far as the runtime is concerned,
-    # and we are mocking out the actual API, so just send an empty request.
-    request = request_type()
-
     # Mock the actual call within the gRPC stub, and fake the request.
-    with mock.patch.object(type(client.transport.get_asset), "__call__") as call:
-        # Designate an appropriate return value for the call.
+    with mock.patch.object(
+        type(client.transport.list_assets), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListAssetsResponse(
+                assets=[resources.Asset(), resources.Asset(), resources.Asset(),],
+                next_page_token="abc",
+            ),
+            service.ListAssetsResponse(assets=[], next_page_token="def",),
+            service.ListAssetsResponse(
+                assets=[resources.Asset(),], next_page_token="ghi",
+            ),
+            service.ListAssetsResponse(assets=[resources.Asset(), resources.Asset(),],),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (await client.list_assets(request={}, lookahead=2)).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [service.GetAssetRequest, dict,])
+def test_get_asset(request_type, transport: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = request_type()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.get_asset), "__call__") as call:
+        # Designate an appropriate return value for the call.
         call.return_value = resources.Asset(
             name="name_value",
             display_name="display_name_value",
@@ -5167,6 +5465,35 @@ def test_list_asset_actions_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_asset_actions_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_asset_actions), "__call__"
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(), resources.Action(),],
+                next_page_token="abc",
+            ),
+            service.ListActionsResponse(actions=[], next_page_token="def",),
+            service.ListActionsResponse(
+                actions=[resources.Action(),], next_page_token="ghi",
+            ),
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(),],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_asset_actions(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_asset_actions_async_pager():
     client = DataplexServiceAsyncClient(
@@ -5238,6 +5565,42 @@ async def test_list_asset_actions_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_asset_actions_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_asset_actions),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(), resources.Action(),],
+                next_page_token="abc",
+            ),
+            service.ListActionsResponse(actions=[], next_page_token="def",),
+            service.ListActionsResponse(
+                actions=[resources.Action(),], next_page_token="ghi",
+            ),
+            service.ListActionsResponse(
+                actions=[resources.Action(), resources.Action(),],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (
+            await client.list_asset_actions(request={}, lookahead=2)
+        ).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.CreateTaskRequest, dict,])
 def test_create_task(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -6141,6 +6504,29 @@ def test_list_tasks_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_tasks_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_tasks), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListTasksResponse(
+                tasks=[tasks.Task(), tasks.Task(), tasks.Task(),],
+                next_page_token="abc",
+            ),
+            service.ListTasksResponse(tasks=[], next_page_token="def",),
+            service.ListTasksResponse(tasks=[tasks.Task(),], next_page_token="ghi",),
+            service.ListTasksResponse(tasks=[tasks.Task(), tasks.Task(),],),
+            RuntimeError,
+        )
+        pages = list(client.list_tasks(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_tasks_async_pager():
     client = DataplexServiceAsyncClient(
@@ -6200,6 +6586,34 @@ async def test_list_tasks_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_tasks_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_tasks), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListTasksResponse(
+                tasks=[tasks.Task(), tasks.Task(), tasks.Task(),],
+                next_page_token="abc",
+            ),
+            service.ListTasksResponse(tasks=[], next_page_token="def",),
+            service.ListTasksResponse(tasks=[tasks.Task(),], next_page_token="ghi",),
+            service.ListTasksResponse(tasks=[tasks.Task(), tasks.Task(),],),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (await client.list_tasks(request={}, lookahead=2)).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.GetTaskRequest, dict,])
 def test_get_task(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -6676,6 +7090,28 @@ def test_list_jobs_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_jobs_pages_prefetch(transport_name: str = "grpc"):
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_jobs), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListJobsResponse(
+                jobs=[tasks.Job(), tasks.Job(), tasks.Job(),], next_page_token="abc",
+            ),
+            service.ListJobsResponse(jobs=[], next_page_token="def",),
+            service.ListJobsResponse(jobs=[tasks.Job(),], next_page_token="ghi",),
+            service.ListJobsResponse(jobs=[tasks.Job(), tasks.Job(),],),
+            RuntimeError,
+        )
+        pages = list(client.list_jobs(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_jobs_async_pager():
     client = DataplexServiceAsyncClient(
@@ -6733,6 +7169,33 @@ async def test_list_jobs_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_jobs_async_pages_lookahead():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_jobs), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            service.ListJobsResponse(
+                jobs=[tasks.Job(), tasks.Job(), tasks.Job(),], next_page_token="abc",
+            ),
+            service.ListJobsResponse(jobs=[], next_page_token="def",),
+            service.ListJobsResponse(jobs=[tasks.Job(),], next_page_token="ghi",),
+            service.ListJobsResponse(jobs=[tasks.Job(), tasks.Job(),],),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (await client.list_jobs(request={}, lookahead=2)).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [service.GetJobRequest, dict,])
 def test_get_job(request_type, transport: str = "grpc"):
     client = DataplexServiceClient(
@@ -7151,6 +7614,234 @@ async def test_cancel_job_flattened_error_async():
         )
 
 
+def test_get_lake_cache():
+    cache = caching.ResponseCache()
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.get_lake), "__call__") as call:
+        call.return_value = resources.Lake(name="name_value", display_name="a")
+        first = client.get_lake(name="name_value")
+        first.display_name = "modified"
+        second = client.get_lake(name="name_value")
+
+        # Only the first lookup went out on the wire.
+        assert len(call.mock_calls) == 1
+
+    assert second.display_name == "a"
+    assert cache.hits == 1
+
+
+def test_delete_zone_evicts_cache():
+    cache = caching.ResponseCache()
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+    zone = "projects/p/locations/l/lakes/k/zones/z"
+
+    with mock.patch.object(type(client.transport.get_zone), "__call__") as call:
+        call.side_effect = [
+            resources.Zone(name=zone),
+            resources.Asset(name=zone + "/assets/a"),
+            resources.Lake(name="projects/p/locations/l/lakes/k"),
+            operations_pb2.Operation(name="operations/op", done=True),
+        ]
+        client.get_zone(name=zone)
+        client.get_asset(name=zone + "/assets/a")
+        client.get_lake(name="projects/p/locations/l/lakes/k")
+        assert len(cache) == 3
+
+        client.delete_zone(name=zone)
+
+    # The zone and its assets are gone; the parent lake is untouched.
+    assert len(cache) == 1
+
+
+def test_update_asset_evicts_cache():
+    cache = caching.ResponseCache()
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+
+    with mock.patch.object(type(client.transport.get_asset), "__call__") as call:
+        call.side_effect = [
+            resources.Asset(name="a"),
+            operations_pb2.Operation(name="operations/op", done=True),
+            resources.Asset(name="a"),
+        ]
+        client.get_asset(name="a")
+        client.update_asset(asset=resources.Asset(name="a"))
+        client.get_asset(name="a")
+
+        assert len(call.mock_calls) == 3
+
+
+def test_update_asset_evicts_cache_on_completion():
+    cache = caching.ResponseCache()
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+    done = operations_pb2.Operation(name="operations/op", done=True)
+    done.response.Pack(resources.Asset.pb(resources.Asset(name="a")))
+
+    with mock.patch.object(
+        client.transport.operations_client,
+        "get_operation",
+        side_effect=[operations_pb2.Operation(name="operations/op"), done],
+    ) as get_operation, mock.patch.object(
+        type(client.transport.get_asset), "__call__"
+    ) as call:
+        call.side_effect = [
+            operations_pb2.Operation(name="operations/op"),
+            resources.Asset(name="a", state=resources.State.ACTION_REQUIRED),
+            resources.Asset(name="a", state=resources.State.ACTIVE),
+        ]
+        lro = client.update_asset(asset=resources.Asset(name="a"))
+
+        # A lookup while the operation runs caches the old state.
+        assert client.get_asset(name="a").state == resources.State.ACTION_REQUIRED
+        assert not lro.done()
+        assert len(cache) == 1
+        # Nothing polls the operation behind the caller's back.
+        time.sleep(0.05)
+        assert get_operation.call_count == 1
+
+        assert lro.result(timeout=5).name == "a"
+        assert len(cache) == 0
+
+        # The next lookup goes out on the wire again.
+        assert client.get_asset(name="a").state == resources.State.ACTIVE
+        assert len(call.mock_calls) == 3
+        assert get_operation.call_count == 2
+
+
+def test_cancel_job_evicts_cache():
+    cache = caching.ResponseCache(ttls={"get_job": 30})
+    client = DataplexServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+
+    with mock.patch.object(type(client.transport.get_job), "__call__") as call:
+        call.side_effect = [tasks.Job(name="j"), None]
+        client.get_job(name="j")
+        assert len(cache) == 1
+        client.cancel_job(name="j")
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_lake_async_single_flight():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), single_flight=True,
+    )
+
+    with mock.patch.object(type(client.transport.get_lake), "__call__") as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            resources.Lake(name="lake_value")
+        )
+        responses = await asyncio.gather(
+            client.get_lake(name="lake_value"),
+            client.get_lake(name="lake_value"),
+            client.get_lake(name="other_value"),
+        )
+
+        # Identical requests share one call; the distinct one is sent alone.
+        assert call.call_count == 2
+        assert [r.name for r in responses] == ["lake_value"] * 3
+        assert responses[0] is not responses[1]
+        assert not len(client._single_flight)
+
+        # Later calls are sent again.
+        await client.get_lake(name="lake_value")
+        assert call.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_list_zones_async_single_flight():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), single_flight=True,
+    )
+
+    with mock.patch.object(type(client.transport.list_zones), "__call__") as call:
+        call.side_effect = (
+            grpc_helpers_async.FakeUnaryUnaryCall(
+                service.ListZonesResponse(
+                    zones=[resources.Zone()], next_page_token="abc"
+                )
+            ),
+            grpc_helpers_async.FakeUnaryUnaryCall(
+                service.ListZonesResponse(zones=[resources.Zone()])
+            ),
+            grpc_helpers_async.FakeUnaryUnaryCall(
+                service.ListZonesResponse(zones=[resources.Zone()])
+            ),
+        )
+        first, second = await asyncio.gather(
+            client.list_zones(parent="parent_value"),
+            client.list_zones(parent="parent_value"),
+        )
+        assert call.call_count == 1
+
+        # Each pager walks the remaining pages on its own.
+        assert len([z async for z in first]) == 2
+        assert len([z async for z in second]) == 2
+        assert call.call_count == 3
+
+
+def test_get_lake_raw():
+    client = DataplexServiceClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.get_lake), "__call__") as call:
+        call.return_value = resources.Lake(name="name_value")
+        response = client.get_lake(name="name_value", raw=True)
+
+    assert isinstance(response, resources.Lake.pb())
+    assert response.name == "name_value"
+
+
+def test_list_jobs_raw():
+    client = DataplexServiceClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(type(client.transport.list_jobs), "__call__") as call:
+        call.side_effect = (
+            service.ListJobsResponse(
+                jobs=[tasks.Job(name="a"), tasks.Job(name="b")], next_page_token="abc",
+            ),
+            service.ListJobsResponse(jobs=[tasks.Job(name="c")]),
+            RuntimeError,
+        )
+        results = list(client.list_jobs(request={}, raw=True))
+
+    assert [r.name for r in results] == ["a", "b", "c"]
+    assert all(isinstance(r, tasks.Job.pb()) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_list_lakes_async_raw():
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    with mock.patch.object(
+        type(client.transport.list_lakes), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = (
+            service.ListLakesResponse(
+                lakes=[resources.Lake(name="a")], next_page_token="abc",
+            ),
+            service.ListLakesResponse(lakes=[resources.Lake(name="b")]),
+            RuntimeError,
+        )
+        pager = await client.list_lakes(request={}, lookahead=1, raw=True)
+        responses = [response async for response in pager]
+
+    assert [r.name for r in responses] == ["a", "b"]
+    assert all(isinstance(r, resources.Lake.pb()) for r in responses)
+
+
 def test_credentials_transport_error():
     # It is an error to provide credentials and a transport instance.
     transport = transports.DataplexServiceGrpcTransport(
@@ -7448,6 +8139,99 @@ def test_dataplex_service_grpc_transport_client_cert_source_for_mtls(transport_c
             )
 
 
+@pytest.mark.parametrize(
+    "transport_class,grpc_helpers",
+    [
+        (transports.DataplexServiceGrpcPoolTransport, grpc_helpers),
+        (transports.DataplexServiceGrpcAsyncIOPoolTransport, grpc_helpers_async),
+    ],
+)
+def test_dataplex_service_pool_transport_create_channel(transport_class, grpc_helpers):
+    # Every pooled channel gets its own connection.
+    with mock.patch.object(
+        google.auth, "default", autospec=True
+    ) as adc, mock.patch.object(
+        grpc_helpers, "create_channel", autospec=True
+    ) as create_channel:
+        creds = ga_credentials.AnonymousCredentials()
+        adc.return_value = (creds, None)
+        transport = transport_class(quota_project_id="octopus", pool_size=3)
+
+        assert create_channel.call_count == 3
+        create_channel.assert_called_with(
+            "dataplex.googleapis.com:443",
+            credentials=creds,
+            credentials_file=None,
+            quota_project_id="octopus",
+            default_scopes=("https://www.googleapis.com/auth/cloud-platform",),
+            scopes=None,
+            default_host="dataplex.googleapis.com",
+            ssl_credentials=None,
+            options=[
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+                ("grpc.use_local_subchannel_pool", 1),
+            ],
+        )
+        assert len(transport.channels) == 3
+
+    with pytest.raises(ValueError):
+        transport_class(credentials=creds, pool_size=0)
+
+
+def test_dataplex_service_grpc_pool_transport_channels():
+    channels = [mock.Mock(), mock.Mock()]
+    for channel in channels:
+        channel.unary_unary.return_value.return_value = resources.Lake(
+            name="name_value"
+        )
+    transport = transports.DataplexServiceGrpcPoolTransport(
+        channels=channels, strategy="round_robin",
+    )
+    client = DataplexServiceClient(transport=transport)
+
+    # Calls alternate between the pooled channels.
+    client.get_lake(name="name_value")
+    client.get_lake(name="name_value")
+
+    for channel in channels:
+        assert channel.unary_unary.return_value.call_count == 1
+    assert transport.channels == channels
+    assert transport.grpc_channel.outstanding == [0, 0]
+    assert (
+        DataplexServiceClient.get_transport_class("grpc_pool")
+        is transports.DataplexServiceGrpcPoolTransport
+    )
+
+
+@pytest.mark.asyncio
+async def test_dataplex_service_grpc_asyncio_pool_transport_channels():
+    def call(request, **kwargs):
+        # A completed call, as the channel would return once it is done.
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(resources.Lake(name="name_value"))
+        return future
+
+    channels = [mock.Mock(), mock.Mock()]
+    for channel in channels:
+        channel.unary_unary.return_value.side_effect = call
+    transport = transports.DataplexServiceGrpcAsyncIOPoolTransport(channels=channels)
+    client = DataplexServiceAsyncClient(transport=transport)
+
+    await asyncio.gather(
+        client.get_lake(name="name_value"), client.get_lake(name="name_value"),
+    )
+
+    await asyncio.sleep(0)
+    assert transport.grpc_channel.outstanding == [0, 0]
+    for channel in channels:
+        assert channel.unary_unary.return_value.call_count == 1
+    assert (
+        DataplexServiceClient.get_transport_class("grpc_asyncio_pool")
+        is transports.DataplexServiceGrpcAsyncIOPoolTransport
+    )
+
+
 def test_dataplex_service_host_no_port():
     client = DataplexServiceClient(
         credentials=ga_credentials.AnonymousCredentials(),
@@ -7872,6 +8656,26 @@ def test_parse_common_location_path():
     assert expected == actual
 
 
+def test_parse_many():
+    paths = [
+        DataplexServiceClient.zone_path("squid", "clam", "whelk", "octopus"),
+        DataplexServiceClient.common_location_path("squid", "clam"),
+        DataplexServiceClient.zone_path("oyster", "nudibranch", "cuttlefish", "mussel"),
+    ]
+
+    # Names that do not match leave a gap in every column.
+    assert DataplexServiceClient.parse_many("zone", paths) == {
+        "project": ["squid", None, "oyster"],
+        "location": ["clam", None, "nudibranch"],
+        "lake": ["whelk", None, "cuttlefish"],
+        "zone": ["octopus", None, "mussel"],
+    }
+    assert DataplexServiceAsyncClient.parse_many("common_location", paths[1:2]) == {
+        "project": ["squid"],
+        "location": ["clam"],
+    }
+
+
 def test_client_with_default_client_info():
     client_info = gapic_v1.client_info.ClientInfo()
 
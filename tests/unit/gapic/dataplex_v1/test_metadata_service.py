@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import os
 import mock
 
@@ -31,6 +32,7 @@ from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.dataplex_v1 import caching
 from google.cloud.dataplex_v1.services.metadata_service import (
     MetadataServiceAsyncClient,
 )
@@ -1114,6 +1116,33 @@ def test_list_entities_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_entities_pages_prefetch(transport_name: str = "grpc"):
+    client = MetadataServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_entities), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(), metadata_.Entity(), metadata_.Entity(),],
+                next_page_token="abc",
+            ),
+            metadata_.ListEntitiesResponse(entities=[], next_page_token="def",),
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(),], next_page_token="ghi",
+            ),
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(), metadata_.Entity(),],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_entities(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_entities_async_pager():
     client = MetadataServiceAsyncClient(
@@ -1181,6 +1210,38 @@ async def test_list_entities_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_entities_async_pages_lookahead():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_entities), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(), metadata_.Entity(), metadata_.Entity(),],
+                next_page_token="abc",
+            ),
+            metadata_.ListEntitiesResponse(entities=[], next_page_token="def",),
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(),], next_page_token="ghi",
+            ),
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(), metadata_.Entity(),],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (await client.list_entities(request={}, lookahead=2)).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [metadata_.GetPartitionRequest, dict,])
 def test_get_partition(request_type, transport: str = "grpc"):
     client = MetadataServiceClient(
@@ -1668,6 +1729,37 @@ def test_list_partitions_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_partitions_pages_prefetch(transport_name: str = "grpc"):
+    client = MetadataServiceClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_partitions), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            metadata_.ListPartitionsResponse(
+                partitions=[
+                    metadata_.Partition(),
+                    metadata_.Partition(),
+                    metadata_.Partition(),
+                ],
+                next_page_token="abc",
+            ),
+            metadata_.ListPartitionsResponse(partitions=[], next_page_token="def",),
+            metadata_.ListPartitionsResponse(
+                partitions=[metadata_.Partition(),], next_page_token="ghi",
+            ),
+            metadata_.ListPartitionsResponse(
+                partitions=[metadata_.Partition(), metadata_.Partition(),],
+            ),
+            RuntimeError,
+        )
+        pages = list(client.list_partitions(request={}, prefetch=2).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.asyncio
 async def test_list_partitions_async_pager():
     client = MetadataServiceAsyncClient(
@@ -1743,6 +1835,309 @@ async def test_list_partitions_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_partitions_async_pages_lookahead():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_partitions), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            metadata_.ListPartitionsResponse(
+                partitions=[
+                    metadata_.Partition(),
+                    metadata_.Partition(),
+                    metadata_.Partition(),
+                ],
+                next_page_token="abc",
+            ),
+            metadata_.ListPartitionsResponse(partitions=[], next_page_token="def",),
+            metadata_.ListPartitionsResponse(
+                partitions=[metadata_.Partition(),], next_page_token="ghi",
+            ),
+            metadata_.ListPartitionsResponse(
+                partitions=[metadata_.Partition(), metadata_.Partition(),],
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page_ in (
+            await client.list_partitions(request={}, lookahead=2)
+        ).pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+def test_get_entity_cache():
+    cache = caching.ResponseCache()
+    client = MetadataServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.side_effect = [
+            metadata_.Entity(name="name_value"),
+            metadata_.Entity(name="name_value", schema=metadata_.Schema()),
+        ]
+        client.get_entity(name="name_value")
+        client.get_entity(name="name_value")
+        # A different view is a different request, and is cached separately.
+        client.get_entity(
+            request=metadata_.GetEntityRequest(
+                name="name_value", view=metadata_.GetEntityRequest.EntityView.SCHEMA
+            )
+        )
+        client.get_entity(
+            request=metadata_.GetEntityRequest(
+                name="name_value", view=metadata_.GetEntityRequest.EntityView.SCHEMA
+            )
+        )
+
+        assert len(call.mock_calls) == 2
+
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def _scan_call(request, **kwargs):
+    # Both stubs share a type, so a single mock serves both RPCs.
+    if isinstance(request, metadata_.ListEntitiesRequest):
+        assert request.parent == "zone"
+        if request.view == metadata_.ListEntitiesRequest.EntityView.TABLES:
+            return metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(name="t1"), metadata_.Entity(name="t2"),],
+            )
+        return metadata_.ListEntitiesResponse(entities=[metadata_.Entity(name="f1"),],)
+    if request.parent == "t2":
+        raise core_exceptions.NotFound("gone")
+    if not request.page_token:
+        return metadata_.ListPartitionsResponse(
+            partitions=[metadata_.Partition(name=request.parent + "/p1"),],
+            next_page_token="abc",
+        )
+    return metadata_.ListPartitionsResponse(
+        partitions=[metadata_.Partition(name=request.parent + "/p2"),],
+    )
+
+
+def test_scan_partitions():
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.list_entities), "__call__") as call:
+        call.side_effect = _scan_call
+        errors = []
+        results = list(
+            client.scan_partitions(
+                "zone", max_workers=2, on_error=lambda e, exc: errors.append(e.name)
+            )
+        )
+        views = [
+            c.args[0].view
+            for c in call.call_args_list
+            if isinstance(c.args[0], metadata_.ListEntitiesRequest)
+        ]
+
+    assert sorted((e.name, p.name) for e, p in results) == [
+        ("f1", "f1/p1"),
+        ("f1", "f1/p2"),
+        ("t1", "t1/p1"),
+        ("t1", "t1/p2"),
+    ]
+    assert errors == ["t2"]
+    assert views == [
+        metadata_.ListEntitiesRequest.EntityView.TABLES,
+        metadata_.ListEntitiesRequest.EntityView.FILESETS,
+    ]
+
+
+def test_scan_partitions_raises_after_scan():
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.list_entities), "__call__") as call:
+        call.side_effect = _scan_call
+        results = []
+        with pytest.raises(core_exceptions.NotFound):
+            for pair in client.scan_partitions("zone"):
+                results.append(pair)
+
+    # The failing entity does not stop the others from being scanned.
+    assert len(results) == 4
+
+
+@pytest.mark.asyncio
+async def test_scan_partitions_async():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+
+    async def scan_call_async(request, **kwargs):
+        return _scan_call(request)
+
+    with mock.patch.object(
+        type(client.transport.list_entities), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = scan_call_async
+        errors = []
+        results = [
+            (e.name, p.name)
+            async for e, p in client.scan_partitions(
+                "zone",
+                max_concurrency=2,
+                on_error=lambda e, exc: errors.append(e.name),
+            )
+        ]
+
+    assert sorted(results) == [
+        ("f1", "f1/p1"),
+        ("f1", "f1/p2"),
+        ("t1", "t1/p1"),
+        ("t1", "t1/p2"),
+    ]
+    assert errors == ["t2"]
+
+
+@pytest.mark.asyncio
+async def test_get_entity_async_single_flight():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), single_flight=True,
+    )
+
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            metadata_.Entity(name="name_value")
+        )
+        basic = metadata_.GetEntityRequest(
+            name="name_value", view=metadata_.GetEntityRequest.EntityView.BASIC
+        )
+        responses = await asyncio.gather(
+            client.get_entity(request=basic),
+            client.get_entity(request=basic),
+            client.get_entity(name="name_value"),
+            client.get_entity(request=basic, metadata=(("x", "y"),)),
+        )
+
+        # Only requests with the same view and metadata are shared.
+        assert call.call_count == 3
+        assert all(r.name == "name_value" for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_get_entity_async_single_flight_error():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), single_flight=True,
+    )
+
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.side_effect = core_exceptions.NotFound("missing")
+        results = await asyncio.gather(
+            client.get_entity(name="name_value", retry=None),
+            client.get_entity(name="name_value", retry=None),
+            return_exceptions=True,
+        )
+
+        assert call.call_count == 1
+        assert all(isinstance(r, core_exceptions.NotFound) for r in results)
+
+
+def test_get_entity_raw():
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.return_value = metadata_.Entity(name="name_value", etag="etag_value")
+        response = client.get_entity(name="name_value", raw=True)
+
+    assert isinstance(response, metadata_.Entity.pb())
+    assert response.name == "name_value"
+    assert response.etag == "etag_value"
+
+
+def test_get_entity_raw_cached():
+    cache = caching.ResponseCache()
+    client = MetadataServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.return_value = metadata_.Entity(name="name_value")
+        first = client.get_entity(name="name_value", raw=True)
+        first.name = "changed"
+        second = client.get_entity(name="name_value", raw=True)
+        wrapped = client.get_entity(name="name_value")
+
+    # Raw responses are not shared with the cache.
+    assert call.call_count == 1
+    assert isinstance(second, metadata_.Entity.pb())
+    assert second.name == "name_value"
+    assert isinstance(wrapped, metadata_.Entity)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_list_partitions_raw(prefetch):
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(type(client.transport.list_partitions), "__call__") as call:
+        call.side_effect = (
+            metadata_.ListPartitionsResponse(
+                partitions=[metadata_.Partition(name="a"), metadata_.Partition()],
+                next_page_token="abc",
+            ),
+            metadata_.ListPartitionsResponse(
+                partitions=[metadata_.Partition(name="c")]
+            ),
+            RuntimeError,
+        )
+        results = list(client.list_partitions(request={}, prefetch=prefetch, raw=True))
+
+    assert [r.name for r in results] == ["a", "", "c"]
+    assert all(isinstance(r, metadata_.Partition.pb()) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_get_partition_async_raw():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+
+    with mock.patch.object(type(client.transport.get_partition), "__call__") as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            metadata_.Partition(name="name_value")
+        )
+        response = await client.get_partition(name="name_value", raw=True)
+
+    assert isinstance(response, metadata_.Partition.pb())
+    assert response.name == "name_value"
+
+
+@pytest.mark.asyncio
+async def test_list_entities_async_raw():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    with mock.patch.object(
+        type(client.transport.list_entities), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = (
+            metadata_.ListEntitiesResponse(
+                entities=[metadata_.Entity(id="a"), metadata_.Entity(id="b")],
+                next_page_token="abc",
+            ),
+            metadata_.ListEntitiesResponse(entities=[metadata_.Entity(id="c")]),
+            RuntimeError,
+        )
+        pager = await client.list_entities(request={}, raw=True)
+        responses = [response async for response in pager]
+
+    assert [r.id for r in responses] == ["a", "b", "c"]
+    assert all(isinstance(r, metadata_.Entity.pb()) for r in responses)
+
+
 def test_credentials_transport_error():
     # It is an error to provide credentials and a transport instance.
     transport = transports.MetadataServiceGrpcTransport(
@@ -2013,6 +2408,99 @@ def test_metadata_service_grpc_transport_client_cert_source_for_mtls(transport_c
             )
 
 
+@pytest.mark.parametrize(
+    "transport_class,grpc_helpers",
+    [
+        (transports.MetadataServiceGrpcPoolTransport, grpc_helpers),
+        (transports.MetadataServiceGrpcAsyncIOPoolTransport, grpc_helpers_async),
+    ],
+)
+def test_metadata_service_pool_transport_create_channel(transport_class, grpc_helpers):
+    # Every pooled channel gets its own connection.
+    with mock.patch.object(
+        google.auth, "default", autospec=True
+    ) as adc, mock.patch.object(
+        grpc_helpers, "create_channel", autospec=True
+    ) as create_channel:
+        creds = ga_credentials.AnonymousCredentials()
+        adc.return_value = (creds, None)
+        transport = transport_class(quota_project_id="octopus", pool_size=3)
+
+        assert create_channel.call_count == 3
+        create_channel.assert_called_with(
+            "dataplex.googleapis.com:443",
+            credentials=creds,
+            credentials_file=None,
+            quota_project_id="octopus",
+            default_scopes=("https://www.googleapis.com/auth/cloud-platform",),
+            scopes=None,
+            default_host="dataplex.googleapis.com",
+            ssl_credentials=None,
+            options=[
+                ("grpc.max_send_message_length", -1),
+                ("grpc.max_receive_message_length", -1),
+                ("grpc.use_local_subchannel_pool", 1),
+            ],
+        )
+        assert len(transport.channels) == 3
+
+    with pytest.raises(ValueError):
+        transport_class(credentials=creds, pool_size=0)
+
+
+def test_metadata_service_grpc_pool_transport_channels():
+    channels = [mock.Mock(), mock.Mock()]
+    for channel in channels:
+        channel.unary_unary.return_value.return_value = metadata_.Entity(
+            name="name_value"
+        )
+    transport = transports.MetadataServiceGrpcPoolTransport(
+        channels=channels, strategy="round_robin",
+    )
+    client = MetadataServiceClient(transport=transport)
+
+    # Calls alternate between the pooled channels.
+    client.get_entity(name="name_value")
+    client.get_entity(name="name_value")
+
+    for channel in channels:
+        assert channel.unary_unary.return_value.call_count == 1
+    assert transport.channels == channels
+    assert transport.grpc_channel.outstanding == [0, 0]
+    assert (
+        MetadataServiceClient.get_transport_class("grpc_pool")
+        is transports.MetadataServiceGrpcPoolTransport
+    )
+
+
+@pytest.mark.asyncio
+async def test_metadata_service_grpc_asyncio_pool_transport_channels():
+    def call(request, **kwargs):
+        # A completed call, as the channel would return once it is done.
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(metadata_.Entity(name="name_value"))
+        return future
+
+    channels = [mock.Mock(), mock.Mock()]
+    for channel in channels:
+        channel.unary_unary.return_value.side_effect = call
+    transport = transports.MetadataServiceGrpcAsyncIOPoolTransport(channels=channels)
+    client = MetadataServiceAsyncClient(transport=transport)
+
+    await asyncio.gather(
+        client.get_entity(name="name_value"), client.get_entity(name="name_value"),
+    )
+
+    await asyncio.sleep(0)
+    assert transport.grpc_channel.outstanding == [0, 0]
+    for channel in channels:
+        assert channel.unary_unary.return_value.call_count == 1
+    assert (
+        MetadataServiceClient.get_transport_class("grpc_asyncio_pool")
+        is transports.MetadataServiceGrpcAsyncIOPoolTransport
+    )
+
+
 def test_metadata_service_host_no_port():
     client = MetadataServiceClient(
         credentials=ga_credentials.AnonymousCredentials(),
@@ -2344,6 +2832,26 @@ def test_parse_common_location_path():
     assert expected == actual
 
 
+def test_parse_many():
+    paths = [
+        MetadataServiceClient.zone_path("squid", "clam", "whelk", "octopus"),
+        MetadataServiceClient.common_location_path("squid", "clam"),
+        MetadataServiceClient.zone_path("oyster", "nudibranch", "cuttlefish", "mussel"),
+    ]
+
+    # Names that do not match leave a gap in every column.
+    assert MetadataServiceClient.parse_many("zone", paths) == {
+        "project": ["squid", None, "oyster"],
+        "location": ["clam", None, "nudibranch"],
+        "lake": ["whelk", None, "cuttlefish"],
+        "zone": ["octopus", None, "mussel"],
+    }
+    assert MetadataServiceAsyncClient.parse_many("common_location", paths[1:2]) == {
+        "project": ["squid"],
+        "location": ["clam"],
+    }
+
+
 def test_client_with_default_client_info():
     client_info = gapic_v1.client_info.ClientInfo()
 
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import batching
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+
+ZONE = "projects/p/locations/l/lakes/k/zones/z"
+
+
+def _client():
+    return MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def _fake_get(request, **kwargs):
+    # Both stubs share one type, so a single mock serves both RPCs.
+    if request.name.endswith("missing"):
+        raise core_exceptions.NotFound(request.name)
+    if isinstance(request, metadata_.GetEntityRequest):
+        return metadata_.Entity(name=request.name, etag=str(int(request.view)))
+    return metadata_.Partition(name=request.name)
+
+
+def test_get_entities_in_input_order():
+    client = _client()
+    names = [ZONE + "/entities/b", ZONE + "/entities/a", ZONE + "/entities/b"]
+    with mock.patch.object(
+        type(client.transport.get_entity), "__call__", side_effect=_fake_get
+    ) as call, batching.MetadataBatcher(client, max_workers=2) as batcher:
+        entities = batcher.get_entities(names, view=batching.EntityView.SCHEMA)
+
+    assert [e.name for e in entities] == names
+    assert all(e.etag == "2" for e in entities)
+    # The repeated name shares one RPC, unless the first already finished.
+    assert batcher.rpcs + batcher.coalesced == 3
+    assert call.call_count == batcher.rpcs
+    entities[0].etag = "changed"
+    assert entities[2].etag == "2"
+
+
+def test_get_partitions_return_exceptions():
+    client = _client()
+    names = [ZONE + "/entities/e/partitions/missing", ZONE + "/entities/e/partitions/p"]
+    with mock.patch.object(
+        type(client.transport.get_partition), "__call__", side_effect=_fake_get
+    ), batching.MetadataBatcher(client) as batcher:
+        missing, partition = batcher.get_partitions(names, return_exceptions=True)
+        assert isinstance(missing, core_exceptions.NotFound)
+        assert partition.name == names[1]
+
+        with pytest.raises(core_exceptions.NotFound):
+            batcher.get_partitions(names)
+
+
+def test_concurrent_callers_share_one_rpc():
+    client = _client()
+    name = ZONE + "/entities/e"
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_get(request, **kwargs):
+        started.set()
+        assert release.wait(timeout=5)
+        return metadata_.Entity(name=request.name)
+
+    with mock.patch.object(
+        type(client.transport.get_entity), "__call__", side_effect=slow_get
+    ) as call, batching.MetadataBatcher(client) as batcher:
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(batcher.get_entity(name))
+        )
+        leader.start()
+        assert started.wait(timeout=5)
+        followers = batcher._executor.submit(batcher.get_entities, [name, name])
+        while batcher.coalesced < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        leader.join(timeout=5)
+
+        assert [e.name for e in followers.result(timeout=5)] == [name, name]
+        assert results[0].name == name
+        assert call.call_count == 1
+
+        # Once the RPC has completed, a new lookup goes to the server again.
+        batcher.get_entity(name)
+        assert call.call_count == 2
+
+
+def test_get_single_lookups():
+    client = _client()
+    with mock.patch.object(
+        type(client.transport.get_entity), "__call__", side_effect=_fake_get
+    ), batching.MetadataBatcher(client) as batcher:
+        assert batcher.get_partition(ZONE + "/entities/e/partitions/p").name.endswith(
+            "/p"
+        )
+        with pytest.raises(core_exceptions.NotFound):
+            batcher.get_entity(ZONE + "/entities/missing")
+        assert not batcher._in_flight
+
+
+def test_closed_batcher_fails_lookups():
+    batcher = batching.MetadataBatcher(_client())
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.get_entities([ZONE + "/entities/e"])
+    assert not batcher._in_flight
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError):
+        batching.MetadataBatcher(_client(), max_workers=0)
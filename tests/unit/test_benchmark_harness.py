@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import mock
+import pytest
+
+from tests.benchmark import harness
+
+
+@pytest.fixture
+def registry():
+    with mock.patch.dict(harness.REGISTRY, clear=True):
+        yield harness.REGISTRY
+
+
+def test_measure():
+    stats = harness.measure(lambda: 3, min_time=0.001, rounds=3)
+    assert stats["rounds"] == 3
+    assert stats["number"] >= 1
+    assert stats["min"] <= stats["mean"] <= stats["max"]
+    assert stats["ops_per_sec"] == pytest.approx(1 / stats["mean"])
+    assert stats["items_per_sec"] == pytest.approx(3 * stats["ops_per_sec"])
+
+
+def test_measure_async():
+    async def operation():
+        pass
+
+    stats = harness.measure(operation, min_time=0.001, rounds=2)
+    assert stats["rounds"] == 2
+    assert "items_per_sec" not in stats
+
+
+def test_benchmark_duplicate(registry):
+    harness.benchmark("group")(lambda: None)
+    with pytest.raises(ValueError):
+        harness.benchmark("group", name="<lambda>")(lambda: None)
+
+
+def test_run(registry):
+    events = []
+
+    @harness.benchmark("first")
+    def plain():
+        return lambda: None
+
+    @harness.benchmark("second")
+    def generator():
+        events.append("setup")
+        yield lambda: None
+        events.append("teardown")
+
+    lines = []
+    results = harness.run(min_time=0.001, rounds=2, log=lines.append)
+    assert set(results["results"]) == {"plain", "generator"}
+    assert results["results"]["generator"]["group"] == "second"
+    assert results["meta"]["rounds"] == 2
+    assert events == ["setup", "teardown"]
+    assert len(lines) == 2
+
+    results = harness.run(["second"], min_time=0.001, rounds=2)
+    assert list(results["results"]) == ["generator"]
+
+
+def test_compare(tmpdir):
+    path = os.path.join(str(tmpdir), "baseline.json")
+    harness.save({"results": {"a": {"mean": 1.0}, "b": {"mean": 2.0}}}, path)
+    current = {"results": {"a": {"mean": 1.5}, "b": {"mean": 2.0}, "c": {"mean": 1}}}
+
+    changes = harness.compare(harness.load(path), current)
+    assert [change.name for change in changes] == ["a", "b"]
+    assert changes[0].ratio == 1.5
+    assert harness.regressions(changes, 0.1) == [changes[0]]
+    assert harness.regressions(changes, 0.5) == []
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.dataplex_v1 import caching
+from google.cloud.dataplex_v1.types import metadata_
+
+ENTITY = "projects/p/locations/l/lakes/k/zones/z/entities/e"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(name=ENTITY, view=None):
+    request = metadata_.GetEntityRequest(name=name)
+    if view is not None:
+        request.view = view
+    return request
+
+
+def test_get_returns_copy_of_put():
+    cache = caching.ResponseCache()
+    cache.put("get_entity", _request(), metadata_.Entity(name=ENTITY, etag="1"))
+
+    cached = cache.get("get_entity", _request())
+    cached.etag = "changed"
+
+    assert cache.get("get_entity", _request()).etag == "1"
+    assert cache.hits == 2
+    assert cache.misses == 0
+
+
+def test_get_miss():
+    cache = caching.ResponseCache()
+
+    assert cache.get("get_entity", _request()) is None
+    assert cache.misses == 1
+
+
+def test_entries_expire_per_method_ttl():
+    clock = FakeClock()
+    cache = caching.ResponseCache(
+        ttls={"get_entity": 10, "get_partition": 100}, clock=clock
+    )
+    cache.put("get_entity", _request(), metadata_.Entity(name=ENTITY))
+    partition = metadata_.GetPartitionRequest(name=ENTITY + "/partitions/p")
+    cache.put("get_partition", partition, metadata_.Partition())
+
+    clock.now = 10
+    assert cache.get("get_entity", _request()) is None
+    assert cache.get("get_partition", partition) is not None
+    assert len(cache) == 1
+
+
+def test_uncached_methods_are_ignored():
+    cache = caching.ResponseCache(ttls={"get_entity": 0})
+    cache.put("get_entity", _request(), metadata_.Entity())
+    cache.put("get_task", _request(), metadata_.Entity())
+
+    assert len(cache) == 0
+    assert not cache.caches("get_task")
+    assert cache.get("get_entity", _request()) is None
+    assert cache.misses == 0
+
+
+def test_lru_eviction():
+    cache = caching.ResponseCache(max_size=2)
+    for name in ("a", "b"):
+        cache.put("get_entity", _request(name), metadata_.Entity(name=name))
+    # Touch "a" so that "b" is the least recently used.
+    cache.get("get_entity", _request("a"))
+    cache.put("get_entity", _request("c"), metadata_.Entity(name="c"))
+
+    assert cache.get("get_entity", _request("a")) is not None
+    assert cache.get("get_entity", _request("b")) is None
+    assert cache.get("get_entity", _request("c")) is not None
+
+
+def test_views_are_cached_separately():
+    cache = caching.ResponseCache()
+    schema = _request(view=metadata_.GetEntityRequest.EntityView.SCHEMA)
+    cache.put("get_entity", schema, metadata_.Entity(name=ENTITY, etag="s"))
+
+    assert cache.get("get_entity", _request()) is None
+    assert cache.get("get_entity", schema).etag == "s"
+
+
+def test_invalidate_children():
+    cache = caching.ResponseCache()
+    zone = ENTITY.rsplit("/entities/", 1)[0]
+    cache.put("get_zone", _request(zone), metadata_.Entity())
+    cache.put("get_entity", _request(), metadata_.Entity())
+    cache.put("get_zone", _request(zone + "2"), metadata_.Entity())
+
+    assert cache.invalidate(zone, children=False) == 1
+    assert len(cache) == 2
+    cache.put("get_zone", _request(zone), metadata_.Entity())
+    assert cache.invalidate(zone) == 2
+    # A sibling sharing the prefix as a string is not a child.
+    assert len(cache) == 1
+
+
+def test_revalidate():
+    clock = FakeClock()
+    cache = caching.ResponseCache(ttls={"get_entity": 10}, clock=clock)
+    cache.put("get_entity", _request(), metadata_.Entity(name=ENTITY, etag="1"))
+
+    clock.now = 8
+    assert cache.revalidate("get_entity", metadata_.Entity(name=ENTITY, etag="1")) == 1
+    clock.now = 15
+    assert cache.get("get_entity", _request()) is not None
+
+    assert cache.revalidate("get_entity", metadata_.Entity(name=ENTITY, etag="2")) == 0
+    assert cache.get("get_entity", _request()) is None
+    assert cache.revalidate("get_task", metadata_.Entity(name=ENTITY)) == 0
+
+
+def test_revalidate_many():
+    cache = caching.ResponseCache(ttls={"get_entity": 10}, clock=FakeClock())
+    for name in ("a", "b", "c"):
+        cache.put("get_entity", _request(name), metadata_.Entity(name=name, etag="1"))
+
+    listed = [
+        metadata_.Entity(name="a", etag="1"),
+        metadata_.Entity(name="b", etag="2"),
+    ]
+    assert cache.revalidate_many("get_entity", listed) == 1
+    assert len(cache) == 2
+    assert cache.get("get_entity", _request("b")) is None
+
+
+def test_clear():
+    cache = caching.ResponseCache()
+    cache.put("get_entity", _request(), metadata_.Entity())
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        caching.ResponseCache(max_size=0)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.api_core import grpc_helpers_async
+from google.cloud.dataplex_v1 import _channel_pool
+
+
+def _channels(count):
+    return [mock.Mock(spec=grpc.Channel) for _ in range(count)]
+
+
+def test_round_robin():
+    channels = _channels(3)
+    pool = _channel_pool.ChannelPool(channels, _channel_pool.ROUND_ROBIN)
+    stub = pool.unary_unary("/Service/Method", request_serializer=str)
+
+    for _ in range(6):
+        stub(b"request", timeout=1)
+
+    for channel in channels:
+        channel.unary_unary.assert_called_once_with(
+            "/Service/Method", request_serializer=str
+        )
+        assert channel.unary_unary.return_value.call_count == 2
+    assert pool.outstanding == [0, 0, 0]
+
+
+def test_least_outstanding_skips_busy_channels():
+    channels = _channels(3)
+    pool = _channel_pool.ChannelPool(channels)
+    stub = pool.unary_unary("/Service/Method")
+    futures = [stub.future(b"request") for _ in range(2)]
+    assert pool.outstanding == [1, 1, 0]
+
+    # Complete the first call; the next two go to the idle channels.
+    (callback,), _ = futures[0].add_done_callback.call_args
+    callback(futures[0])
+    stub.future(b"request")
+    stub.future(b"request")
+
+    assert pool.outstanding == [1, 1, 1]
+    assert [c.unary_unary.return_value.future.call_count for c in channels] == [
+        2,
+        1,
+        1,
+    ]
+
+
+def test_blocking_calls_count_while_in_flight():
+    channels = _channels(2)
+    pool = _channel_pool.ChannelPool(channels)
+    seen = []
+
+    def with_call(request):
+        seen.append(pool.outstanding)
+
+    for channel in channels:
+        channel.unary_unary.return_value.with_call.side_effect = with_call
+        channel.unary_unary.return_value.side_effect = RuntimeError("boom")
+    stub = pool.unary_unary("/Service/Method")
+
+    stub.with_call(b"request")
+    with pytest.raises(RuntimeError):
+        stub(b"request")
+
+    assert sum(seen[0]) == 1
+    assert pool.outstanding == [0, 0]
+
+
+def test_streams_are_wrapped_as_streams():
+    pool = _channel_pool.ChannelPool(_channels(1))
+
+    assert isinstance(pool.unary_unary("/S/M"), grpc.UnaryUnaryMultiCallable)
+    assert isinstance(pool.unary_stream("/S/M"), grpc.UnaryStreamMultiCallable)
+    assert isinstance(pool.stream_unary("/S/M"), grpc.StreamUnaryMultiCallable)
+    assert isinstance(pool.stream_stream("/S/M"), grpc.StreamStreamMultiCallable)
+
+
+def test_close_and_subscribe_reach_every_channel():
+    channels = _channels(2)
+    callback = mock.Mock()
+    with _channel_pool.ChannelPool(channels) as pool:
+        pool.subscribe(callback, try_to_connect=True)
+        pool.unsubscribe(callback)
+
+    for channel in channels:
+        channel.subscribe.assert_called_once_with(callback, try_to_connect=True)
+        channel.unsubscribe.assert_called_once_with(callback)
+        channel.close.assert_called_once_with()
+
+
+def test_invalid_pools():
+    with pytest.raises(ValueError):
+        _channel_pool.ChannelPool([])
+    with pytest.raises(ValueError):
+        _channel_pool.ChannelPool(_channels(1), "random")
+
+
+@pytest.mark.asyncio
+async def test_async_pool_releases_when_call_done():
+    channels = [mock.Mock(spec=aio.Channel) for _ in range(2)]
+    for channel in channels:
+        channel.close = mock.AsyncMock()
+        channel.channel_ready = mock.AsyncMock()
+    pool = _channel_pool.AsyncChannelPool(channels)
+    stub = pool.unary_unary("/Service/Method")
+
+    first = stub(b"request")
+    stub(b"request")
+    assert pool.outstanding == [1, 1]
+    (callback,), _ = first.add_done_callback.call_args
+    callback(first)
+    assert pool.outstanding == [0, 1]
+
+    assert isinstance(pool.unary_stream("/S/M"), aio.UnaryStreamMultiCallable)
+    assert isinstance(pool.stream_unary("/S/M"), aio.StreamUnaryMultiCallable)
+    assert isinstance(pool.stream_stream("/S/M"), aio.StreamStreamMultiCallable)
+    grpc_helpers_async.wrap_errors(pool.stream_stream("/S/M"))
+
+    async with pool:
+        await pool.channel_ready()
+    for channel in channels:
+        channel.channel_ready.assert_awaited_once_with()
+        channel.close.assert_awaited_once_with(None)
+    pool.get_state(try_to_connect=True)
+    channels[0].get_state.assert_called_once_with(True)
+
+
+@pytest.mark.asyncio
+async def test_async_pool_release_on_error():
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value.side_effect = RuntimeError("boom")
+    pool = _channel_pool.AsyncChannelPool([channel])
+
+    with pytest.raises(RuntimeError):
+        pool.unary_unary("/Service/Method")(b"request")
+    assert pool.outstanding == [0]
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers_async
+from google.api_core import retry as retries
+from google.api_core import retry_async
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import checkpoints
+from google.cloud.dataplex_v1.services.dataplex_service import (
+    DataplexServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import service
+
+ENTITY = "projects/p/locations/l/lakes/k/zones/z/entities/e"
+
+
+class Pages:
+    """Serves numbered pages of one item, failing chosen pages once."""
+
+    def __init__(self, response_type, items, pages=6, failures=()):
+        self.response_type = response_type
+        self.items = items
+        self.pages = pages
+        self.failures = set(failures)
+        self.tokens = []
+
+    def __call__(self, request, **kwargs):
+        self.tokens.append(request.page_token)
+        page = int(request.page_token or 0)
+        if page in self.failures:
+            self.failures.discard(page)
+            raise core_exceptions.InternalServerError("page {}".format(page))
+        return self.response_type(
+            {
+                self.items: [{"name": str(page)}],
+                "next_page_token": str(page + 1) if page + 1 < self.pages else "",
+            }
+        )
+
+
+def _client():
+    return MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def test_fingerprint():
+    request = metadata_.ListPartitionsRequest(parent=ENTITY, filter="a")
+    fingerprint = checkpoints.fingerprint(request)
+
+    assert fingerprint == checkpoints.fingerprint(
+        metadata_.ListPartitionsRequest(
+            parent=ENTITY, filter="a", page_token="x", page_size=5
+        )
+    )
+    assert fingerprint != checkpoints.fingerprint(
+        metadata_.ListPartitionsRequest(parent=ENTITY, filter="b")
+    )
+    assert fingerprint != checkpoints.fingerprint(
+        metadata_.ListEntitiesRequest(parent=ENTITY, filter="a")
+    )
+    # The request itself is left alone.
+    assert request.filter == "a"
+
+
+def test_checkpoint_file(tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    store = checkpoints.CheckpointFile(path)
+    store.save(checkpoints.Checkpoint("a", "token-a"))
+    store.save(checkpoints.Checkpoint("b", "token-b"))
+    store.discard("a")
+    store.discard("c")
+
+    reopened = checkpoints.CheckpointFile(path)
+    assert reopened.load("a") is None
+    assert reopened.load("b") == checkpoints.Checkpoint("b", "token-b")
+    with open(path) as f:
+        assert json.load(f) == {"b": "token-b"}
+    with pytest.raises(ValueError):
+        checkpoints.CheckpointFile(path, every=0)
+
+
+def test_resume_after_failure(tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    client = _client()
+    pages = Pages(metadata_.ListPartitionsResponse, "partitions", failures=[3])
+    names = []
+    with mock.patch.object(
+        type(client.transport.list_partitions), "__call__", side_effect=pages
+    ):
+        pager = client.list_partitions(
+            parent=ENTITY, checkpoint_file=checkpoints.CheckpointFile(path, every=2)
+        )
+        with pytest.raises(core_exceptions.InternalServerError):
+            names.extend(p.name for p in pager)
+        assert names == ["0", "1", "2"]
+        # Only every second page is recorded.
+        assert pager.checkpoint.page_token == "3"
+        store = checkpoints.CheckpointFile(path)
+        assert store.load(pager.checkpoint.fingerprint).page_token == "2"
+
+        pager = client.list_partitions(parent=ENTITY, checkpoint_file=store)
+        names.extend(p.name for p in pager)
+
+    assert names == ["0", "1", "2", "2", "3", "4", "5"]
+    assert pages.tokens == ["", "1", "2", "3", "2", "3", "4", "5"]
+    # The completed listing is forgotten.
+    assert checkpoints.CheckpointFile(path).load(pager.checkpoint.fingerprint) is None
+
+
+def test_resume_from_checkpoint():
+    client = _client()
+    pages = Pages(metadata_.ListPartitionsResponse, "partitions")
+    with mock.patch.object(
+        type(client.transport.list_partitions), "__call__", side_effect=pages
+    ):
+        pager = client.list_partitions(parent=ENTITY)
+        next(iter(pager.pages))
+        checkpoint = pager.checkpoint
+
+        pager = client.list_partitions(parent=ENTITY, resume_from=checkpoint)
+        assert [p.name for p in pager] == ["1", "2", "3", "4", "5"]
+        with pytest.raises(ValueError):
+            client.list_partitions(parent=ENTITY + "2", resume_from=checkpoint)
+
+
+def test_resume_from_complete_checkpoint():
+    client = _client()
+    pages = Pages(metadata_.ListPartitionsResponse, "partitions", pages=3)
+    with mock.patch.object(
+        type(client.transport.list_partitions), "__call__", side_effect=pages
+    ):
+        pager = client.list_partitions(parent=ENTITY)
+        assert [p.name for p in pager] == ["0", "1", "2"]
+        checkpoint = pager.checkpoint
+        assert checkpoint.complete
+
+        pager = client.list_partitions(parent=ENTITY, resume_from=checkpoint)
+        assert list(pager) == []
+        assert pager.checkpoint == checkpoint
+
+    # The finished listing is not requested again.
+    assert pages.tokens == ["", "1", "2"]
+
+
+def test_page_retry():
+    client = _client()
+    pages = Pages(metadata_.ListPartitionsResponse, "partitions", failures=[2, 4])
+    retry = retries.Retry(
+        initial=0.001,
+        maximum=0.001,
+        predicate=retries.if_exception_type(core_exceptions.InternalServerError),
+    )
+    with mock.patch.object(
+        type(client.transport.list_partitions), "__call__", side_effect=pages
+    ):
+        pager = client.list_partitions(parent=ENTITY, page_retry=retry)
+        assert len(list(pager)) == 6
+
+    assert pages.tokens == ["", "1", "2", "2", "3", "4", "4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_async_checkpoints(tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    pages = Pages(service.ListActionsResponse, "actions", failures=[1, 4])
+
+    def call(request, **kwargs):
+        return grpc_helpers_async.FakeUnaryUnaryCall(pages(request))
+
+    retry = retry_async.AsyncRetry(
+        initial=0.001,
+        maximum=0.001,
+        predicate=retries.if_exception_type(core_exceptions.InternalServerError),
+    )
+    with mock.patch.object(
+        type(client.transport.list_lake_actions), "__call__", side_effect=call
+    ):
+        pager = await client.list_lake_actions(
+            parent="projects/p/locations/l/lakes/k",
+            checkpoint_file=checkpoints.CheckpointFile(path, every=1),
+        )
+        with pytest.raises(core_exceptions.InternalServerError):
+            async for _ in pager:
+                pass
+        fingerprint = pager.checkpoint.fingerprint
+        assert checkpoints.CheckpointFile(path).load(fingerprint).page_token == "1"
+
+        pager = await client.list_lake_actions(
+            parent="projects/p/locations/l/lakes/k",
+            checkpoint_file=checkpoints.CheckpointFile(path, every=1),
+            page_retry=retry,
+        )
+        assert [a.name async for a in pager] == ["1", "2", "3", "4", "5"]
+
+    assert checkpoints.CheckpointFile(path).load(fingerprint) is None
+
+    with mock.patch.object(
+        type(client.transport.list_lake_actions), "__call__", side_effect=call
+    ) as rpc:
+        pager = await client.list_lake_actions(
+            parent="projects/p/locations/l/lakes/k",
+            resume_from=checkpoints.Checkpoint(fingerprint, ""),
+        )
+        assert [a async for a in pager] == []
+    rpc.assert_not_called()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import crawler
+from google.cloud.dataplex_v1.services.dataplex_service import DataplexServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import resources
+from google.cloud.dataplex_v1.types import service
+
+LOCATION = DataplexServiceClient.common_location_path("p", "l")
+
+
+def _children(parent, kind, count):
+    return ["{}/{}/{}{}".format(parent, kind, kind[0], i) for i in range(count)]
+
+
+def _fake_call(request, **kwargs):
+    # Every stub shares one type, so a single mock serves all RPCs.
+    if isinstance(request, service.ListLakesRequest):
+        assert request.parent == LOCATION
+        if not request.page_token:
+            return service.ListLakesResponse(
+                lakes=[resources.Lake(name=LOCATION + "/lakes/l0")],
+                next_page_token="more",
+            )
+        return service.ListLakesResponse(
+            lakes=[resources.Lake(name=LOCATION + "/lakes/l1")]
+        )
+    if isinstance(request, service.ListZonesRequest):
+        return service.ListZonesResponse(
+            zones=[
+                resources.Zone(name=n) for n in _children(request.parent, "zones", 2)
+            ]
+        )
+    if isinstance(request, service.ListAssetsRequest):
+        if request.parent.endswith("l1/zones/z1"):
+            raise core_exceptions.PermissionDenied("denied")
+        return service.ListAssetsResponse(
+            assets=[
+                resources.Asset(name=n) for n in _children(request.parent, "assets", 1)
+            ]
+        )
+    if isinstance(request, metadata_.ListEntitiesRequest):
+        kind = request.view.name.lower()
+        return metadata_.ListEntitiesResponse(
+            entities=[
+                metadata_.Entity(name=n) for n in _children(request.parent, kind, 1)
+            ]
+        )
+    raise AssertionError(request)
+
+
+@pytest.fixture
+def clients():
+    dataplex = DataplexServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    metadata = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    with mock.patch.object(type(dataplex.transport.list_lakes), "__call__") as call:
+        call.side_effect = _fake_call
+        yield dataplex, metadata
+
+
+def test_crawl_all_levels(clients):
+    errors = []
+    lake_crawler = crawler.LakeCrawler(
+        *clients, max_workers=3, on_error=lambda parent, exc: errors.append(parent)
+    )
+
+    records = list(lake_crawler.crawl(LOCATION))
+
+    levels = [r.level for r in records]
+    # Breadth-first: every level is complete before the next one starts.
+    assert levels == sorted(levels, key=list(crawler.CrawlLevel).index)
+    counts = {level: levels.count(level) for level in crawler.CrawlLevel}
+    assert counts == {
+        crawler.CrawlLevel.LAKE: 2,
+        crawler.CrawlLevel.ZONE: 4,
+        crawler.CrawlLevel.ASSET: 3,
+        crawler.CrawlLevel.ENTITY: 8,
+    }
+    assert errors == [LOCATION + "/lakes/l1/zones/z1"]
+    for record in records:
+        assert record.resource.name.startswith(record.parent + "/")
+
+    stats = lake_crawler.stats
+    assert stats[crawler.CrawlLevel.LAKE].pages == 2
+    assert stats[crawler.CrawlLevel.LAKE].parents == 1
+    assert stats[crawler.CrawlLevel.ZONE].parents == 2
+    assert stats[crawler.CrawlLevel.ENTITY].resources == 8
+    assert stats[crawler.CrawlLevel.ENTITY].pages == 8
+    assert all(s.throughput >= 0 for s in stats.values())
+    assert "entities" in repr(stats[crawler.CrawlLevel.ENTITY])
+
+
+def test_crawl_selected_levels(clients):
+    dataplex, metadata = clients
+    lake_crawler = crawler.LakeCrawler(
+        dataplex, metadata, levels=[crawler.CrawlLevel.ENTITY]
+    )
+
+    records = list(lake_crawler.crawl(LOCATION))
+
+    assert {r.level for r in records} == {crawler.CrawlLevel.ENTITY}
+    assert len(records) == 8
+    # Zones were still listed to reach the entities; assets were not.
+    assert set(lake_crawler.stats) == {
+        crawler.CrawlLevel.LAKE,
+        crawler.CrawlLevel.ZONE,
+        crawler.CrawlLevel.ENTITY,
+    }
+
+
+def test_crawl_lakes_only(clients):
+    dataplex, _ = clients
+    lake_crawler = crawler.LakeCrawler(dataplex, levels=[crawler.CrawlLevel.LAKE])
+
+    records = list(lake_crawler.crawl(LOCATION))
+
+    assert [r.resource.name for r in records] == [
+        LOCATION + "/lakes/l0",
+        LOCATION + "/lakes/l1",
+    ]
+    assert set(lake_crawler.stats) == {crawler.CrawlLevel.LAKE}
+
+
+def test_crawl_skips_entities_without_metadata_client(clients):
+    dataplex, _ = clients
+    lake_crawler = crawler.LakeCrawler(dataplex, on_error=lambda parent, exc: None)
+
+    records = list(lake_crawler.crawl(LOCATION))
+
+    assert crawler.CrawlLevel.ENTITY not in {r.level for r in records}
+
+
+def test_crawl_raises_first_error_after_level(clients):
+    lake_crawler = crawler.LakeCrawler(*clients)
+
+    records = []
+    with pytest.raises(core_exceptions.PermissionDenied):
+        for record in lake_crawler.crawl(LOCATION):
+            records.append(record)
+
+    assert sum(r.level == crawler.CrawlLevel.ASSET for r in records) == 3
+    assert crawler.CrawlLevel.ENTITY not in {r.level for r in records}
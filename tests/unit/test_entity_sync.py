@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import entity_sync
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+from google.protobuf import timestamp_pb2  # type: ignore
+
+ZONE = "projects/p/locations/l/lakes/k/zones/z"
+OTHER_ZONE = "projects/p/locations/l/lakes/k/zones/y"
+
+ListView = metadata_.ListEntitiesRequest.EntityView
+GetView = metadata_.GetEntityRequest.EntityView
+
+
+class FakeService:
+    """Serves entities the way the service does: schemas only on GetEntity."""
+
+    def __init__(self):
+        self.entities = {}
+        self.gets = []
+        self.missing = set()
+        self.failing = set()
+
+    def put(self, parent, entity_id, etag, seconds=1, fileset=False):
+        name = "{}/entities/{}".format(parent, entity_id)
+        self.entities[name] = metadata_.Entity(
+            name=name,
+            id=entity_id,
+            etag=etag,
+            update_time=timestamp_pb2.Timestamp(seconds=seconds),
+            type_=metadata_.Entity.Type.FILESET
+            if fileset
+            else metadata_.Entity.Type.TABLE,
+            schema=metadata_.Schema(user_managed=True),
+        )
+        return name
+
+    def __call__(self, request, **kwargs):
+        # All stubs share one type, so a single mock serves both RPCs.
+        if isinstance(request, metadata_.GetEntityRequest):
+            self.gets.append((request.name, request.view))
+            if request.name in self.failing:
+                raise core_exceptions.InternalServerError(request.name)
+            if request.name in self.missing or request.name not in self.entities:
+                raise core_exceptions.NotFound(request.name)
+            return self.entities[request.name]
+        wanted = (
+            metadata_.Entity.Type.TABLE
+            if request.view == ListView.TABLES
+            else metadata_.Entity.Type.FILESET
+        )
+        return metadata_.ListEntitiesResponse(
+            entities=[
+                metadata_.Entity(
+                    name=e.name, etag=e.etag, update_time=e.update_time, type_=e.type_
+                )
+                for name, e in sorted(self.entities.items())
+                if name.startswith(request.parent + "/") and e.type_ == wanted
+            ]
+        )
+
+
+@pytest.fixture
+def service():
+    fake = FakeService()
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    with mock.patch.object(
+        type(client.transport.list_entities), "__call__", side_effect=fake
+    ):
+        fake.client = client
+        yield fake
+
+
+def _summary(deltas):
+    return [(d.kind, d.name.rsplit("/", 1)[1]) for d in deltas]
+
+
+def test_initial_sync_fetches_everything(service):
+    service.put(ZONE, "a", "1")
+    service.put(ZONE, "b", "1", fileset=True)
+
+    with entity_sync.EntitySync(service.client) as mirror:
+        deltas = mirror.sync(ZONE)
+
+    assert _summary(deltas) == [
+        (entity_sync.DeltaKind.ADDED, "a"),
+        (entity_sync.DeltaKind.ADDED, "b"),
+    ]
+    assert all(view == GetView.SCHEMA for _, view in service.gets)
+    assert deltas[0].entity.schema.user_managed
+    assert deltas[0].previous is None
+    assert len(mirror.snapshot) == 2
+    assert mirror.listed == mirror.fetched == 2
+
+
+def test_incremental_sync_fetches_only_changes(service):
+    for i in range(10):
+        service.put(ZONE, "e{}".format(i), "1")
+    mirror = entity_sync.EntitySync(service.client)
+    mirror.sync(ZONE)
+    service.gets.clear()
+
+    service.put(ZONE, "e1", "2")
+    service.put(ZONE, "e2", "1", seconds=2)
+    service.put(ZONE, "new", "1")
+    del service.entities[ZONE + "/entities/e3"]
+    deltas = mirror.sync([ZONE])
+
+    assert _summary(deltas) == [
+        (entity_sync.DeltaKind.ADDED, "new"),
+        (entity_sync.DeltaKind.MODIFIED, "e1"),
+        (entity_sync.DeltaKind.MODIFIED, "e2"),
+        (entity_sync.DeltaKind.DELETED, "e3"),
+    ]
+    assert sorted(name.rsplit("/", 1)[1] for name, _ in service.gets) == [
+        "e1",
+        "e2",
+        "new",
+    ]
+    assert deltas[1].previous.etag == "1"
+    assert deltas[1].entity.etag == "2"
+    assert deltas[3].entity is None
+    assert ZONE + "/entities/e3" not in mirror.snapshot
+
+    service.gets.clear()
+    assert mirror.sync(ZONE) == []
+    assert service.gets == []
+
+
+def test_sync_leaves_other_zones_alone(service):
+    service.put(ZONE, "a", "1")
+    service.put(OTHER_ZONE, "b", "1")
+    mirror = entity_sync.EntitySync(service.client)
+    mirror.sync([ZONE, OTHER_ZONE])
+
+    service.entities.clear()
+    deltas = mirror.sync(ZONE)
+
+    assert _summary(deltas) == [(entity_sync.DeltaKind.DELETED, "a")]
+    assert [e.name for e in mirror.snapshot.entities()] == [OTHER_ZONE + "/entities/b"]
+
+
+def test_entity_deleted_after_listing(service):
+    service.put(ZONE, "a", "1")
+    service.put(ZONE, "b", "1")
+    mirror = entity_sync.EntitySync(service.client)
+    mirror.sync(ZONE)
+
+    service.put(ZONE, "a", "2")
+    service.put(ZONE, "c", "1")
+    service.missing.update([ZONE + "/entities/a", ZONE + "/entities/c"])
+    deltas = mirror.sync(ZONE)
+
+    # A modified entity that vanished is deleted; an added one is skipped.
+    assert _summary(deltas) == [(entity_sync.DeltaKind.DELETED, "a")]
+    assert list(mirror.snapshot) == [ZONE + "/entities/b"]
+
+
+def test_fetch_errors(service):
+    service.put(ZONE, "a", "1")
+    service.put(ZONE, "b", "1")
+    service.failing.add(ZONE + "/entities/a")
+
+    mirror = entity_sync.EntitySync(service.client, retry=None)
+    with pytest.raises(core_exceptions.InternalServerError):
+        mirror.sync(ZONE)
+    assert len(mirror.snapshot) == 0
+
+    errors = []
+    mirror = entity_sync.EntitySync(
+        service.client, retry=None, on_error=lambda name, exc: errors.append(name)
+    )
+    assert _summary(mirror.sync(ZONE)) == [(entity_sync.DeltaKind.ADDED, "b")]
+    assert errors == [ZONE + "/entities/a"]
+
+    service.failing.clear()
+    assert _summary(mirror.sync(ZONE)) == [(entity_sync.DeltaKind.ADDED, "a")]
+
+
+def test_snapshot_save_and_load(service, tmp_path):
+    service.put(ZONE, "a", "1")
+    service.put(ZONE, "b", "1")
+    path = str(tmp_path / "snapshot.bin")
+    mirror = entity_sync.EntitySync(service.client)
+    mirror.sync(ZONE)
+    mirror.snapshot.save(path)
+
+    restored = entity_sync.EntitySnapshot.load(path)
+    service.gets.clear()
+    service.put(ZONE, "b", "2")
+    deltas = entity_sync.EntitySync(service.client, restored).sync(ZONE)
+
+    assert sorted(restored) == sorted(mirror.snapshot)
+    assert restored.get(ZONE + "/entities/a").schema.user_managed
+    assert _summary(deltas) == [(entity_sync.DeltaKind.MODIFIED, "b")]
+    assert len(service.gets) == 1
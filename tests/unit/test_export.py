@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import sys
+
+import mock
+import pytest
+
+from google.cloud.dataplex_v1 import export
+from google.cloud.dataplex_v1.services.metadata_service import pagers
+from google.cloud.dataplex_v1.types import metadata_
+
+
+def _page(start, count, token=""):
+    return metadata_.ListPartitionsResponse(
+        partitions=[
+            metadata_.Partition(
+                name="entities/e/partitions/{}".format(i),
+                values=["2022", str(i)],
+                location="gs://bucket/{}".format(i),
+                etag="etag-{}".format(i),
+            )
+            for i in range(start, start + count)
+        ],
+        next_page_token=token,
+    )
+
+
+def _pages():
+    return [_page(0, 3, "a"), _page(3, 0, "b"), _page(3, 2)]
+
+
+def _pager():
+    pages = _pages()
+    method = mock.Mock(side_effect=pages[1:])
+    return pagers.ListPartitionsPager(
+        method, metadata_.ListPartitionsRequest(parent="entities/e"), pages[0]
+    )
+
+
+def test_partition_columns():
+    batches = list(export.partition_columns(_pager()))
+
+    assert len(batches) == 2
+    assert batches[0] == {
+        "name": ["entities/e/partitions/{}".format(i) for i in range(3)],
+        "values": [["2022", str(i)] for i in range(3)],
+        "location": ["gs://bucket/{}".format(i) for i in range(3)],
+        "etag": ["etag-{}".format(i) for i in range(3)],
+    }
+    assert batches[1]["name"] == ["entities/e/partitions/3", "entities/e/partitions/4"]
+
+
+def test_partition_columns_consumes_pages_lazily():
+    consumed = []
+
+    def pages():
+        for page in _pages():
+            consumed.append(page)
+            yield page
+
+    batches = export.partition_columns(pages())
+
+    assert len(next(batches)["name"]) == 3
+    assert len(consumed) == 1
+    assert len(next(batches)["name"]) == 2
+    assert len(consumed) == 3
+
+
+def test_partition_columns_skips_wrappers():
+    with mock.patch.object(
+        metadata_.Partition, "wrap", side_effect=AssertionError
+    ) as wrap:
+        list(export.partition_columns(_pages()))
+
+    wrap.assert_not_called()
+
+
+def test_missing_dependency():
+    with mock.patch.dict(sys.modules, {"pyarrow": None, "numpy": None}):
+        with pytest.raises(ImportError, match=r"google-cloud-dataplex\[arrow\]"):
+            list(export.partition_record_batches(_pages()))
+        with pytest.raises(ImportError, match=r"google-cloud-dataplex\[numpy\]"):
+            list(export.partition_arrays(_pages()))
+
+
+def test_partition_record_batches():
+    pa = pytest.importorskip("pyarrow")
+
+    batches = list(export.partition_record_batches(_pager()))
+
+    assert [batch.num_rows for batch in batches] == [3, 2]
+    assert batches[0].schema == export.partition_arrow_schema()
+    assert pa.Table.from_batches(batches).to_pylist()[4] == {
+        "name": "entities/e/partitions/4",
+        "values": ["2022", "4"],
+        "location": "gs://bucket/4",
+        "etag": "etag-4",
+    }
+
+
+def test_write_partitions_arrow():
+    pa = pytest.importorskip("pyarrow")
+    sink = io.BytesIO()
+
+    rows = export.write_partitions_arrow(_pages(), sink)
+
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert rows == table.num_rows == 5
+    assert table.column("etag").to_pylist()[0] == "etag-0"
+
+
+def test_write_partitions_arrow_empty():
+    pa = pytest.importorskip("pyarrow")
+    sink = io.BytesIO()
+
+    assert (
+        export.write_partitions_arrow([metadata_.ListPartitionsResponse()], sink) == 0
+    )
+    assert pa.ipc.open_stream(sink.getvalue()).read_all().num_rows == 0
+
+
+def test_partition_arrays():
+    pytest.importorskip("numpy")
+
+    arrays = list(export.partition_arrays(_pages()))
+
+    assert [len(array) for array in arrays] == [3, 2]
+    assert arrays[0].dtype.names == export.PARTITION_COLUMNS
+    assert arrays[1]["name"][1] == "entities/e/partitions/4"
+    assert arrays[1]["values"][1] == ("2022", "4")
+    assert arrays[0]["etag"].dtype.str.endswith("U6")
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import resources
+
+from tests import fake_server
+
+
+@pytest.fixture
+def server():
+    server = fake_server.FakeDataplexServer(
+        fake_server.Scale(lakes=2, zones=3, assets=2, entities=6, partitions=250)
+    )
+    yield server
+    server.stop()
+
+
+def test_synthetic_hierarchy(server):
+    client = server.dataplex_client()
+
+    lakes = list(client.list_lakes(parent=server.location_name()))
+    assert [lake.name for lake in lakes] == [server.lake_name(0), server.lake_name(1)]
+    zones = list(client.list_zones(parent=server.lake_name(1)))
+    assert [zone.type_ for zone in zones] == [
+        resources.Zone.Type.RAW,
+        resources.Zone.Type.CURATED,
+        resources.Zone.Type.RAW,
+    ]
+    assets = list(client.list_assets(parent=server.zone_name(1, 2)))
+    assert assets[1].name == server.asset_name(1, 2, 1)
+    assert client.get_asset(name=assets[1].name).uid == assets[1].uid
+    assert list(client.list_lake_actions(parent=server.lake_name())) == []
+
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_lake(name=server.lake_name(5))
+
+
+def test_metadata_paging(server):
+    client = server.metadata_client()
+    partitions = list(client.list_partitions(parent=server.entity_name(0, 1, 2)))
+
+    assert len(partitions) == 250
+    assert partitions[7].name == server.partition_name(0, 1, 2, 7)
+    assert server.calls["list_partitions"] == 25
+    pager = client.list_partitions(
+        request={"parent": server.entity_name(), "page_size": 5000}
+    )
+    assert len(pager.partitions) == 250
+    assert client.get_partition(name=partitions[7].name) == partitions[7]
+
+    tables = list(
+        client.list_entities(
+            request={
+                "parent": server.zone_name(),
+                "view": metadata_.ListEntitiesRequest.EntityView.TABLES,
+            }
+        )
+    )
+    assert len(tables) == 3
+    assert not tables[0].schema.fields
+    full = client.get_entity(
+        request={
+            "name": tables[0].name,
+            "view": metadata_.GetEntityRequest.EntityView.FULL,
+        }
+    )
+    assert len(full.schema.fields) == 20
+    assert not client.get_entity(name=tables[0].name).schema.fields
+
+    with pytest.raises(core_exceptions.InvalidArgument):
+        client.list_partitions(
+            request={"parent": server.entity_name(), "page_token": "x"}
+        )
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_entity(name=server.entity_name(entity=99))
+
+
+def test_operations(server):
+    client = server.dataplex_client()
+    server.operation_delay = 0.05
+
+    operation = client.create_zone(
+        parent=server.lake_name(),
+        zone_id="new",
+        zone=resources.Zone(
+            type_=resources.Zone.Type.RAW,
+            resource_spec={"location_type": "SINGLE_REGION"},
+        ),
+    )
+    assert not operation.done()
+    assert operation.result(timeout=5).name == server.lake_name() + "/zones/new"
+    assert operation.metadata.verb == "create"
+
+    operation = client.update_zone(
+        zone=resources.Zone(name=server.zone_name(), display_name="Raw"),
+        update_mask={"paths": ["display_name"]},
+    )
+    assert operation.result(timeout=5).display_name == "Raw"
+    assert client.get_zone(name=server.zone_name()).display_name == "Raw"
+
+    with pytest.raises(core_exceptions.FailedPrecondition):
+        client.delete_zone(name=server.zone_name())
+    with pytest.raises(core_exceptions.AlreadyExists):
+        client.create_zone(
+            parent=server.lake_name(), zone_id="new", zone=resources.Zone()
+        )
+
+    server.operation_delay = 60
+    operation = client.delete_asset(name=server.asset_name())
+    operation.cancel()
+    with pytest.raises(core_exceptions.Cancelled):
+        operation.result(timeout=5)
+    assert len(list(client.list_assets(parent=server.zone_name()))) == 1
+
+
+def test_reads_do_not_wait_for_mutations(server, monkeypatch):
+    client = server.dataplex_client()
+    put, updating, release = server._put, threading.Event(), threading.Event()
+
+    def slow_put(parent, resource):
+        updating.set()
+        release.wait(5)
+        put(parent, resource)
+
+    monkeypatch.setattr(server, "_put", slow_put)
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        update = executor.submit(
+            client.update_lake,
+            lake=resources.Lake(name=server.lake_name(), description="Lake"),
+            update_mask={"paths": ["description"]},
+        )
+        assert updating.wait(5)
+        # The update still runs, holding the lock.
+        assert client.get_lake(name=server.lake_name(), timeout=5).description == ""
+        release.set()
+        update.result(timeout=5)
+    assert client.get_lake(name=server.lake_name()).description == "Lake"
+
+
+def test_injected_latency_and_errors(server):
+    client = server.metadata_client()
+    server.latency = {"get_partition": 0.05}
+    server.item_latency = 0.001
+
+    start = time.monotonic()
+    client.get_partition(name=server.partition_name())
+    assert time.monotonic() - start >= 0.05
+    start = time.monotonic()
+    client.list_partitions(request={"parent": server.entity_name(), "page_size": 100})
+    assert time.monotonic() - start >= 0.1
+
+    server.fail_next("get_entity", grpc.StatusCode.UNAVAILABLE, count=2)
+    assert client.get_entity(name=server.entity_name()).name == server.entity_name()
+    assert server.calls["get_entity"] == 3
+
+    server.latency = 0
+    server.error_rate = 1.0
+    server.error_code = grpc.StatusCode.RESOURCE_EXHAUSTED
+    with pytest.raises(core_exceptions.ResourceExhausted):
+        client.get_entity(name=server.entity_name())
+
+
+@pytest.mark.asyncio
+async def test_async_clients(server):
+    metadata = server.metadata_async_client()
+    dataplex = server.dataplex_async_client()
+
+    pager = await metadata.list_partitions(
+        request={"parent": server.entity_name(), "page_size": 100}
+    )
+    assert len([p async for p in pager]) == 250
+
+    operation = await dataplex.update_lake(
+        lake=resources.Lake(name=server.lake_name(), description="Lake"),
+        update_mask={"paths": ["description"]},
+    )
+    assert (await operation.result()).description == "Lake"
+
+
+def test_main_arguments(monkeypatch):
+    started = []
+
+    class Server:
+        address = "localhost:1"
+
+        def __init__(self, scale, **kwargs):
+            started.append((scale, kwargs))
+
+        class _server:
+            @staticmethod
+            def wait_for_termination():
+                pass
+
+    monkeypatch.setattr(fake_server, "FakeDataplexServer", Server)
+    fake_server.main(["--port", "0", "--partitions", "7", "--latency", "0.5"])
+
+    scale, kwargs = started[0]
+    assert scale == fake_server.Scale(partitions=7)
+    assert kwargs["latency"] == 0.5
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+from concurrent import futures
+import gc
+import threading
+import weakref
+
+import mock
+import pytest
+
+from google.cloud.dataplex_v1 import _fanout
+
+
+def test_fan_out_yields_every_chunk():
+    results = list(_fanout.fan_out(range(5), lambda i: [[i]] * i, max_workers=3))
+
+    assert sorted(results) == [
+        (1, [1]),
+        (2, [2]),
+        (2, [2]),
+        (3, [3]),
+        (3, [3]),
+        (3, [3]),
+        (4, [4]),
+        (4, [4]),
+        (4, [4]),
+        (4, [4]),
+    ]
+
+
+def test_fan_out_runs_items_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def expand(item):
+        # Deadlocks unless all three items are expanded at the same time.
+        barrier.wait()
+        yield item
+
+    assert sorted(i for i, _ in _fanout.fan_out(range(3), expand, max_workers=3)) == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_fan_out_consumes_items_lazily():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = _fanout.fan_out(items(), lambda i: [i], max_workers=2)
+    next(results)
+    results.close()
+
+    assert len(consumed) < 100
+
+
+def test_fan_out_isolates_errors():
+    def expand(item):
+        if item == 1:
+            raise RuntimeError("boom")
+        yield item
+
+    errors = []
+    results = list(
+        _fanout.fan_out(
+            range(3),
+            expand,
+            max_workers=2,
+            on_error=lambda item, exc: errors.append((item, str(exc))),
+        )
+    )
+
+    assert sorted(results) == [(0, 0), (2, 2)]
+    assert errors == [(1, "boom")]
+
+
+def test_fan_out_raises_first_error_at_end():
+    def expand(item):
+        if item == 0:
+            raise RuntimeError("boom")
+        yield item
+
+    results = []
+    with pytest.raises(RuntimeError, match="boom"):
+        for pair in _fanout.fan_out(range(4), expand, max_workers=1):
+            results.append(pair)
+
+    assert results == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_fan_out_releases_workers_on_close():
+    def expand(item):
+        while True:
+            yield item
+
+    results = _fanout.fan_out(range(4), expand, max_workers=2)
+    next(results)
+    results.close()
+
+    for thread in threading.enumerate():
+        if thread.name.startswith("dataplex-fan-out"):
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+
+def test_fan_out_releases_finished_futures():
+    submitted = []
+    submit = futures.ThreadPoolExecutor.submit
+
+    def tracking_submit(executor, *args):
+        future = submit(executor, *args)
+        submitted.append(weakref.ref(future))
+        return future
+
+    with mock.patch.object(futures.ThreadPoolExecutor, "submit", tracking_submit):
+        results = _fanout.fan_out(range(100), lambda i: [i], max_workers=2)
+        for _ in range(90):
+            next(results)
+        gc.collect()
+        live = [ref for ref in submitted if ref() is not None]
+        results.close()
+
+    assert len(submitted) > 90
+    assert len(live) <= 4
+
+
+def test_fan_out_invalid_max_workers():
+    with pytest.raises(ValueError):
+        next(_fanout.fan_out([], list, max_workers=0))
+
+
+async def _aiter(values):
+    for value in values:
+        yield value
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_yields_every_chunk():
+    async def expand(item):
+        for _ in range(item):
+            await asyncio.sleep(0)
+            yield [item]
+
+    results = [
+        pair
+        async for pair in _fanout.async_fan_out(
+            _aiter(range(4)), expand, max_concurrency=2
+        )
+    ]
+
+    assert sorted(results) == [
+        (1, [1]),
+        (2, [2]),
+        (2, [2]),
+        (3, [3]),
+        (3, [3]),
+        (3, [3]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_bounds_concurrency():
+    active = 0
+    peak = 0
+
+    async def expand(item):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        yield item
+
+    results = [
+        pair
+        async for pair in _fanout.async_fan_out(
+            _aiter(range(10)), expand, max_concurrency=3
+        )
+    ]
+
+    assert len(results) == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_isolates_errors():
+    async def expand(item):
+        if item == 1:
+            raise RuntimeError("boom")
+        yield item
+
+    errors = []
+    results = [
+        pair
+        async for pair in _fanout.async_fan_out(
+            _aiter(range(3)),
+            expand,
+            max_concurrency=2,
+            on_error=lambda item, exc: errors.append(item),
+        )
+    ]
+
+    assert sorted(results) == [(0, 0), (2, 2)]
+    assert errors == [1]
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_raises_first_error_at_end():
+    async def expand(item):
+        if item == 0:
+            raise RuntimeError("boom")
+        yield item
+
+    results = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for pair in _fanout.async_fan_out(
+            _aiter(range(3)), expand, max_concurrency=1
+        ):
+            results.append(pair)
+
+    assert results == [(1, 1), (2, 2)]
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_propagates_item_errors():
+    async def items():
+        yield 0
+        raise RuntimeError("listing failed")
+
+    async def expand(item):
+        await asyncio.sleep(0.01)
+        yield item
+
+    with pytest.raises(RuntimeError, match="listing failed"):
+        async for _ in _fanout.async_fan_out(items(), expand, max_concurrency=2):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_stops_every_task_on_close():
+    async def items():
+        for i in range(100):
+            yield i
+
+    async def expand(item):
+        yield item
+
+    before = asyncio.all_tasks()
+    results = _fanout.async_fan_out(items(), expand, max_concurrency=2)
+    await results.__anext__()
+    await results.aclose()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert [task for task in asyncio.all_tasks() - before if not task.done()] == []
+
+
+@pytest.mark.asyncio
+async def test_async_fan_out_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        await _fanout.async_fan_out(_aiter([]), _aiter, max_concurrency=0).__anext__()
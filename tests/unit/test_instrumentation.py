@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+
+import grpc
+from grpc.experimental import aio
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers_async
+from google.api_core import retry as retries
+from google.api_core import retry_async
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import instrumentation
+from google.cloud.dataplex_v1.services.metadata_service import (
+    MetadataServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import transports
+from google.cloud.dataplex_v1.types import metadata_
+
+ENTITY = "projects/p/locations/l/lakes/k/zones/z/entities/e"
+FAST_RETRY = retries.Retry(
+    initial=0.001,
+    maximum=0.001,
+    predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable),
+)
+
+
+def _local_async_channels(address):
+    """Let async transports open their channels to the local server.
+
+    The channels keep the interceptors the transport passes in.
+    """
+
+    def create_channel(target, **kwargs):
+        return aio.insecure_channel(address, interceptors=kwargs.get("interceptors"))
+
+    return mock.patch.object(
+        grpc_helpers_async, "create_channel", side_effect=create_channel
+    )
+
+
+class Server:
+    """Serves GetEntity and three pages of ListPartitions."""
+
+    def __init__(self):
+        self.unavailable = 0
+        handler = grpc.method_handlers_generic_handler(
+            "google.cloud.dataplex.v1.MetadataService",
+            {
+                "GetEntity": grpc.unary_unary_rpc_method_handler(
+                    self.get_entity,
+                    request_deserializer=metadata_.GetEntityRequest.deserialize,
+                    response_serializer=metadata_.Entity.serialize,
+                ),
+                "ListPartitions": grpc.unary_unary_rpc_method_handler(
+                    self.list_partitions,
+                    request_deserializer=metadata_.ListPartitionsRequest.deserialize,
+                    response_serializer=metadata_.ListPartitionsResponse.serialize,
+                ),
+            },
+        )
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        self.server.add_generic_rpc_handlers((handler,))
+        self.address = "localhost:{}".format(self.server.add_insecure_port("[::]:0"))
+        self.server.start()
+
+    def get_entity(self, request, context):
+        if self.unavailable:
+            self.unavailable -= 1
+            context.abort(grpc.StatusCode.UNAVAILABLE, "try again")
+        return metadata_.Entity(name=request.name, etag="x" * 100)
+
+    def list_partitions(self, request, context):
+        page = int(request.page_token or 0)
+        return metadata_.ListPartitionsResponse(
+            partitions=[
+                metadata_.Partition(name="{}/partitions/{}-{}".format(ENTITY, page, i))
+                for i in range(page + 1)
+            ],
+            next_page_token=str(page + 1) if page < 2 else "",
+        )
+
+
+@pytest.fixture
+def server():
+    server = Server()
+    yield server
+    server.server.stop(None)
+
+
+def _client(server, sink):
+    return MetadataServiceClient(
+        transport=transports.MetadataServiceGrpcTransport(
+            channel=grpc.insecure_channel(server.address),
+            interceptors=[instrumentation.InstrumentationInterceptor(sink)],
+        )
+    )
+
+
+def test_records_calls_retries_and_pages(server):
+    sink = instrumentation.InMemorySink()
+    client = _client(server, sink)
+    server.unavailable = 2
+
+    assert client.get_entity(name=ENTITY, retry=FAST_RETRY).name == ENTITY
+    assert len(list(client.list_partitions(parent=ENTITY))) == 6
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        server.unavailable = 1
+        client.get_entity(name=ENTITY, retry=None)
+
+    stats = sink.stats()
+    get = stats["get_entity"]
+    assert get.calls == 4
+    assert get.codes == {grpc.StatusCode.UNAVAILABLE: 3, grpc.StatusCode.OK: 1}
+    assert get.retries == 2
+    assert (
+        get.request_bytes
+        == 4
+        * metadata_.GetEntityRequest.pb(
+            metadata_.GetEntityRequest(name=ENTITY)
+        ).ByteSize()
+    )
+    assert get.response_bytes > 100
+    assert get.pages == 0
+    assert sum(get.bucket_counts) == 4
+    assert get.quantile(0.5) <= 1.0
+
+    pages = stats["list_partitions"]
+    assert (pages.calls, pages.pages, pages.page_items, pages.retries) == (3, 3, 6, 0)
+
+
+def test_prometheus_text(server):
+    sink = instrumentation.PrometheusSink(buckets=(0.5, 60.0), prefix="test")
+    client = _client(server, sink)
+    client.get_entity(name=ENTITY)
+    list(client.list_partitions(parent=ENTITY))
+
+    text = sink.render()
+    lines = text.splitlines()
+    assert "# TYPE test_latency_seconds histogram" in lines
+    assert 'test_latency_seconds_bucket{method="get_entity",le="60.0"} 1' in lines
+    assert 'test_latency_seconds_bucket{method="get_entity",le="+Inf"} 1' in lines
+    assert 'test_latency_seconds_count{method="list_partitions"} 3' in lines
+    assert 'test_calls_total{method="get_entity",code="OK"} 1' in lines
+    assert 'test_pages_total{method="list_partitions"} 3' in lines
+    assert 'test_page_items_total{method="list_partitions"} 6' in lines
+    assert 'test_retries_total{method="get_entity"} 0' in lines
+    assert text.endswith("\n")
+
+    sink.reset()
+    assert sink.stats() == {}
+
+
+class FakeInstrument:
+    def __init__(self, name):
+        self.name = name
+        self.points = []
+
+    def add(self, value, attributes):
+        self.points.append((value, attributes))
+
+    record = add
+
+
+class FakeMeter:
+    def __init__(self):
+        self.instruments = {}
+
+    def _create(self, name, unit="", description=""):
+        return self.instruments.setdefault(name, FakeInstrument(name))
+
+    create_counter = create_histogram = _create
+
+
+def test_opentelemetry_sink(server):
+    pytest.importorskip("opentelemetry.metrics")
+    meter = FakeMeter()
+    client = _client(server, instrumentation.OpenTelemetrySink(meter))
+    server.unavailable = 1
+    client.get_entity(name=ENTITY, retry=FAST_RETRY)
+    list(client.list_partitions(parent=ENTITY))
+
+    instruments = meter.instruments
+    calls = instruments["dataplex.client.calls"].points
+    assert (1, {"rpc.method": "get_entity", "rpc.grpc.status_code": 14}) in calls
+    assert len(calls) == 5
+    assert instruments["dataplex.client.retries"].points == [
+        (1, {"rpc.method": "get_entity"})
+    ]
+    assert [v for v, _ in instruments["dataplex.client.page_items"].points] == [
+        1,
+        2,
+        3,
+    ]
+    assert len(instruments["dataplex.client.duration"].points) == 5
+    # The default meter comes from the global provider.
+    instrumentation.OpenTelemetrySink()
+
+
+def test_sink_requires_record():
+    class Incomplete(instrumentation.Sink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_sink_errors_do_not_fail_calls(server):
+    class Broken(instrumentation.Sink):
+        def record(self, record):
+            raise RuntimeError("broken")
+
+    client = _client(server, Broken())
+    assert client.get_entity(name=ENTITY).name == ENTITY
+
+
+@pytest.mark.asyncio
+async def test_async_interceptor(server):
+    sink = instrumentation.InMemorySink()
+    with _local_async_channels(server.address):
+        client = MetadataServiceAsyncClient(
+            transport=transports.MetadataServiceGrpcAsyncIOTransport(
+                credentials=ga_credentials.AnonymousCredentials(),
+                interceptors=[instrumentation.AsyncInstrumentationInterceptor(sink)],
+            )
+        )
+    server.unavailable = 1
+
+    retry = retry_async.AsyncRetry(
+        initial=0.001,
+        maximum=0.001,
+        predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable),
+    )
+    assert (await client.get_entity(name=ENTITY, retry=retry)).name == ENTITY
+    pager = await client.list_partitions(parent=ENTITY)
+    assert len([p async for p in pager]) == 6
+
+    stats = sink.stats()
+    assert stats["get_entity"].codes == {
+        grpc.StatusCode.UNAVAILABLE: 1,
+        grpc.StatusCode.OK: 1,
+    }
+    assert stats["get_entity"].retries == 1
+    assert stats["list_partitions"].page_items == 6
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import sys
+
+import pytest
+
+from google.cloud import dataplex
+from google.cloud import dataplex_v1
+from google.cloud.dataplex_v1 import types
+
+# Modules that should only be loaded once a client is used.
+HEAVY_MODULES = (
+    "grpc",
+    "google.api_core.gapic_v1",
+    "google.cloud.dataplex_v1.services",
+)
+
+
+def _run(code):
+    """Run ``code`` in a fresh interpreter, returning its output and import times.
+
+    The import time is the total, in microseconds, reported by
+    ``-X importtime`` for the modules imported at the top level.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return result.stdout, total
+
+
+@pytest.mark.parametrize("package", [dataplex, dataplex_v1, types])
+def test_exports_resolve(package):
+    for name in package.__all__:
+        assert getattr(package, name) is getattr(dataplex_v1, name)
+        assert name in dir(package)
+    with pytest.raises(AttributeError):
+        package.NoSuchName
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import google.cloud.dataplex",
+        "import google.cloud.dataplex_v1",
+        "from google.cloud.dataplex_v1 import GetLakeRequest; GetLakeRequest()",
+    ],
+)
+def test_import_does_not_load_clients(code):
+    report = "import sys; print([m for m in sys.modules if m.startswith({!r})])"
+    stdout, _ = _run(code + "\n" + report.format(HEAVY_MODULES))
+
+    assert stdout.strip() == "[]"
+
+
+def test_import_time_benchmark():
+    # Compare against loading every export in the same interpreter build, so
+    # the check holds on slow machines too.
+    _, lazy = _run("import google.cloud.dataplex")
+    _, eager = _run("from google.cloud.dataplex import *")
+
+    assert lazy * 5 < eager, "lazy import took {}us, eager {}us".format(lazy, eager)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import operation_async  # type: ignore
+from google.cloud.dataplex_v1.operation_manager import OperationManager
+from google.cloud.dataplex_v1.types import resources
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2  # type: ignore
+
+FAST = dict(initial_delay=0.001, max_delay=0.004)
+
+
+class FakeOperations:
+    """Completes each operation after a given number of refreshes."""
+
+    def __init__(self):
+        self.refreshes = {}
+        self.flaky = set()
+        self.gone = set()
+
+    def create(self, name, polls, error=False):
+        self.refreshes[name] = 0
+
+        async def refresh(retry=None):
+            self.refreshes[name] += 1
+            if name in self.flaky:
+                self.flaky.discard(name)
+                raise core_exceptions.ServiceUnavailable(name)
+            if name in self.gone:
+                raise core_exceptions.NotFound(name)
+            current = operations_pb2.Operation(name=name)
+            if self.refreshes[name] >= polls:
+                current.done = True
+                if error:
+                    current.error.CopyFrom(status_pb2.Status(code=13, message=name))
+                else:
+                    current.response.Pack(resources.Lake.pb(resources.Lake(name=name)))
+            return current
+
+        async def cancel():
+            pass
+
+        initial = operations_pb2.Operation(name=name, done=polls == 0)
+        if polls == 0:
+            initial.response.Pack(resources.Lake.pb(resources.Lake(name=name)))
+        return operation_async.AsyncOperation(
+            initial, refresh, cancel, result_type=resources.Lake
+        )
+
+
+@pytest.mark.asyncio
+async def test_wait_all_returns_results_in_order():
+    fake = FakeOperations()
+    ops = [fake.create("op{}".format(i), polls=i % 4) for i in range(12)]
+
+    async with OperationManager(**FAST) as manager:
+        for op in ops:
+            manager.add(op)
+        results = await manager.wait_all(timeout=5)
+
+    assert [r.name for r in results] == ["op{}".format(i) for i in range(12)]
+    assert len(manager) == 0
+    # Already complete operations are never refreshed, the others once per
+    # required poll.
+    assert (
+        manager.polls == sum(fake.refreshes.values()) == sum(i % 4 for i in range(12))
+    )
+
+
+@pytest.mark.asyncio
+async def test_as_completed_yields_in_completion_order():
+    fake = FakeOperations()
+    slow = fake.create("slow", polls=5)
+    fast = fake.create("fast", polls=1)
+    done = fake.create("done", polls=0)
+
+    async with OperationManager(**FAST) as manager:
+        names = [
+            (await op.result()).name
+            async for op in manager.as_completed([slow, fast, done], timeout=5)
+        ]
+
+    assert names == ["done", "fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_batches_bound_polls_per_round():
+    fake = FakeOperations()
+    ops = [fake.create("op{}".format(i), polls=1) for i in range(10)]
+
+    async with OperationManager(batch_size=4, initial_delay=0.05) as manager:
+        for op in ops:
+            manager.add(op)
+        await asyncio.sleep(0.07)
+        assert manager.polls == 4
+        await manager.wait_all(timeout=5)
+
+    assert manager.polls == 10
+
+
+@pytest.mark.asyncio
+async def test_backoff_is_shared():
+    fake = FakeOperations()
+    ops = [fake.create("op{}".format(i), polls=6) for i in range(3)]
+
+    manager = OperationManager(initial_delay=0.001, max_delay=0.01, multiplier=2)
+    await manager.wait_all(ops, timeout=5)
+
+    # One schedule for all of them: the delay grew while nothing completed.
+    assert manager.delay > 0.001
+    assert manager.polls == 18
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_errors():
+    fake = FakeOperations()
+    failed = fake.create("failed", polls=1, error=True)
+    flaky = fake.create("flaky", polls=1)
+    fake.flaky.add("flaky")
+
+    async with OperationManager(**FAST) as manager:
+        results = await manager.wait_all(
+            [failed, flaky], timeout=5, return_exceptions=True
+        )
+        assert isinstance(results[0], core_exceptions.GoogleAPICallError)
+        assert results[1].name == "flaky"
+        # A failed poll is retried in a later round.
+        assert manager.errors == 1
+
+        with pytest.raises(core_exceptions.GoogleAPICallError):
+            await manager.wait_all([failed])
+
+
+@pytest.mark.asyncio
+async def test_unpollable_operations_fail():
+    fake = FakeOperations()
+    gone = fake.create("gone", polls=1)
+    fine = fake.create("fine", polls=2)
+    fake.gone.add("gone")
+
+    async with OperationManager(**FAST) as manager:
+        results = await manager.wait_all(
+            [gone, fine], timeout=5, return_exceptions=True
+        )
+        assert isinstance(results[0], core_exceptions.NotFound)
+        assert results[1].name == "fine"
+        # It was polled once, not until the timeout.
+        assert fake.refreshes["gone"] == 1
+
+        again = fake.create("again", polls=1)
+        fake.gone.add("again")
+        with pytest.raises(core_exceptions.NotFound):
+            async for _ in manager.as_completed([again], timeout=5):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_waited_operations_are_released():
+    fake = FakeOperations()
+    ops = [fake.create("op{}".format(i), polls=i % 2) for i in range(4)]
+
+    async with OperationManager(**FAST) as manager:
+        for op in ops:
+            manager.add(op)
+        await manager.wait_all(ops[:2], timeout=5)
+        assert len(manager._tracked) == len(manager._completions) == 2
+
+        names = [(await op.result()).name async for op in manager.as_completed()]
+        assert sorted(names) == ["op2", "op3"]
+        assert manager._tracked == manager._completions == {}
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    fake = FakeOperations()
+    never = fake.create("never", polls=10 ** 6)
+
+    async with OperationManager(**FAST) as manager:
+        with pytest.raises(asyncio.TimeoutError):
+            await manager.wait_all([never], timeout=0.02)
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in manager.as_completed(timeout=0.02):
+                pass
+        assert len(manager) == 1
+    assert manager._poller.done()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        OperationManager(batch_size=0)
+    with pytest.raises(ValueError):
+        OperationManager(multiplier=0.5)
@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import _paging
+from google.cloud.dataplex_v1.services.metadata_service import (
+    MetadataServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import pagers
+from google.cloud.dataplex_v1.types import metadata_
+
+
+def _partitions_response(count, next_page_token=""):
+    return metadata_.ListPartitionsResponse(
+        partitions=[metadata_.Partition() for _ in range(count)],
+        next_page_token=next_page_token,
+    )
+
+
+def test_prefetch_pages_yields_all_pages_in_order():
+    method = mock.Mock(
+        side_effect=[
+            _partitions_response(2, next_page_token="def"),
+            _partitions_response(1),
+        ]
+    )
+    pager = pagers.ListPartitionsPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(parent="p"),
+        response=_partitions_response(3, next_page_token="abc"),
+        metadata=(("x", "y"),),
+        prefetch=1,
+    )
+
+    assert len(list(pager)) == 6
+    assert [c.args[0].page_token for c in method.call_args_list] == ["def", "def"]
+    assert all(c.kwargs["metadata"] == (("x", "y"),) for c in method.call_args_list)
+    # The pager tracks the last page handed out, as it does without prefetch.
+    assert pager.next_page_token == ""
+
+
+def test_prefetch_pages_fetches_ahead_of_consumer():
+    fetched = threading.Event()
+
+    def method(request, metadata):
+        fetched.set()
+        return _partitions_response(1)
+
+    pager = pagers.ListPartitionsPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="abc"),
+        prefetch=1,
+    )
+    pages = pager.pages
+    next(pages)
+
+    # The second page is requested while the first one is still held.
+    assert fetched.wait(timeout=5)
+    assert len(list(pages)) == 1
+
+
+def test_prefetch_pages_bounded_by_depth():
+    calls = []
+    tokens = iter(["b", "c", "d", "e", ""])
+
+    def method(request, metadata):
+        calls.append(request.page_token)
+        return _partitions_response(1, next_page_token=next(tokens))
+
+    pager = pagers.ListPartitionsPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="a"),
+        prefetch=2,
+    )
+    pages = pager.pages
+    next(pages)
+    next(pages)
+
+    # One page handed out beyond the first, at most two more buffered.
+    for _ in range(50):
+        if len(calls) == 3:
+            break
+        threading.Event().wait(0.01)
+    assert calls == ["a", "b", "c"]
+    pages.close()
+
+
+def test_prefetch_pages_propagates_errors():
+    method = mock.Mock(side_effect=RuntimeError("boom"))
+    pager = pagers.ListPartitionsPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="abc"),
+        prefetch=3,
+    )
+    pages = pager.pages
+
+    assert next(pages).next_page_token == "abc"
+    with pytest.raises(RuntimeError, match="boom"):
+        next(pages)
+
+
+def test_prefetch_pages_stops_producer_on_close():
+    release = threading.Event()
+
+    def method(request, metadata):
+        release.wait(timeout=5)
+        return _partitions_response(1, next_page_token="more")
+
+    pager = pagers.ListPartitionsPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="abc"),
+        prefetch=1,
+    )
+    pages = pager.pages
+    next(pages)
+    pages.close()
+    release.set()
+
+    for thread in threading.enumerate():
+        if thread.name == "dataplex-page-prefetch":
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+
+def test_prefetch_pages_single_page():
+    method = mock.Mock()
+    pager = pagers.ListPartitionsPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(2),
+        prefetch=4,
+    )
+
+    assert len(list(pager)) == 2
+    method.assert_not_called()
+
+
+def test_prefetch_pages_invalid_depth():
+    pager = pagers.ListPartitionsPager(
+        method=mock.Mock(),
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1),
+    )
+
+    with pytest.raises(ValueError):
+        next(_paging.prefetch_pages(pager, 0))
+
+
+@pytest.mark.asyncio
+async def test_lookahead_pages_yields_all_pages_in_order():
+    method = mock.AsyncMock(
+        side_effect=[
+            _partitions_response(2, next_page_token="def"),
+            _partitions_response(1),
+        ]
+    )
+    pager = pagers.ListPartitionsAsyncPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(parent="p"),
+        response=_partitions_response(3, next_page_token="abc"),
+        lookahead=2,
+    )
+
+    results = [i async for i in pager]
+
+    assert len(results) == 6
+    assert method.await_count == 2
+    assert pager.next_page_token == ""
+
+
+@pytest.mark.asyncio
+async def test_lookahead_pages_fetches_ahead_of_consumer():
+    fetched = asyncio.Event()
+
+    async def method(request, metadata):
+        fetched.set()
+        return _partitions_response(1)
+
+    pager = pagers.ListPartitionsAsyncPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="abc"),
+        lookahead=1,
+    )
+    pages = pager.pages
+    await pages.__anext__()
+
+    # The second page is requested while the first one is still held.
+    await asyncio.wait_for(fetched.wait(), timeout=5)
+    assert len([p async for p in pages]) == 1
+
+
+@pytest.mark.asyncio
+async def test_lookahead_pages_bounded_by_depth():
+    calls = []
+    tokens = iter(["b", "c", "d", "e", ""])
+
+    async def method(request, metadata):
+        calls.append(request.page_token)
+        return _partitions_response(1, next_page_token=next(tokens))
+
+    pager = pagers.ListPartitionsAsyncPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="a"),
+        lookahead=2,
+    )
+    pages = pager.pages
+    await pages.__anext__()
+    await pages.__anext__()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert calls == ["a", "b", "c"]
+    await pages.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lookahead_pages_propagates_errors():
+    method = mock.AsyncMock(side_effect=RuntimeError("boom"))
+    pager = pagers.ListPartitionsAsyncPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="abc"),
+        lookahead=1,
+    )
+    pages = pager.pages
+
+    assert (await pages.__anext__()).next_page_token == "abc"
+    with pytest.raises(RuntimeError, match="boom"):
+        await pages.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_lookahead_pages_cancels_producer_on_close():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def method(request, metadata):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    pager = pagers.ListPartitionsAsyncPager(
+        method=method,
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1, next_page_token="abc"),
+        lookahead=1,
+    )
+    pages = pager.pages
+    await pages.__anext__()
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await pages.aclose()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_lookahead_pages_invalid_depth():
+    pager = pagers.ListPartitionsAsyncPager(
+        method=mock.AsyncMock(),
+        request=metadata_.ListPartitionsRequest(),
+        response=_partitions_response(1),
+    )
+
+    with pytest.raises(ValueError):
+        await _paging.lookahead_pages(pager, -1).__anext__()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_page_size_tuner_grows_and_shrinks():
+    limits = _paging.PAGE_LIMITS["list_partitions"]
+    tuner = _paging.PageSizeTuner(limits, page_size=100, max_response_bytes=10 ** 9)
+
+    tuner.observe(0.1, 1000, 100)
+    assert tuner.page_size == 200
+    # A short page does not grow the size any further.
+    tuner.observe(0.1, 1000, 150)
+    assert tuner.page_size == 200
+    tuner.observe(0.7, 1000, 200)
+    assert tuner.page_size == 200
+    tuner.observe(1.5, 1000, 200)
+    assert tuner.page_size == 100
+    for _ in range(10):
+        tuner.observe(0.1, 1000, tuner.page_size)
+    assert tuner.page_size == limits.maximum
+
+    # Pages of 10 KiB items stay below the byte budget.
+    tuner.max_response_bytes = 1024 * 1024
+    tuner.observe(0.1, 1000 * 10240, 1000)
+    assert tuner.page_size == 102
+
+
+def test_page_size_tuner_for_method():
+    assert _paging.PageSizeTuner.for_method("list_lakes").page_size == 100
+    assert _paging.PageSizeTuner.for_method("list_jobs", 5000).page_size == 1000
+    tuner = _paging.PageSizeTuner.for_method("list_entities", 20, min_page_size=10)
+    assert tuner.limits.items == "entities"
+    assert tuner.shrink() and tuner.page_size == 10
+    assert not tuner.shrink()
+
+
+def test_page_size_tuner_retries_page_past_deadline():
+    clock = FakeClock()
+    tuner = _paging.PageSizeTuner.for_method("list_partitions", clock=clock)
+    sizes = []
+
+    def method(request, metadata):
+        sizes.append((request.page_token, request.page_size))
+        if request.page_size > 30:
+            raise core_exceptions.DeadlineExceeded("slow")
+        clock.now += 2
+        return _partitions_response(request.page_size)
+
+    tuned = tuner.wrap(method)
+    request = metadata_.ListPartitionsRequest(page_token="abc")
+    assert len(tuned(request, metadata=()).partitions) == 25
+    assert sizes == [("abc", 100), ("abc", 50), ("abc", 25)]
+    # The page was slow, so the next one is smaller still.
+    assert tuner.page_size == 12
+
+    # Past the minimum page size, the error is raised.
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        _paging.PageSizeTuner.for_method("list_partitions", 40, min_page_size=40).wrap(
+            method
+        )(request, metadata=())
+
+
+def _full_pages(pages, response_type, items, tokens=None):
+    def method(request, **kwargs):
+        if tokens is not None:
+            tokens.append(request.page_token)
+        page = int(request.page_token or 0)
+        return response_type(
+            {
+                items: [{} for _ in range(request.page_size)],
+                "next_page_token": str(page + 1) if page + 1 < pages else "",
+            }
+        )
+
+    return method
+
+
+def test_client_adaptive_page_size():
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    request = metadata_.ListPartitionsRequest(parent="p")
+    tokens = []
+    with mock.patch.object(
+        type(client.transport.list_partitions),
+        "__call__",
+        side_effect=_full_pages(
+            5, metadata_.ListPartitionsResponse, "partitions", tokens
+        ),
+    ):
+        pager = client.list_partitions(request, adaptive_page_size=True)
+        assert pager.page_size == 100
+        assert len(list(pager)) == 100 + 200 + 400 + 800 + 1000
+        assert pager.page_size == 1000
+
+    assert tokens == ["", "1", "2", "3", "4"]
+    # The caller's request is left alone.
+    assert request.page_size == 0
+
+    with mock.patch.object(
+        type(client.transport.list_partitions),
+        "__call__",
+        side_effect=_full_pages(2, metadata_.ListPartitionsResponse, "partitions"),
+    ):
+        pager = client.list_partitions(request)
+        assert pager.page_size == 0
+        assert len(list(pager)) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_adaptive_page_size():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    pages = _full_pages(3, metadata_.ListEntitiesResponse, "entities")
+
+    def call(request, **kwargs):
+        return grpc_helpers_async.FakeUnaryUnaryCall(pages(request))
+
+    with mock.patch.object(
+        type(client.transport.list_entities), "__call__", side_effect=call
+    ):
+        pager = await client.list_entities(
+            request={"parent": "p", "page_size": 50}, adaptive_page_size=True
+        )
+        assert [len(p.entities) async for p in pager.pages] == [50, 100, 200]
+        assert pager.page_size == 200
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import itertools
+import re
+import timeit
+
+import pytest
+
+from google.cloud.dataplex_v1 import _path_template
+
+TEMPLATE = "projects/{project}/locations/{location}/lakes/{lake}"
+# The pattern the generated parse_lake_path helper used to match with.
+PATTERN = r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/lakes/(?P<lake>.+?)$"
+
+SEGMENTS = ["p", "projects", "locations", "lakes", "a/b", "", "x\n"]
+
+
+def _regex_parse(path):
+    m = re.match(PATTERN, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "projects/p/locations/l/lakes/k",
+        "projects/p/locations/l/lakes/k/zones/z",
+        "projects/p/locations/l/lakes/",
+        "projects/p/locations/l/lakes",
+        "projects//locations/l/lakes/k",
+        "projects/a/b/locations/l/lakes/k",
+        "projects/p/locations/l/lakes/k\n",
+        "projects/p/locations/l\n/lakes/k",
+        "projects/p/locations/locations/l/lakes/k",
+        "folders/f",
+        "",
+    ],
+)
+def test_parse_matches_regex(path):
+    template = _path_template.PathTemplate(TEMPLATE)
+
+    assert template.parse(path) == _regex_parse(path)
+
+
+def test_parse_matches_regex_exhaustively():
+    template = _path_template.PathTemplate(TEMPLATE)
+    for values in itertools.product(SEGMENTS, repeat=3):
+        path = "projects/{}/locations/{}/lakes/{}".format(*values)
+        assert template.parse(path) == _regex_parse(path), path
+
+
+def test_parse_many():
+    template = _path_template.PathTemplate(TEMPLATE)
+    paths = [
+        "projects/p/locations/l/lakes/k",
+        "projects/a/b/locations/l/lakes/k",
+        "folders/f",
+    ]
+
+    assert template.parse_many(paths) == {
+        "project": ["p", "a/b", None],
+        "location": ["l", "l", None],
+        "lake": ["k", "k", None],
+    }
+    assert template.parse_many([]) == {"project": [], "location": [], "lake": []}
+    assert repr(template) == "PathTemplate({!r})".format(TEMPLATE)
+
+
+def test_parse_benchmark():
+    # Long segments make the lazy groups of the regex scan character by
+    # character; splitting stays linear.
+    template = _path_template.PathTemplate(TEMPLATE)
+    paths = [
+        "projects/{0}{1}/locations/us-central1/lakes/{0}{2}".format(i, "p" * 200, "k")
+        for i in range(1000)
+    ]
+
+    def regex():
+        for path in paths:
+            _regex_parse(path)
+
+    def split():
+        for path in paths:
+            template.parse(path)
+
+    def columns():
+        template.parse_many(paths)
+
+    regex_time = min(timeit.repeat(regex, number=3, repeat=3))
+    split_time = min(timeit.repeat(split, number=3, repeat=3))
+    columns_time = min(timeit.repeat(columns, number=3, repeat=3))
+
+    assert split_time < regex_time
+    assert columns_time < regex_time
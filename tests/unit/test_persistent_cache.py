@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import mock
+import pytest
+
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import persistent_cache
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+
+ZONE = "projects/p/locations/l/lakes/k/zones/z"
+OTHER_ZONE = "projects/p/locations/l/lakes/k/zones/y"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _entity_request(name, view=metadata_.GetEntityRequest.EntityView.SCHEMA):
+    return metadata_.GetEntityRequest(name=name, view=view)
+
+
+def _put_entity(cache, name, etag="1"):
+    cache.put(
+        "get_entity",
+        _entity_request(name),
+        metadata_.Entity(
+            name=name, etag=etag, schema=metadata_.Schema(user_managed=True)
+        ),
+    )
+
+
+def _get_entity(cache, name):
+    return cache.get("get_entity", _entity_request(name))
+
+
+def test_get_put(tmp_path):
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        name = ZONE + "/entities/e"
+        assert _get_entity(cache, name) is None
+        _put_entity(cache, name)
+
+        entity = _get_entity(cache, name)
+        assert entity.schema.user_managed
+        entity.etag = "changed"
+        assert _get_entity(cache, name).etag == "1"
+        # Different views are cached separately.
+        basic = _entity_request(name, metadata_.GetEntityRequest.EntityView.BASIC)
+        assert cache.get("get_entity", basic) is None
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert len(cache) == 1
+
+
+def test_reopen_serves_without_rpcs(tmp_path):
+    client = MetadataServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        cache=persistent_cache.PersistentCache(str(tmp_path)),
+    )
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.return_value = metadata_.Entity(name=ZONE + "/entities/e", etag="1")
+        client.get_entity(name=ZONE + "/entities/e")
+    assert call.call_count == 1
+    client._cache.close()
+
+    cache = persistent_cache.PersistentCache(str(tmp_path))
+    client = MetadataServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), cache=cache,
+    )
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        entity = client.get_entity(name=ZONE + "/entities/e")
+    call.assert_not_called()
+    assert entity.etag == "1"
+    assert cache.hits == 1
+
+
+def test_invalidate_prefix_persists(tmp_path):
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        _put_entity(cache, ZONE + "/entities/a")
+        _put_entity(cache, ZONE + "/entities/b")
+        _put_entity(cache, OTHER_ZONE + "/entities/a")
+        assert cache.invalidate(ZONE + "/entities/a", children=False) == 1
+        assert cache.invalidate(ZONE) == 1
+        assert len(cache) == 1
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert len(cache) == 1
+        assert _get_entity(cache, ZONE + "/entities/b") is None
+        assert _get_entity(cache, OTHER_ZONE + "/entities/a") is not None
+
+
+def test_revalidate(tmp_path):
+    clock = FakeClock()
+    cache = persistent_cache.PersistentCache(
+        str(tmp_path), ttls={"get_entity": 10.0}, clock=clock
+    )
+    _put_entity(cache, ZONE + "/entities/a")
+    _put_entity(cache, ZONE + "/entities/b")
+
+    clock.now += 8
+    listed_a = metadata_.Entity(name=ZONE + "/entities/a", etag="1")
+    listed_b = metadata_.Entity(name=ZONE + "/entities/b", etag="2")
+    assert cache.revalidate("get_entity", listed_a) == 1
+    assert cache.revalidate("get_entity", listed_b) == 0
+
+    clock.now += 8
+    assert _get_entity(cache, ZONE + "/entities/a") is not None
+    assert _get_entity(cache, ZONE + "/entities/b") is None
+    cache.close()
+
+    # Refreshed expiry times survive a restart.
+    cache = persistent_cache.PersistentCache(
+        str(tmp_path), ttls={"get_entity": 10.0}, clock=clock
+    )
+    assert _get_entity(cache, ZONE + "/entities/a") is not None
+    clock.now += 8
+    assert _get_entity(cache, ZONE + "/entities/a") is None
+
+
+def test_invalidate_and_revalidate_read_only_matching_records(tmp_path):
+    clock = FakeClock()
+    with persistent_cache.PersistentCache(str(tmp_path), clock=clock) as cache:
+        names = [OTHER_ZONE + "/entities/e{}".format(i) for i in range(2000)]
+        for name in names:
+            _put_entity(cache, name)
+        zone = [ZONE + "/entities/e{}".format(i) for i in range(4)]
+        for name in zone:
+            _put_entity(cache, name)
+
+        with mock.patch.object(cache, "_read", wraps=cache._read) as read:
+            listed = [metadata_.Entity(name=name, etag="1") for name in zone[:3]]
+            listed.append(metadata_.Entity(name=zone[3], etag="2"))
+            assert cache.revalidate_many("get_entity", listed) == 3
+            assert read.call_count == 4
+
+            read.reset_mock()
+            # A name sharing the prefix of the zone's is not beneath it.
+            _put_entity(cache, ZONE + "-other/entities/e")
+            assert cache.invalidate(ZONE) == 3
+            assert read.call_count == 3
+
+        assert len(cache) == 2001
+
+
+def test_names_survive_growth_and_reopen(tmp_path):
+    names = [ZONE + "/entities/e{}".format(i) for i in range(1500)]
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        for name in names:
+            _put_entity(cache, name)
+        _put_entity(cache, OTHER_ZONE + "/entities/e")
+        assert cache.invalidate(names[0]) == 1
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert cache.invalidate(names[1]) == 1
+        cache.compact()
+        assert cache.invalidate(ZONE) == len(names) - 2
+        assert len(cache) == 1
+
+
+def test_one_process_at_a_time(tmp_path):
+    cache = persistent_cache.PersistentCache(str(tmp_path))
+    with pytest.raises(BlockingIOError):
+        persistent_cache.PersistentCache(str(tmp_path))
+    cache.close()
+
+    persistent_cache.PersistentCache(str(tmp_path)).close()
+
+
+def test_uncached_methods(tmp_path):
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        request = metadata_.GetPartitionRequest(name=ZONE + "/entities/e/partitions/p")
+        cache.put("get_lake", request, metadata_.Partition(name=request.name))
+        assert cache.get("get_lake", request) is None
+        assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        persistent_cache.PersistentCache(str(tmp_path), ttls={"list_entities": 1.0})
+
+
+def test_growth_and_compaction(tmp_path):
+    names = [ZONE + "/entities/e{}".format(i) for i in range(3000)]
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        for name in names:
+            _put_entity(cache, name)
+        for name in names[:1000]:
+            _put_entity(cache, name, etag="2")
+        assert len(cache) == 3000
+
+        size = os.path.getsize(os.path.join(str(tmp_path), "log"))
+        cache.compact()
+        assert os.path.getsize(os.path.join(str(tmp_path), "log")) < size * 0.8
+        assert _get_entity(cache, names[0]).etag == "2"
+        assert _get_entity(cache, names[-1]).etag == "1"
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert len(cache) == 3000
+        assert all(_get_entity(cache, name) is not None for name in names)
+
+
+def test_recovers_from_torn_write_and_lost_index(tmp_path):
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        _put_entity(cache, ZONE + "/entities/a")
+        _put_entity(cache, ZONE + "/entities/b")
+        cache.invalidate(ZONE + "/entities/b")
+    log = os.path.join(str(tmp_path), "log")
+    size = os.path.getsize(log)
+    with open(log, "ab") as f:
+        f.write(b"\x00\x01\x02")
+    os.remove(os.path.join(str(tmp_path), "index"))
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert os.path.getsize(log) == size
+        assert len(cache) == 1
+        assert _get_entity(cache, ZONE + "/entities/a") is not None
+        assert _get_entity(cache, ZONE + "/entities/b") is None
+        _put_entity(cache, ZONE + "/entities/c")
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert _get_entity(cache, ZONE + "/entities/c") is not None
+
+
+def test_corrupt_record_is_a_miss(tmp_path):
+    log = os.path.join(str(tmp_path), "log")
+
+    def corrupt():
+        # Flip the last byte of the first record, which is already indexed.
+        with open(log, "r+b") as f:
+            f.seek(os.path.getsize(log) // 2 - 1)
+            byte = f.read(1)
+            f.seek(-1, os.SEEK_CUR)
+            f.write(bytes([byte[0] ^ 0xFF]))
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        _put_entity(cache, ZONE + "/entities/a")
+        _put_entity(cache, ZONE + "/entities/b")
+        corrupt()
+
+        assert len(cache) == 2
+        assert _get_entity(cache, ZONE + "/entities/a") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert len(cache) == 1
+        assert _get_entity(cache, ZONE + "/entities/b") is not None
+
+        _put_entity(cache, ZONE + "/entities/a")
+        assert _get_entity(cache, ZONE + "/entities/a") is not None
+        cache.clear()
+        _put_entity(cache, ZONE + "/entities/a")
+        _put_entity(cache, ZONE + "/entities/b")
+    corrupt()
+
+    # The record is found corrupt when the cache is opened again.
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert len(cache) == 1
+        assert _get_entity(cache, ZONE + "/entities/a") is None
+        assert cache.invalidate(ZONE) == 1
+
+
+def test_clear(tmp_path):
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        _put_entity(cache, ZONE + "/entities/a")
+        cache.clear()
+        assert len(cache) == 0
+        assert _get_entity(cache, ZONE + "/entities/a") is None
+
+    with persistent_cache.PersistentCache(str(tmp_path)) as cache:
+        assert len(cache) == 0
+
+
+def test_rejects_foreign_log(tmp_path):
+    with open(os.path.join(str(tmp_path), "log"), "wb") as f:
+        f.write(b"something else")
+
+    with pytest.raises(ValueError):
+        persistent_cache.PersistentCache(str(tmp_path))
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+import mock
+import pytest
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import provisioning
+from google.cloud.dataplex_v1 import rate_limiting
+from google.cloud.dataplex_v1.operation_manager import OperationManager
+from google.cloud.dataplex_v1.services.dataplex_service import (
+    DataplexServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.types import resources
+from google.cloud.dataplex_v1.types import service
+from google.longrunning import operations_pb2
+from google.protobuf import empty_pb2  # type: ignore
+from google.rpc import status_pb2  # type: ignore
+
+LAKE = "projects/p/locations/l/lakes/k"
+RAW = LAKE + "/zones/raw"
+CURATED = LAKE + "/zones/curated"
+Kind = provisioning.ActionKind
+
+
+def _zone(name, **kwargs):
+    kwargs.setdefault("type_", resources.Zone.Type.RAW)
+    return resources.Zone(name=name, **kwargs)
+
+
+def _asset(name, **kwargs):
+    return resources.Asset(
+        name=name,
+        resource_spec=resources.Asset.ResourceSpec(
+            name="projects/p/buckets/" + name.rsplit("/", 1)[1],
+            type_=resources.Asset.ResourceSpec.Type.STORAGE_BUCKET,
+        ),
+        **kwargs
+    )
+
+
+class FakeService:
+    """Serves zones and assets, enforcing the service's ordering rules."""
+
+    def __init__(self):
+        self.resources = {}
+        self.calls = []
+        self.failing = set()
+
+    def _operation(self, name, response=None, error=None):
+        operation = operations_pb2.Operation(name="operations/" + name, done=True)
+        if error is not None:
+            operation.error.CopyFrom(status_pb2.Status(code=9, message=error))
+        else:
+            operation.response.Pack(response)
+        return operation
+
+    def _children(self, parent, kind):
+        prefix = parent + "/" + kind + "/"
+        return [
+            r
+            for n, r in sorted(self.resources.items())
+            if n.startswith(prefix) and "/" not in n[len(prefix) :]
+        ]
+
+    def _handle(self, request):
+        if isinstance(request, service.ListZonesRequest):
+            return service.ListZonesResponse(
+                zones=self._children(request.parent, "zones")
+            )
+        if isinstance(request, service.ListAssetsRequest):
+            return service.ListAssetsResponse(
+                assets=self._children(request.parent, "assets")
+            )
+        if isinstance(request, (service.CreateZoneRequest, service.CreateAssetRequest)):
+            is_zone = isinstance(request, service.CreateZoneRequest)
+            resource = request.zone if is_zone else request.asset
+            name = "{}/{}/{}".format(
+                request.parent,
+                "zones" if is_zone else "assets",
+                request.zone_id if is_zone else request.asset_id,
+            )
+            self.calls.append(("create", name))
+            if name in self.failing:
+                return self._operation(name, error="failed")
+            if request.parent not in self.resources and not is_zone:
+                return self._operation(name, error="no zone")
+            resource.name = name
+            self.resources[name] = resource
+            return self._operation(name, type(resource).pb(resource))
+        if isinstance(request, (service.UpdateZoneRequest, service.UpdateAssetRequest)):
+            resource = (
+                request.zone
+                if isinstance(request, service.UpdateZoneRequest)
+                else request.asset
+            )
+            self.calls.append(
+                ("update", resource.name, tuple(request.update_mask.paths))
+            )
+            current = self.resources[resource.name]
+            for path in request.update_mask.paths:
+                setattr(current, path, getattr(resource, path))
+            return self._operation(resource.name, type(current).pb(current))
+        self.calls.append(("delete", request.name))
+        if self._children(request.name, "assets"):
+            return self._operation(request.name, error="zone has assets")
+        del self.resources[request.name]
+        return self._operation(request.name, empty_pb2.Empty())
+
+    def __call__(self, request, **kwargs):
+        # All stubs share one type, so a single mock serves every RPC.
+        return grpc_helpers_async.FakeUnaryUnaryCall(self._handle(request))
+
+
+def _provisioner(fake, **kwargs):
+    client = DataplexServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    patcher = mock.patch.object(
+        type(client.transport.list_zones), "__call__", side_effect=fake
+    )
+    patcher.start()
+    kwargs.setdefault("max_qps", None)
+    kwargs.setdefault("operations", OperationManager(initial_delay=0.001))
+    return provisioning.Provisioner(client, **kwargs), patcher
+
+
+@pytest.mark.asyncio
+async def test_creates_zones_before_their_assets():
+    fake = FakeService()
+    provisioner, patcher = _provisioner(fake)
+    progress = []
+    try:
+        results = await provisioner.apply(
+            [
+                _asset(RAW + "/assets/a"),
+                _asset(RAW + "/assets/b"),
+                _zone(RAW),
+                _zone(CURATED, type_=resources.Zone.Type.CURATED),
+                _asset(CURATED + "/assets/c"),
+            ],
+            on_progress=lambda result, done, total: progress.append((done, total)),
+        )
+    finally:
+        patcher.stop()
+
+    assert [(r.action.kind, r.action.name) for r in results] == [
+        (Kind.CREATE, CURATED),
+        (Kind.CREATE, RAW),
+        (Kind.CREATE, CURATED + "/assets/c"),
+        (Kind.CREATE, RAW + "/assets/a"),
+        (Kind.CREATE, RAW + "/assets/b"),
+    ]
+    assert all(r.error is None for r in results)
+    assert results[2].response.name == CURATED + "/assets/c"
+    assert sorted(progress) == [(i, 5) for i in range(1, 6)]
+    for zone in (RAW, CURATED):
+        created = [n for kind, n in fake.calls if n.startswith(zone)]
+        assert created[0] == zone
+
+
+@pytest.mark.asyncio
+async def test_plan_diffs_against_current_state():
+    fake = FakeService()
+    fake.resources[RAW] = _zone(RAW, description="old", display_name="Raw")
+    fake.resources[RAW + "/assets/a"] = _asset(RAW + "/assets/a")
+    fake.resources[RAW + "/assets/gone"] = _asset(RAW + "/assets/gone")
+    fake.resources[CURATED] = _zone(CURATED)
+    fake.resources[CURATED + "/assets/c"] = _asset(CURATED + "/assets/c")
+    provisioner, patcher = _provisioner(fake)
+    try:
+        specs = [_zone(RAW, description="new"), _asset(RAW + "/assets/a")]
+        kept = await provisioner.plan(specs)
+        pruned = await provisioner.plan(specs, prune=True)
+    finally:
+        patcher.stop()
+
+    # Unset fields, such as the display name, are not managed.
+    assert kept == [provisioning.Action(Kind.UPDATE, RAW, specs[0], mock.ANY)]
+    assert list(kept[0].update_mask.paths) == ["description"]
+    assert [(a.kind, a.name) for a in pruned] == [
+        (Kind.UPDATE, RAW),
+        (Kind.DELETE, CURATED + "/assets/c"),
+        (Kind.DELETE, RAW + "/assets/gone"),
+        (Kind.DELETE, CURATED),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prune_deletes_assets_before_their_zone():
+    fake = FakeService()
+    fake.resources[RAW] = _zone(RAW)
+    fake.resources[CURATED] = _zone(CURATED)
+    for i in range(5):
+        name = CURATED + "/assets/a{}".format(i)
+        fake.resources[name] = _asset(name)
+    provisioner, patcher = _provisioner(fake, max_concurrency=2)
+    try:
+        results = await provisioner.apply([_zone(RAW)], prune=True)
+    finally:
+        patcher.stop()
+
+    assert [r.error for r in results] == [None] * 6
+    assert fake.calls[-1] == ("delete", CURATED)
+    assert sorted(fake.resources) == [RAW]
+
+
+@pytest.mark.asyncio
+async def test_failures_skip_dependents():
+    fake = FakeService()
+    fake.failing.add(RAW)
+    provisioner, patcher = _provisioner(fake)
+    try:
+        specs = [_zone(RAW), _asset(RAW + "/assets/a"), _zone(CURATED)]
+        with pytest.raises(Exception, match="failed"):
+            await provisioner.apply(specs)
+        fake.calls.clear()
+        results = await provisioner.apply(specs, return_exceptions=True)
+    finally:
+        patcher.stop()
+
+    errors = {r.action.name: r.error for r in results}
+    assert "failed" in str(errors[RAW])
+    assert isinstance(errors[RAW + "/assets/a"], provisioning.DependencyError)
+    assert errors[RAW + "/assets/a"].dependency == RAW
+    # Independent actions still went through on the first attempt.
+    assert CURATED not in errors
+    assert CURATED in fake.resources
+    assert ("create", RAW + "/assets/a") not in fake.calls
+
+
+@pytest.mark.asyncio
+async def test_invalid_specs():
+    fake = FakeService()
+    fake.resources[RAW] = _zone(RAW)
+    provisioner, patcher = _provisioner(fake)
+    try:
+        with pytest.raises(ValueError):
+            await provisioner.plan([_zone(RAW, type_=resources.Zone.Type.CURATED)])
+        with pytest.raises(ValueError):
+            await provisioner.plan([_asset(CURATED + "/assets/a")])
+        with pytest.raises(ValueError):
+            await provisioner.plan([_zone(LAKE)])
+    finally:
+        patcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit():
+    provisioner, patcher = _provisioner(FakeService(), max_qps=100.0)
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    try:
+        await provisioner.apply(
+            [_zone(RAW)] + [_asset(RAW + "/assets/{}".format(i)) for i in range(5)]
+        )
+    finally:
+        patcher.stop()
+    assert loop.time() - start >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_shared_rate_limiter():
+    limiter = rate_limiting.AdaptiveRateLimiter(rate=1000)
+    provisioner, patcher = _provisioner(
+        FakeService(), max_qps=0.001, rate_limiter=limiter
+    )
+    try:
+        with mock.patch.object(
+            limiter, "acquire_async", wraps=limiter.acquire_async
+        ) as acquire:
+            results = await provisioner.apply(
+                [_zone(RAW), _asset(RAW + "/assets/a"), _asset(RAW + "/assets/b")]
+            )
+    finally:
+        patcher.stop()
+
+    assert all(r.error is None for r in results)
+    assert acquire.await_count == 3
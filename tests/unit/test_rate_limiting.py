@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent import futures
+
+import grpc
+from grpc.experimental import aio
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import rate_limiting
+from google.cloud.dataplex_v1.services.metadata_service import (
+    MetadataServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import transports
+from google.cloud.dataplex_v1.types import metadata_
+
+ENTITY = "projects/p/locations/l/lakes/k/zones/z/entities/e"
+
+
+def _local_async_channels(address):
+    """Let async transports open their channels to the local server.
+
+    The channels keep the interceptors the transport passes in.
+    """
+
+    def create_channel(target, **kwargs):
+        return aio.insecure_channel(address, interceptors=kwargs.get("interceptors"))
+
+    return mock.patch.object(
+        grpc_helpers_async, "create_channel", side_effect=create_channel
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class Server:
+    """Serves GetEntity and ListEntities, rejecting the first calls."""
+
+    def __init__(self, rejections=0):
+        self.rejections = rejections
+        self.calls = 0
+        handler = grpc.method_handlers_generic_handler(
+            "google.cloud.dataplex.v1.MetadataService",
+            {
+                "GetEntity": grpc.unary_unary_rpc_method_handler(
+                    self.get_entity,
+                    request_deserializer=metadata_.GetEntityRequest.deserialize,
+                    response_serializer=metadata_.Entity.serialize,
+                ),
+                "ListEntities": grpc.unary_unary_rpc_method_handler(
+                    self.list_entities,
+                    request_deserializer=metadata_.ListEntitiesRequest.deserialize,
+                    response_serializer=metadata_.ListEntitiesResponse.serialize,
+                ),
+            },
+        )
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        self.server.add_generic_rpc_handlers((handler,))
+        self.address = "localhost:{}".format(self.server.add_insecure_port("[::]:0"))
+        self.server.start()
+
+    def get_entity(self, request, context):
+        self.calls += 1
+        if self.rejections:
+            self.rejections -= 1
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "quota")
+        return metadata_.Entity(name=request.name)
+
+    def list_entities(self, request, context):
+        self.calls += 1
+        return metadata_.ListEntitiesResponse()
+
+
+@pytest.fixture
+def server():
+    server = Server()
+    yield server
+    server.server.stop(None)
+
+
+def test_token_bucket():
+    clock = FakeClock()
+    limiter = rate_limiting.AdaptiveRateLimiter(rate=2, burst=2, clock=clock)
+
+    assert [limiter.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    assert limiter.waits == 2
+    clock.now += 1
+    # The queued reservations used up the refill.
+    assert limiter.reserve() == 0.5
+
+
+def test_aimd():
+    clock = FakeClock()
+    limiter = rate_limiting.AdaptiveRateLimiter(
+        rate=10, min_rate=2, max_rate=12, latency_target=0.5, clock=clock
+    )
+
+    for _ in range(10):
+        limiter.record(grpc.StatusCode.OK, 0.1)
+    assert 10.9 < limiter.rate < 11
+    limiter.record(grpc.StatusCode.NOT_FOUND, 0.1)
+    assert 10.9 < limiter.rate < 11
+    for _ in range(100):
+        limiter.record(grpc.StatusCode.OK, 0.1)
+    assert limiter.rate == 12
+
+    # Rejections of calls already in flight only count once.
+    for _ in range(5):
+        limiter.record(grpc.StatusCode.RESOURCE_EXHAUSTED, 0.1)
+    assert limiter.rate == 6
+    assert limiter.throttled == 5
+    clock.now += 1
+    limiter.record(grpc.StatusCode.OK, 0.9)
+    assert limiter.rate == 3
+    clock.now += 1
+    limiter.record(grpc.StatusCode.RESOURCE_EXHAUSTED, 0.1)
+    assert limiter.rate == 2
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        rate_limiting.AdaptiveRateLimiter(rate=1, min_rate=2)
+    with pytest.raises(ValueError):
+        rate_limiting.AdaptiveRateLimiter(rate=10, max_rate=5)
+    with pytest.raises(ValueError):
+        rate_limiting.AdaptiveRateLimiter(decrease=1)
+    with pytest.raises(ValueError):
+        rate_limiting.RateLimitInterceptor()
+
+
+def test_method_limiters():
+    default = rate_limiting.AdaptiveRateLimiter()
+    entities = rate_limiting.AdaptiveRateLimiter()
+    partition = rate_limiting.AdaptiveRateLimiter()
+    interceptor = rate_limiting.RateLimitInterceptor(
+        default,
+        methods={
+            "get_entity": entities,
+            "list_entities": entities,
+            "/google.cloud.dataplex.v1.MetadataService/GetPartition": partition,
+        },
+    )
+    service = "/google.cloud.dataplex.v1.MetadataService/"
+
+    assert interceptor._limiter(service + "GetEntity") is entities
+    assert interceptor._limiter((service + "ListEntities").encode()) is entities
+    assert interceptor._limiter(service + "GetPartition") is partition
+    assert interceptor._limiter(service + "ListPartitions") is default
+    assert (
+        rate_limiting.RateLimitInterceptor(methods={"get_entity": entities})._limiter(
+            service + "ListPartitions"
+        )
+        is None
+    )
+
+
+def test_sync_transport_backs_off(server):
+    server.rejections = 3
+    limiter = rate_limiting.AdaptiveRateLimiter(rate=1000, min_rate=1, cooldown=0)
+    transport = transports.MetadataServiceGrpcTransport(
+        channel=grpc.insecure_channel(server.address),
+        interceptors=[
+            rate_limiting.RateLimitInterceptor(methods={"get_entity": limiter})
+        ],
+    )
+    client = MetadataServiceClient(transport=transport)
+
+    for _ in range(3):
+        with pytest.raises(core_exceptions.ResourceExhausted):
+            client.get_entity(name=ENTITY, retry=None)
+    assert limiter.throttled == 3
+    assert limiter.rate == 125
+    assert client.get_entity(name=ENTITY, retry=None).name == ENTITY
+    assert limiter.rate > 125
+
+    # Methods without a limiter go straight through.
+    client.list_entities(
+        request=metadata_.ListEntitiesRequest(
+            parent=ENTITY.rsplit("/", 2)[0],
+            view=metadata_.ListEntitiesRequest.EntityView.TABLES,
+        )
+    )
+    assert server.calls == 5
+
+
+def test_pool_transport_limits_every_channel(server):
+    limiter = rate_limiting.AdaptiveRateLimiter(rate=1000)
+    transport = transports.MetadataServiceGrpcPoolTransport(
+        channels=[grpc.insecure_channel(server.address) for _ in range(3)],
+        interceptors=[rate_limiting.RateLimitInterceptor(limiter)],
+        strategy="round_robin",
+    )
+    client = MetadataServiceClient(transport=transport)
+
+    for _ in range(6):
+        client.get_entity(name=ENTITY)
+    assert limiter.rate == pytest.approx(1000.006, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_async_transport_shares_limiter(server):
+    server.rejections = 1
+    limiter = rate_limiting.AdaptiveRateLimiter(rate=100, cooldown=0)
+    with _local_async_channels(server.address):
+        transport = transports.MetadataServiceGrpcAsyncIOTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            interceptors=[rate_limiting.AsyncRateLimitInterceptor(limiter)],
+        )
+    client = MetadataServiceAsyncClient(transport=transport)
+    sync_client = MetadataServiceClient(
+        transport=transports.MetadataServiceGrpcTransport(
+            channel=grpc.insecure_channel(server.address),
+            interceptors=[rate_limiting.RateLimitInterceptor(limiter)],
+        )
+    )
+
+    with pytest.raises(core_exceptions.ResourceExhausted):
+        await client.get_entity(name=ENTITY, retry=None)
+    assert limiter.rate == 50
+    assert (await client.get_entity(name=ENTITY)).name == ENTITY
+    assert sync_client.get_entity(name=ENTITY).name == ENTITY
+    assert limiter.rate > 50.03
+    assert limiter.throttled == 1
+
+
+@pytest.mark.asyncio
+async def test_async_interceptors_are_checked():
+    with pytest.raises(ValueError):
+        transports.MetadataServiceGrpcAsyncIOTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            interceptors=[
+                rate_limiting.RateLimitInterceptor(rate_limiting.AdaptiveRateLimiter())
+            ],
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_interceptors_leave_channels_passed_in_alone():
+    channel = aio.insecure_channel("localhost:1")
+    interceptor = rate_limiting.AsyncRateLimitInterceptor(
+        rate_limiting.AdaptiveRateLimiter()
+    )
+    with pytest.raises(ValueError):
+        transports.MetadataServiceGrpcAsyncIOTransport(
+            channel=channel, interceptors=[interceptor]
+        )
+    with pytest.raises(ValueError):
+        transports.MetadataServiceGrpcAsyncIOPoolTransport(
+            channels=[channel], interceptors=[interceptor]
+        )
+    await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_transport_limits_every_channel(server):
+    limiter = rate_limiting.AdaptiveRateLimiter(rate=1000)
+    with _local_async_channels(server.address) as create_channel:
+        transport = transports.MetadataServiceGrpcAsyncIOPoolTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            pool_size=3,
+            interceptors=[rate_limiting.AsyncRateLimitInterceptor(limiter)],
+        )
+    assert create_channel.call_count == 3
+    client = MetadataServiceAsyncClient(transport=transport)
+
+    for _ in range(6):
+        assert (await client.get_entity(name=ENTITY)).name == ENTITY
+    assert limiter.rate == pytest.approx(1000.006, abs=1e-3)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pickle
+import tracemalloc
+
+import pytest
+
+from google.cloud.dataplex_v1 import resource_names
+from google.cloud.dataplex_v1.services.dataplex_service import DataplexServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+
+PARTITION = "projects/p/locations/l/lakes/k/zones/z/entities/e/partitions/dt=1/h=2"
+
+
+@pytest.mark.parametrize("key", sorted(resource_names.RESOURCE_NAMES))
+def test_templates_match_clients(key):
+    name_type = resource_names.RESOURCE_NAMES[key]
+    for client_class in (DataplexServiceClient, MetadataServiceClient):
+        template = client_class._path_templates.get(key)
+        if template is not None:
+            assert name_type.template.template == template.template
+            assert name_type.variables == template.names
+
+
+@pytest.mark.parametrize("key", sorted(resource_names.RESOURCE_NAMES))
+def test_round_trip_with_path_helpers(key):
+    name_type = resource_names.RESOURCE_NAMES[key]
+    client_class = (
+        DataplexServiceClient
+        if key in DataplexServiceClient._path_templates
+        else MetadataServiceClient
+    )
+    values = ["v{}".format(i) for i in range(len(name_type.variables))]
+    path = getattr(client_class, key + "_path")(*values)
+
+    name = name_type.from_path(path)
+
+    assert str(name) == name.path == path
+    assert name == name_type(*values)
+    assert name.to_dict() == getattr(client_class, "parse_" + key + "_path")(path)
+    assert name.id == values[-1]
+
+
+def test_accessors():
+    name = resource_names.PartitionName.from_path(PARTITION)
+
+    assert name.project == "p"
+    assert name.zone == "z"
+    assert name.entity == "e"
+    assert name.partition == "dt=1/h=2"
+    assert name.values() == ("p", "l", "k", "z", "e", "dt=1/h=2")
+    assert name.parent == resource_names.EntityName("p", "l", "k", "z", "e")
+    assert name.parent.parent.parent == resource_names.LakeName("p", "l", "k")
+    assert resource_names.ProjectName("p").parent is None
+    assert repr(name) == "PartitionName('p', 'l', 'k', 'z', 'e', 'dt=1/h=2')"
+
+
+def test_parents_are_interned():
+    first = resource_names.PartitionName.from_path(PARTITION)
+    second = resource_names.PartitionName("p", "l", "k", "z", "e", "other")
+    asset = resource_names.AssetName("p", "l", "k", "z", "a")
+
+    assert first.parent is second.parent
+    assert first.parent.parent is asset.parent
+    assert resource_names.LakeName.intern("p", "l", "k") is asset.parent.parent
+    assert resource_names.interned_count() >= 5
+
+
+def test_clear_interned():
+    first = resource_names.ZoneName("p", "l", "k", "z")
+    resource_names.clear_interned()
+    second = resource_names.ZoneName("p", "l", "k", "z")
+
+    assert resource_names.interned_count() == 3
+    assert first.parent is not second.parent
+    assert first == second
+    assert hash(first) == hash(second)
+
+
+def test_equality_and_hashing():
+    zone = resource_names.ZoneName("p", "l", "k", "z")
+    entity = resource_names.EntityName("p", "l", "k", "z", "x")
+    asset = resource_names.AssetName("p", "l", "k", "z", "x")
+
+    assert entity != asset
+    assert entity != "projects/p/locations/l/lakes/k/zones/z/entities/x"
+    assert zone != resource_names.ZoneName("p", "l", "k", "y")
+    assert len({entity, asset, resource_names.EntityName(*entity.values())}) == 2
+    assert entity.parent == asset.parent == zone
+
+
+def test_pickle_shares_parents():
+    name = resource_names.PartitionName.from_path(PARTITION)
+
+    restored = pickle.loads(pickle.dumps(name))
+
+    assert restored == name
+    assert restored.parent is name.parent
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        resource_names.ZoneName.from_path("projects/p/locations/l/lakes/k")
+    with pytest.raises(TypeError):
+        resource_names.ZoneName("p", "l", "k")
+    with pytest.raises(AttributeError):
+        resource_names.ZoneName("p", "l", "k", "z").extra = 1
+
+
+def test_memory_smaller_than_strings():
+    paths = [
+        "projects/analytics-prod-342817/locations/us-central1/lakes/sales/"
+        "zones/curated-zone/entities/orders_daily/partitions/{:06d}".format(i)
+        for i in range(10000)
+    ]
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        copies = [(path + "/")[:-1] for path in paths]
+        strings = tracemalloc.get_traced_memory()[0] - start
+        del copies
+        start = tracemalloc.get_traced_memory()[0]
+        names = [resource_names.PartitionName.from_path(path) for path in paths]
+        compact = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    assert len(names) == len(paths)
+    assert compact < strings * 0.75
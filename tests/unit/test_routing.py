@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import pytest
+
+from google.api_core import gapic_v1
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import _routing
+from google.cloud.dataplex_v1.services.dataplex_service import DataplexServiceClient
+from google.cloud.dataplex_v1.services.metadata_service import (
+    MetadataServiceAsyncClient,
+)
+from google.cloud.dataplex_v1.services.metadata_service import MetadataServiceClient
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import service
+
+NAME = "projects/p/locations/l/lakes/lake/zones/zone/entities/e 1"
+
+
+def test_header_matches_api_core():
+    for field, value in (("name", NAME), ("lake.name", "a&b=c"), ("parent", "")):
+        assert _routing.header(field, value) == (
+            gapic_v1.routing_header.to_grpc_metadata(((field, value),))
+        )
+
+
+def test_header_is_memoized():
+    with mock.patch.object(
+        gapic_v1.routing_header, "to_grpc_metadata", return_value=("k", "v")
+    ) as encode:
+        _routing.header.cache_clear()
+        assert _routing.header("name", NAME) == ("k", "v")
+        assert _routing.header("name", NAME) == ("k", "v")
+    _routing.header.cache_clear()
+
+    encode.assert_called_once_with((("name", NAME),))
+
+
+def test_raw_request_is_wrapped_without_copy():
+    client = MetadataServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    request = metadata_.GetEntityRequest.pb(metadata_.GetEntityRequest(name=NAME))
+
+    with mock.patch.object(type(client.transport.get_entity), "__call__") as call:
+        call.return_value = metadata_.Entity(name=NAME)
+        client.get_entity(request=request)
+
+    sent = call.call_args.args[0]
+    assert metadata_.GetEntityRequest.pb(sent) is request
+    assert ("x-goog-request-params", "name=" + NAME.replace(" ", "+")) in (
+        call.call_args.kwargs["metadata"]
+    )
+
+
+def test_nested_routing_field():
+    client = DataplexServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    request = service.UpdateLakeRequest(lake={"name": "projects/p/lakes/l"})
+
+    with mock.patch.object(type(client.transport.update_lake), "__call__") as call:
+        call.return_value = mock.Mock()
+        client.update_lake(request=request)
+
+    assert call.call_args.args[0] is request
+    assert ("x-goog-request-params", "lake.name=projects/p/lakes/l") in (
+        call.call_args.kwargs["metadata"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_methods_are_wrapped_once():
+    client = MetadataServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    request = metadata_.GetEntityRequest(name=NAME)
+
+    with mock.patch.object(
+        type(client.transport.get_entity), "__call__"
+    ) as call, mock.patch.object(gapic_v1.method_async, "wrap_method") as wrap:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            metadata_.Entity(name=NAME)
+        )
+        await client.get_entity(request=request)
+        await client.get_entity(request=request)
+
+    wrap.assert_not_called()
+    assert call.call_count == 2
+    # A request object is sent as is, as the sync client does.
+    assert call.call_args.args[0] is request
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import pytest
+
+import google.auth
+from google.auth import credentials as ga_credentials
+from google.cloud.dataplex_v1 import _channel_pool
+from google.cloud.dataplex_v1 import sharing
+from google.cloud.dataplex_v1.services.dataplex_service import transports
+from google.cloud.dataplex_v1.types import metadata_
+from google.cloud.dataplex_v1.types import resources
+
+
+def test_create_clients_share_one_channel():
+    creds = ga_credentials.AnonymousCredentials()
+    channel = mock.Mock()
+    with mock.patch.object(
+        google.auth, "default", autospec=True, return_value=(creds, None)
+    ) as adc, mock.patch.object(
+        transports.DataplexServiceGrpcTransport, "create_channel", return_value=channel
+    ) as create_channel:
+        dataplex_client, metadata_client = sharing.create_clients(
+            quota_project_id="octopus"
+        )
+
+    adc.assert_called_once_with(
+        scopes=None, default_scopes=sharing.AUTH_SCOPES, quota_project_id="octopus"
+    )
+    create_channel.assert_called_once_with(
+        "dataplex.googleapis.com:443",
+        credentials=creds,
+        scopes=None,
+        quota_project_id="octopus",
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
+
+    stub = channel.unary_unary.return_value
+    stub.return_value = resources.Lake(name="lake")
+    assert dataplex_client.get_lake(name="lake").name == "lake"
+    stub.return_value = metadata_.Entity(name="entity")
+    assert metadata_client.get_entity(name="entity").name == "entity"
+    assert stub.call_count == 2
+
+    # Closing one client leaves the channel open for the other.
+    with dataplex_client:
+        pass
+    dataplex_client.transport.close()
+    channel.close.assert_not_called()
+    metadata_client.transport.close()
+    channel.close.assert_called_once_with()
+
+
+def test_create_clients_pool():
+    with mock.patch.object(
+        transports.DataplexServiceGrpcTransport, "create_channel"
+    ) as create_channel:
+        dataplex_client, metadata_client = sharing.create_clients(
+            credentials=ga_credentials.AnonymousCredentials(), pool_size=3
+        )
+
+    assert create_channel.call_count == 3
+    _, kwargs = create_channel.call_args
+    assert ("grpc.use_local_subchannel_pool", 1) in kwargs["options"]
+    shared = dataplex_client.transport.grpc_channel._refs.channel
+    assert isinstance(shared, _channel_pool.ChannelPool)
+    assert metadata_client.transport.grpc_channel._refs.channel is shared
+
+    with pytest.raises(ValueError):
+        sharing.create_clients(pool_size=0)
+
+
+def test_shared_channel_cannot_be_leased_once_closed():
+    channel = mock.Mock()
+    shared = sharing.SharedChannel(channel)
+    with shared.lease() as lease:
+        lease.subscribe(None)
+        lease.unsubscribe(None)
+        lease.unary_stream("/S/M")
+        lease.stream_unary("/S/M")
+        lease.stream_stream("/S/M")
+        assert shared.leases == 1
+    lease.close()
+
+    assert shared.closed
+    channel.close.assert_called_once_with()
+    with pytest.raises(ValueError):
+        shared.lease()
+
+
+@pytest.mark.asyncio
+async def test_create_async_clients_share_one_channel():
+    channel = mock.Mock()
+    channel.close = mock.AsyncMock()
+    channel.channel_ready = mock.AsyncMock()
+    channel.wait_for_state_change = mock.AsyncMock()
+    with mock.patch.object(
+        transports.DataplexServiceGrpcAsyncIOTransport,
+        "create_channel",
+        return_value=channel,
+    ):
+        dataplex_client, metadata_client = sharing.create_async_clients(
+            credentials=ga_credentials.AnonymousCredentials(), host="localhost:1234"
+        )
+
+    assert dataplex_client.transport._host == "localhost:1234"
+    lease = metadata_client.transport.grpc_channel
+    lease.unary_stream("/S/M")
+    lease.stream_unary("/S/M")
+    lease.stream_stream("/S/M")
+    lease.get_state()
+    await lease.channel_ready()
+    await lease.wait_for_state_change(None)
+
+    async with dataplex_client:
+        pass
+    channel.close.assert_not_awaited()
+    async with metadata_client:
+        pass
+    await metadata_client.transport.close()
+    channel.close.assert_awaited_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_create_async_clients_pool():
+    with mock.patch.object(
+        transports.DataplexServiceGrpcAsyncIOTransport, "create_channel"
+    ):
+        dataplex_client, _ = sharing.create_async_clients(
+            credentials=ga_credentials.AnonymousCredentials(), pool_size=2
+        )
+
+    shared = dataplex_client.transport.grpc_channel._refs.channel
+    assert isinstance(shared, _channel_pool.AsyncChannelPool)
+    with pytest.raises(ValueError):
+        sharing.create_async_clients(pool_size=0)
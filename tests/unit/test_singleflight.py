@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+import pytest
+
+from google.cloud.dataplex_v1 import _singleflight
+from google.cloud.dataplex_v1.types import resources
+from google.cloud.dataplex_v1.types import service
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    release = asyncio.Event()
+    calls = []
+
+    async def rpc(request, metadata, timeout):
+        calls.append(timeout)
+        await release.wait()
+        return resources.Lake(name=request.name)
+
+    flight = _singleflight.SingleFlight()
+    request = service.GetLakeRequest(name="lake")
+    first = asyncio.ensure_future(flight.call(rpc, request, metadata=(), timeout=1))
+    second = asyncio.ensure_future(flight.call(rpc, request, metadata=(), timeout=2))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert (await second).name == "lake"
+    assert first.cancelled()
+    # The first caller's arguments were used for the shared call.
+    assert calls == [1]
+    assert not len(flight)
+
+
+@pytest.mark.asyncio
+async def test_distinct_request_types_are_not_shared():
+    async def rpc(request, metadata):
+        await asyncio.sleep(0)
+        return resources.Lake()
+
+    flight = _singleflight.SingleFlight()
+    lake = flight.call(rpc, service.GetLakeRequest(name="x"), metadata=())
+    zone = flight.call(rpc, service.GetZoneRequest(name="x"), metadata=())
+    pending = [asyncio.ensure_future(lake), asyncio.ensure_future(zone)]
+    await asyncio.sleep(0)
+
+    assert len(flight) == 2
+    await asyncio.gather(*pending)